@@ -1,96 +1,197 @@
 """
-Constant Product Market Maker (CPMM) for Binary Markets
-========================================================
+Constant Product Market Maker (CPMM) for Prediction Markets
+===========================================================
 
-Implements Uniswap-style AMM for prediction markets.
+Implements Uniswap-style AMM for prediction markets, binary or N-outcome.
 
-Formula: x * y = k (constant product)
-- x = YES shares (liquidity)
-- y = NO shares (liquidity)
+Formula: x_1 * x_2 * ... * x_N = k (constant product)
+- x_i = liquidity (shares) for outcome i, stored as one compact array
 - k = constant product
+- Binary markets are the N = 2 case: x * y = k, x = YES, y = NO
 
 Price calculation:
-- Price of YES = NO_shares / (YES_shares + NO_shares)
-- Price of NO = YES_shares / (YES_shares + NO_shares)
+- Price of outcome i = (1 / x_i) / sum_j (1 / x_j)
+- Binary: Price of YES = NO_shares / (YES_shares + NO_shares)
+          Price of NO = YES_shares / (YES_shares + NO_shares)
+
+Trading:
+- Buying outcome i adds the amount (after fee) to x_i; every other reserve
+  is scaled by the same factor so the product stays k
+- Binary: new NO shares = k / new YES shares, exactly as before
 
 Price impact:
 - When buying YES shares, NO shares increase (price goes up)
-- Maintains no-arbitrage: YES_price + NO_price = 1.00 (with small spread)
+- Maintains no-arbitrage: prices sum to 1.00 (with small spread)
+
+Pricing and trades are O(N) NumPy operations over the reserve array.
 
 Reference: Uniswap V2 AMM
 """
 
-from typing import Dict, Tuple
+from typing import Dict, Optional, Sequence, Tuple
 from dataclasses import dataclass
 
+import numpy as np
+
+BINARY_OUTCOMES = ("YES", "NO")
+
 
-@dataclass
 class CPMMState:
-    """State of a CPMM market."""
-    yes_shares: float  # Liquidity for YES outcome
-    no_shares: float   # Liquidity for NO outcome
+    """State of a CPMM market: one liquidity reserve per outcome."""
+    
+    def __init__(
+        self,
+        yes_shares: Optional[float] = None,
+        no_shares: Optional[float] = None,
+        *,
+        reserves: Optional[Sequence[float]] = None,
+        outcomes: Sequence[str] = BINARY_OUTCOMES
+    ):
+        """
+        Args:
+            yes_shares: Liquidity for YES (binary markets)
+            no_shares: Liquidity for NO (binary markets)
+            reserves: Liquidity per outcome, aligned with outcomes (any N)
+            outcomes: Outcome names (default: YES, NO)
+        """
+        if reserves is None:
+            reserves = [yes_shares, no_shares]
+        self.outcomes = list(outcomes)
+        self.reserves = np.array(reserves, dtype=float)  # Own copy: trades mutate it
+        if len(self.outcomes) < 2 or len(self.outcomes) != len(self.reserves):
+            raise ValueError("Need at least two outcomes, one reserve each")
+        self._index = {outcome.upper(): i for i, outcome in enumerate(self.outcomes)}
+    
+    def __repr__(self) -> str:
+        return f"CPMMState({dict(zip(self.outcomes, self.reserves.tolist()))})"
+    
+    def index(self, outcome: str) -> int:
+        """Position of an outcome in the reserve array."""
+        try:
+            return self._index[outcome.upper()]
+        except KeyError:
+            raise ValueError(f"Unknown outcome: {outcome}") from None
+    
+    @property
+    def yes_shares(self) -> float:
+        """Liquidity for YES outcome"""
+        return float(self.reserves[self.index("YES")])
+    
+    @yes_shares.setter
+    def yes_shares(self, value: float):
+        self.reserves[self.index("YES")] = value
+    
+    @property
+    def no_shares(self) -> float:
+        """Liquidity for NO outcome"""
+        return float(self.reserves[self.index("NO")])
+    
+    @no_shares.setter
+    def no_shares(self, value: float):
+        self.reserves[self.index("NO")] = value
     
     @property
     def constant_product(self) -> float:
-        """Calculate k = x * y"""
-        return self.yes_shares * self.no_shares
+        """Calculate k = x_1 * ... * x_N"""
+        return float(np.prod(self.reserves))
     
     @property
     def total_liquidity(self) -> float:
         """Total liquidity in the pool"""
-        return self.yes_shares + self.no_shares
+        return float(np.sum(self.reserves))
+    
+    def price_vector(self) -> np.ndarray:
+        """Prices of all outcomes, aligned with outcomes (sum to 1)."""
+        return _prices(self.reserves)
     
     def get_price(self, outcome: str) -> float:
         """Get current price for an outcome (0.0 to 1.0)"""
-        if outcome.upper() == "YES":
-            if self.total_liquidity == 0:
-                return 0.5  # Default to 50/50 if no liquidity
-            return self.no_shares / self.total_liquidity
-        elif outcome.upper() == "NO":
-            if self.total_liquidity == 0:
-                return 0.5
-            return self.yes_shares / self.total_liquidity
-        else:
-            raise ValueError(f"Unknown outcome: {outcome}")
+        return float(self.price_vector()[self.index(outcome)])
     
     def get_all_prices(self) -> Dict[str, float]:
         """Get prices for all outcomes"""
-        return {
-            "YES": self.get_price("YES"),
-            "NO": self.get_price("NO")
-        }
+        return dict(zip(self.outcomes, self.price_vector().tolist()))
     
     def verify_no_arbitrage(self, tolerance: float = 0.01) -> bool:
-        """Verify that YES + NO ≈ 1.00 (within tolerance)"""
-        yes_price = self.get_price("YES")
-        no_price = self.get_price("NO")
-        total = yes_price + no_price
-        return abs(total - 1.0) <= tolerance
+        """Verify that prices sum to ≈ 1.00 (within tolerance)"""
+        return abs(float(np.sum(self.price_vector())) - 1.0) <= tolerance
+
+
+def _prices(reserves: np.ndarray) -> np.ndarray:
+    """
+    Prices for reserve rows: (1 / x_i) / sum_j (1 / x_j) along the last axis.
+    
+    Outcomes with no liquidity left split the whole price; a pool with no
+    liquidity at all prices every outcome equally.
+    """
+    if np.all(reserves > 0):
+        inverse = 1.0 / reserves
+        return inverse / np.sum(inverse, axis=-1, keepdims=True)
+    empty = (reserves <= 0).astype(float)
+    counts = np.sum(empty, axis=-1, keepdims=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        inverse = np.where(reserves > 0, 1.0 / np.where(reserves > 0, reserves, 1.0), 0.0)
+        return np.where(counts > 0, empty / np.maximum(counts, 1), inverse / np.sum(inverse, axis=-1, keepdims=True))
+
+
+@dataclass
+class CPMMQuotes:
+    """Quotes for buying one outcome at many sizes (one array element per amount)."""
+    outcome: str
+    amounts: np.ndarray
+    shares_out: np.ndarray
+    price_impact: np.ndarray
+    new_prices: Dict[str, np.ndarray]  # Post-trade price of each outcome
 
 
 class CPMM:
     """
-    Constant Product Market Maker for binary prediction markets.
+    Constant Product Market Maker for prediction markets.
     
-    Maintains x * y = k where:
-    - x = YES shares
-    - y = NO shares
+    Maintains x_1 * ... * x_N = k where:
+    - x_i = shares for outcome i (binary: x = YES, y = NO)
     - k = constant product
     """
     
-    def __init__(self, initial_liquidity: float = 1000.0):
+    def __init__(
+        self,
+        initial_liquidity: float = 1000.0,
+        outcomes: Sequence[str] = BINARY_OUTCOMES,
+        reserves: Optional[Sequence[float]] = None
+    ):
         """
-        Initialize CPMM with equal liquidity for both outcomes.
+        Initialize CPMM with equal liquidity for every outcome.
         
         Args:
             initial_liquidity: Starting liquidity for each outcome (default: 1000)
+            outcomes: Outcome names (default: YES, NO)
+            reserves: Liquidity per outcome, to restore a market
         """
-        self.state = CPMMState(
-            yes_shares=initial_liquidity,
-            no_shares=initial_liquidity
-        )
+        if reserves is None:
+            reserves = [initial_liquidity] * len(outcomes)
+        self.state = CPMMState(reserves=reserves, outcomes=outcomes)
         self.fee_rate = 0.03  # 3% fee (like Uniswap)
     
+    def _reserves_after(self, i: int, spend: np.ndarray) -> np.ndarray:
+        """
+        Reserves after spending each amount on outcome i (one row per amount).
+        
+        x_i grows by the amount; the other reserves shrink by a common factor
+        (x_i / new_x_i) ** (1 / (N - 1)), keeping the product at k.
+        """
+        x = self.state.reserves
+        new_bought = x[i] + spend
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scale = np.where(new_bought > 0, x[i] / new_bought, 1.0) ** (1.0 / (len(x) - 1))
+        after = x * scale[:, None]
+        after[:, i] = new_bought
+        return after
+    
+    def _spend(self, amounts, apply_fee: bool) -> np.ndarray:
+        amounts = np.asarray(amounts, dtype=float)
+        spend = np.where(amounts > 0, amounts, 0.0)
+        return spend * (1 - self.fee_rate) if apply_fee else spend
+    
     def calculate_shares_out(
         self,
         outcome: str,
@@ -101,52 +202,26 @@ class CPMM:
         Calculate how many shares you get for a given amount.
         
         Formula: 
-        - For buying YES: amount_in buys YES shares
-        - New YES shares = old_YES + amount_in
-        - New NO shares = k / new_YES
-        - Shares received = new_YES - old_YES
+        - For buying outcome i: amount_in buys outcome i shares
+        - New x_i = old x_i + amount_in
+        - Other reserves scale so the product stays k (binary: new NO = k / new YES)
+        - Shares received = new x_i - old x_i
         
         Args:
-            outcome: "YES" or "NO"
+            outcome: Outcome to buy (e.g. "YES", "NO", "HOME")
             amount_in: Amount of capital to invest
             apply_fee: Whether to apply trading fee
         
         Returns:
             Tuple of (shares_out, price_impact)
         """
+        i = self.state.index(outcome)
         if amount_in <= 0:
             return 0.0, 0.0
         
-        # Apply fee
-        if apply_fee:
-            amount_after_fee = amount_in * (1 - self.fee_rate)
-        else:
-            amount_after_fee = amount_in
-        
-        k = self.state.constant_product
-        
-        if outcome.upper() == "YES":
-            # Buying YES shares
-            old_yes = self.state.yes_shares
-            new_yes = old_yes + amount_after_fee
-            new_no = k / new_yes if new_yes > 0 else self.state.no_shares
-            
-            shares_out = new_yes - old_yes
-            price_impact = (new_yes / (new_yes + new_no)) - (old_yes / (old_yes + self.state.no_shares))
-            
-        elif outcome.upper() == "NO":
-            # Buying NO shares
-            old_no = self.state.no_shares
-            new_no = old_no + amount_after_fee
-            new_yes = k / new_no if new_no > 0 else self.state.yes_shares
-            
-            shares_out = new_no - old_no
-            price_impact = (new_no / (new_yes + new_no)) - (old_no / (self.state.yes_shares + old_no))
-            
-        else:
-            raise ValueError(f"Unknown outcome: {outcome}")
-        
-        return shares_out, abs(price_impact)
+        spend = self._spend([amount_in], apply_fee)
+        new_price = _prices(self._reserves_after(i, spend))[0, i]
+        return float(spend[0]), abs(float(new_price) - self.state.get_price(outcome))
     
     def calculate_amount_in(
         self,
@@ -160,30 +235,19 @@ class CPMM:
         This is the inverse of calculate_shares_out.
         
         Args:
-            outcome: "YES" or "NO"
+            outcome: Outcome to buy
             shares_out: Desired number of shares
             apply_fee: Whether to account for trading fee
         
         Returns:
             Amount of capital needed
         """
+        self.state.index(outcome)  # Validate outcome
         if shares_out <= 0:
             return 0.0
         
-        k = self.state.constant_product
-        
-        if outcome.upper() == "YES":
-            new_yes = self.state.yes_shares + shares_out
-            new_no = k / new_yes if new_yes > 0 else self.state.no_shares
-            amount_needed = new_yes - self.state.yes_shares
-            
-        elif outcome.upper() == "NO":
-            new_no = self.state.no_shares + shares_out
-            new_yes = k / new_no if new_no > 0 else self.state.yes_shares
-            amount_needed = new_no - self.state.no_shares
-            
-        else:
-            raise ValueError(f"Unknown outcome: {outcome}")
+        # Shares received equal the growth of the bought reserve
+        amount_needed = shares_out
         
         # Account for fee
         if apply_fee:
@@ -201,7 +265,7 @@ class CPMM:
         Execute a trade and update the market state.
         
         Args:
-            outcome: "YES" or "NO"
+            outcome: Outcome to buy
             amount_in: Amount of capital to invest
             apply_fee: Whether to apply trading fee
         
@@ -211,26 +275,48 @@ class CPMM:
         shares_out, price_impact = self.calculate_shares_out(outcome, amount_in, apply_fee)
         
         # Update state
-        if apply_fee:
-            amount_after_fee = amount_in * (1 - self.fee_rate)
-        else:
-            amount_after_fee = amount_in
-        
-        k = self.state.constant_product
-        
-        if outcome.upper() == "YES":
-            self.state.yes_shares += amount_after_fee
-            self.state.no_shares = k / self.state.yes_shares if self.state.yes_shares > 0 else self.state.no_shares
-        elif outcome.upper() == "NO":
-            self.state.no_shares += amount_after_fee
-            self.state.yes_shares = k / self.state.no_shares if self.state.no_shares > 0 else self.state.yes_shares
-        else:
-            raise ValueError(f"Unknown outcome: {outcome}")
+        if shares_out > 0:
+            self.state.reserves = self._reserves_after(self.state.index(outcome), np.array([shares_out]))[0]
         
         new_prices = self.state.get_all_prices()
         
         return shares_out, price_impact, new_prices
     
+    def quote_many(
+        self,
+        outcome: str,
+        amounts: Sequence[float],
+        apply_fee: bool = True
+    ) -> CPMMQuotes:
+        """
+        Price many trade sizes at once, without changing the market state.
+        
+        Each amount is quoted independently against the current pool, in
+        closed form: O(N) per amount, vectorized over all amounts. Element i
+        matches calculate_shares_out(outcome, amounts[i]) and the prices
+        execute_trade would leave behind.
+        
+        Args:
+            outcome: Outcome to buy
+            amounts: Amounts of capital to quote (non-positive amounts quote as 0)
+            apply_fee: Whether to apply trading fee
+        
+        Returns:
+            CPMMQuotes with shares, price impact and post-trade prices per amount
+        """
+        i = self.state.index(outcome)
+        amounts = np.asarray(amounts, dtype=float)
+        spend = self._spend(amounts, apply_fee)
+        new_prices = _prices(self._reserves_after(i, spend))
+        
+        return CPMMQuotes(
+            outcome=self.state.outcomes[i],
+            amounts=amounts,
+            shares_out=spend,
+            price_impact=np.abs(new_prices[:, i] - self.state.get_price(outcome)),
+            new_prices={name: new_prices[:, j] for j, name in enumerate(self.state.outcomes)},
+        )
+    
     def get_current_odds(self) -> Dict[str, float]:
         """
         Get current odds (prices) for all outcomes.
@@ -243,23 +329,21 @@ class CPMM:
     def get_liquidity(self) -> Dict[str, float]:
         """Get current liquidity for each outcome"""
         return {
-            "YES": self.state.yes_shares,
-            "NO": self.state.no_shares,
+            **dict(zip(self.state.outcomes, self.state.reserves.tolist())),
             "total": self.state.total_liquidity
         }
     
-    def add_initial_liquidity(self, yes_amount: float, no_amount: float):
+    def add_initial_liquidity(self, *amounts: float):
         """
         Add initial liquidity to bootstrap the market.
         Used when creating a new market.
         
         Args:
-            yes_amount: Initial YES liquidity
-            no_amount: Initial NO liquidity
+            *amounts: Initial liquidity per outcome (binary: YES, NO)
         """
-        if yes_amount <= 0 or no_amount <= 0:
+        if len(amounts) != len(self.state.outcomes):
+            raise ValueError(f"Expected {len(self.state.outcomes)} liquidity amounts")
+        if any(amount <= 0 for amount in amounts):
             raise ValueError("Liquidity amounts must be positive")
         
-        self.state.yes_shares = yes_amount
-        self.state.no_shares = no_amount
-
+        self.state.reserves = np.array(amounts, dtype=float)
@@ -33,10 +33,12 @@ import json
 import asyncio
 import requests
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Callable, Awaitable
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 import hashlib
+import threading
+import weakref
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -243,13 +245,50 @@ class BettingMarket:
     # CPMM liquidity tracking
     yes_shares: float = 1000.0  # Initial liquidity for YES
     no_shares: float = 1000.0   # Initial liquidity for NO
+    cpmm_reserves: List[float] = field(default_factory=list)  # Pool per outcome, 3+ outcome CPMM markets
+    
+    # Market maker engine: "CPMM" (pools above) or "LMSR" (N outcomes)
+    market_maker: str = "CPMM"
+    liquidity_b: float = 100.0  # LMSR liquidity parameter, fixed at creation
+    lmsr_quantities: List[float] = field(default_factory=list)  # LMSR shares outstanding per outcome
     
     winning_outcome: Optional[str] = None
     virality_score: float = 0.0
     source_event: Optional[RawEvent] = None
     
+    def amm(self):
+        """The market's market maker engine (CPMM or LMSR), loaded with its current state."""
+        if self.market_maker == "LMSR":
+            from backend.core.lmsr import LMSR
+            return LMSR(self.outcomes, self.liquidity_b, self.lmsr_quantities or None)
+        from backend.core.cpmm import CPMM
+        if self.cpmm_reserves:
+            return CPMM(outcomes=self.outcomes, reserves=self.cpmm_reserves)
+        return CPMM(reserves=[self.yes_shares, self.no_shares])
+    
+    def apply_amm(self, engine):
+        """Store an engine's post-trade state on the market."""
+        if self.market_maker == "LMSR":
+            self.lmsr_quantities = engine.state.quantities.tolist()
+        elif self.cpmm_reserves:
+            self.cpmm_reserves = engine.state.reserves.tolist()
+        else:
+            self.yes_shares = engine.state.yes_shares
+            self.no_shares = engine.state.no_shares
+    
+    def amm_state(self) -> Dict[str, Any]:
+        """The engine state a trade changes (what the trade journal records)."""
+        if self.market_maker == "LMSR":
+            return {"lmsr_quantities": list(self.lmsr_quantities)}
+        if self.cpmm_reserves:
+            return {"cpmm_reserves": list(self.cpmm_reserves)}
+        return {"yes_shares": self.yes_shares, "no_shares": self.no_shares}
+    
     def recalculate_odds_from_cpmm(self):
-        """Recalculate odds from CPMM liquidity state."""
+        """Recalculate odds from the market maker's liquidity state."""
+        if self.market_maker == "LMSR" or self.cpmm_reserves:
+            self.outcome_odds = self.amm().get_current_odds()
+            return
         from backend.core.cpmm import CPMMState
         state = CPMMState(yes_shares=self.yes_shares, no_shares=self.no_shares)
         self.outcome_odds = state.get_all_prices()
@@ -278,6 +317,9 @@ class BettingMarket:
             "virality_score": self.virality_score,
             "yes_shares": self.yes_shares,
             "no_shares": self.no_shares,
+            "cpmm_reserves": self.cpmm_reserves,
+            "market_maker": self.market_maker,
+            "liquidity_b": self.liquidity_b,
         }
 
 
@@ -1109,6 +1151,19 @@ class AgentDispatcher:
 # EVENT ORCHESTRATOR (Main Interface)
 # =============================================================================
 
+# Journaled trades between background snapshots of markets.json
+JOURNAL_COMPACT_EVERY = 1000
+
+
+@dataclass
+class TradeFill:
+    """Result of a trade applied to a market's market maker (CPMM or LMSR)."""
+    shares_received: float
+    price_impact: float
+    price_before: float
+    new_odds: Dict[str, float]
+
+
 class EventOrchestrator:
     """
     The main interface for event orchestration.
@@ -1125,7 +1180,10 @@ class EventOrchestrator:
         self.dispatcher = AgentDispatcher()
         
         self.events: List[RawEvent] = []
-        self.markets: Dict[str, BettingMarket] = {}
+        # Indexed by status/domain/duration and ranked by virality/volume;
+        # call self.markets.touch(id) after changing a market in place
+        from backend.core.market_index import MarketStore
+        self.markets: Dict[str, BettingMarket] = MarketStore()
         
         self.stats = {
             "events_processed": 0,
@@ -1145,6 +1203,23 @@ class EventOrchestrator:
                 self.persistence = None
                 print("⚠️ Persistence manager not available for EventOrchestrator")
         
+        # Trades are journaled (one line per bet) and compacted into snapshots
+        self.trade_journal = None
+        self._snapshot_lock = threading.Lock()
+        self._snapshot_generation = 0  # Last snapshot built
+        self._written_generation = 0   # Last snapshot on disk
+        self._compacting = False
+        
+        # One lock per market: trades on a market apply one at a time, in
+        # arrival order; trades on different markets never wait on each other.
+        # Weakly held, so a lock lives only while a trade holds or awaits it
+        self._market_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = (
+            weakref.WeakValueDictionary()
+        )
+        if self.persistence:
+            from backend.core.trade_journal import TradeJournal
+            self.trade_journal = TradeJournal(self.persistence.data_dir / "journal")
+        
         # Load saved markets on startup
         if self.persistence:
             self._load_markets_state()
@@ -1207,8 +1282,15 @@ class EventOrchestrator:
         events = events or self.events
         return [e for e in events if e.virality_score >= min_score]
     
-    def create_market(self, event: RawEvent) -> BettingMarket:
-        """Create a betting market from an event."""
+    def create_market(self, event: RawEvent, market_maker: str = "CPMM",
+                      liquidity_b: float = 100.0,
+                      outcomes: Optional[List[str]] = None) -> BettingMarket:
+        """
+        Create a betting market from an event, priced by CPMM or LMSR.
+        
+        Markets are YES/NO unless `outcomes` names others (e.g. HOME/DRAW/AWAY).
+        """
+        outcomes = list(outcomes or ["YES", "NO"])
         duration = classify_duration(event)
         
         duration_hours = {
@@ -1220,8 +1302,9 @@ class EventOrchestrator:
         
         market_id = f"MKT_{event.id}_{duration.value}"
         
-        # Initialize with CPMM: equal liquidity for YES and NO
+        # CPMM starts with equal liquidity per outcome; LMSR with no shares outstanding
         initial_liquidity = 1000.0
+        binary = outcomes == ["YES", "NO"]
         market = BettingMarket(
             id=market_id,
             event_id=event.id,
@@ -1230,14 +1313,18 @@ class EventOrchestrator:
             domain=event.domain,
             duration=duration,
             expires_at=expires_at,
-            outcomes=["YES", "NO"],
-            outcome_odds={"YES": 0.5, "NO": 0.5},  # Initial 50/50 odds
+            outcomes=outcomes,
+            outcome_odds={o: 1 / len(outcomes) for o in outcomes},  # Initial even odds
             yes_shares=initial_liquidity,
             no_shares=initial_liquidity,
+            cpmm_reserves=[] if binary or market_maker == "LMSR" else [initial_liquidity] * len(outcomes),
+            market_maker=market_maker,
+            liquidity_b=liquidity_b,
+            lmsr_quantities=[0.0] * len(outcomes) if market_maker == "LMSR" else [],
             virality_score=event.virality_score,
             source_event=event,
         )
-        # Ensure odds match CPMM state
+        # Ensure odds match the market maker state
         market.recalculate_odds_from_cpmm()
         
         self.markets[market_id] = market
@@ -1288,11 +1375,137 @@ class EventOrchestrator:
         """Get all open markets."""
         return [m for m in self.markets.values() if m.status == "OPEN"]
     
-    def _save_markets_state(self):
-        """Save all markets to disk."""
-        if not self.persistence:
+    def market_lock(self, market_id: str) -> asyncio.Lock:
+        """The lock serializing trades on one market."""
+        lock = self._market_locks.get(market_id)
+        if lock is None:
+            lock = self._market_locks[market_id] = asyncio.Lock()
+        return lock
+    
+    async def place_trade(
+        self,
+        market_id: str,
+        outcome: str,
+        amount: float,
+        debit: Optional[Callable[[], Awaitable[None]]] = None,
+    ) -> TradeFill:
+        """
+        Trade against a market's market maker (CPMM or LMSR) atomically.
+        
+        The pool is read, priced, charged for and written back under the
+        market's lock, so concurrent bets on one market never act on stale
+        reserves and x * y = k holds across them.
+        
+        Args:
+            market_id: Market to trade on
+            outcome: Outcome to buy
+            amount: Amount to spend
+            debit: Awaited after pricing, before the pool is updated; if it
+                raises (e.g. the balance can't be charged) the market is untouched.
+                It runs under the market's lock, so blocking work (a DB commit)
+                belongs in a worker thread to keep other markets trading
+        
+        Returns:
+            TradeFill with shares, price impact and the new odds
+        """
+        async with self.market_lock(market_id):
+            market = self.markets.get(market_id)
+            if market is None:
+                raise KeyError(market_id)
+            if market.status != "OPEN":
+                raise ValueError(f"Market is {market.status}, not accepting bets")
+            
+            engine = market.amm()
+            price_before = engine.get_current_odds().get(outcome, 0.5)
+            shares_received, price_impact, new_odds = engine.execute_trade(
+                outcome=outcome, amount_in=amount, apply_fee=True
+            )
+            
+            if debit is not None:
+                await debit()
+            
+            # Normalize if slightly off due to floating point
+            total_odds = sum(new_odds.values())
+            if abs(total_odds - 1.0) > 0.01:
+                new_odds = {o: p / total_odds for o, p in new_odds.items()}
+            
+            market.apply_amm(engine)
+            market.total_volume += amount
+            market.outcome_odds = new_odds
+            self.markets.touch(market_id)
+            self.record_trade(market, outcome, amount)
+        
+        return TradeFill(
+            shares_received=shares_received,
+            price_impact=price_impact,
+            price_before=price_before,
+            new_odds=new_odds,
+        )
+    
+    def record_trade(self, market: BettingMarket, outcome: str, amount: float):
+        """
+        Persist one trade by appending the market's new state to the journal.
+        
+        O(1) regardless of market count; the full snapshot is rewritten in
+        the background every JOURNAL_COMPACT_EVERY trades.
+        """
+        if not self.trade_journal:
+            self._save_markets_state()
             return
         
+        self.trade_journal.append(market.id, {
+            "outcome": outcome,
+            "amount": amount,
+            **market.amm_state(),
+            "total_volume": market.total_volume,
+            "outcome_odds": market.outcome_odds,
+        })
+        if self.trade_journal.pending >= JOURNAL_COMPACT_EVERY and not self._compacting:
+            self._compact_in_background()
+    
+    def _compact_in_background(self):
+        """Seal the journal and write a covering snapshot on a worker thread."""
+        sealed_seq, generation, markets_data, stats = self._take_snapshot()
+        self._compacting = True
+        
+        def compact():
+            try:
+                self._write_snapshot(sealed_seq, generation, markets_data, stats)
+            except Exception as e:
+                print(f"❌ Trade journal compaction failed: {e}")
+            finally:
+                self._compacting = False
+        
+        threading.Thread(target=compact, daemon=True, name="trade-journal-compaction").start()
+    
+    def _take_snapshot(self) -> Tuple[int, int, Dict[str, Any], Dict[str, Any]]:
+        """
+        Seal the journal and capture every market's state.
+        
+        Runs on the caller's thread, between trades, so the snapshot covers
+        exactly the trades up to the sealed sequence number.
+        """
+        sealed_seq = self.trade_journal.seal() if self.trade_journal else 0
+        self._snapshot_generation += 1
+        return sealed_seq, self._snapshot_generation, self._serialize_markets(), dict(self.stats)
+    
+    def _write_snapshot(self, sealed_seq: int, generation: int,
+                        markets_data: Dict[str, Any], stats: Dict[str, Any]):
+        """Write a snapshot unless a newer one already landed, then drop covered segments."""
+        with self._snapshot_lock:
+            if generation < self._written_generation:
+                return  # A newer snapshot already superseded this one
+            saved = self.persistence.save("markets", markets_data)
+            self.persistence.save("stats", stats)
+            if not saved:
+                return  # Keep the journal; it is still needed for recovery
+            self._written_generation = generation
+            if self.trade_journal:
+                self.trade_journal.discard_sealed(sealed_seq)
+        print(f"💾 Saved {len(markets_data)} markets to disk (including CPMM state)")
+    
+    def _serialize_markets(self) -> Dict[str, Any]:
+        """Every market as a JSON-ready dict, as stored in markets.json."""
         markets_data = {}
         for market_id, market in self.markets.items():
             markets_data[market_id] = {
@@ -1306,17 +1519,25 @@ class EventOrchestrator:
                 "created_at": market.created_at.isoformat() if hasattr(market.created_at, "isoformat") else str(market.created_at),
                 "expires_at": market.expires_at.isoformat() if market.expires_at and hasattr(market.expires_at, "isoformat") else None,
                 "outcomes": market.outcomes,
-                "outcome_odds": market.outcome_odds,
+                "outcome_odds": dict(market.outcome_odds),
                 "total_volume": market.total_volume,
                 "virality_score": market.virality_score,
                 # CRITICAL: Save CPMM state
                 "yes_shares": getattr(market, "yes_shares", 1000.0),
                 "no_shares": getattr(market, "no_shares", 1000.0),
+                "cpmm_reserves": list(market.cpmm_reserves),
+                "market_maker": market.market_maker,
+                "liquidity_b": market.liquidity_b,
+                "lmsr_quantities": list(market.lmsr_quantities),
             }
+        return markets_data
+    
+    def _save_markets_state(self):
+        """Save all markets to disk (a full snapshot; supersedes the trade journal)."""
+        if not self.persistence:
+            return
         
-        self.persistence.save("markets", markets_data)
-        self.persistence.save("stats", self.stats)
-        print(f"💾 Saved {len(markets_data)} markets to disk (including CPMM state)")
+        self._write_snapshot(*self._take_snapshot())
     
     def _load_markets_state(self):
         """Load markets from disk and restore BettingMarket objects."""
@@ -1349,6 +1570,10 @@ class EventOrchestrator:
                     total_volume=market_dict.get("total_volume", 0.0),
                     yes_shares=market_dict.get("yes_shares", 1000.0),
                     no_shares=market_dict.get("no_shares", 1000.0),
+                    cpmm_reserves=market_dict.get("cpmm_reserves", []),
+                    market_maker=market_dict.get("market_maker", "CPMM"),
+                    liquidity_b=market_dict.get("liquidity_b", 100.0),
+                    lmsr_quantities=market_dict.get("lmsr_quantities", []),
                     virality_score=market_dict.get("virality_score", 0.0),
                     source_event=None,  # Source event not saved, can be None
                 )
@@ -1360,6 +1585,24 @@ class EventOrchestrator:
                 continue
         
         print(f"📂 Loaded {len(self.markets)} markets from disk")
+        
+        # Re-apply trades journaled since the snapshot, oldest first
+        if self.trade_journal:
+            replayed = 0
+            for record in self.trade_journal.replay():
+                market = self.markets.get(record.get("market_id"))
+                if market is None:
+                    continue
+                for key in ("yes_shares", "no_shares", "cpmm_reserves", "lmsr_quantities"):
+                    if key in record:
+                        setattr(market, key, record[key])
+                market.total_volume = record["total_volume"]
+                market.outcome_odds = record["outcome_odds"]
+                self.markets.touch(market.id)
+                replayed += 1
+            if replayed:
+                print(f"📂 Replayed {replayed} journaled trades")
+                self._save_markets_state()
 
 
 
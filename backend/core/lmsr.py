@@ -0,0 +1,285 @@
+"""
+Logarithmic Market Scoring Rule (LMSR) Market Maker
+===================================================
+
+Hanson's automated market maker for N-outcome prediction markets.
+
+Cost function: C(q) = b * ln(sum_j exp(q_j / b))
+- q_j = outstanding shares of outcome j (each pays 1.0 if j wins)
+- b   = liquidity parameter, committed at market creation
+
+Price calculation:
+- Price of outcome i = exp(q_i / b) / sum_j exp(q_j / b)   (softmax of q / b)
+- Prices are always positive and sum to exactly 1.00
+
+Trading:
+- Buying d shares of outcome i costs C(q + d * e_i) - C(q)
+- Higher b = deeper market: prices move less per trade, more capital at risk
+
+Bounded loss:
+- The market maker can lose at most b * ln(N), whatever the trades
+
+All exponentials are taken relative to the largest q_j / b (log-sum-exp),
+so pricing stays finite however lopsided the market gets.
+
+Reference: Hanson (2003), "Combinatorial Information Market Design"
+"""
+
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from backend.core.cpmm import CPMMQuotes
+
+
+def _logsumexp(x: np.ndarray) -> float:
+    """ln(sum(exp(x))) without overflow."""
+    top = np.max(x)
+    return float(top + np.log(np.sum(np.exp(x - top))))
+
+
+def _log_expm1(x):
+    """ln(exp(x) - 1) for x > 0, stable for both tiny and huge x."""
+    x = np.asarray(x, dtype=float)
+    return np.where(x > 30.0, x + np.log1p(-np.exp(-np.minimum(x, 700.0))), np.log(np.expm1(np.minimum(x, 30.0))))
+
+
+@dataclass
+class LMSRState:
+    """State of an LMSR market."""
+    outcomes: List[str]
+    quantities: np.ndarray  # Outstanding shares per outcome, aligned with outcomes
+    b: float                # Liquidity parameter
+    _index: Dict[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.quantities = np.array(self.quantities, dtype=float)  # Own copy: trades mutate it
+        if self.b <= 0:
+            raise ValueError("Liquidity parameter b must be positive")
+        if len(self.outcomes) < 2 or len(self.outcomes) != len(self.quantities):
+            raise ValueError("Need at least two outcomes, one quantity each")
+        self._index = {outcome.upper(): i for i, outcome in enumerate(self.outcomes)}
+
+    def index(self, outcome: str) -> int:
+        """Position of an outcome in the quantity vector."""
+        try:
+            return self._index[outcome.upper()]
+        except KeyError:
+            raise ValueError(f"Unknown outcome: {outcome}") from None
+
+    @property
+    def cost(self) -> float:
+        """C(q) = b * ln(sum exp(q / b))"""
+        return self.b * _logsumexp(self.quantities / self.b)
+
+    @property
+    def max_loss(self) -> float:
+        """Worst-case market maker loss, b * ln(N)."""
+        return self.b * np.log(len(self.outcomes))
+
+    def price_vector(self) -> np.ndarray:
+        """Prices of all outcomes, aligned with outcomes (sum to 1)."""
+        z = self.quantities / self.b
+        weights = np.exp(z - np.max(z))
+        return weights / np.sum(weights)
+
+    def log_price(self, outcome: str) -> float:
+        """ln(price) of an outcome, exact even when the price underflows."""
+        z = self.quantities / self.b
+        return float(z[self.index(outcome)] - _logsumexp(z))
+
+    def get_price(self, outcome: str) -> float:
+        """Get current price for an outcome (0.0 to 1.0)"""
+        return float(self.price_vector()[self.index(outcome)])
+
+    def get_all_prices(self) -> Dict[str, float]:
+        """Get prices for all outcomes"""
+        return dict(zip(self.outcomes, self.price_vector().tolist()))
+
+    def verify_no_arbitrage(self, tolerance: float = 0.01) -> bool:
+        """Verify that prices sum to ≈ 1.00 (within tolerance)"""
+        return abs(float(np.sum(self.price_vector())) - 1.0) <= tolerance
+
+
+class LMSR:
+    """
+    LMSR market maker for N-outcome prediction markets.
+
+    Same interface as CPMM: calculate_shares_out, calculate_amount_in,
+    execute_trade, quote_many and get_current_odds.
+    """
+
+    def __init__(
+        self,
+        outcomes: Sequence[str] = ("YES", "NO"),
+        liquidity_b: float = 100.0,
+        quantities: Optional[Sequence[float]] = None
+    ):
+        """
+        Initialize LMSR with no shares outstanding (uniform prices).
+
+        Args:
+            outcomes: Outcome names (at least two)
+            liquidity_b: Liquidity parameter b (default: 100)
+            quantities: Outstanding shares per outcome, to restore a market
+        """
+        if quantities is None:
+            quantities = np.zeros(len(outcomes))
+        self.state = LMSRState(outcomes=list(outcomes), quantities=quantities, b=liquidity_b)
+        self.fee_rate = 0.03  # 3% fee, same as CPMM
+
+    def calculate_shares_out(
+        self,
+        outcome: str,
+        amount_in: float,
+        apply_fee: bool = True
+    ) -> Tuple[float, float]:
+        """
+        Calculate how many shares you get for a given amount.
+
+        Solving C(q + d * e_i) - C(q) = a for d gives, in closed form,
+        d = b * ln(1 + (exp(a / b) - 1) / p_i), evaluated in log space.
+
+        Args:
+            outcome: Outcome to buy
+            amount_in: Amount of capital to invest
+            apply_fee: Whether to apply trading fee
+
+        Returns:
+            Tuple of (shares_out, price_impact)
+        """
+        shares_out, log_p, new_log_p = self._fill(outcome, amount_in, apply_fee)
+        return shares_out, abs(math.exp(new_log_p) - math.exp(log_p))
+
+    def calculate_amount_in(
+        self,
+        outcome: str,
+        shares_out: float,
+        apply_fee: bool = True
+    ) -> float:
+        """
+        Calculate how much capital is needed to get a certain number of shares.
+
+        This is the inverse of calculate_shares_out:
+        a = b * ln(1 + p_i * (exp(d / b) - 1)).
+
+        Args:
+            outcome: Outcome to buy
+            shares_out: Desired number of shares
+            apply_fee: Whether to account for trading fee
+
+        Returns:
+            Amount of capital needed
+        """
+        if shares_out <= 0:
+            return 0.0
+
+        b = self.state.b
+        log_p = self.state.log_price(outcome)
+        amount_needed = b * float(np.logaddexp(0.0, log_p + _log_expm1(shares_out / b)))
+
+        if apply_fee:
+            return amount_needed / (1 - self.fee_rate)
+        return amount_needed
+
+    def quote_many(
+        self,
+        outcome: str,
+        amounts: Sequence[float],
+        apply_fee: bool = True
+    ) -> CPMMQuotes:
+        """
+        Price many trade sizes at once, without changing the market state.
+
+        Args:
+            outcome: Outcome to buy
+            amounts: Amounts of capital to quote (non-positive amounts quote as 0)
+            apply_fee: Whether to apply trading fee
+
+        Returns:
+            CPMMQuotes with shares, price impact and post-trade prices per amount
+        """
+        i = self.state.index(outcome)
+        b = self.state.b
+        amounts = np.asarray(amounts, dtype=float)
+        spend = np.where(amounts > 0, amounts, 0.0)
+        if apply_fee:
+            spend = spend * (1 - self.fee_rate)
+
+        z = self.state.quantities / b
+        log_total = _logsumexp(z)
+        log_p = z[i] - log_total
+
+        with np.errstate(divide="ignore"):
+            shares = np.where(
+                spend > 0,
+                b * np.logaddexp(0.0, _log_expm1(np.where(spend > 0, spend, 1.0) / b) - log_p),
+                0.0,
+            )
+
+        # Post-trade prices, one row per amount. The cost rises by exactly
+        # the amount spent, so the new log-normalizer is log_total + spend / b
+        new_log_total = log_total + spend / b
+        new_z = np.broadcast_to(z, (len(amounts), len(z))).copy()
+        new_z[:, i] += shares / b
+        new_prices = np.exp(new_z - new_log_total[:, None])
+
+        return CPMMQuotes(
+            outcome=self.state.outcomes[i],
+            amounts=amounts,
+            shares_out=shares,
+            price_impact=np.abs(new_prices[:, i] - np.exp(log_p)),
+            new_prices={name: new_prices[:, j] for j, name in enumerate(self.state.outcomes)},
+        )
+
+    def execute_trade(
+        self,
+        outcome: str,
+        amount_in: float,
+        apply_fee: bool = True
+    ) -> Tuple[float, float, Dict[str, float]]:
+        """
+        Execute a trade and update the market state.
+
+        Args:
+            outcome: Outcome to buy
+            amount_in: Amount of capital to invest
+            apply_fee: Whether to apply trading fee
+
+        Returns:
+            Tuple of (shares_received, price_impact, new_prices)
+        """
+        shares_out, price_impact = self.calculate_shares_out(outcome, amount_in, apply_fee)
+        self.state.quantities[self.state.index(outcome)] += shares_out
+        return shares_out, price_impact, self.state.get_all_prices()
+
+    def _fill(self, outcome: str, amount_in: float, apply_fee: bool) -> Tuple[float, float, float]:
+        """Shares bought for amount_in, with ln(price) of the outcome before and after."""
+        log_p = self.state.log_price(outcome)
+        if amount_in <= 0:
+            return 0.0, log_p, log_p
+
+        b = self.state.b
+        spend = amount_in * (1 - self.fee_rate) if apply_fee else amount_in
+        shares_out = b * float(np.logaddexp(0.0, float(_log_expm1(spend / b)) - log_p))
+        # C rises by exactly `spend`; q_i rises by shares_out
+        return shares_out, log_p, log_p + (shares_out - spend) / b
+
+    def get_current_odds(self) -> Dict[str, float]:
+        """
+        Get current odds (prices) for all outcomes.
+
+        Returns:
+            Dictionary mapping outcome to price (0.0 to 1.0)
+        """
+        return self.state.get_all_prices()
+
+    def get_liquidity(self) -> Dict[str, float]:
+        """Get outstanding shares per outcome, plus b and the worst-case loss"""
+        return {
+            **dict(zip(self.state.outcomes, self.state.quantities.tolist())),
+            "b": self.state.b,
+            "max_loss": self.state.max_loss,
+        }
@@ -0,0 +1,217 @@
+"""
+market_index.py - Indexed in-memory market store
+
+The /markets listing and trending endpoints used to copy every market,
+filter with list comprehensions, fully sort, and re-derive each market's
+odds on every request. MarketStore is the orchestrator's `markets` dict
+with indexes kept up to date as markets are added, traded or removed:
+
+- Secondary indexes: market ids by status, domain and duration
+- Rankings: sorted key lists by virality and by volume (bisect insert/remove)
+- Payload cache: each market's to_dict() until the market changes
+
+A listing is then a walk down one ranking (or a k-smallest over the
+smallest matching index when filters are selective): O(k log n), not
+O(n log n).
+
+Markets are mutated in place (trades, status changes). Whoever does that
+must call `touch(market_id)` afterwards; adding, replacing or deleting
+through the dict interface is indexed automatically.
+"""
+
+import bisect
+import heapq
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+RANKINGS = ("virality", "volume")
+
+
+def _rank_keys(market) -> Dict[str, Tuple]:
+    """Sort keys per ranking, best first (ascending); the id makes them unique."""
+    return {
+        "virality": (-market.virality_score, market.id),
+        "volume": (-market.total_volume, -market.virality_score, market.id),
+    }
+
+
+class MarketStore(dict):
+    """
+    Dict of market id -> BettingMarket with secondary indexes and rankings.
+
+    Usage:
+        store = MarketStore()
+        store[market.id] = market                 # Indexed
+
+        market.total_volume += 10                 # In-place change...
+        store.touch(market.id)                    # ...re-indexed
+
+        store.query(status="OPEN", domain="sports", order="virality", limit=20)
+        store.payload(market.id)                  # Cached market.to_dict()
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self._by_status: Dict[str, Set[str]] = {}
+        self._by_domain: Dict[str, Set[str]] = {}
+        self._by_duration: Dict[str, Set[str]] = {}
+        self._rankings: Dict[str, List[Tuple]] = {name: [] for name in RANKINGS}
+        self._entries: Dict[str, Tuple[str, str, str, Dict[str, Tuple]]] = {}
+        self._payloads: Dict[str, Dict[str, Any]] = {}
+        self.update(*args, **kwargs)
+
+    # ------------------------------------------------------------------
+    # dict interface (kept in sync with the indexes)
+    # ------------------------------------------------------------------
+
+    def __setitem__(self, market_id: str, market):
+        super().__setitem__(market_id, market)
+        self.touch(market_id)
+
+    def __delitem__(self, market_id: str):
+        super().__delitem__(market_id)
+        self._unindex(market_id)
+
+    def pop(self, market_id: str, *default):
+        if market_id in self:
+            self._unindex(market_id)
+        return super().pop(market_id, *default)
+
+    def popitem(self):
+        market_id, market = super().popitem()
+        self._unindex(market_id)
+        return market_id, market
+
+    def setdefault(self, market_id: str, market=None):
+        if market_id not in self:
+            self[market_id] = market
+        return self[market_id]
+
+    def update(self, *args, **kwargs):
+        for market_id, market in dict(*args, **kwargs).items():
+            self[market_id] = market
+
+    def clear(self):
+        super().clear()
+        for index in (self._by_status, self._by_domain, self._by_duration):
+            index.clear()
+        for ranking in self._rankings.values():
+            ranking.clear()
+        self._entries.clear()
+        self._payloads.clear()
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
+
+    def touch(self, market_id: str):
+        """Re-index a market after an in-place change and drop its cached payload."""
+        self._unindex(market_id)
+        market = self.get(market_id)
+        if market is None:
+            return
+
+        entry = (
+            market.status.upper(),
+            market.domain.value,
+            market.duration.value,
+            _rank_keys(market),
+        )
+        self._entries[market_id] = entry
+        self._by_status.setdefault(entry[0], set()).add(market_id)
+        self._by_domain.setdefault(entry[1], set()).add(market_id)
+        self._by_duration.setdefault(entry[2], set()).add(market_id)
+        for name, key in entry[3].items():
+            bisect.insort(self._rankings[name], key)
+
+    def _unindex(self, market_id: str):
+        self._payloads.pop(market_id, None)
+        entry = self._entries.pop(market_id, None)
+        if entry is None:
+            return
+        for index, value in zip((self._by_status, self._by_domain, self._by_duration), entry):
+            ids = index.get(value)
+            if ids is not None:
+                ids.discard(market_id)
+                if not ids:
+                    del index[value]
+        for name, key in entry[3].items():
+            ranking = self._rankings[name]
+            i = bisect.bisect_left(ranking, key)
+            if i < len(ranking) and ranking[i] == key:
+                del ranking[i]
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _filters(self, status: Optional[str], domain: Optional[str],
+                 duration: Optional[str]) -> List[Set[str]]:
+        filters = []
+        if status:
+            filters.append(self._by_status.get(status.upper(), set()))
+        if domain:
+            filters.append(self._by_domain.get(domain.lower(), set()))
+        if duration:
+            filters.append(self._by_duration.get(duration.lower(), set()))
+        return filters
+
+    def iter_ranked(self, order: str = "virality", status: Optional[str] = None,
+                    domain: Optional[str] = None, duration: Optional[str] = None) -> Iterator:
+        """Yield matching markets best first, lazily, by walking one ranking."""
+        filters = self._filters(status, domain, duration)
+        for key in self._rankings[order]:
+            market_id = key[-1]
+            if all(market_id in ids for ids in filters):
+                yield self[market_id]
+
+    def query(self, status: Optional[str] = None, domain: Optional[str] = None,
+              duration: Optional[str] = None, order: str = "virality", limit: int = 50) -> List:
+        """
+        Top `limit` markets matching every given filter, best first.
+
+        Args:
+            status: Market status (case-insensitive), e.g. "OPEN"
+            domain: EventDomain value, e.g. "sports"
+            duration: BetDuration value, e.g. "micro"
+            order: "virality" or "volume"
+            limit: Maximum markets returned
+        """
+        if limit <= 0:
+            return []
+        filters = self._filters(status, domain, duration)
+        ranking = self._rankings[order]
+        if not filters:
+            return [self[key[-1]] for key in ranking[:limit]]
+
+        # Walking the ranking visits ~limit * n / m keys for m matches; a
+        # k-smallest over the smallest index costs ~m log k. Pick the cheaper.
+        filters.sort(key=len)
+        smallest, rest = filters[0], filters[1:]
+        if len(smallest) * len(smallest) >= len(ranking) * limit:
+            ranked = self.iter_ranked(order, status, domain, duration)
+            return [market for market, _ in zip(ranked, range(limit))]
+
+        keys = (
+            self._entries[market_id][3][order]
+            for market_id in smallest
+            if all(market_id in ids for ids in rest)
+        )
+        return [self[key[-1]] for key in heapq.nsmallest(limit, keys)]
+
+    def count(self, status: Optional[str] = None, domain: Optional[str] = None,
+              duration: Optional[str] = None) -> int:
+        """Number of markets matching every given filter."""
+        filters = self._filters(status, domain, duration)
+        if not filters:
+            return len(self)
+        filters.sort(key=len)
+        return sum(1 for market_id in filters[0] if all(market_id in ids for ids in filters[1:]))
+
+    def payload(self, market_id: str) -> Dict[str, Any]:
+        """market.to_dict(), cached until the market is touched."""
+        cached = self._payloads.get(market_id)
+        if cached is None:
+            cached = self[market_id].to_dict()
+            cached["outcome_odds"] = dict(cached["outcome_odds"])  # Detach from the market
+            self._payloads[market_id] = cached
+        return cached
@@ -0,0 +1,191 @@
+"""
+trade_journal.py - Write-ahead journal for market trades
+
+Placing a bet used to rewrite markets.json in full. With the journal, a bet
+appends one compact JSON line holding the market's post-trade CPMM state,
+so persisting a trade costs the same however many markets exist.
+
+- On startup the journal is replayed over the last markets snapshot
+- Every so often the active segment is sealed, a fresh snapshot is
+  written, and sealed segments the snapshot covers are deleted
+- Records carry absolute post-trade state, not deltas, so replaying a
+  record the snapshot already reflects is harmless
+- A torn final line (crash mid-append) is truncated on open, so a trade
+  is either fully journaled or not at all
+
+Layout (data/journal/):
+    trades.journal                 active segment, appended per trade
+    trades.<last_seq>.sealed       sealed segments awaiting compaction
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+ACTIVE_SEGMENT = "trades.journal"
+SEALED_SUFFIX = ".sealed"
+
+
+class TradeJournal:
+    """
+    Append-only, segmented journal of trades.
+
+    Usage:
+        journal = TradeJournal(Path("data/journal"))
+
+        # Per trade: O(1)
+        journal.append("MKT_123", {"yes_shares": 1010.0, "no_shares": 990.1})
+
+        # Startup: replay everything not yet compacted
+        for record in journal.replay():
+            ...
+
+        # Compaction: seal, snapshot everything up to `seq`, then discard
+        seq = journal.seal()
+        ...write snapshot...
+        journal.discard_sealed(seq)
+    """
+
+    def __init__(self, journal_dir: Path, fsync: bool = False):
+        """
+        Args:
+            journal_dir: Directory holding the journal segments
+            fsync: fsync after every append (survives power loss, not just
+                process crashes, at the cost of one disk flush per trade)
+        """
+        self.journal_dir = Path(journal_dir)
+        self.journal_dir.mkdir(parents=True, exist_ok=True)
+        self._fsync = fsync
+        self._lock = threading.Lock()
+        self._active_path = self.journal_dir / ACTIVE_SEGMENT
+
+        self._repair_torn_tail()
+        self._seq = 0
+        self._pending = 0
+        for path in self._segments():
+            for record in self._read_segment(path):
+                self._seq = max(self._seq, record.get("seq", 0))
+                if path == self._active_path:
+                    self._pending += 1
+        self._file = open(self._active_path, "a", encoding="utf-8")
+
+    @property
+    def seq(self) -> int:
+        """Sequence number of the last appended trade."""
+        return self._seq
+
+    @property
+    def pending(self) -> int:
+        """Trades in the active segment (appended since the last seal)."""
+        return self._pending
+
+    def append(self, market_id: str, state: Dict[str, Any]) -> int:
+        """
+        Journal one trade.
+
+        Args:
+            market_id: Market the trade was placed on
+            state: The market's state after the trade (JSON-serializable)
+
+        Returns:
+            The trade's sequence number
+        """
+        with self._lock:
+            self._seq += 1
+            record = {"seq": self._seq, "market_id": market_id, **state}
+            self._file.write(json.dumps(record, separators=(",", ":"), default=str) + "\n")
+            self._file.flush()
+            if self._fsync:
+                os.fsync(self._file.fileno())
+            self._pending += 1
+            return self._seq
+
+    def replay(self) -> Iterator[Dict[str, Any]]:
+        """Yield every journaled trade, oldest first (sealed segments, then active)."""
+        with self._lock:
+            self._file.flush()
+            segments = self._segments()
+        for path in segments:
+            yield from self._read_segment(path)
+
+    def seal(self) -> int:
+        """
+        Close the active segment so a snapshot can supersede it.
+
+        Returns:
+            The sequence number a snapshot taken now covers
+        """
+        with self._lock:
+            if self._pending:
+                self._file.close()
+                self._active_path.rename(
+                    self.journal_dir / f"trades.{self._seq:012d}{SEALED_SUFFIX}"
+                )
+                self._file = open(self._active_path, "a", encoding="utf-8")
+                self._pending = 0
+            return self._seq
+
+    def discard_sealed(self, up_to_seq: int) -> int:
+        """
+        Delete sealed segments whose trades are all at or before `up_to_seq`.
+
+        Call only once a snapshot covering `up_to_seq` is safely on disk.
+
+        Returns:
+            Number of segments deleted
+        """
+        deleted = 0
+        for last_seq, path in self._sealed_segments():
+            if last_seq <= up_to_seq:
+                path.unlink(missing_ok=True)
+                deleted += 1
+        return deleted
+
+    def close(self):
+        """Close the active segment."""
+        with self._lock:
+            self._file.close()
+
+    def _sealed_segments(self) -> List[Tuple[int, Path]]:
+        segments = []
+        for path in self.journal_dir.glob(f"trades.*{SEALED_SUFFIX}"):
+            try:
+                segments.append((int(path.name.split(".")[1]), path))
+            except ValueError:
+                continue
+        return sorted(segments)
+
+    def _segments(self) -> List[Path]:
+        paths = [path for _, path in self._sealed_segments()]
+        if self._active_path.exists():
+            paths.append(self._active_path)
+        return paths
+
+    @staticmethod
+    def _read_segment(path: Path) -> Iterator[Dict[str, Any]]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        print(f"⚠️ Skipping corrupt journal record in {path.name}")
+        except FileNotFoundError:
+            return  # Discarded by a compaction while we were reading
+
+    def _repair_torn_tail(self):
+        """Truncate a partial last line left by a crash mid-append."""
+        path = self._active_path
+        if not path.exists():
+            return
+        data = path.read_bytes()
+        if not data or data.endswith(b"\n"):
+            return
+        keep = data.rfind(b"\n") + 1
+        with open(path, "r+b") as f:
+            f.truncate(keep)
+        print(f"⚠️ Truncated torn trade journal record ({len(data) - keep} bytes)")
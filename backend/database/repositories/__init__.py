@@ -10,11 +10,13 @@ from .timeline_repository import TimelineRepository
 from .agent_repository import AgentRepository
 from .paradox_repository import ParadoxRepository
 from .user_repository import UserRepository
+from .theatre_repository import TheatreRepository
 
 __all__ = [
     "TimelineRepository",
     "AgentRepository",
     "ParadoxRepository",
     "UserRepository",
+    "TheatreRepository",
 ]
 
@@ -0,0 +1,57 @@
+"""
+Theatre Repository
+==================
+
+Repository pattern for Theatre result persistence.
+
+Episode scores and audit events are written with Core ``insert()`` over
+lists of plain dicts, executed in chunks. SQLAlchemy turns each chunk into
+an executemany (multi-row VALUES on PostgreSQL), and no ORM objects
+enter the identity map. All chunks run in the caller's transaction, so
+the write remains all-or-nothing.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import TheatreAuditEvent, TheatreEpisodeScore
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def _chunks(rows: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    chunk: List[Dict[str, Any]] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class TheatreRepository:
+    """Repository for bulk Theatre result writes."""
+
+    def __init__(self, session: AsyncSession, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+        self.session = session
+        self.chunk_size = chunk_size
+
+    async def bulk_insert_episode_scores(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """Insert TheatreEpisodeScore rows given as column dicts. Returns row count."""
+        return await self._bulk_insert(TheatreEpisodeScore, rows)
+
+    async def bulk_insert_audit_events(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """Insert TheatreAuditEvent rows given as column dicts. Returns row count."""
+        return await self._bulk_insert(TheatreAuditEvent, rows)
+
+    async def _bulk_insert(self, model: type, rows: Iterable[Dict[str, Any]]) -> int:
+        count = 0
+        for chunk in _chunks(rows, self.chunk_size):
+            await self.session.execute(insert(model), chunk)
+            count += len(chunk)
+        return count
@@ -1,4 +1,5 @@
 import uvicorn
+import asyncio
 import json
 import subprocess 
 import re 
@@ -636,10 +637,10 @@ class BetPlacement(BaseModel):
     
     @validator('outcome')
     def validate_outcome(cls, v):
-        """Validate outcome is YES or NO."""
+        """Normalize outcome (checked against the market's outcomes when placed)."""
         v = v.upper().strip()
-        if v not in ['YES', 'NO']:
-            raise ValueError("Outcome must be 'YES' or 'NO'")
+        if not v:
+            raise ValueError("Outcome is required")
         return v
     
     @validator('amount')
@@ -648,6 +649,16 @@ class BetPlacement(BaseModel):
         return BetAmountValidator.validate(v)
 
 
+class BatchQuoteRequest(BaseModel):
+    amounts: list[float] = Field(..., min_length=1, max_length=500)
+    outcomes: list[str] | None = None  # Default: every outcome of the market
+    
+    @validator('amounts', each_item=True)
+    def validate_amounts(cls, v):
+        """Validate each amount as a bet amount."""
+        return BetAmountValidator.validate(v)
+
+
 class MarketBetResponse(BaseModel):
     success: bool
     message: str
@@ -682,22 +693,10 @@ async def list_markets(
 ):
     try:
         orchestrator = get_orchestrator()
-        markets = list(orchestrator.markets.values())
-
-        if status:
-            markets = [m for m in markets if m.status.upper() == status.upper()]
-        if domain:
-            markets = [m for m in markets if m.domain.value == domain.lower()]
-        if duration:
-            markets = [m for m in markets if m.duration.value == duration.lower()]
-
-        markets.sort(key=lambda m: m.virality_score, reverse=True)
-        markets = markets[:limit]
+        markets = orchestrator.markets.query(
+            status=status, domain=domain, duration=duration, order="virality", limit=limit
+        )
 
-        # Recalculate odds from CPMM before returning
-        for m in markets:
-            m.recalculate_odds_from_cpmm()
-        
         # DEBUG: Log sample market's CPMM state
         if markets and len(markets) > 0:
             sample = markets[0]
@@ -708,26 +707,8 @@ async def list_markets(
             print(f"   total_volume: {sample.total_volume}")
 
         return {
-            "markets": [
-                {
-                    "id": m.id,
-                    "title": m.title,
-                    "description": m.description,
-                    "domain": m.domain.value,
-                    "duration": m.duration.value,
-                    "status": m.status,
-                    "created_at": m.created_at.isoformat(),
-                    "expires_at": m.expires_at.isoformat() if m.expires_at else None,
-                    "outcomes": m.outcomes,
-                    "outcome_odds": m.outcome_odds,  # Now recalculated from CPMM
-                    "total_volume": m.total_volume,
-                    "virality_score": m.virality_score,
-                    # Include CPMM state for debugging
-                    "yes_shares": m.yes_shares,
-                    "no_shares": m.no_shares,
-                }
-                for m in markets
-            ],
+            # Cached per market until it changes; odds recalculated from CPMM
+            "markets": [orchestrator.markets.payload(m.id) for m in markets],
             "total": len(orchestrator.markets),
             "filtered": len(markets),
         }
@@ -748,55 +729,24 @@ async def get_trending_markets(limit: int = 3):
     """
     try:
         orchestrator = get_orchestrator()
-        markets = list(orchestrator.markets.values())
-        
-        # Filter only OPEN markets
-        open_markets = [m for m in markets if m.status.upper() == "OPEN"]
         
-        # Remove duplicates by market title (normalized)
+        # Walk OPEN markets by total_volume (descending), then by
+        # virality_score as tiebreaker, until `limit` unique titles are found.
+        # Of markets sharing a title, the highest-ranked one is returned
         seen_titles = set()
-        unique_markets = []
-        for market in open_markets:
+        trending = []
+        for market in orchestrator.markets.iter_ranked(order="volume", status="OPEN"):
+            if len(trending) >= limit:
+                break
             # Normalize title for comparison (lowercase, remove special chars)
             normalized_title = market.title.lower().strip()
             if normalized_title not in seen_titles:
                 seen_titles.add(normalized_title)
-                unique_markets.append(market)
-        
-        # Sort by total_volume (descending), then by virality_score as tiebreaker
-        unique_markets.sort(
-            key=lambda m: (m.total_volume, m.virality_score),
-            reverse=True
-        )
-        
-        # Take top N markets
-        trending = unique_markets[:limit]
-        
-        # Recalculate odds from CPMM before returning
-        for m in trending:
-            m.recalculate_odds_from_cpmm()
+                trending.append(market)
         
         return {
-            "markets": [
-                {
-                    "id": m.id,
-                    "title": m.title,
-                    "description": m.description,
-                    "domain": m.domain.value,
-                    "duration": m.duration.value,
-                    "status": m.status,
-                    "created_at": m.created_at.isoformat(),
-                    "expires_at": m.expires_at.isoformat() if m.expires_at else None,
-                    "outcomes": m.outcomes,
-                    "outcome_odds": m.outcome_odds,  # Now recalculated from CPMM
-                    "total_volume": m.total_volume,
-                    "virality_score": m.virality_score,
-                    # Include CPMM state for debugging
-                    "yes_shares": m.yes_shares,
-                    "no_shares": m.no_shares,
-                }
-                for m in trending
-            ],
+            # Cached per market until it changes; odds recalculated from CPMM
+            "markets": [orchestrator.markets.payload(m.id) for m in trending],
             "total": len(trending),
         }
     except Exception as e:
@@ -910,13 +860,7 @@ async def create_market(market: MarketCreate):
             virality_score=75,
         )
 
-        betting_market = orchestrator.create_market(event)
-
-        if market.outcomes and market.outcomes != ["YES", "NO"]:
-            betting_market.outcomes = market.outcomes
-            betting_market.outcome_odds = {
-                o: 1.0 / len(market.outcomes) for o in market.outcomes
-            }
+        betting_market = orchestrator.create_market(event, outcomes=market.outcomes or None)
 
         agents = orchestrator.dispatch_agents(betting_market)
 
@@ -1029,63 +973,56 @@ async def place_bet(
         if current_user.play_money_balance < bet.amount:
             raise HTTPException(status_code=400, detail="Insufficient balance")
 
-        # Use CPMM for odds calculation
-        from backend.core.cpmm import CPMM
-        
-        # Initialize CPMM with current market liquidity
-        cpmm = CPMM(initial_liquidity=1.0)  # Will be overridden
-        cpmm.state.yes_shares = getattr(market, 'yes_shares', 1000.0)
-        cpmm.state.no_shares = getattr(market, 'no_shares', 1000.0)
-        
-        # DEBUG: Log shares BEFORE bet
-        print(f"🔍 [BET DEBUG] Market {market_id} BEFORE bet:")
-        print(f"   yes_shares: {cpmm.state.yes_shares}")
-        print(f"   no_shares: {cpmm.state.no_shares}")
-        print(f"   bet: {bet.outcome} ${bet.amount}")
-        
-        # Get current odds before trade
-        current_odds = cpmm.get_current_odds()
-        current_price = current_odds.get(bet.outcome, 0.5)
-        
-        # Execute trade through CPMM
-        shares_received, price_impact, new_odds = cpmm.execute_trade(
-            outcome=bet.outcome,
-            amount_in=bet.amount,
-            apply_fee=True
-        )
-        
+        def charge() -> float:
+            # Runs in a worker thread, so it opens its own session rather than
+            # sharing the request's. Conditional UPDATE, so bets by this user on
+            # other markets (other locks) can never both spend the same balance
+            charge_db = SessionLocal()
+            try:
+                charged = (
+                    charge_db.query(DBUser)
+                    .filter(DBUser.id == current_user.id, DBUser.play_money_balance >= bet.amount)
+                    .update(
+                        {DBUser.play_money_balance: DBUser.play_money_balance - bet.amount},
+                        synchronize_session=False,
+                    )
+                )
+                if not charged:
+                    charge_db.rollback()
+                    raise HTTPException(status_code=400, detail="Insufficient balance")
+                charge_db.commit()
+                return (
+                    charge_db.query(DBUser.play_money_balance)
+                    .filter(DBUser.id == current_user.id)
+                    .scalar()
+                )
+            finally:
+                charge_db.close()
+
+        new_balance = current_user.play_money_balance
+
+        async def debit():
+            # Runs under the market lock; keep the blocking commit off the loop
+            nonlocal new_balance
+            new_balance = await asyncio.to_thread(charge)
+
+        # Price, charge and apply the trade atomically on this market's CPMM pool
+        try:
+            fill = await orchestrator.place_trade(market_id, bet.outcome, bet.amount, debit=debit)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        price_impact = fill.price_impact
+
         # Calculate potential payout (shares * final price if outcome wins)
         # For binary markets, if you win, you get: shares * (1 / final_price)
         # Simplified: payout = bet_amount * (1 / current_price) * (1 - fee)
-        potential_payout = bet.amount * (1 / current_price) * 0.97  # 3% fee
-        
-        # Update user balance
-        current_user.play_money_balance -= bet.amount
-        db.commit()
-        db.refresh(current_user)
-
-        # Update market state
-        market.total_volume += bet.amount
-        market.yes_shares = cpmm.state.yes_shares
-        market.no_shares = cpmm.state.no_shares
-        market.outcome_odds = new_odds
-        
+        potential_payout = bet.amount * (1 / fill.price_before) * 0.97  # 3% fee
+
         # DEBUG: Log shares AFTER bet
         print(f"🔍 [BET DEBUG] Market {market_id} AFTER bet:")
         print(f"   yes_shares: {market.yes_shares}")
         print(f"   no_shares: {market.no_shares}")
-        print(f"   new_odds: {new_odds}")
-        
-        # CRITICAL: Save markets state after bet to persist CPMM state
-        orchestrator._save_markets_state()
-        
-        # Verify no-arbitrage (YES + NO should ≈ 1.0)
-        total_odds = sum(new_odds.values())
-        if abs(total_odds - 1.0) > 0.01:
-            # Normalize if slightly off due to floating point
-            for outcome in new_odds:
-                new_odds[outcome] = new_odds[outcome] / total_odds
-            market.outcome_odds = new_odds
+        print(f"   new_odds: {fill.new_odds}")
         
         bet_id = f"BET_{market_id}_{datetime.now().strftime('%H%M%S')}"
 
@@ -1093,7 +1030,7 @@ async def place_bet(
             success=True,
             message=f"Bet placed on {bet.outcome}. Price impact: {price_impact:.2%}",
             bet_id=bet_id,
-            new_balance=current_user.play_money_balance,
+            new_balance=new_balance,
             potential_payout=round(potential_payout, 2),
         )
     except HTTPException:
@@ -1137,28 +1074,18 @@ async def get_market_quote(
         if amount <= 0:
             raise HTTPException(status_code=400, detail="Amount must be positive")
         
-        # Use CPMM to calculate quote
-        from backend.core.cpmm import CPMM
-        
-        cpmm = CPMM(initial_liquidity=1.0)
-        cpmm.state.yes_shares = getattr(market, 'yes_shares', 1000.0)
-        cpmm.state.no_shares = getattr(market, 'no_shares', 1000.0)
+        # Use the market's market maker to calculate quote
+        cpmm = market.amm()  # CPMM or LMSR, per market
         
         # Get current odds
         current_odds = cpmm.get_current_odds()
         current_price = current_odds.get(outcome, 0.5)
         
         # Calculate what would happen if bet is placed (without executing)
-        # Create a temporary CPMM to simulate the trade
-        temp_cpmm = CPMM(initial_liquidity=1.0)
-        temp_cpmm.state.yes_shares = cpmm.state.yes_shares
-        temp_cpmm.state.no_shares = cpmm.state.no_shares
-        
-        shares_received, price_impact, new_odds = temp_cpmm.execute_trade(
-            outcome=outcome,
-            amount_in=amount,
-            apply_fee=True
-        )
+        quote = cpmm.quote_many(outcome, [amount])
+        shares_received = float(quote.shares_out[0])
+        price_impact = float(quote.price_impact[0])
+        new_odds = {k: float(v[0]) for k, v in quote.new_prices.items()}
         
         # Calculate potential payout
         potential_payout = amount * (1 / current_price) * 0.97  # 3% fee
@@ -1185,6 +1112,66 @@ async def get_market_quote(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/markets/{market_id}/quotes")
+@limiter.limit(RATE_LIMITS["general"])
+async def get_market_quotes(
+    request: Request,
+    market_id: str,
+    batch: BatchQuoteRequest
+):
+    """
+    Quote many bet sizes (and outcomes) in one call, e.g. a slippage curve.
+    
+    Each amount is priced independently against the current pool; results
+    are column arrays aligned with `amounts`.
+    """
+    try:
+        orchestrator = get_orchestrator()
+        
+        if market_id not in orchestrator.markets:
+            raise HTTPException(status_code=404, detail=f"Market {market_id} not found")
+        
+        market = orchestrator.markets[market_id]
+        
+        if market.status != "OPEN":
+            raise HTTPException(status_code=400, detail=f"Market is {market.status}")
+        
+        outcomes = [o.upper().strip() for o in batch.outcomes] if batch.outcomes else list(market.outcomes)
+        invalid = [o for o in outcomes if o not in market.outcomes]
+        if invalid:
+            raise HTTPException(status_code=400, detail=f"Invalid outcome: {invalid[0]}")
+        
+        import numpy as np
+        
+        cpmm = market.amm()  # CPMM or LMSR, per market
+        current_odds = cpmm.get_current_odds()
+        
+        amounts = np.asarray(batch.amounts, dtype=float)
+        quotes = {}
+        for outcome in outcomes:
+            quote = cpmm.quote_many(outcome, amounts)
+            current_price = current_odds.get(outcome, 0.5)
+            quotes[outcome] = {
+                "current_price": round(current_price, 4),
+                "shares_received": np.round(quote.shares_out, 2).tolist(),
+                "price_impact": np.round(quote.price_impact, 4).tolist(),
+                "new_odds": {k: np.round(v, 4).tolist() for k, v in quote.new_prices.items()},
+                "potential_payout": np.round(amounts * (1 / current_price) * 0.97, 2).tolist(),  # 3% fee
+            }
+        
+        return {
+            "market_id": market_id,
+            "amounts": batch.amounts,
+            "current_odds": {k: round(v, 4) for k, v in current_odds.items()},
+            "fee": np.round(amounts * 0.03, 2).tolist(),
+            "quotes": quotes,
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.post("/markets/refresh")
 async def refresh_markets():
     try:
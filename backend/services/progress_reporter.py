@@ -0,0 +1,134 @@
+"""
+Progress Reporter — coalesces per-episode progress callbacks into few DB writes.
+
+Replay and verification pipelines call their progress callback once per
+completed item. Writing each call straight to the database opens one session
+per item and lets the UPDATEs race each other. The reporter keeps only the
+latest (completed, total) value and writes it through a single in-flight
+task when either the time window or the count window has elapsed. A value
+held back by the windows is written by a deadline timer at the end of the
+time window, so progress never sits unwritten while a pipeline stalls.
+Callers flush() at state transitions so the final value is always persisted.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# (completed, total); total is None when the source cannot report its size
+ProgressWriter = Callable[[int, Optional[int]], Awaitable[None]]
+
+
+class CoalescingProgressReporter:
+    """Rate-limited, latest-value-wins progress writer.
+
+    Args:
+        write: Async function persisting (completed, total).
+        interval: Seconds since the last write after which a new value is due.
+        every: Completed-count delta after which a new value is due.
+        clock: Monotonic time source (injectable for tests).
+
+    report() is a plain sync callback, safe to pass as progress_callback.
+    At most one write is in flight at a time; values reported while it runs
+    are coalesced into the next write. A value that no window has released
+    yet is written once `interval` has passed since the last write.
+    """
+
+    def __init__(
+        self,
+        write: ProgressWriter,
+        interval: float = 1.0,
+        every: int = 100,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if interval < 0:
+            raise ValueError(f"interval must be >= 0, got {interval}")
+        if every < 1:
+            raise ValueError(f"every must be >= 1, got {every}")
+        self._write = write
+        self._interval = interval
+        self._every = every
+        self._clock = clock
+        self._latest: Optional[tuple[int, Optional[int]]] = None
+        self._written: Optional[tuple[int, Optional[int]]] = None
+        self._last_write_at = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._deadline: Optional[asyncio.TimerHandle] = None
+        self.write_count = 0
+
+    def report(self, completed: int, total: Optional[int]) -> None:
+        """Record the latest progress; schedule a write if a window elapsed."""
+        self._latest = (completed, total)
+        if self._task is not None and not self._task.done():
+            return  # The in-flight writer picks up the latest value
+        if self._due():
+            self._start(force=False)
+        else:
+            self._arm_deadline()
+
+    async def flush(self) -> None:
+        """Wait for any in-flight write, then persist the latest value if unwritten."""
+        self._cancel_deadline()
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._latest is not None and self._latest != self._written:
+            await self._write_latest()
+
+    def _due(self) -> bool:
+        if self._latest is None or self._latest == self._written:
+            return False
+        if self._written is None:
+            return True
+        if self._latest[0] - self._written[0] >= self._every:
+            return True
+        return self._clock() - self._last_write_at >= self._interval
+
+    def _start(self, force: bool) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No running loop — value is written on flush()
+        self._task = loop.create_task(self._drain(force))
+
+    def _arm_deadline(self) -> None:
+        """Make sure an unwritten value is written when the time window ends."""
+        if self._deadline is not None or self._latest in (None, self._written):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        delay = max(0.0, self._interval - (self._clock() - self._last_write_at))
+        self._deadline = loop.call_later(delay, self._on_deadline)
+
+    def _cancel_deadline(self) -> None:
+        if self._deadline is not None:
+            self._deadline.cancel()
+            self._deadline = None
+
+    def _on_deadline(self) -> None:
+        self._deadline = None
+        if self._task is None or self._task.done():
+            self._start(force=True)
+
+    async def _drain(self, force: bool) -> None:
+        if force and self._latest != self._written:
+            await self._write_latest()
+        while self._due():
+            await self._write_latest()
+        self._arm_deadline()  # Values reported mid-write but not yet due
+
+    async def _write_latest(self) -> None:
+        self._cancel_deadline()
+        value = self._latest
+        self._written = value
+        self._last_write_at = self._clock()
+        self.write_count += 1
+        try:
+            await self._write(*value)
+        except Exception as e:
+            logger.warning("Progress update %s failed: %s", value, e)
@@ -8,6 +8,8 @@ to the database. Each task gets its own session (no sharing with request).
 import logging
 import uuid
 from datetime import datetime
+from pathlib import Path
+from typing import Optional
 
 from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -17,9 +19,12 @@ from backend.database.models import (
     Theatre,
     TheatreTemplate,
     TheatreCertificate,
-    TheatreEpisodeScore,
-    TheatreAuditEvent,
 )
+from backend.database.repositories.theatre_repository import (
+    DEFAULT_CHUNK_SIZE,
+    TheatreRepository,
+)
+from backend.services.progress_reporter import CoalescingProgressReporter
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +34,7 @@ try:
     from theatre.engine.commitment import CommitmentProtocol
     from theatre.engine.models import TheatreCriteria, GroundTruthEpisode
     from theatre.engine.replay import ReplayEngine
+    from theatre.engine.checkpoint import ReplayCheckpoint
     from theatre.engine.oracle_contract import OracleAdapter, MockOracleAdapter
     from theatre.engine.scoring import TheatreScoringProvider, SimpleScoringFunction
     from theatre.engine.tier_assigner import TierAssigner
@@ -41,14 +47,21 @@ except ImportError:
 
 
 async def _update_theatre_progress(
-    theatre_id: str, progress: int, total: int
+    theatre_id: str, progress: int, total: Optional[int]
 ) -> None:
-    """Update theatre progress in a fresh session (called from replay callback)."""
+    """Update theatre progress in a fresh session (called via the progress reporter).
+
+    total is None for streamed datasets of unknown size; the stored total is
+    then left as is.
+    """
+    values = {"progress": progress}
+    if total is not None:
+        values["total_episodes"] = total
     async with get_session() as session:
         await session.execute(
             update(Theatre)
             .where(Theatre.id == theatre_id)
-            .values(progress=progress, total_episodes=total)
+            .values(**values)
         )
 
 
@@ -66,13 +79,25 @@ async def _transition_theatre_state(
         )
 
 
-async def run_theatre_task(theatre_id: str) -> None:
+async def run_theatre_task(
+    theatre_id: str,
+    score_chunk_size: int = DEFAULT_CHUNK_SIZE,
+    checkpoint_dir: Optional[Path] = None,
+) -> None:
     """Background task — runs the full Theatre lifecycle.
 
     Opens its own session (not shared with request).
     Guarantees theatre reaches a terminal state (RESOLVED or error state with message).
 
     Lifecycle: COMMITTED → ACTIVE (replay) → SETTLING (score) → RESOLVED (certificate)
+
+    Episode scores are bulk-inserted in chunks of score_chunk_size rows within
+    the same transaction as the certificate.
+
+    With checkpoint_dir, completed episodes are checkpointed to
+    {checkpoint_dir}/{theatre_id}.replay.jsonl so a restarted task resumes the
+    replay instead of re-invoking the construct. The checkpoint is removed
+    once the theatre is RESOLVED.
     """
     if not THEATRE_ENGINE_AVAILABLE:
         async with get_session() as session:
@@ -86,6 +111,10 @@ async def run_theatre_task(theatre_id: str) -> None:
             )
         return
 
+    progress = CoalescingProgressReporter(
+        lambda completed, total: _update_theatre_progress(theatre_id, completed, total)
+    )
+
     try:
         # Load theatre and template
         async with get_session() as session:
@@ -171,24 +200,22 @@ async def run_theatre_task(theatre_id: str) -> None:
         # For now, create minimal test episodes
         ground_truth: list[GroundTruthEpisode] = []
 
-        # Progress callback
-        def progress_callback(completed: int, total: int) -> None:
-            import asyncio
-            try:
-                loop = asyncio.get_running_loop()
-                loop.create_task(
-                    _update_theatre_progress(theatre_id, completed, total)
-                )
-            except RuntimeError:
-                pass
+        checkpoint = None
+        if checkpoint_dir is not None:
+            Path(checkpoint_dir).mkdir(parents=True, exist_ok=True)
+            checkpoint = ReplayCheckpoint(
+                Path(checkpoint_dir) / f"{theatre_id}.replay.jsonl"
+            )
 
-        # Run replay
+        # Run replay (progress writes are coalesced, not one per episode)
         replay_result = await replay_engine.run(
             ground_truth=ground_truth,
-            progress_callback=progress_callback,
+            progress_callback=progress.report,
+            checkpoint=checkpoint,
         )
 
         # Transition to SETTLING
+        await progress.flush()
         await _transition_theatre_state(theatre_id, TheatreState.SETTLING.value)
 
         # Assign verification tier
@@ -239,36 +266,38 @@ async def run_theatre_task(theatre_id: str) -> None:
             session.add(db_cert)
             await session.flush()
 
-            # Persist episode scores
-            for ep in replay_result.episode_results:
-                db_score = TheatreEpisodeScore(
-                    id=str(uuid.uuid4()),
-                    theatre_id=theatre_id,
-                    certificate_id=cert_id,
-                    episode_id=ep.episode_id,
-                    invocation_status=ep.invocation_status,
-                    latency_ms=ep.latency_ms,
-                    scores_json=ep.scores or {},
-                    composite_score=ep.composite_score or 0.0,
-                    scored_at=now,
-                )
-                session.add(db_score)
+            # Persist episode scores (chunked executemany, no ORM objects)
+            repo = TheatreRepository(session, chunk_size=score_chunk_size)
+            await repo.bulk_insert_episode_scores(
+                {
+                    "id": str(uuid.uuid4()),
+                    "theatre_id": theatre_id,
+                    "certificate_id": cert_id,
+                    "episode_id": ep.episode_id,
+                    "invocation_status": ep.invocation_status,
+                    "latency_ms": ep.latency_ms,
+                    "scores_json": ep.scores or {},
+                    "composite_score": ep.composite_score or 0.0,
+                    "scored_at": now,
+                }
+                for ep in replay_result.episode_results
+            )
 
             # Add audit event
-            audit_event = TheatreAuditEvent(
-                id=str(uuid.uuid4()),
-                theatre_id=theatre_id,
-                event_type="theatre_resolved",
-                from_state=TheatreState.SETTLING.value,
-                to_state=TheatreState.RESOLVED.value,
-                detail_json={
+            await repo.bulk_insert_audit_events([{
+                "id": str(uuid.uuid4()),
+                "theatre_id": theatre_id,
+                "event_type": "theatre_resolved",
+                "from_state": TheatreState.SETTLING.value,
+                "to_state": TheatreState.RESOLVED.value,
+                "detail_json": {
                     "certificate_id": cert_id,
                     "composite_score": replay_result.composite_score,
                     "verification_tier": tier,
                     "replay_count": replay_result.replay_count,
                 },
-            )
-            session.add(audit_event)
+                "created_at": now,
+            }])
 
         # Transition to RESOLVED with certificate
         await _transition_theatre_state(
@@ -281,9 +310,13 @@ async def run_theatre_task(theatre_id: str) -> None:
             failure_count=replay_result.failure_count,
         )
 
+        if checkpoint is not None:
+            checkpoint.path.unlink(missing_ok=True)
+
     except Exception as e:
         logger.error("Theatre %s failed: %s", theatre_id, e, exc_info=True)
         try:
+            await progress.flush()
             async with get_session() as session:
                 await session.execute(
                     update(Theatre)
@@ -8,6 +8,7 @@ to the database. Each task gets its own session (no sharing with request).
 import logging
 import uuid
 from datetime import datetime
+from typing import Optional
 
 from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -19,6 +20,7 @@ from backend.database.models import (
     VerificationCertificate,
     VerificationReplayScore,
 )
+from backend.services.progress_reporter import CoalescingProgressReporter
 
 logger = logging.getLogger(__name__)
 
@@ -80,14 +82,20 @@ def replay_score_to_db(
 
 
 async def _update_run_progress(
-    run_id: str, progress: int, total: int, status: VerificationRunStatus
+    run_id: str, progress: int, total: Optional[int], status: VerificationRunStatus
 ) -> None:
-    """Update run progress in a fresh session (called from pipeline callback)."""
+    """Update run progress in a fresh session (called via the progress reporter).
+
+    A None total (size not known up front) leaves the stored total as is.
+    """
+    values = {"progress": progress, "status": status}
+    if total is not None:
+        values["total"] = total
     async with get_session() as session:
         await session.execute(
             update(VerificationRun)
             .where(VerificationRun.id == run_id)
-            .values(progress=progress, total=total, status=status)
+            .values(**values)
         )
 
 
@@ -109,6 +117,12 @@ async def run_verification_task(run_id: str) -> None:
             )
         return
 
+    progress = CoalescingProgressReporter(
+        lambda completed, total: _update_run_progress(
+            run_id, completed, total, VerificationRunStatus.SCORING
+        )
+    )
+
     try:
         async with get_session() as session:
             run = await session.get(VerificationRun, run_id)
@@ -154,18 +168,9 @@ async def run_verification_task(run_id: str) -> None:
         scorer = AnthropicScorer(pipeline_config.scoring)
         pipeline = VerificationPipeline(pipeline_config, oracle, scorer)
 
-        def progress_callback(completed: int, total: int) -> None:
-            """Sync callback — schedules async DB update."""
-            import asyncio
-            try:
-                loop = asyncio.get_running_loop()
-                loop.create_task(
-                    _update_run_progress(run_id, completed, total, VerificationRunStatus.SCORING)
-                )
-            except RuntimeError:
-                pass  # No running loop — skip progress update
-
-        result = await pipeline.run(progress=progress_callback)
+        # Progress writes are coalesced, not one per replay
+        result = await pipeline.run(progress=progress.report)
+        await progress.flush()
 
         # Persist results
         async with get_session() as session:
@@ -191,6 +196,7 @@ async def run_verification_task(run_id: str) -> None:
     except Exception as e:
         logger.error("Verification run %s failed: %s", run_id, e, exc_info=True)
         try:
+            await progress.flush()
             async with get_session() as session:
                 await session.execute(
                     update(VerificationRun)
@@ -0,0 +1,54 @@
+"""
+Shared fixtures for backend tests.
+"""
+
+import pytest
+
+
+@pytest.fixture
+def orchestrator_factory(tmp_path, monkeypatch):
+    """Build EventOrchestrators persisting to tmp_path (a call simulates a restart)."""
+    pytest.importorskip("requests")
+    pytest.importorskip("dotenv")
+    import backend.core.persistence_manager as pm
+
+    def make():
+        from backend.core.event_orchestrator import EventOrchestrator
+
+        monkeypatch.setattr(
+            pm, "_persistence_manager",
+            pm.PersistenceManager(pm.PersistenceConfig(data_dir=str(tmp_path))),
+        )
+        return EventOrchestrator()
+
+    return make
+
+
+@pytest.fixture
+def add_markets():
+    """Add `count` 50/50 binary markets MKT_0..MKT_{count-1} and snapshot them."""
+    def add(orchestrator, count: int):
+        from backend.core.event_orchestrator import BetDuration, BettingMarket, EventDomain
+
+        for i in range(count):
+            market = BettingMarket(
+                id=f"MKT_{i}",
+                event_id=f"evt_{i}",
+                title=f"Market {i}",
+                description="",
+                domain=list(EventDomain)[0],
+                duration=BetDuration.MICRO,
+                outcomes=["YES", "NO"],
+                outcome_odds={"YES": 0.5, "NO": 0.5},
+            )
+            orchestrator.markets[market.id] = market
+        orchestrator._save_markets_state()
+
+    return add
+
+
+@pytest.fixture
+def bench(request):
+    """pytest-benchmark's `benchmark` fixture; skips when the plugin is absent."""
+    pytest.importorskip("pytest_benchmark")
+    return request.getfixturevalue("benchmark")
@@ -0,0 +1,161 @@
+"""
+Tests for the constant product market maker.
+"""
+
+import numpy as np
+import pytest
+
+from backend.core.cpmm import CPMM
+
+
+def _pool(yes: float = 800.0, no: float = 1250.0) -> CPMM:
+    cpmm = CPMM()
+    cpmm.state.yes_shares = yes
+    cpmm.state.no_shares = no
+    return cpmm
+
+
+# ============================================
+# BATCH QUOTES
+# ============================================
+
+class TestQuoteMany:
+    @pytest.mark.parametrize("outcome", ["YES", "NO"])
+    @pytest.mark.parametrize("apply_fee", [True, False])
+    def test_matches_single_trades(self, outcome, apply_fee):
+        amounts = [0.5, 10.0, 250.0, 5_000.0, 1e6]
+        quotes = _pool().quote_many(outcome, amounts, apply_fee=apply_fee)
+
+        for i, amount in enumerate(amounts):
+            shares, impact, prices = _pool().execute_trade(outcome, amount, apply_fee=apply_fee)
+            assert quotes.shares_out[i] == pytest.approx(shares)
+            assert quotes.price_impact[i] == pytest.approx(impact)
+            for side, price in prices.items():
+                assert quotes.new_prices[side][i] == pytest.approx(price)
+
+    def test_does_not_mutate_state(self):
+        cpmm = _pool()
+        cpmm.quote_many("YES", np.linspace(1, 1000, 50))
+        assert (cpmm.state.yes_shares, cpmm.state.no_shares) == (800.0, 1250.0)
+
+    def test_depth_curve_is_monotonic(self):
+        quotes = _pool().quote_many("yes", np.linspace(1, 10_000, 200))
+        assert quotes.outcome == "YES"
+        assert np.all(np.diff(quotes.shares_out) > 0)
+        assert np.all(np.diff(quotes.price_impact) > 0)
+        np.testing.assert_allclose(quotes.new_prices["YES"] + quotes.new_prices["NO"], 1.0)
+
+    def test_non_positive_amounts_quote_zero(self):
+        cpmm = _pool()
+        quotes = cpmm.quote_many("NO", [0.0, -5.0])
+        np.testing.assert_array_equal(quotes.shares_out, [0.0, 0.0])
+        np.testing.assert_array_equal(quotes.price_impact, [0.0, 0.0])
+        np.testing.assert_allclose(quotes.new_prices["NO"], cpmm.state.get_price("NO"))
+
+    def test_unknown_outcome(self):
+        with pytest.raises(ValueError, match="Unknown outcome"):
+            _pool().quote_many("MAYBE", [1.0])
+
+
+# ============================================
+# MULTI-OUTCOME POOLS
+# ============================================
+
+FOOTBALL = ["HOME", "DRAW", "AWAY"]
+
+
+class TestMultiOutcome:
+    def test_binary_defaults_unchanged(self):
+        cpmm = _pool()
+        assert cpmm.state.outcomes == ["YES", "NO"]
+        assert cpmm.state.get_price("YES") == pytest.approx(1250.0 / 2050.0)
+        cpmm.execute_trade("YES", 100.0, apply_fee=False)
+        assert cpmm.state.no_shares == pytest.approx(800.0 * 1250.0 / 900.0)
+
+    @pytest.mark.parametrize("n", [3, 10, 50])
+    def test_trades_keep_product_and_prices(self, n):
+        outcomes = [f"O{i}" for i in range(n)]
+        cpmm = CPMM(outcomes=outcomes)
+        log_k = np.sum(np.log(cpmm.state.reserves))
+        rng = np.random.default_rng(n)
+        for _ in range(200):
+            _, _, prices = cpmm.execute_trade(outcomes[rng.integers(n)], float(rng.exponential(80)))
+            assert sum(prices.values()) == pytest.approx(1.0)
+        assert np.sum(np.log(cpmm.state.reserves)) == pytest.approx(log_k)
+
+    def test_football_pool(self):
+        cpmm = CPMM(outcomes=FOOTBALL)
+        assert cpmm.get_current_odds() == pytest.approx({o: 1 / 3 for o in FOOTBALL})
+
+        shares, impact, prices = cpmm.execute_trade("draw", 200.0)
+        assert shares == pytest.approx(194.0)
+        assert prices["HOME"] == pytest.approx(prices["AWAY"])
+        assert impact == pytest.approx(abs(prices["DRAW"] - 1 / 3))
+        assert cpmm.calculate_amount_in("DRAW", shares) == pytest.approx(200.0)
+
+    def test_quote_many_matches_single_trades(self):
+        reserves = [700.0, 1300.0, 950.0]
+        quotes = CPMM(outcomes=FOOTBALL, reserves=reserves).quote_many("AWAY", [1.0, 90.0, 4_000.0])
+
+        for i, amount in enumerate([1.0, 90.0, 4_000.0]):
+            shares, impact, prices = CPMM(outcomes=FOOTBALL, reserves=reserves).execute_trade("AWAY", amount)
+            assert quotes.shares_out[i] == pytest.approx(shares)
+            assert quotes.price_impact[i] == pytest.approx(impact)
+            for outcome, price in prices.items():
+                assert quotes.new_prices[outcome][i] == pytest.approx(price)
+
+    def test_empty_reserves(self):
+        cpmm = CPMM(outcomes=FOOTBALL, reserves=[0.0, 10.0, 10.0])
+        assert cpmm.get_current_odds() == {"HOME": 1.0, "DRAW": 0.0, "AWAY": 0.0}
+        assert CPMM(outcomes=FOOTBALL, reserves=[0.0] * 3).get_current_odds() == pytest.approx(
+            {o: 1 / 3 for o in FOOTBALL}
+        )
+
+    def test_liquidity_helpers(self):
+        cpmm = CPMM(outcomes=FOOTBALL)
+        cpmm.add_initial_liquidity(100.0, 200.0, 300.0)
+        assert cpmm.get_liquidity() == {"HOME": 100.0, "DRAW": 200.0, "AWAY": 300.0, "total": 600.0}
+        with pytest.raises(ValueError, match="Expected 3"):
+            cpmm.add_initial_liquidity(100.0, 200.0)
+        with pytest.raises(ValueError, match="Unknown outcome"):
+            cpmm.state.yes_shares
+
+
+class TestMultiOutcomeMarkets:
+    def _event(self):
+        from datetime import datetime
+
+        from backend.core.event_orchestrator import EventDomain, RawEvent
+
+        return RawEvent(
+            id="match_1", title="Arsenal vs Chelsea", description="", source="test",
+            url="", published_at=datetime.now(), domain=EventDomain.SPORTS,
+        )
+
+    @pytest.mark.asyncio
+    async def test_football_market_trades_and_persists(self, orchestrator_factory):
+        orchestrator = orchestrator_factory()
+        market = orchestrator.create_market(self._event(), outcomes=FOOTBALL)
+        assert market.cpmm_reserves == [1000.0] * 3
+
+        await orchestrator.place_trade(market.id, "HOME", 150.0)
+        await orchestrator.place_trade(market.id, "AWAY", 40.0)
+        assert sum(market.outcome_odds.values()) == pytest.approx(1.0)
+        assert (market.yes_shares, market.no_shares) == (1000.0, 1000.0)  # Binary pool unused
+        orchestrator.trade_journal.close()
+
+        restored = orchestrator_factory().markets[market.id]
+        assert restored.cpmm_reserves == pytest.approx(market.cpmm_reserves)
+        assert restored.to_dict()["outcome_odds"] == pytest.approx(market.outcome_odds)
+
+    @pytest.mark.asyncio
+    async def test_binary_market_keeps_yes_no_fields(self, orchestrator_factory):
+        orchestrator = orchestrator_factory()
+        market = orchestrator.create_market(self._event())
+        await orchestrator.place_trade(market.id, "YES", 100.0)
+
+        assert market.cpmm_reserves == []
+        assert market.yes_shares == pytest.approx(1097.0)
+        assert market.to_dict()["outcome_odds"]["YES"] == pytest.approx(
+            market.no_shares / (market.yes_shares + market.no_shares)
+        )
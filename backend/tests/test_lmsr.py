@@ -0,0 +1,199 @@
+"""
+Tests for the LMSR market maker and LMSR-priced betting markets.
+"""
+
+import math
+import random
+
+import numpy as np
+import pytest
+
+from backend.core.lmsr import LMSR
+
+OUTCOME_COUNTS = [2, 10, 100]
+
+
+def _outcomes(n: int) -> list:
+    return ["YES", "NO"] if n == 2 else [f"O{i}" for i in range(n)]
+
+
+def _random_trades(rng: random.Random, outcomes: list, count: int):
+    for _ in range(count):
+        yield rng.choice(outcomes), rng.expovariate(1 / 40)
+
+
+# ============================================
+# PRICING
+# ============================================
+
+class TestLMSR:
+    def test_starts_uniform(self):
+        lmsr = LMSR(_outcomes(4), liquidity_b=50)
+        assert lmsr.get_current_odds() == pytest.approx({o: 0.25 for o in _outcomes(4)})
+        assert lmsr.state.cost == pytest.approx(50 * math.log(4))
+
+    @pytest.mark.parametrize("n", OUTCOME_COUNTS)
+    def test_trade_costs_exactly_the_amount(self, n):
+        lmsr = LMSR(_outcomes(n), liquidity_b=75)
+        rng = random.Random(n)
+        for outcome, amount in _random_trades(rng, _outcomes(n), 50):
+            before = lmsr.state.cost
+            lmsr.execute_trade(outcome, amount, apply_fee=False)
+            assert lmsr.state.cost - before == pytest.approx(amount)
+
+    @pytest.mark.parametrize("n", OUTCOME_COUNTS)
+    @pytest.mark.parametrize("apply_fee", [True, False])
+    def test_amount_in_inverts_shares_out(self, n, apply_fee):
+        lmsr = LMSR(_outcomes(n), liquidity_b=30, quantities=np.linspace(0, 90, n))
+        for outcome in (_outcomes(n)[0], _outcomes(n)[-1]):
+            for amount in (0.01, 5.0, 300.0, 20_000.0):
+                shares, _ = lmsr.calculate_shares_out(outcome, amount, apply_fee)
+                assert lmsr.calculate_amount_in(outcome, shares, apply_fee) == pytest.approx(amount)
+
+    def test_buying_raises_price_and_impact_matches(self):
+        lmsr = LMSR(_outcomes(3), liquidity_b=100)
+        before = lmsr.state.get_price("O1")
+        shares, impact, prices = lmsr.execute_trade("o1", 40.0)
+        assert shares > 40.0  # Shares pay 1.0 each and were bought below 1.0
+        assert prices["O1"] > before
+        assert impact == pytest.approx(prices["O1"] - before)
+
+    def test_quote_many_matches_single_trades(self):
+        amounts = [0.0, 1.0, 75.0, 5_000.0]
+        base = dict(outcomes=_outcomes(10), liquidity_b=60, quantities=np.arange(10) * 7.0)
+        quotes = LMSR(**base).quote_many("O3", amounts)
+
+        for i, amount in enumerate(amounts):
+            shares, impact, prices = LMSR(**base).execute_trade("O3", amount)
+            assert quotes.shares_out[i] == pytest.approx(shares)
+            assert quotes.price_impact[i] == pytest.approx(impact, abs=1e-12)
+            for outcome, price in prices.items():
+                assert quotes.new_prices[outcome][i] == pytest.approx(price)
+
+    def test_extreme_quantities_stay_finite(self):
+        lmsr = LMSR(_outcomes(3), liquidity_b=1.0, quantities=[1e6, 0.0, -1e6])
+        prices = lmsr.get_current_odds()
+        assert prices["O0"] == pytest.approx(1.0)
+        assert sum(prices.values()) == pytest.approx(1.0)
+        assert math.isfinite(lmsr.state.cost)
+
+        shares, _ = lmsr.calculate_shares_out("O2", 1e5)
+        assert math.isfinite(shares) and shares > 0
+        assert lmsr.calculate_amount_in("O2", shares) == pytest.approx(1e5)
+
+    def test_invalid_inputs(self):
+        with pytest.raises(ValueError, match="Unknown outcome"):
+            LMSR().calculate_shares_out("MAYBE", 1.0)
+        with pytest.raises(ValueError, match="must be positive"):
+            LMSR(liquidity_b=0)
+        with pytest.raises(ValueError, match="at least two outcomes"):
+            LMSR(outcomes=["YES"])
+
+
+# ============================================
+# PROPERTIES (seeded random trade sequences)
+# ============================================
+
+class TestLMSRProperties:
+    @pytest.mark.parametrize("n", OUTCOME_COUNTS)
+    @pytest.mark.parametrize("seed", range(5))
+    def test_prices_sum_to_one(self, n, seed):
+        rng = random.Random(seed)
+        lmsr = LMSR(_outcomes(n), liquidity_b=rng.uniform(1, 500))
+        for outcome, amount in _random_trades(rng, _outcomes(n), 200):
+            _, _, prices = lmsr.execute_trade(outcome, amount)
+            assert sum(prices.values()) == pytest.approx(1.0)
+            assert all(p >= 0 for p in prices.values())
+
+    @pytest.mark.parametrize("n", OUTCOME_COUNTS)
+    @pytest.mark.parametrize("seed", range(5))
+    def test_loss_bounded_by_b_ln_n(self, n, seed):
+        rng = random.Random(seed)
+        b = rng.uniform(1, 500)
+        lmsr = LMSR(_outcomes(n), liquidity_b=b)
+        collected = 0.0
+        for outcome, amount in _random_trades(rng, _outcomes(n), 200):
+            lmsr.execute_trade(outcome, amount, apply_fee=False)
+            collected += amount
+            # Worst case: the outcome with most shares outstanding wins
+            loss = float(np.max(lmsr.state.quantities)) - collected
+            assert loss <= b * math.log(n) + 1e-6
+
+    @pytest.mark.parametrize("n", OUTCOME_COUNTS)
+    def test_loss_approaches_bound_when_one_side_dominates(self, n):
+        lmsr = LMSR(_outcomes(n), liquidity_b=100)
+        shares, _, _ = lmsr.execute_trade(_outcomes(n)[0], 10_000.0, apply_fee=False)
+        assert shares - 10_000.0 == pytest.approx(lmsr.state.max_loss, rel=1e-3)
+
+
+# ============================================
+# LMSR MARKETS
+# ============================================
+
+def _make_lmsr_market(orchestrator, outcomes: list, b: float = 100.0):
+    from backend.core.event_orchestrator import BetDuration, BettingMarket, EventDomain
+
+    market = BettingMarket(
+        id="MKT_LMSR",
+        event_id="evt_lmsr",
+        title="Who wins?",
+        description="",
+        domain=EventDomain.SPORTS,
+        duration=BetDuration.MICRO,
+        outcomes=outcomes,
+        market_maker="LMSR",
+        liquidity_b=b,
+        lmsr_quantities=[0.0] * len(outcomes),
+    )
+    market.recalculate_odds_from_cpmm()
+    orchestrator.markets[market.id] = market
+    orchestrator._save_markets_state()
+    return market
+
+
+class TestLMSRMarkets:
+    @pytest.mark.asyncio
+    async def test_trades_route_through_lmsr(self, orchestrator_factory):
+        orchestrator = orchestrator_factory()
+        market = _make_lmsr_market(orchestrator, ["HOME", "DRAW", "AWAY"])
+        assert market.to_dict()["outcome_odds"] == pytest.approx({o: 1 / 3 for o in market.outcomes})
+
+        fill = await orchestrator.place_trade("MKT_LMSR", "DRAW", 50.0)
+
+        assert fill.price_before == pytest.approx(1 / 3)
+        assert market.lmsr_quantities[1] == pytest.approx(fill.shares_received)
+        assert market.outcome_odds["DRAW"] > 0.5
+        assert (market.yes_shares, market.no_shares) == (1000.0, 1000.0)  # CPMM pool unused
+
+    @pytest.mark.asyncio
+    async def test_lmsr_state_survives_restart(self, orchestrator_factory):
+        orchestrator = orchestrator_factory()
+        _make_lmsr_market(orchestrator, ["A", "B", "C", "D"], b=40.0)
+        for outcome in ["A", "C", "C", "D"]:
+            await orchestrator.place_trade("MKT_LMSR", outcome, 25.0)
+        before = orchestrator.markets["MKT_LMSR"]
+        orchestrator.trade_journal.close()
+
+        restored = orchestrator_factory().markets["MKT_LMSR"]
+        assert restored.market_maker == "LMSR"
+        assert restored.liquidity_b == 40.0
+        assert restored.lmsr_quantities == pytest.approx(before.lmsr_quantities)
+        assert restored.outcome_odds == pytest.approx(before.outcome_odds)
+
+
+# ============================================
+# BENCHMARKS (`bench` fixture in conftest.py)
+# ============================================
+
+@pytest.mark.parametrize("n", OUTCOME_COUNTS)
+def test_bench_lmsr_trades(bench, n):
+    outcomes = _outcomes(n)
+    trades = list(_random_trades(random.Random(0), outcomes, 1_000))
+
+    def run():
+        lmsr = LMSR(outcomes, liquidity_b=100)
+        for outcome, amount in trades:
+            lmsr.execute_trade(outcome, amount)
+
+    bench(run)
+    bench.extra_info["trades_per_second"] = round(len(trades) / bench.stats.stats.mean)
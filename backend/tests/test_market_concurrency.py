@@ -0,0 +1,111 @@
+"""
+Load tests for per-market serialization of CPMM trades.
+"""
+
+import asyncio
+import random
+
+import pytest
+
+from backend.core.cpmm import CPMM
+
+
+def _replay(fills):
+    """Apply (outcome, amount) fills sequentially to a fresh 1000/1000 pool."""
+    cpmm = CPMM()
+    for outcome, amount in fills:
+        cpmm.execute_trade(outcome, amount)
+    return cpmm.state.yes_shares, cpmm.state.no_shares
+
+
+class TestPlaceTrade:
+    @pytest.mark.asyncio
+    async def test_concurrent_bets_keep_invariant(self, orchestrator_factory, add_markets):
+        orchestrator = orchestrator_factory()
+        add_markets(orchestrator, 4)
+        rng = random.Random(7)
+        applied = {f"MKT_{i}": [] for i in range(4)}
+
+        async def bet(market_id, outcome, amount):
+            async def debit():
+                await asyncio.sleep(0)  # Yield mid-trade, as a DB round trip would
+                applied[market_id].append((outcome, amount))
+
+            await orchestrator.place_trade(market_id, outcome, amount, debit=debit)
+
+        bets = [
+            (f"MKT_{rng.randrange(4)}", rng.choice(["YES", "NO"]), rng.uniform(1, 50))
+            for _ in range(4000)
+        ]
+        await asyncio.gather(*(bet(*b) for b in bets))
+
+        for market_id, fills in applied.items():
+            market = orchestrator.markets[market_id]
+            assert market.yes_shares * market.no_shares == pytest.approx(1000.0 * 1000.0)
+            assert (market.yes_shares, market.no_shares) == pytest.approx(_replay(fills))
+            assert market.total_volume == pytest.approx(sum(a for _, a in fills))
+            assert sum(market.outcome_odds.values()) == pytest.approx(1.0)
+        assert sum(len(f) for f in applied.values()) == len(bets)
+        assert orchestrator.trade_journal.seq == len(bets)
+
+    @pytest.mark.asyncio
+    async def test_failed_debit_leaves_market_untouched(self, orchestrator_factory, add_markets):
+        orchestrator = orchestrator_factory()
+        add_markets(orchestrator, 1)
+
+        async def debit():
+            raise RuntimeError("insufficient balance")
+
+        with pytest.raises(RuntimeError):
+            await orchestrator.place_trade("MKT_0", "YES", 100.0, debit=debit)
+
+        market = orchestrator.markets["MKT_0"]
+        assert (market.yes_shares, market.no_shares, market.total_volume) == (1000.0, 1000.0, 0.0)
+        assert orchestrator.trade_journal.seq == 0
+
+    @pytest.mark.asyncio
+    async def test_closed_market_rejected(self, orchestrator_factory, add_markets):
+        orchestrator = orchestrator_factory()
+        add_markets(orchestrator, 1)
+        orchestrator.markets["MKT_0"].status = "RESOLVED"
+
+        with pytest.raises(ValueError, match="RESOLVED"):
+            await orchestrator.place_trade("MKT_0", "YES", 10.0)
+
+    @pytest.mark.asyncio
+    async def test_markets_trade_independently(self, orchestrator_factory, add_markets):
+        """Debits on different markets overlap; debits on one market never do."""
+        orchestrator = orchestrator_factory()
+        add_markets(orchestrator, 5)
+        in_flight = {f"MKT_{i}": 0 for i in range(5)}
+        peak = {"total": 0, "per_market": 0}
+        all_waiting = asyncio.Event()
+
+        def debit_for(market_id):
+            async def debit():
+                in_flight[market_id] += 1
+                peak["total"] = max(peak["total"], sum(in_flight.values()))
+                peak["per_market"] = max(peak["per_market"], in_flight[market_id])
+                if peak["total"] == len(in_flight):
+                    all_waiting.set()
+                await all_waiting.wait()  # Released once every market is mid-debit
+                in_flight[market_id] -= 1
+
+            return debit
+
+        await asyncio.wait_for(asyncio.gather(*(
+            orchestrator.place_trade(f"MKT_{i % 5}", "YES", 1.0, debit=debit_for(f"MKT_{i % 5}"))
+            for i in range(50)
+        )), timeout=5)
+
+        assert peak == {"total": 5, "per_market": 1}
+        assert orchestrator.trade_journal.seq == 50
+
+    @pytest.mark.asyncio
+    async def test_idle_market_locks_are_released(self, orchestrator_factory, add_markets):
+        orchestrator = orchestrator_factory()
+        add_markets(orchestrator, 3)
+        await asyncio.gather(*(
+            orchestrator.place_trade(f"MKT_{i}", "NO", 5.0) for i in range(3)
+        ))
+        assert len(orchestrator._market_locks) == 0
@@ -0,0 +1,175 @@
+"""
+Endpoint tests for betting and batch quotes on orchestrator markets.
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("fastapi")
+httpx = pytest.importorskip("httpx")
+
+
+@pytest.fixture
+def api(tmp_path, monkeypatch, orchestrator_factory, add_markets):
+    """(main module, orchestrator, session factory) with two fresh markets."""
+    monkeypatch.chdir(tmp_path)  # main creates ./database.db on import
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    import backend.main as main
+    from backend.core.database import Base, User
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'api.db'}")
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as db:
+        db.add(User(username="alice", hashed_password="x", play_money_balance=100.0))
+        db.commit()
+
+    def get_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def get_user(db=main.Depends(main.get_db)):
+        return db.query(User).filter(User.username == "alice").one()
+
+    orchestrator = orchestrator_factory()
+    add_markets(orchestrator, 2)
+    monkeypatch.setattr(main, "_orchestrator", orchestrator)
+    monkeypatch.setattr(main, "SessionLocal", Session)  # Bet debits open their own session
+    monkeypatch.setitem(main.app.dependency_overrides, main.get_db, get_db)
+    monkeypatch.setitem(main.app.dependency_overrides, main.get_user_or_wallet, get_user)
+    yield main, orchestrator, Session
+    orchestrator.trade_journal.close()
+
+
+def _client(main):
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app), base_url="http://test")
+
+
+def _balance(Session) -> float:
+    from backend.core.database import User
+
+    with Session() as db:
+        return db.query(User).filter(User.username == "alice").one().play_money_balance
+
+
+# ============================================
+# BETS
+# ============================================
+
+class TestPlaceBet:
+    @pytest.mark.asyncio
+    async def test_bet_debits_balance_and_trades(self, api):
+        main, orchestrator, Session = api
+        async with _client(main) as client:
+            response = await client.post("/markets/MKT_0/bet", json={"outcome": "yes", "amount": 40})
+
+        assert response.status_code == 200
+        assert response.json()["new_balance"] == 60.0
+        assert _balance(Session) == 60.0
+        assert orchestrator.markets["MKT_0"].total_volume == 40.0
+
+    @pytest.mark.asyncio
+    async def test_insufficient_balance_leaves_market_untouched(self, api):
+        main, orchestrator, Session = api
+        async with _client(main) as client:
+            response = await client.post("/markets/MKT_0/bet", json={"outcome": "NO", "amount": 500})
+
+        assert response.status_code == 400
+        assert _balance(Session) == 100.0
+        assert orchestrator.markets["MKT_0"].total_volume == 0.0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_bets_cannot_overspend(self, api):
+        """Bets on different markets take different locks; the debit itself is atomic."""
+        main, orchestrator, Session = api
+        async with _client(main) as client:
+            responses = await asyncio.gather(*(
+                client.post(f"/markets/MKT_{i}/bet", json={"outcome": "YES", "amount": 60})
+                for i in range(2)
+            ))
+
+        assert sorted(r.status_code for r in responses) == [200, 400]
+        assert _balance(Session) == 40.0
+        assert sum(m.total_volume for m in orchestrator.markets.values()) == 60.0
+
+
+# ============================================
+# BATCH QUOTES
+# ============================================
+
+class TestMarketQuotes:
+    @pytest.mark.asyncio
+    async def test_quotes_match_single_trade_pricing(self, api):
+        main, orchestrator, _ = api
+        amounts = [1.0, 50.0, 2_000.0]
+        async with _client(main) as client:
+            response = await client.post("/markets/MKT_0/quotes", json={"amounts": amounts})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["amounts"] == amounts
+        assert set(body["quotes"]) == {"YES", "NO"}
+        for i, amount in enumerate(amounts):
+            shares, impact, _ = orchestrator.markets["MKT_0"].amm().execute_trade("YES", amount)
+            assert body["quotes"]["YES"]["shares_received"][i] == pytest.approx(shares, abs=0.01)
+            assert body["quotes"]["YES"]["price_impact"][i] == pytest.approx(impact, abs=1e-4)
+        assert orchestrator.markets["MKT_0"].total_volume == 0.0  # Quoting never trades
+
+    @pytest.mark.asyncio
+    async def test_quotes_selected_outcomes(self, api):
+        main, _, _ = api
+        async with _client(main) as client:
+            response = await client.post(
+                "/markets/MKT_1/quotes", json={"amounts": [10.0], "outcomes": ["no"]}
+            )
+        assert response.status_code == 200
+        assert set(response.json()["quotes"]) == {"NO"}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("payload,status_code", [
+        ({"amounts": [10.0, 0.0]}, 400),
+        ({"amounts": [-5.0]}, 400),
+        ({"amounts": [100_000.01]}, 400),  # Above BetAmountValidator.MAX_BET
+        ({"amounts": [10.0], "outcomes": ["MAYBE"]}, 400),
+        ({"amounts": []}, 422),
+    ])
+    async def test_invalid_requests_rejected(self, api, payload, status_code):
+        main, _, _ = api
+        async with _client(main) as client:
+            response = await client.post("/markets/MKT_0/quotes", json=payload)
+        assert response.status_code == status_code
+
+    @pytest.mark.asyncio
+    async def test_unknown_and_closed_markets(self, api):
+        main, orchestrator, _ = api
+        orchestrator.markets["MKT_1"].status = "RESOLVED"
+        async with _client(main) as client:
+            missing = await client.post("/markets/NOPE/quotes", json={"amounts": [1.0]})
+            closed = await client.post("/markets/MKT_1/quotes", json={"amounts": [1.0]})
+        assert missing.status_code == 404
+        assert closed.status_code == 400
+
+
+# ============================================
+# TRENDING
+# ============================================
+
+class TestTrendingMarkets:
+    @pytest.mark.asyncio
+    async def test_duplicate_titles_keep_highest_volume(self, api):
+        main, orchestrator, _ = api
+        for market in orchestrator.markets.values():
+            market.title = "Who wins?"
+        await orchestrator.place_trade("MKT_1", "YES", 25.0)  # Inserted second, higher volume
+
+        async with _client(main) as client:
+            response = await client.get("/markets/trending", params={"limit": 3})
+
+        assert response.status_code == 200
+        assert [m["id"] for m in response.json()["markets"]] == ["MKT_1"]
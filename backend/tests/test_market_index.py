@@ -0,0 +1,145 @@
+"""
+Tests for the indexed in-memory market store.
+"""
+
+import random
+
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("dotenv")
+
+from backend.core.event_orchestrator import BetDuration, BettingMarket, EventDomain
+from backend.core.market_index import MarketStore
+
+STATUSES = ["OPEN", "OPEN", "OPEN", "RESOLVED", "CLOSED"]
+
+
+def _market(i: int, rng: random.Random) -> BettingMarket:
+    return BettingMarket(
+        id=f"MKT_{i}",
+        event_id=f"evt_{i}",
+        title=f"Market {i}",
+        description="",
+        domain=rng.choice(list(EventDomain)),
+        duration=rng.choice(list(BetDuration)),
+        status=rng.choice(STATUSES),
+        outcomes=["YES", "NO"],
+        total_volume=float(rng.randrange(0, 50)) * 10,
+        virality_score=float(rng.randrange(0, 100)),
+    )
+
+
+def _brute_force(markets, status=None, domain=None, duration=None, order="virality", limit=50):
+    matches = [
+        m for m in markets
+        if (not status or m.status.upper() == status.upper())
+        and (not domain or m.domain.value == domain.lower())
+        and (not duration or m.duration.value == duration.lower())
+    ]
+    if order == "virality":
+        matches.sort(key=lambda m: (-m.virality_score, m.id))
+    else:
+        matches.sort(key=lambda m: (-m.total_volume, -m.virality_score, m.id))
+    return [m.id for m in matches[:limit]]
+
+
+@pytest.fixture
+def store():
+    rng = random.Random(11)
+    return MarketStore((m.id, m) for m in (_market(i, rng) for i in range(2_000)))
+
+
+class TestMarketStore:
+    @pytest.mark.parametrize("order", ["virality", "volume"])
+    @pytest.mark.parametrize("limit", [1, 10, 500])
+    def test_query_matches_brute_force(self, store, order, limit):
+        rng = random.Random(limit)
+        for _ in range(30):
+            filters = {
+                "status": rng.choice([None, "open", "RESOLVED"]),
+                "domain": rng.choice([None, "sports", "CRYPTO", "nope"]),
+                "duration": rng.choice([None, "micro", "macro"]),
+            }
+            got = [m.id for m in store.query(order=order, limit=limit, **filters)]
+            assert got == _brute_force(store.values(), order=order, limit=limit, **filters)
+            assert store.count(**filters) == len(_brute_force(store.values(), limit=10**9, **filters))
+
+    def test_iter_ranked_is_lazy_and_ordered(self, store):
+        ranked = store.iter_ranked(order="volume", status="OPEN")
+        first = [next(ranked).id for _ in range(25)]
+        assert first == _brute_force(store.values(), status="OPEN", order="volume", limit=25)
+
+    def test_touch_reindexes_in_place_changes(self, store):
+        market = store["MKT_7"]
+        market.total_volume = 1e9
+        market.status = "OPEN"
+        store.touch("MKT_7")
+        assert store.query(status="OPEN", order="volume", limit=1)[0] is market
+
+        market.status = "RESOLVED"
+        store.touch("MKT_7")
+        assert "MKT_7" not in [m.id for m in store.query(status="OPEN", limit=len(store))]
+        assert store.query(status="RESOLVED", order="volume", limit=1)[0] is market
+
+    def test_dict_mutations_stay_indexed(self, store):
+        del store["MKT_1"]
+        store.pop("MKT_2")
+        store.pop("missing", None)
+        new = _market(9_999, random.Random(0))
+        store[new.id] = new
+
+        for order in ("virality", "volume"):
+            assert [m.id for m in store.query(order=order, limit=len(store))] == _brute_force(
+                store.values(), order=order, limit=len(store)
+            )
+
+        store.clear()
+        assert store.query() == [] and store.count(status="OPEN") == 0
+
+    def test_payload_cached_until_touched(self, store, monkeypatch):
+        calls = []
+        original = BettingMarket.to_dict
+
+        def counting_to_dict(market):
+            calls.append(market.id)
+            return original(market)
+
+        monkeypatch.setattr(BettingMarket, "to_dict", counting_to_dict)
+
+        first = store.payload("MKT_3")
+        assert store.payload("MKT_3") is first
+        assert calls == ["MKT_3"]
+
+        store["MKT_3"].total_volume += 100
+        store.touch("MKT_3")
+        assert store.payload("MKT_3")["total_volume"] == first["total_volume"] + 100
+        assert calls == ["MKT_3", "MKT_3"]
+
+
+class TestOrchestratorIndex:
+    @pytest.mark.asyncio
+    async def test_trades_update_rankings_and_payloads(self, orchestrator_factory, add_markets):
+        orchestrator = orchestrator_factory()
+        add_markets(orchestrator, 5)
+        before = orchestrator.markets.payload("MKT_3")
+
+        await orchestrator.place_trade("MKT_3", "YES", 250.0)
+
+        assert orchestrator.markets.query(order="volume", limit=1)[0].id == "MKT_3"
+        after = orchestrator.markets.payload("MKT_3")
+        assert after is not before
+        assert after["total_volume"] == 250.0
+        assert after["outcome_odds"]["YES"] < 0.5
+
+    def test_replayed_trades_are_indexed(self, orchestrator_factory, add_markets):
+        orchestrator = orchestrator_factory()
+        add_markets(orchestrator, 3)
+        market = orchestrator.markets["MKT_1"]
+        market.total_volume = 75.0
+        orchestrator.record_trade(market, "NO", 75.0)
+        orchestrator.trade_journal.close()
+
+        restarted = orchestrator_factory()
+        top = restarted.markets.query(status="open", order="volume", limit=1)
+        assert top[0].id == "MKT_1"
@@ -0,0 +1,151 @@
+"""
+Tests for the coalescing progress reporter used by the theatre and
+verification bridges.
+"""
+
+import asyncio
+from typing import Optional
+
+import pytest
+
+from services.progress_reporter import CoalescingProgressReporter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class RecordingWriter:
+    def __init__(self, delay: float = 0.0):
+        self.calls: list[tuple[int, Optional[int]]] = []
+        self.delay = delay
+
+    async def __call__(self, completed: int, total: Optional[int]) -> None:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.calls.append((completed, total))
+
+
+# ============================================
+# COALESCING
+# ============================================
+
+class TestCoalescingProgressReporter:
+    @pytest.mark.asyncio
+    async def test_count_window_coalesces_writes(self):
+        writer = RecordingWriter()
+        reporter = CoalescingProgressReporter(
+            writer, interval=3600, every=100, clock=FakeClock()
+        )
+
+        for i in range(1, 5001):
+            reporter.report(i, 5000)
+            await asyncio.sleep(0)
+        await reporter.flush()
+
+        # First report, every 100 completions after it, then the final flush
+        assert len(writer.calls) == 51
+        assert writer.calls[-1] == (5000, 5000)
+
+    @pytest.mark.asyncio
+    async def test_time_window_triggers_write(self):
+        writer = RecordingWriter()
+        clock = FakeClock()
+        reporter = CoalescingProgressReporter(
+            writer, interval=1.0, every=1000, clock=clock
+        )
+
+        reporter.report(1, 10)
+        await asyncio.sleep(0)
+        reporter.report(2, 10)
+        await asyncio.sleep(0)
+        assert writer.calls == [(1, 10)]
+
+        clock.now = 1.5
+        reporter.report(3, 10)
+        await asyncio.sleep(0)
+        assert writer.calls == [(1, 10), (3, 10)]
+
+    @pytest.mark.asyncio
+    async def test_deadline_writes_held_back_value(self):
+        """A value no window released is written when the interval runs out."""
+        writer = RecordingWriter()
+        reporter = CoalescingProgressReporter(writer, interval=0.05, every=1000)
+
+        reporter.report(1, None)
+        await asyncio.sleep(0)
+        reporter.report(2, None)
+        reporter.report(3, None)
+        await asyncio.sleep(0)
+        assert writer.calls == [(1, None)]
+
+        await asyncio.sleep(0.2)  # No further reports: the deadline fires
+        assert writer.calls == [(1, None), (3, None)]
+        await reporter.flush()
+        assert writer.calls == [(1, None), (3, None)]
+
+    @pytest.mark.asyncio
+    async def test_flush_cancels_deadline(self):
+        writer = RecordingWriter()
+        reporter = CoalescingProgressReporter(writer, interval=0.05, every=1000)
+
+        reporter.report(1, 5)
+        await asyncio.sleep(0)
+        reporter.report(2, 5)
+        await reporter.flush()
+        await asyncio.sleep(0.1)
+        assert writer.calls == [(1, 5), (2, 5)]
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_latest_only(self):
+        writer = RecordingWriter()
+        reporter = CoalescingProgressReporter(
+            writer, interval=3600, every=1000, clock=FakeClock()
+        )
+
+        for i in range(1, 11):
+            reporter.report(i, 10)
+        await reporter.flush()
+        await reporter.flush()  # Nothing new — no extra write
+
+        assert writer.calls == [(10, 10)]
+
+    @pytest.mark.asyncio
+    async def test_single_writer_in_flight(self):
+        """Reports during a slow write are coalesced into one follow-up write."""
+        writer = RecordingWriter(delay=0.01)
+        reporter = CoalescingProgressReporter(writer, interval=0, every=1)
+
+        for i in range(1, 101):
+            reporter.report(i, 100)
+            await asyncio.sleep(0)
+        await reporter.flush()
+
+        assert len(writer.calls) < 10
+        assert writer.calls == sorted(writer.calls)
+        assert writer.calls[-1] == (100, 100)
+
+    @pytest.mark.asyncio
+    async def test_write_failure_is_logged_not_raised(self):
+        async def failing_write(completed, total):
+            raise RuntimeError("db down")
+
+        reporter = CoalescingProgressReporter(failing_write)
+        reporter.report(1, 2)
+        await reporter.flush()
+        assert reporter.write_count == 1
+
+    def test_report_without_running_loop(self):
+        writer = RecordingWriter()
+        reporter = CoalescingProgressReporter(writer)
+        reporter.report(1, 2)  # Must not raise
+        asyncio.run(reporter.flush())
+        assert writer.calls == [(1, 2)]
+
+    def test_invalid_window(self):
+        with pytest.raises(ValueError):
+            CoalescingProgressReporter(RecordingWriter(), every=0)
@@ -0,0 +1,190 @@
+"""
+Tests for TheatreRepository bulk persistence of episode scores and audit events.
+"""
+
+import asyncio
+import os
+import time
+import uuid
+from datetime import datetime
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from database.connection import Base
+from database.models import TheatreAuditEvent, TheatreEpisodeScore
+from database.repositories.theatre_repository import TheatreRepository
+
+pytest.importorskip("aiosqlite")
+
+_TABLES = [TheatreEpisodeScore.__table__, TheatreAuditEvent.__table__]
+
+
+# ============================================
+# FIXTURES
+# ============================================
+
+async def _make_engine(url: str):
+    eng = create_async_engine(url)
+    async with eng.begin() as conn:
+        await conn.run_sync(lambda c: Base.metadata.drop_all(c, tables=_TABLES))
+        await conn.run_sync(lambda c: Base.metadata.create_all(c, tables=_TABLES))
+    return eng
+
+
+@pytest.fixture
+def engine():
+    eng = asyncio.run(_make_engine("sqlite+aiosqlite:///:memory:"))
+    yield eng
+    asyncio.run(eng.dispose())
+
+
+def make_score_rows(n: int, theatre_id: str = "theatre-1") -> list[dict]:
+    now = datetime(2026, 2, 19, 16, 30, 0)
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "theatre_id": theatre_id,
+            "certificate_id": "cert-1",
+            "episode_id": f"ep-{i:06d}",
+            "invocation_status": "SUCCESS",
+            "latency_ms": 120,
+            "scores_json": {"accuracy": 0.9, "completeness": 0.8},
+            "composite_score": 0.86,
+            "scored_at": now,
+        }
+        for i in range(n)
+    ]
+
+
+async def _count(eng, model) -> int:
+    async with async_sessionmaker(eng)() as session:
+        return (await session.execute(select(func.count()).select_from(model))).scalar_one()
+
+
+# ============================================
+# BULK INSERT
+# ============================================
+
+class TestBulkInsert:
+    def test_inserts_all_rows_across_chunks(self, engine):
+        async def run():
+            async with async_sessionmaker(engine)() as session:
+                repo = TheatreRepository(session, chunk_size=7)
+                inserted = await repo.bulk_insert_episode_scores(make_score_rows(50))
+                await session.commit()
+            return inserted, await _count(engine, TheatreEpisodeScore)
+
+        assert asyncio.run(run()) == (50, 50)
+
+    def test_round_trips_json_and_values(self, engine):
+        async def run():
+            async with async_sessionmaker(engine)() as session:
+                await TheatreRepository(session).bulk_insert_episode_scores(
+                    make_score_rows(1)
+                )
+                await session.commit()
+                row = (await session.execute(select(TheatreEpisodeScore))).scalar_one()
+                return row.episode_id, row.scores_json
+
+        assert asyncio.run(run()) == (
+            "ep-000000", {"accuracy": 0.9, "completeness": 0.8}
+        )
+
+    def test_audit_event_defaults_applied(self, engine):
+        async def run():
+            async with async_sessionmaker(engine)() as session:
+                await TheatreRepository(session).bulk_insert_audit_events([{
+                    "theatre_id": "theatre-1",
+                    "event_type": "theatre_resolved",
+                    "detail_json": {"replay_count": 3},
+                }])
+                await session.commit()
+                return (await session.execute(select(TheatreAuditEvent))).scalar_one()
+
+        event = asyncio.run(run())
+        assert event.id
+        assert event.created_at is not None
+
+    def test_failure_in_later_chunk_rolls_back_everything(self, engine):
+        rows = make_score_rows(30)
+        rows[25]["id"] = rows[3]["id"]  # Duplicate primary key in the last chunk
+
+        async def run():
+            async with async_sessionmaker(engine)() as session:
+                repo = TheatreRepository(session, chunk_size=10)
+                with pytest.raises(IntegrityError):
+                    await repo.bulk_insert_episode_scores(rows)
+                await session.rollback()
+            return await _count(engine, TheatreEpisodeScore)
+
+        assert asyncio.run(run()) == 0
+
+    def test_empty_input(self, engine):
+        async def run():
+            async with async_sessionmaker(engine)() as session:
+                return await TheatreRepository(session).bulk_insert_episode_scores([])
+
+        assert asyncio.run(run()) == 0
+
+    def test_invalid_chunk_size(self):
+        with pytest.raises(ValueError):
+            TheatreRepository(session=None, chunk_size=0)
+
+
+# ============================================
+# BENCHMARKS (`bench` fixture in conftest.py; skipped without pytest-benchmark)
+# ============================================
+
+_BENCH_ROWS = 20_000
+
+# SQLite file DB always; PostgreSQL only when a stand-in URL is provided,
+# e.g. ECHELON_BENCH_POSTGRES_URL=postgresql+asyncpg://user:pw@localhost/bench
+_BENCH_URLS = {
+    "sqlite": None,
+    "postgres": os.environ.get("ECHELON_BENCH_POSTGRES_URL"),
+}
+
+
+@pytest.fixture(params=sorted(_BENCH_URLS))
+def bench_url(request, tmp_path):
+    if request.param == "sqlite":
+        return f"sqlite+aiosqlite:///{tmp_path / 'bench.db'}"
+    if not _BENCH_URLS[request.param]:
+        pytest.skip("ECHELON_BENCH_POSTGRES_URL not set")
+    return _BENCH_URLS[request.param]
+
+
+async def _per_object_add(eng, rows: list[dict]) -> None:
+    async with async_sessionmaker(eng)() as session:
+        for row in rows:
+            session.add(TheatreEpisodeScore(**row))
+        await session.commit()
+
+
+async def _bulk_insert(eng, rows: list[dict]) -> None:
+    async with async_sessionmaker(eng)() as session:
+        await TheatreRepository(session).bulk_insert_episode_scores(rows)
+        await session.commit()
+
+
+@pytest.mark.parametrize("strategy", ["per_object_add", "bulk_insert"])
+def test_bench_episode_score_persistence(bench, bench_url, strategy):
+    write = {"per_object_add": _per_object_add, "bulk_insert": _bulk_insert}[strategy]
+
+    def run() -> float:
+        async def go():
+            eng = await _make_engine(bench_url)
+            try:
+                start = time.perf_counter()
+                await write(eng, make_score_rows(_BENCH_ROWS))
+                return time.perf_counter() - start
+            finally:
+                await eng.dispose()
+
+        return asyncio.run(go())
+
+    elapsed = bench.pedantic(run, rounds=1, iterations=1)
+    bench.extra_info["rows_per_sec"] = round(_BENCH_ROWS / elapsed)
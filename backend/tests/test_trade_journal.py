@@ -0,0 +1,183 @@
+"""
+Tests for the trade journal and the orchestrator's journal-backed market persistence.
+"""
+
+import json
+import time
+
+import pytest
+
+from backend.core.trade_journal import ACTIVE_SEGMENT, TradeJournal
+
+
+def _state(i: int) -> dict:
+    return {"yes_shares": 1000.0 + i, "no_shares": 1000.0 - i}
+
+
+# ============================================
+# JOURNAL
+# ============================================
+
+class TestTradeJournal:
+    def test_append_and_replay_in_order(self, tmp_path):
+        journal = TradeJournal(tmp_path)
+        seqs = [journal.append(f"MKT_{i % 3}", _state(i)) for i in range(10)]
+
+        records = list(journal.replay())
+        assert seqs == list(range(1, 11))
+        assert [r["seq"] for r in records] == seqs
+        assert records[4] == {"seq": 5, "market_id": "MKT_1", **_state(4)}
+
+    def test_records_are_single_compact_lines(self, tmp_path):
+        journal = TradeJournal(tmp_path)
+        journal.append("MKT_1", _state(1))
+        journal.close()
+
+        lines = (tmp_path / ACTIVE_SEGMENT).read_text().splitlines()
+        assert len(lines) == 1
+        assert " " not in lines[0]
+
+    def test_reopen_continues_sequence(self, tmp_path):
+        journal = TradeJournal(tmp_path)
+        for i in range(3):
+            journal.append("MKT_1", _state(i))
+        journal.close()
+
+        reopened = TradeJournal(tmp_path)
+        assert reopened.seq == 3
+        assert reopened.pending == 3
+        assert reopened.append("MKT_1", _state(3)) == 4
+        assert len(list(reopened.replay())) == 4
+
+    def test_torn_tail_truncated(self, tmp_path):
+        journal = TradeJournal(tmp_path)
+        journal.append("MKT_1", _state(1))
+        journal.close()
+        with open(tmp_path / ACTIVE_SEGMENT, "a") as f:
+            f.write('{"seq":2,"market_id":"MKT_1","yes_sh')  # Crash mid-append
+
+        reopened = TradeJournal(tmp_path)
+        assert reopened.seq == 1
+        reopened.append("MKT_2", _state(2))
+        assert [r["market_id"] for r in reopened.replay()] == ["MKT_1", "MKT_2"]
+
+    def test_seal_and_discard(self, tmp_path):
+        journal = TradeJournal(tmp_path)
+        for i in range(3):
+            journal.append("MKT_1", _state(i))
+        first = journal.seal()
+        for i in range(3, 5):
+            journal.append("MKT_1", _state(i))
+        second = journal.seal()
+        journal.append("MKT_1", _state(5))
+
+        assert (first, second) == (3, 5)
+        assert journal.pending == 1
+        assert [r["seq"] for r in journal.replay()] == [1, 2, 3, 4, 5, 6]
+
+        assert journal.discard_sealed(first) == 1
+        assert [r["seq"] for r in journal.replay()] == [4, 5, 6]
+        assert journal.seal() == 6
+        assert journal.seal() == 6  # Nothing pending: no empty segment
+        journal.discard_sealed(6)
+        assert list(journal.replay()) == []
+
+
+# ============================================
+# ORCHESTRATOR INTEGRATION
+# ============================================
+
+def _trade(orchestrator, market_id: str, outcome: str, amount: float):
+    from backend.core.cpmm import CPMM
+
+    market = orchestrator.markets[market_id]
+    cpmm = CPMM()
+    cpmm.state.yes_shares, cpmm.state.no_shares = market.yes_shares, market.no_shares
+    _, _, new_odds = cpmm.execute_trade(outcome, amount)
+    market.yes_shares, market.no_shares = cpmm.state.yes_shares, cpmm.state.no_shares
+    market.total_volume += amount
+    market.outcome_odds = new_odds
+    orchestrator.record_trade(market, outcome, amount)
+
+
+def _wait_for_compaction(orchestrator, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while orchestrator._compacting and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def _market_state(orchestrator) -> dict:
+    return {
+        mid: (m.yes_shares, m.no_shares, m.total_volume)
+        for mid, m in orchestrator.markets.items()
+    }
+
+
+class TestOrchestratorJournal:
+    def test_bets_append_without_rewriting_snapshot(self, orchestrator_factory, add_markets, tmp_path):
+        orchestrator = orchestrator_factory()
+        add_markets(orchestrator, 20)
+        snapshot = (tmp_path / "markets.json").read_bytes()
+
+        for i in range(50):
+            _trade(orchestrator, f"MKT_{i % 20}", "YES" if i % 2 else "NO", 10.0)
+
+        assert (tmp_path / "markets.json").read_bytes() == snapshot
+        assert orchestrator.trade_journal.pending == 50
+
+    def test_restart_replays_journal(self, orchestrator_factory, add_markets):
+        orchestrator = orchestrator_factory()
+        add_markets(orchestrator, 5)
+        for i in range(30):
+            _trade(orchestrator, f"MKT_{i % 5}", "YES", 5.0 + i)
+        expected = _market_state(orchestrator)
+        orchestrator.trade_journal.close()
+
+        restarted = orchestrator_factory()
+        assert _market_state(restarted) == expected
+        # Startup folds the replayed trades into a fresh snapshot
+        assert list(restarted.trade_journal.replay()) == []
+
+    def test_background_compaction(self, orchestrator_factory, add_markets, monkeypatch, tmp_path):
+        import backend.core.event_orchestrator as eo
+
+        monkeypatch.setattr(eo, "JOURNAL_COMPACT_EVERY", 10)
+        orchestrator = orchestrator_factory()
+        add_markets(orchestrator, 3)
+        for i in range(25):
+            _trade(orchestrator, f"MKT_{i % 3}", "NO", 7.0)
+            _wait_for_compaction(orchestrator)
+
+        # Two compactions ran; only the 5 trades since are still journaled
+        assert [r["seq"] for r in orchestrator.trade_journal.replay()] == list(range(21, 26))
+        saved = json.loads((tmp_path / "markets.json").read_text())["data"]
+        assert saved["MKT_2"]["total_volume"] == pytest.approx(7.0 * 6)
+
+        expected = _market_state(orchestrator)
+        orchestrator.trade_journal.close()
+        assert _market_state(orchestrator_factory()) == expected
+
+    def test_crash_before_snapshot_recovers_from_sealed_segment(self, orchestrator_factory, add_markets):
+        orchestrator = orchestrator_factory()
+        add_markets(orchestrator, 2)
+        for i in range(6):
+            _trade(orchestrator, f"MKT_{i % 2}", "YES", 3.0)
+        orchestrator.trade_journal.seal()  # Compaction started, snapshot never written
+        _trade(orchestrator, "MKT_0", "NO", 4.0)
+        expected = _market_state(orchestrator)
+        orchestrator.trade_journal.close()
+
+        assert _market_state(orchestrator_factory()) == expected
+
+    def test_stale_snapshot_never_overwrites_newer(self, orchestrator_factory, add_markets, tmp_path):
+        orchestrator = orchestrator_factory()
+        add_markets(orchestrator, 2)
+        _trade(orchestrator, "MKT_0", "YES", 50.0)
+        stale = orchestrator._take_snapshot()
+        _trade(orchestrator, "MKT_0", "YES", 50.0)
+        orchestrator._save_markets_state()
+
+        orchestrator._write_snapshot(*stale)  # Late background write
+
+        saved = json.loads((tmp_path / "markets.json").read_text())["data"]
+        assert saved["MKT_0"]["total_volume"] == 100.0
@@ -0,0 +1,375 @@
+"""Benchmark Script — end-to-end Theatre lifecycle throughput on synthetic data.
+
+Generates a seeded two-rail dataset (theatre.fixtures.synthetic), then runs
+the full certificate lifecycle the way run_two_rail_theatres.py does:
+template validation, commitment, ReplayEngine, EvidenceBundleBuilder and
+certificate validation. Episodes are streamed from JSONL, so runs of up to
+1M episodes do not need the dataset in memory.
+
+Reports episodes per second, per-stage wall time and peak memory (process
+RSS high-water mark after each stage; traced Python allocations per stage
+with --trace-memory, which is much slower).
+
+Usage:
+    python scripts/bench_theatre_lifecycle.py --theatre distribution_waterfall_v1 --episodes 100000
+    python scripts/bench_theatre_lifecycle.py --all --episodes 10000 --json report.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator
+
+# Ensure project root is on the path
+_ROOT = Path(__file__).resolve().parents[1]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from pydantic import BaseModel, Field
+
+from scripts.run_two_rail_theatres import (
+    THEATRE_ID,
+    THEATRES,
+    _normalize_template_for_schema,
+    certificate_to_schema_dict,
+    populate_template_runtime_fields,
+)
+from theatre.engine.certificate import TheatreCalibrationCertificate
+from theatre.engine.commitment import CommitmentProtocol
+from theatre.engine.evidence_bundle import EvidenceBundleBuilder
+from theatre.engine.ground_truth import JsonlGroundTruthSource, iter_episodes_jsonl
+from theatre.engine.models import BundleManifest, TheatreCriteria
+from theatre.engine.replay import ReplayEngine
+from theatre.engine.scoring import TheatreScoringProvider
+from theatre.engine.template_validator import TemplateValidator
+from theatre.engine.tier_assigner import TierAssigner
+from theatre.fixtures.synthetic import load_template, write_dataset_jsonl
+from theatre.scoring import DeterministicOracleAdapter
+
+STAGES = ("generate", "template", "commitment", "replay", "evidence_bundle", "certificate")
+
+
+class StageReport(BaseModel):
+    seconds: float
+    peak_rss_mb: float  # Process high-water mark at the end of the stage
+    peak_traced_mb: float | None = None  # With trace_memory only
+
+
+class LifecycleReport(BaseModel):
+    """Throughput, per-stage timing and memory for one lifecycle run."""
+
+    theatre_key: str
+    episodes: int
+    seed: int
+    max_concurrency: int
+    invocation_layout: str
+    composite_score: float
+    dataset_hash: str
+    # Episodes per second over the lifecycle (template validation through
+    # certificate; dataset generation excluded)
+    episodes_per_second: float
+    replay_episodes_per_second: float
+    lifecycle_seconds: float
+    peak_rss_mb: float
+    stages: dict[str, StageReport] = Field(default_factory=dict)
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class _StageTimer:
+    def __init__(self, trace_memory: bool):
+        self._trace_memory = trace_memory
+        self.stages: dict[str, StageReport] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        if self._trace_memory:
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        yield
+        elapsed = time.perf_counter() - start
+        traced = (
+            tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+            if self._trace_memory else None
+        )
+        self.stages[name] = StageReport(
+            seconds=elapsed, peak_rss_mb=_peak_rss_mb(), peak_traced_mb=traced
+        )
+
+
+async def run_lifecycle_benchmark(
+    theatre_key: str,
+    episodes: int,
+    work_dir: Path,
+    seed: int = 0,
+    max_concurrency: int = 64,
+    invocation_layout: str = "packed",
+    trace_memory: bool = False,
+) -> LifecycleReport:
+    """Run one synthetic theatre end to end and report where the time went."""
+    config = THEATRES[theatre_key]
+    timer = _StageTimer(trace_memory)
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        with timer.stage("generate"):
+            dataset_path = work_dir / f"{theatre_key}_{episodes}_{seed}.jsonl"
+            dataset_hash = write_dataset_jsonl(theatre_key, episodes, dataset_path, seed)
+
+        with timer.stage("template"):
+            raw_template = load_template(theatre_key)
+            template_id = raw_template.get("template_id", theatre_key)
+            construct_info = raw_template["product_theatre_config"]["construct_under_test"]
+            construct_id = construct_info["construct_id"]
+            construct_version_hex = hashlib.sha256(
+                construct_info["construct_version"].encode()
+            ).hexdigest()
+            template = populate_template_runtime_fields(
+                template=_normalize_template_for_schema(raw_template),
+                construct_version=construct_version_hex,
+                dataset_hash=dataset_hash,
+            )
+            schema_path = _ROOT / "docs" / "schemas" / "echelon_theatre_schema_v2.json"
+            validator = TemplateValidator(schema=json.loads(schema_path.read_text()))
+            errors = validator.validate(template, is_certificate_run=True)
+            if errors:
+                raise ValueError(f"[{theatre_key}] Template validation failed: {errors}")
+
+        with timer.stage("commitment"):
+            version_pins = template["version_pins"]
+            receipt = CommitmentProtocol.create_receipt(
+                theatre_id=THEATRE_ID,
+                template=template,
+                version_pins=version_pins,
+                dataset_hashes=template["dataset_hashes"],
+            )
+
+        with timer.stage("replay"):
+            criteria = TheatreCriteria(**template["criteria"])
+            engine = ReplayEngine(
+                theatre_id=THEATRE_ID,
+                construct_id=construct_id,
+                construct_version=construct_version_hex,
+                criteria=criteria,
+                oracle_adapter=DeterministicOracleAdapter(),
+                scoring_provider=TheatreScoringProvider(
+                    criteria=criteria, scorer=config["scorer_class"]()
+                ),
+                committed_dataset_hash=dataset_hash,
+                max_concurrency=max_concurrency,
+            )
+            result = await engine.run(JsonlGroundTruthSource(dataset_path, total=episodes))
+            resolved_at = datetime.utcnow()
+
+        with timer.stage("evidence_bundle"):
+            bundle = EvidenceBundleBuilder(
+                theatre_id=f"{template_id}-{uuid.uuid4().hex[:8]}",
+                output_dir=work_dir / "bundles",
+                flush_every=256,
+                invocation_layout=invocation_layout,
+            )
+            bundle.write_ground_truth(
+                dataset=(ep.model_dump() for ep in iter_episodes_jsonl(dataset_path)),
+                filename=dataset_path.name,
+            )
+            bundle.write_invocations(
+                (
+                    er.episode_id,
+                    {"episode_id": er.episode_id, "status": er.invocation_status},
+                    {
+                        "oracle_output": er.oracle_output,
+                        "scores": er.scores,
+                        "composite": er.composite_score,
+                    },
+                )
+                for er in result.episode_results
+            )
+            for er in result.episode_results:
+                if er.scores:
+                    bundle.write_episode_score({
+                        "episode_id": er.episode_id,
+                        "scores": er.scores,
+                        "composite_score": er.composite_score,
+                        "status": er.invocation_status,
+                    })
+            bundle.write_aggregate_scores({
+                "scores": result.aggregate_scores,
+                "composite_score": result.composite_score,
+                "replay_count": result.replay_count,
+            })
+            bundle.write_template(template)
+            bundle.write_commitment_receipt(receipt)
+            file_inventory = bundle.compute_file_inventory()
+            evidence_bundle_hash = bundle.compute_bundle_hash()
+            bundle.write_manifest(BundleManifest(
+                theatre_id=THEATRE_ID,
+                template_id=template_id,
+                construct_id=construct_id,
+                execution_path="replay",
+                commitment_hash=receipt.commitment_hash,
+                file_inventory=file_inventory,
+            ))
+
+        with timer.stage("certificate"):
+            tier = TierAssigner.assign(
+                replay_count=result.replay_count,
+                has_full_pins=bool(version_pins.get("constructs")),
+                has_published_scores=True,
+                has_verifiable_hash=True,
+                has_disputes=False,
+                failure_rate=result.failure_rate,
+            )
+            issued_at = datetime.utcnow()
+            certificate = TheatreCalibrationCertificate(
+                certificate_id=str(uuid.uuid4()),
+                theatre_id=THEATRE_ID,
+                template_id=template_id,
+                construct_id=construct_id,
+                criteria=criteria,
+                scores=result.aggregate_scores,
+                composite_score=result.composite_score,
+                replay_count=result.replay_count,
+                evidence_bundle_hash=evidence_bundle_hash,
+                ground_truth_hash=dataset_hash,
+                construct_version=construct_version_hex,
+                scorer_version=version_pins.get("scorer_version", "deterministic-v0.1"),
+                methodology_version="1.0.0",
+                dataset_hash=result.dataset_hash,
+                verification_tier=tier,
+                commitment_hash=receipt.commitment_hash,
+                issued_at=issued_at,
+                expires_at=TierAssigner.compute_expiry(tier, issued_at),
+                theatre_committed_at=receipt.committed_at,
+                theatre_resolved_at=resolved_at,
+                ground_truth_source="DETERMINISTIC_COMPUTATION",
+                execution_path="replay",
+            )
+            cert_dict = certificate_to_schema_dict(certificate)
+            cert_schema_path = _ROOT / "docs" / "schemas" / "echelon_certificate_schema.json"
+
+            import jsonschema
+            jsonschema.validate(
+                instance=cert_dict, schema=json.loads(cert_schema_path.read_text())
+            )
+            bundle.write_certificate(cert_dict)
+            bundle.close()
+            missing = bundle.validate_minimum_files()
+            if missing:
+                raise ValueError(f"[{theatre_key}] Evidence bundle incomplete: {missing}")
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+
+    lifecycle_seconds = sum(
+        report.seconds for name, report in timer.stages.items() if name != "generate"
+    )
+    replay_seconds = timer.stages["replay"].seconds
+    return LifecycleReport(
+        theatre_key=theatre_key,
+        episodes=episodes,
+        seed=seed,
+        max_concurrency=max_concurrency,
+        invocation_layout=invocation_layout,
+        composite_score=result.composite_score,
+        dataset_hash=dataset_hash,
+        episodes_per_second=episodes / lifecycle_seconds if lifecycle_seconds else 0.0,
+        replay_episodes_per_second=episodes / replay_seconds if replay_seconds else 0.0,
+        lifecycle_seconds=lifecycle_seconds,
+        peak_rss_mb=_peak_rss_mb(),
+        stages=timer.stages,
+    )
+
+
+def format_report(report: LifecycleReport) -> str:
+    lines = [
+        f"{report.theatre_key}: {report.episodes} episodes, "
+        f"{report.episodes_per_second:,.0f} eps lifecycle, "
+        f"{report.replay_episodes_per_second:,.0f} eps replay, "
+        f"peak RSS {report.peak_rss_mb:,.0f} MB, composite={report.composite_score:.3f}",
+    ]
+    for name in STAGES:
+        stage = report.stages[name]
+        traced = (
+            f"  traced peak {stage.peak_traced_mb:,.1f} MB"
+            if stage.peak_traced_mb is not None else ""
+        )
+        lines.append(
+            f"  {name:16s} {stage.seconds:9.3f}s  RSS high-water "
+            f"{stage.peak_rss_mb:,.0f} MB{traced}"
+        )
+    return "\n".join(lines)
+
+
+async def main() -> None:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the Theatre lifecycle on synthetic two-rail data",
+    )
+    parser.add_argument(
+        "--theatre",
+        choices=list(THEATRES.keys()),
+        default="distribution_waterfall_v1",
+        help="Theatre to benchmark (default: distribution_waterfall_v1)",
+    )
+    parser.add_argument("--all", action="store_true", help="Benchmark all three theatres")
+    parser.add_argument("--episodes", type=int, default=10_000, help="Episodes to generate")
+    parser.add_argument("--seed", type=int, default=0, help="Generator seed")
+    parser.add_argument(
+        "--max-concurrency", type=int, default=64, help="ReplayEngine max_concurrency"
+    )
+    parser.add_argument(
+        "--invocation-layout",
+        choices=["files", "packed"],
+        default="packed",
+        help="Evidence bundle invocation layout",
+    )
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="Also report traced Python allocation peaks per stage (slow)",
+    )
+    parser.add_argument("--work-dir", help="Directory for datasets and bundles (default: temp)")
+    parser.add_argument("--json", dest="json_path", help="Write the reports to this JSON file")
+    args = parser.parse_args()
+
+    keys = list(THEATRES) if args.all else [args.theatre]
+    with tempfile.TemporaryDirectory(prefix="theatre_bench_") as tmp:
+        work_dir = Path(args.work_dir) if args.work_dir else Path(tmp)
+        reports = []
+        for key in keys:
+            report = await run_lifecycle_benchmark(
+                key,
+                args.episodes,
+                work_dir,
+                seed=args.seed,
+                max_concurrency=args.max_concurrency,
+                invocation_layout=args.invocation_layout,
+                trace_memory=args.trace_memory,
+            )
+            print(format_report(report))
+            reports.append(report)
+
+    if args.json_path:
+        Path(args.json_path).write_text(
+            json.dumps([r.model_dump() for r in reports], indent=2)
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -31,6 +31,7 @@ from theatre.engine.certificate import TheatreCalibrationCertificate
 from theatre.engine.commitment import CommitmentProtocol
 from theatre.engine.evidence_bundle import EvidenceBundleBuilder
 from theatre.engine.models import AuditEvent, BundleManifest, TheatreCriteria
+from theatre.engine.oracle_cache import CachingOracleAdapter, OracleResponseCache
 from theatre.engine.replay import ReplayEngine
 from theatre.engine.scoring import TheatreScoringProvider
 from theatre.engine.template_validator import TemplateValidator
@@ -41,6 +42,7 @@ from theatre.integration import (
     GitHubIngester,
     GroundTruthAdapter,
     GroundTruthRecord,
+    GroundTruthStore,
     ObserverOracleAdapter,
     ObserverScoringFunction,
     load_observer_template,
@@ -176,6 +178,8 @@ async def run_observer_theatre(
     anthropic_api_key: str | None = None,
     construct_version: str = "0000000",
     verbose: bool = False,
+    max_concurrency: int = 1,
+    oracle_cache_dir: Path | None = None,
 ) -> Path:
     """Execute the full Observer Theatre lifecycle.
 
@@ -185,6 +189,11 @@ async def run_observer_theatre(
         anthropic_api_key: Anthropic API key (None = use env default).
         construct_version: Git commit hash of construct under test.
         verbose: Enable verbose logging.
+        max_concurrency: Maximum episodes invoked and scored in parallel.
+        oracle_cache_dir: If set, reuse oracle outputs cached for the same
+            construct version and input (e.g. when re-scoring a run). The
+            Observer construct is non-deterministic, so this replays earlier
+            outputs rather than sampling new ones; a warning is logged.
 
     Returns:
         Path to the written certificate file.
@@ -271,6 +280,21 @@ async def run_observer_theatre(
     criteria = TheatreCriteria(**populated_template["criteria"])
 
     oracle_adapter = ObserverOracleAdapter(api_key=anthropic_api_key)
+    if oracle_cache_dir is not None:
+        # The Observer construct is an LLM call, so a cached output is a past
+        # sample, not the answer this run would get. Opt-in only, and loud.
+        logger.warning(
+            "Oracle cache enabled for non-deterministic construct %s: cached "
+            "outputs from %s are reused instead of re-invoking it",
+            construct_id,
+            oracle_cache_dir,
+        )
+        oracle_adapter = CachingOracleAdapter(
+            oracle_adapter,
+            OracleResponseCache(oracle_cache_dir),
+            construct_id=construct_id,
+            construct_version=construct_version,
+        )
     scoring_provider = TheatreScoringProvider(criteria=criteria, scorer=scorer)
 
     engine = ReplayEngine(
@@ -281,6 +305,7 @@ async def run_observer_theatre(
         oracle_adapter=oracle_adapter,
         scoring_provider=scoring_provider,
         committed_dataset_hash=dataset_hash,
+        max_concurrency=max_concurrency,
     )
 
     # ── Step 8: Run replay ───────────────────────────────────────────
@@ -295,6 +320,12 @@ async def run_observer_theatre(
         replay_result.failure_count,
         replay_result.composite_score,
     )
+    if replay_result.cache_stats is not None:
+        logger.info(
+            "Oracle cache: %d hits, %d misses",
+            replay_result.cache_stats.hits,
+            replay_result.cache_stats.misses,
+        )
 
     # ── Step 9: Assign tier ──────────────────────────────────────────
     tier = TierAssigner.assign(
@@ -311,147 +342,153 @@ async def run_observer_theatre(
 
     # ── Step 9.5: Build evidence bundle ──────────────────────────────
     # Bundle directory uses template_id (the specific template being verified)
-    bundle = EvidenceBundleBuilder(theatre_id=template_id, output_dir=output_dir)
+    with EvidenceBundleBuilder(
+        theatre_id=template_id, output_dir=output_dir, flush_every=256
+    ) as bundle:
+        # Write ground truth
+        bundle.write_ground_truth(
+            dataset=[ep.model_dump() for ep in episodes],
+            filename="observer_prs.jsonl",
+        )
 
-    # Write ground truth
-    bundle.write_ground_truth(
-        dataset=[ep.model_dump() for ep in episodes],
-        filename="observer_prs.jsonl",
-    )
+        # Write invocations and per-episode scores
+        bundle.write_invocations(
+            (
+                ep_result.episode_id,
+                {"episode_id": ep_result.episode_id, "status": ep_result.invocation_status},
+                {
+                    "oracle_output": ep_result.oracle_output,
+                    "scores": ep_result.scores,
+                    "composite": ep_result.composite_score,
+                },
+            )
+            for ep_result in replay_result.episode_results
+        )
+        for ep_result in replay_result.episode_results:
+            if ep_result.scores:
+                bundle.write_episode_score({
+                    "episode_id": ep_result.episode_id,
+                    "scores": ep_result.scores,
+                    "composite_score": ep_result.composite_score,
+                    "status": ep_result.invocation_status,
+                })
+
+        # Write aggregate scores
+        bundle.write_aggregate_scores({
+            "scores": replay_result.aggregate_scores,
+            "composite_score": replay_result.composite_score,
+            "replay_count": replay_result.replay_count,
+            "scored_count": replay_result.scored_count,
+            "failure_count": replay_result.failure_count,
+            "failure_rate": replay_result.failure_rate,
+        })
+        if replay_result.statistics is not None:
+            bundle.write_score_statistics(replay_result.statistics.model_dump())
+
+        # Write template and commitment receipt
+        bundle.write_template(populated_template)
+        bundle.write_commitment_receipt(receipt)
+
+        # ── Step 9.6: Build RLMF export records ──────────────────────────
+        episode_map = {ep.episode_id: ep for ep in episodes}
+        rlmf_records: list[dict] = []
+
+        for idx, ep_result in enumerate(replay_result.episode_results):
+            episode = episode_map[ep_result.episode_id]
+            rlmf_record = build_rlmf_record(
+                episode=episode,
+                oracle_output=ep_result.oracle_output,
+                scores=ep_result.scores or {},
+                criteria_ids=criteria.criteria_ids,
+                theatre_id=theatre_id,
+                config_hash=receipt.commitment_hash,
+                construct_id=construct_id,
+                construct_version=construct_version,
+                certificate_id=certificate_id,
+                invocation_status=ep_result.invocation_status,
+                composite_score=ep_result.composite_score or 0.0,
+                timestep=idx,
+            )
+            rlmf_records.append(rlmf_record)
+
+        # ── Step 9.7: Validate RLMF records against schema ───────────────
+        rlmf_schema_path = _ROOT / "docs" / "schemas" / "echelon_rlmf_schema_v2.json"
+        rlmf_schema = json.loads(rlmf_schema_path.read_text())
 
-    # Write invocations and per-episode scores
-    for ep_result in replay_result.episode_results:
-        bundle.write_invocation(
-            episode_id=ep_result.episode_id,
-            request={"episode_id": ep_result.episode_id, "status": ep_result.invocation_status},
-            response={
-                "oracle_output": ep_result.oracle_output,
-                "scores": ep_result.scores,
-                "composite": ep_result.composite_score,
-            },
+        try:
+            import jsonschema
+            for record in rlmf_records:
+                jsonschema.validate(instance=record, schema=rlmf_schema)
+            logger.info("All %d RLMF records validate against schema", len(rlmf_records))
+        except ImportError:
+            logger.warning("jsonschema not installed — skipping RLMF validation")
+        except jsonschema.ValidationError as e:
+            raise ValueError(f"RLMF schema validation failed: {e.message}") from e
+
+        # Write RLMF export to bundle
+        bundle.write_rlmf_export(rlmf_records)
+
+        # ── Step 9.8: Compute file inventory and bundle hash ─────────────
+        file_inventory = bundle.compute_file_inventory()
+        evidence_bundle_hash = bundle.compute_bundle_hash()
+
+        # Write manifest (with file_inventory, after all evidence files written)
+        manifest = BundleManifest(
+            theatre_id=theatre_id,
+            template_id=template_id,
+            construct_id=construct_id,
+            execution_path="replay",
+            commitment_hash=receipt.commitment_hash,
+            file_inventory=file_inventory,
         )
-        if ep_result.scores:
-            bundle.write_episode_score({
-                "episode_id": ep_result.episode_id,
-                "scores": ep_result.scores,
-                "composite_score": ep_result.composite_score,
-                "status": ep_result.invocation_status,
-            })
-
-    # Write aggregate scores
-    bundle.write_aggregate_scores({
-        "scores": replay_result.aggregate_scores,
-        "composite_score": replay_result.composite_score,
-        "replay_count": replay_result.replay_count,
-        "scored_count": replay_result.scored_count,
-        "failure_count": replay_result.failure_count,
-        "failure_rate": replay_result.failure_rate,
-    })
-
-    # Write template and commitment receipt
-    bundle.write_template(populated_template)
-    bundle.write_commitment_receipt(receipt)
-
-    # ── Step 9.6: Build RLMF export records ──────────────────────────
-    episode_map = {ep.episode_id: ep for ep in episodes}
-    rlmf_records: list[dict] = []
-
-    for idx, ep_result in enumerate(replay_result.episode_results):
-        episode = episode_map[ep_result.episode_id]
-        rlmf_record = build_rlmf_record(
-            episode=episode,
-            oracle_output=ep_result.oracle_output,
-            scores=ep_result.scores or {},
-            criteria_ids=criteria.criteria_ids,
+        bundle.write_manifest(manifest)
+
+        # ── Step 10: Build certificate with certificate_id from Step 0 ───
+        certificate = TheatreCalibrationCertificate(
+            certificate_id=certificate_id,
             theatre_id=theatre_id,
-            config_hash=receipt.commitment_hash,
+            template_id=template_id,
             construct_id=construct_id,
+            criteria=criteria,
+            scores=replay_result.aggregate_scores,
+            composite_score=replay_result.composite_score,
+            precision=replay_result.aggregate_scores.get("precision"),
+            recall=replay_result.aggregate_scores.get("recall"),
+            reply_accuracy=replay_result.aggregate_scores.get("reply_accuracy"),
+            replay_count=replay_result.replay_count,
+            evidence_bundle_hash=evidence_bundle_hash,
+            ground_truth_hash=dataset_hash,
             construct_version=construct_version,
-            certificate_id=certificate_id,
-            invocation_status=ep_result.invocation_status,
-            composite_score=ep_result.composite_score or 0.0,
-            timestep=idx,
+            scorer_version=version_pins.get("scorer_version", "unknown"),
+            methodology_version=version_pins.get("methodology_version", "1.0.0"),
+            dataset_hash=replay_result.dataset_hash,
+            verification_tier=tier,
+            commitment_hash=receipt.commitment_hash,
+            issued_at=issued_at,
+            expires_at=expires_at,
+            theatre_committed_at=receipt.committed_at,
+            theatre_resolved_at=resolved_at,
+            ground_truth_source="GITHUB_API",
+            execution_path="replay",
         )
-        rlmf_records.append(rlmf_record)
 
-    # ── Step 9.7: Validate RLMF records against schema ───────────────
-    rlmf_schema_path = _ROOT / "docs" / "schemas" / "echelon_rlmf_schema_v2.json"
-    rlmf_schema = json.loads(rlmf_schema_path.read_text())
+        # ── Step 11: Validate certificate against JSON Schema ────────────
+        cert_dict = certificate_to_schema_dict(certificate)
 
-    try:
-        import jsonschema
-        for record in rlmf_records:
-            jsonschema.validate(instance=record, schema=rlmf_schema)
-        logger.info("All %d RLMF records validate against schema", len(rlmf_records))
-    except ImportError:
-        logger.warning("jsonschema not installed — skipping RLMF validation")
-    except jsonschema.ValidationError as e:
-        raise ValueError(f"RLMF schema validation failed: {e.message}") from e
-
-    # Write RLMF export to bundle
-    bundle.write_rlmf_export(rlmf_records)
-
-    # ── Step 9.8: Compute file inventory and bundle hash ─────────────
-    file_inventory = bundle.compute_file_inventory()
-    evidence_bundle_hash = bundle.compute_bundle_hash()
-
-    # Write manifest (with file_inventory, after all evidence files written)
-    manifest = BundleManifest(
-        theatre_id=theatre_id,
-        template_id=template_id,
-        construct_id=construct_id,
-        execution_path="replay",
-        commitment_hash=receipt.commitment_hash,
-        file_inventory=file_inventory,
-    )
-    bundle.write_manifest(manifest)
+        cert_schema_path = _ROOT / "docs" / "schemas" / "echelon_certificate_schema.json"
+        cert_schema = json.loads(cert_schema_path.read_text())
 
-    # ── Step 10: Build certificate with certificate_id from Step 0 ───
-    certificate = TheatreCalibrationCertificate(
-        certificate_id=certificate_id,
-        theatre_id=theatre_id,
-        template_id=template_id,
-        construct_id=construct_id,
-        criteria=criteria,
-        scores=replay_result.aggregate_scores,
-        composite_score=replay_result.composite_score,
-        precision=replay_result.aggregate_scores.get("precision"),
-        recall=replay_result.aggregate_scores.get("recall"),
-        reply_accuracy=replay_result.aggregate_scores.get("reply_accuracy"),
-        replay_count=replay_result.replay_count,
-        evidence_bundle_hash=evidence_bundle_hash,
-        ground_truth_hash=dataset_hash,
-        construct_version=construct_version,
-        scorer_version=version_pins.get("scorer_version", "unknown"),
-        methodology_version=version_pins.get("methodology_version", "1.0.0"),
-        dataset_hash=replay_result.dataset_hash,
-        verification_tier=tier,
-        commitment_hash=receipt.commitment_hash,
-        issued_at=issued_at,
-        expires_at=expires_at,
-        theatre_committed_at=receipt.committed_at,
-        theatre_resolved_at=resolved_at,
-        ground_truth_source="GITHUB_API",
-        execution_path="replay",
-    )
-
-    # ── Step 11: Validate certificate against JSON Schema ────────────
-    cert_dict = certificate_to_schema_dict(certificate)
-
-    cert_schema_path = _ROOT / "docs" / "schemas" / "echelon_certificate_schema.json"
-    cert_schema = json.loads(cert_schema_path.read_text())
-
-    try:
-        import jsonschema
-        jsonschema.validate(instance=cert_dict, schema=cert_schema)
-        logger.info("Certificate validates against schema")
-    except ImportError:
-        logger.warning("jsonschema not installed — skipping schema validation")
-    except jsonschema.ValidationError as e:
-        raise ValueError(f"Certificate schema validation failed: {e.message}") from e
+        try:
+            import jsonschema
+            jsonschema.validate(instance=cert_dict, schema=cert_schema)
+            logger.info("Certificate validates against schema")
+        except ImportError:
+            logger.warning("jsonschema not installed — skipping schema validation")
+        except jsonschema.ValidationError as e:
+            raise ValueError(f"Certificate schema validation failed: {e.message}") from e
 
-    # Write certificate to evidence bundle
-    bundle.write_certificate(cert_dict)
+        # Write certificate to evidence bundle
+        bundle.write_certificate(cert_dict)
 
     # Validate bundle completeness
     missing = bundle.validate_minimum_files()
@@ -489,6 +526,36 @@ async def main() -> None:
         default="output",
         help="Output directory for certificates and evidence bundles",
     )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=1,
+        help="Maximum episodes invoked and scored in parallel",
+    )
+    parser.add_argument(
+        "--oracle-cache-dir",
+        default=None,
+        help=(
+            "Directory for cached oracle outputs (reused across runs). The Observer "
+            "construct is non-deterministic: cached outputs replace new samples"
+        ),
+    )
+    parser.add_argument(
+        "--github-cache-dir",
+        default=None,
+        help="Directory for cached PR diffs (revalidated with conditional requests)",
+    )
+    parser.add_argument(
+        "--store-dir",
+        default=None,
+        help="Keep a rolling ground-truth store here and sync only PRs changed since the last run",
+    )
+    parser.add_argument(
+        "--github-concurrency",
+        type=int,
+        default=8,
+        help="Maximum PR diff requests in flight",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -509,9 +576,17 @@ async def main() -> None:
 
     print(f"Ingesting up to {args.limit} merged PRs from {args.repo}...")
 
-    ingester = GitHubIngester(token=github_token)
+    ingester = GitHubIngester(
+        token=github_token,
+        cache_dir=Path(args.github_cache_dir) if args.github_cache_dir else None,
+        max_concurrency=args.github_concurrency,
+    )
     try:
-        records = await ingester.ingest(repo=args.repo, limit=args.limit)
+        if args.store_dir:
+            store = GroundTruthStore(Path(args.store_dir))
+            records = await ingester.sync(repo=args.repo, store=store, limit=args.limit)
+        else:
+            records = await ingester.ingest(repo=args.repo, limit=args.limit)
     except httpx.HTTPStatusError as exc:
         print(f"ERROR: GitHub API returned {exc.response.status_code}: {exc.response.text[:200]}")
         sys.exit(1)
@@ -531,6 +606,8 @@ async def main() -> None:
         output_dir=output_dir,
         anthropic_api_key=anthropic_api_key,
         verbose=args.verbose,
+        max_concurrency=args.max_concurrency,
+        oracle_cache_dir=Path(args.oracle_cache_dir) if args.oracle_cache_dir else None,
     )
     print(f"Certificate written to {cert_path}")
 
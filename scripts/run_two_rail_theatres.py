@@ -42,6 +42,7 @@ from theatre.scoring import (
     ReconciliationScorer,
     WaterfallScorer,
 )
+from theatre.scoring.process_pool import DEFAULT_BATCH_SIZE, ProcessPoolScorer
 
 logger = logging.getLogger(__name__)
 
@@ -171,6 +172,9 @@ def populate_template_runtime_fields(
     return populated
 
 
+_COMPOSITE_ROUNDING_TOLERANCE = 1e-9
+
+
 def certificate_to_schema_dict(cert: TheatreCalibrationCertificate) -> dict:
     """Convert certificate to dict matching the JSON Schema."""
     data = cert.model_dump()
@@ -185,6 +189,14 @@ def certificate_to_schema_dict(cert: TheatreCalibrationCertificate) -> dict:
     if hasattr(data.get("criteria"), "model_dump"):
         data["criteria"] = data["criteria"].model_dump()
 
+    # The schema bounds composite_score to [0, 1]; template weights summing
+    # to 1.0 can overshoot it by an ulp when every score is perfect
+    composite = data["composite_score"]
+    if 1.0 < composite <= 1.0 + _COMPOSITE_ROUNDING_TOLERANCE:
+        data["composite_score"] = 1.0
+    elif not 0.0 <= composite <= 1.0:
+        raise ValueError(f"composite_score {composite} is outside [0, 1]")
+
     for optional_key in ("brier_score", "ece", "construct_chain_versions",
                          "ground_truth_hash", "methodology_version",
                          "precision", "recall", "reply_accuracy"):
@@ -214,9 +226,12 @@ async def run_single_theatre(
     theatre_key: str,
     output_dir: Path,
     verbose: bool = False,
+    score_workers: int = 0,
 ) -> tuple[Path, dict]:
     """Execute a single deterministic theatre.
 
+    With score_workers > 0, scoring runs in that many worker processes.
+
     Returns (certificate_path, certificate_dict).
     """
     config = THEATRES[theatre_key]
@@ -284,7 +299,14 @@ async def run_single_theatre(
     # Step 7: Build ReplayEngine
     criteria = TheatreCriteria(**populated_template["criteria"])
     scorer_instance = config["scorer_class"]()
-    scoring_provider = TheatreScoringProvider(criteria=criteria, scorer=scorer_instance)
+    pool_scorer = None
+    max_concurrency = 1
+    if score_workers > 0:
+        pool_scorer = ProcessPoolScorer(scorer_instance, max_workers=score_workers)
+        max_concurrency = score_workers * DEFAULT_BATCH_SIZE
+    scoring_provider = TheatreScoringProvider(
+        criteria=criteria, scorer=pool_scorer or scorer_instance
+    )
     oracle_adapter = DeterministicOracleAdapter()
 
     engine = ReplayEngine(
@@ -295,13 +317,18 @@ async def run_single_theatre(
         oracle_adapter=oracle_adapter,
         scoring_provider=scoring_provider,
         committed_dataset_hash=dataset_hash,
+        max_concurrency=max_concurrency,
     )
 
     # Step 8: Run replay
     def progress_callback(current: int, total: int) -> None:
         logger.info("[%s] Progress: %d/%d", theatre_key, current, total)
 
-    replay_result = await engine.run(episodes, progress_callback=progress_callback)
+    try:
+        replay_result = await engine.run(episodes, progress_callback=progress_callback)
+    finally:
+        if pool_scorer is not None:
+            pool_scorer.close()
     resolved_at = datetime.utcnow()
     logger.info(
         "[%s] Replay complete: %d scored, composite=%.3f",
@@ -324,94 +351,100 @@ async def run_single_theatre(
     logger.info("[%s] Tier: %s", theatre_key, tier)
 
     # Step 9.5: Build evidence bundle
-    bundle = EvidenceBundleBuilder(theatre_id=template_id, output_dir=output_dir)
-
-    bundle.write_ground_truth(
-        dataset=[ep.model_dump() for ep in episodes],
-        filename=f"{theatre_key}_episodes.jsonl",
-    )
-
-    for ep_result in replay_result.episode_results:
-        bundle.write_invocation(
-            episode_id=ep_result.episode_id,
-            request={"episode_id": ep_result.episode_id, "status": ep_result.invocation_status},
-            response={
-                "oracle_output": ep_result.oracle_output,
-                "scores": ep_result.scores,
-                "composite": ep_result.composite_score,
-            },
+    with EvidenceBundleBuilder(
+        theatre_id=template_id, output_dir=output_dir, flush_every=256
+    ) as bundle:
+        bundle.write_ground_truth(
+            dataset=[ep.model_dump() for ep in episodes],
+            filename=f"{theatre_key}_episodes.jsonl",
         )
-        if ep_result.scores:
-            bundle.write_episode_score({
-                "episode_id": ep_result.episode_id,
-                "scores": ep_result.scores,
-                "composite_score": ep_result.composite_score,
-                "status": ep_result.invocation_status,
-            })
-
-    bundle.write_aggregate_scores({
-        "scores": replay_result.aggregate_scores,
-        "composite_score": replay_result.composite_score,
-        "replay_count": replay_result.replay_count,
-        "scored_count": replay_result.scored_count,
-        "failure_count": replay_result.failure_count,
-        "failure_rate": replay_result.failure_rate,
-    })
-
-    bundle.write_template(populated_template)
-    bundle.write_commitment_receipt(receipt)
-
-    # Compute evidence bundle hash
-    file_inventory = bundle.compute_file_inventory()
-    evidence_bundle_hash = bundle.compute_bundle_hash()
-
-    manifest = BundleManifest(
-        theatre_id=theatre_id,
-        template_id=template_id,
-        construct_id=construct_id,
-        execution_path="replay",
-        commitment_hash=receipt.commitment_hash,
-        file_inventory=file_inventory,
-    )
-    bundle.write_manifest(manifest)
 
-    # Step 10: Build certificate
-    certificate = TheatreCalibrationCertificate(
-        certificate_id=certificate_id,
-        theatre_id=theatre_id,
-        template_id=template_id,
-        construct_id=construct_id,
-        criteria=criteria,
-        scores=replay_result.aggregate_scores,
-        composite_score=replay_result.composite_score,
-        replay_count=replay_result.replay_count,
-        evidence_bundle_hash=evidence_bundle_hash,
-        ground_truth_hash=dataset_hash,
-        construct_version=construct_version_hex,
-        scorer_version=version_pins.get("scorer_version", "deterministic-v0.1"),
-        methodology_version="1.0.0",
-        dataset_hash=replay_result.dataset_hash,
-        verification_tier=tier,
-        commitment_hash=receipt.commitment_hash,
-        issued_at=issued_at,
-        expires_at=expires_at,
-        theatre_committed_at=receipt.committed_at,
-        theatre_resolved_at=resolved_at,
-        ground_truth_source="DETERMINISTIC_COMPUTATION",
-        execution_path="replay",
-    )
+        bundle.write_invocations(
+            (
+                ep_result.episode_id,
+                {"episode_id": ep_result.episode_id, "status": ep_result.invocation_status},
+                {
+                    "oracle_output": ep_result.oracle_output,
+                    "scores": ep_result.scores,
+                    "composite": ep_result.composite_score,
+                },
+            )
+            for ep_result in replay_result.episode_results
+        )
+        for ep_result in replay_result.episode_results:
+            if ep_result.scores:
+                bundle.write_episode_score({
+                    "episode_id": ep_result.episode_id,
+                    "scores": ep_result.scores,
+                    "composite_score": ep_result.composite_score,
+                    "status": ep_result.invocation_status,
+                })
+
+        bundle.write_aggregate_scores({
+            "scores": replay_result.aggregate_scores,
+            "composite_score": replay_result.composite_score,
+            "replay_count": replay_result.replay_count,
+            "scored_count": replay_result.scored_count,
+            "failure_count": replay_result.failure_count,
+            "failure_rate": replay_result.failure_rate,
+        })
+        if replay_result.statistics is not None:
+            bundle.write_score_statistics(replay_result.statistics.model_dump())
+
+        bundle.write_template(populated_template)
+        bundle.write_commitment_receipt(receipt)
+
+        # Compute evidence bundle hash
+        file_inventory = bundle.compute_file_inventory()
+        evidence_bundle_hash = bundle.compute_bundle_hash()
+
+        manifest = BundleManifest(
+            theatre_id=theatre_id,
+            template_id=template_id,
+            construct_id=construct_id,
+            execution_path="replay",
+            commitment_hash=receipt.commitment_hash,
+            file_inventory=file_inventory,
+        )
+        bundle.write_manifest(manifest)
+
+        # Step 10: Build certificate
+        certificate = TheatreCalibrationCertificate(
+            certificate_id=certificate_id,
+            theatre_id=theatre_id,
+            template_id=template_id,
+            construct_id=construct_id,
+            criteria=criteria,
+            scores=replay_result.aggregate_scores,
+            composite_score=replay_result.composite_score,
+            replay_count=replay_result.replay_count,
+            evidence_bundle_hash=evidence_bundle_hash,
+            ground_truth_hash=dataset_hash,
+            construct_version=construct_version_hex,
+            scorer_version=version_pins.get("scorer_version", "deterministic-v0.1"),
+            methodology_version="1.0.0",
+            dataset_hash=replay_result.dataset_hash,
+            verification_tier=tier,
+            commitment_hash=receipt.commitment_hash,
+            issued_at=issued_at,
+            expires_at=expires_at,
+            theatre_committed_at=receipt.committed_at,
+            theatre_resolved_at=resolved_at,
+            ground_truth_source="DETERMINISTIC_COMPUTATION",
+            execution_path="replay",
+        )
 
-    # Step 11: Validate certificate against schema
-    cert_dict = certificate_to_schema_dict(certificate)
+        # Step 11: Validate certificate against schema
+        cert_dict = certificate_to_schema_dict(certificate)
 
-    cert_schema_path = _ROOT / "docs" / "schemas" / "echelon_certificate_schema.json"
-    cert_schema = json.loads(cert_schema_path.read_text())
+        cert_schema_path = _ROOT / "docs" / "schemas" / "echelon_certificate_schema.json"
+        cert_schema = json.loads(cert_schema_path.read_text())
 
-    import jsonschema
-    jsonschema.validate(instance=cert_dict, schema=cert_schema)
-    logger.info("[%s] Certificate validates against schema", theatre_key)
+        import jsonschema
+        jsonschema.validate(instance=cert_dict, schema=cert_schema)
+        logger.info("[%s] Certificate validates against schema", theatre_key)
 
-    bundle.write_certificate(cert_dict)
+        bundle.write_certificate(cert_dict)
 
     missing = bundle.validate_minimum_files()
     if missing:
@@ -430,11 +463,14 @@ async def run_single_theatre(
 async def run_all_theatres(
     output_dir: Path,
     verbose: bool = False,
+    score_workers: int = 0,
 ) -> list[tuple[Path, dict]]:
     """Execute all three deterministic theatres."""
     results = []
     for theatre_key in THEATRES:
-        path, cert_dict = await run_single_theatre(theatre_key, output_dir, verbose)
+        path, cert_dict = await run_single_theatre(
+            theatre_key, output_dir, verbose, score_workers
+        )
         results.append((path, cert_dict))
     return results
 
@@ -465,6 +501,12 @@ async def main() -> None:
         action="store_true",
         help="Enable verbose logging",
     )
+    parser.add_argument(
+        "--score-workers",
+        type=int,
+        default=0,
+        help="Score in this many worker processes (default: inline)",
+    )
     args = parser.parse_args()
 
     if args.verbose:
@@ -476,13 +518,13 @@ async def main() -> None:
 
     if args.theatre:
         path, cert_dict = await run_single_theatre(
-            args.theatre, output_dir, args.verbose
+            args.theatre, output_dir, args.verbose, args.score_workers
         )
         print(f"Certificate written to {path}")
         print(f"  Composite score: {cert_dict.get('composite_score', 'N/A')}")
         print(f"  Tier: {cert_dict.get('verification_tier', 'N/A')}")
     else:
-        results = await run_all_theatres(output_dir, args.verbose)
+        results = await run_all_theatres(output_dir, args.verbose, args.score_workers)
         print(f"\n{'='*60}")
         print(f"Two-Rail Deterministic Theatres — {len(results)} certificates produced")
         print(f"{'='*60}")
@@ -3,6 +3,15 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 project_root = str(Path(__file__).resolve().parent.parent.parent)
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
+
+
+@pytest.fixture
+def bench(request):
+    """pytest-benchmark's `benchmark` fixture; skips when the plugin is absent."""
+    pytest.importorskip("pytest_benchmark")
+    return request.getfixturevalue("benchmark")
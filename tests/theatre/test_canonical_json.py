@@ -2,10 +2,14 @@
 
 import json
 import math
+import random
+from collections import OrderedDict
+from enum import IntEnum
+from typing import Any
 
 import pytest
 
-from theatre.engine.canonical_json import canonical_json, _normalise_float
+from theatre.engine.canonical_json import canonical_json
 
 
 class TestCanonicalJson:
@@ -95,13 +99,14 @@ class TestFloatNormalisation:
         parsed = json.loads(result)
         assert parsed["v"] == 1e10
 
-    def test_normalise_float_whole(self):
-        assert _normalise_float(1.0) == 1
-        assert isinstance(_normalise_float(1.0), int)
+    def test_whole_float_written_as_integer(self):
+        assert canonical_json(1.0) == "1"
+        assert canonical_json(-3.0) == "-3"
+        assert canonical_json(-0.0) == "0"
 
-    def test_normalise_float_decimal(self):
-        assert _normalise_float(0.5) == 0.5
-        assert isinstance(_normalise_float(0.5), float)
+    def test_decimal_float_kept(self):
+        assert canonical_json(0.5) == "0.5"
+        assert canonical_json(2.0**53) == "9007199254740992.0"
 
 
 class TestRoundTripDeterminism:
@@ -146,3 +151,178 @@ class TestBoolIntDistinction:
     def test_false_is_false_not_0(self):
         result = canonical_json({"v": False})
         assert result == '{"v":false}'
+
+
+def _reference_canonical_json(obj: Any) -> str:
+    """Original two-pass implementation (normalise, then json.dumps).
+
+    Kept as the conformance oracle for the single-pass encoder.
+    """
+
+    def normalise(v: Any) -> Any:
+        if v is None or isinstance(v, bool):
+            return v
+        if isinstance(v, dict):
+            return {k: normalise(val) for k, val in v.items()}
+        if isinstance(v, (list, tuple)):
+            return [normalise(item) for item in v]
+        if isinstance(v, float):
+            if math.isnan(v) or math.isinf(v):
+                raise ValueError(f"canonical_json: NaN/Infinity not permitted: {v}")
+            if v == int(v) and abs(v) < 2**53:
+                return int(v)
+            return v
+        if isinstance(v, (int, str)):
+            return v
+        raise TypeError(f"canonical_json: unsupported type {type(v).__name__}: {v!r}")
+
+    return json.dumps(
+        normalise(obj),
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        allow_nan=False,
+    )
+
+
+class _Level(IntEnum):
+    LOW = 1
+    HIGH = 2
+
+
+_SCALARS = [
+    0, -1, 2**60, 0.0, -0.0, 1.0, -3.0, 0.1, 1e-7, 1e16, 1e300, 2.0**53,
+    2.0**53 - 1, 123456.789, True, False, None, "", "plain", "quote\"s",
+    "back\\slash", "\u00e9\u4e2d\U0001f600", "\x00\x1f\n\t", "1.0,",
+]
+
+
+def _random_value(rng: random.Random, depth: int) -> Any:
+    kind = rng.random()
+    if depth <= 0 or kind < 0.4:
+        return rng.choice(_SCALARS + [rng.uniform(-1e6, 1e6), rng.randint(-10**9, 10**9)])
+    if kind < 0.55:
+        return [rng.uniform(-1, 1) for _ in range(rng.randint(0, 5))]
+    if kind < 0.65:
+        return [rng.choice(["a", "b\u00e9", ""]) for _ in range(rng.randint(1, 4))]
+    if kind < 0.8:
+        return [_random_value(rng, depth - 1) for _ in range(rng.randint(0, 4))]
+    return {
+        rng.choice(["a", "B", "z", "\u00e9", "key", "10", "9", ""]) + str(i):
+            _random_value(rng, depth - 1)
+        for i in range(rng.randint(0, 5))
+    }
+
+
+class TestReferenceConformance:
+    """Single-pass encoder must match the original implementation byte for byte."""
+
+    @pytest.mark.parametrize("seed", range(25))
+    def test_random_structures(self, seed):
+        rng = random.Random(seed)
+        obj = _random_value(rng, depth=5)
+        assert canonical_json(obj) == _reference_canonical_json(obj)
+
+    @pytest.mark.parametrize("value", _SCALARS)
+    def test_scalars(self, value):
+        for obj in (value, [value], {"k": value}, [value, value], (value,)):
+            assert canonical_json(obj) == _reference_canonical_json(obj)
+
+    def test_homogeneous_float_array_with_whole_values(self):
+        obj = [0.5, 1.0, -2.0, 2.0**53, 0.25]
+        assert canonical_json(obj) == _reference_canonical_json(obj)
+
+    def test_non_string_keys(self):
+        obj = {10: "a", 9: "b", 2: {1.5: None}}
+        assert canonical_json(obj) == _reference_canonical_json(obj)
+        obj = {True: 1, False: 2}
+        assert canonical_json(obj) == _reference_canonical_json(obj)
+        # Unorderable keys fail the same way in both implementations
+        with pytest.raises(TypeError):
+            _reference_canonical_json({True: 1, None: 2})
+        with pytest.raises(TypeError):
+            canonical_json({True: 1, None: 2})
+
+    def test_subclasses(self):
+        obj = OrderedDict([("z", _Level.HIGH), ("a", [_Level.LOW, 1.0])])
+        assert canonical_json(obj) == _reference_canonical_json(obj)
+
+    def test_fixture_templates(self):
+        from pathlib import Path
+
+        fixtures = Path(__file__).resolve().parents[2] / "theatre" / "fixtures"
+        for path in sorted(fixtures.rglob("*.json")):
+            obj = json.loads(path.read_text())
+            assert canonical_json(obj) == _reference_canonical_json(obj), path.name
+
+    def test_nan_in_float_array_rejected(self):
+        with pytest.raises(ValueError, match="NaN"):
+            canonical_json([0.5, float("nan")])
+        with pytest.raises(ValueError, match="Infinity"):
+            canonical_json([1.0, float("inf")])
+
+
+# ── Benchmarks (`bench` fixture in conftest.py) ──────────────────────────
+
+
+@pytest.fixture(scope="module")
+def large_dataset() -> list[dict]:
+    """~10 MB of episode dumps shaped like Observer / two-rail ground truth."""
+    rng = random.Random(7)
+    return [
+        {
+            "episode_id": f"ep_{i:05d}",
+            "input_data": {
+                "title": f"PR {i}",
+                "diff_content": "+    value = compute(x, y)  # \"quoted\"\n" * 20,
+                "files_changed": [f"src/module_{j}.py" for j in range(4)],
+                "amounts": [rng.uniform(0, 1e6) for _ in range(10)],
+                "ratios": {"lp": 0.8, "gp": 0.2, "hurdle": 1.0},
+            },
+            "expected_output": {"total": float(i), "ok": True},
+            "labels": None,
+            "metadata": {"period_end": "2025-12-31"},
+        }
+        for i in range(9_000)
+    ]
+
+
+@pytest.fixture(scope="module")
+def large_template() -> dict:
+    """Template with a wide resolution programme and many criteria."""
+    return {
+        "schema_version": "2.0.1",
+        "criteria": {
+            "criteria_ids": [f"c_{i}" for i in range(200)],
+            "criteria_human": "Synthetic criteria",
+            "weights": {f"c_{i}": 0.005 for i in range(200)},
+        },
+        "resolution_programme": [
+            {
+                "step_id": f"step_{i}",
+                "type": "construct_invocation",
+                "input_spec": {f"field_{j}": "string" for j in range(30)},
+                "output_spec": {f"out_{j}": "number" for j in range(30)},
+                "timeout_seconds": 60,
+            }
+            for i in range(2_000)
+        ],
+    }
+
+
+class TestCanonicalJsonBenchmarks:
+    def test_dataset_single_pass(self, bench, large_dataset):
+        bench.group = "canonical_json:dataset"
+        bench.pedantic(canonical_json, args=(large_dataset,), rounds=3)
+
+    def test_dataset_reference(self, bench, large_dataset):
+        bench.group = "canonical_json:dataset"
+        bench.pedantic(_reference_canonical_json, args=(large_dataset,), rounds=3)
+
+    def test_template_single_pass(self, bench, large_template):
+        bench.group = "canonical_json:template"
+        bench.pedantic(canonical_json, args=(large_template,), rounds=3)
+
+    def test_template_reference(self, bench, large_template):
+        bench.group = "canonical_json:template"
+        bench.pedantic(_reference_canonical_json, args=(large_template,), rounds=3)
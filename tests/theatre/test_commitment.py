@@ -1,8 +1,14 @@
 """Tests for Commitment Protocol — hash determinism, verification, receipts."""
 
+import hashlib
+import json
+
 import pytest
 
+from theatre.engine.canonical_json import canonical_json
 from theatre.engine.commitment import CommitmentProtocol, CommitmentReceipt
+from theatre.engine.ground_truth import iter_episodes_jsonl
+from theatre.engine.models import GroundTruthEpisode
 
 
 SAMPLE_TEMPLATE = {
@@ -145,3 +151,41 @@ class TestCommitmentReceipt:
         assert "theatre_id" in data
         assert "commitment_hash" in data
         assert "committed_at" in data
+
+
+def _episodes(count: int) -> list[GroundTruthEpisode]:
+    return [
+        GroundTruthEpisode(
+            episode_id=f"ep_{i:03d}",
+            input_data={"diff": "x" * i, "weight": i / 4},
+            expected_output={"ok": i % 2 == 0},
+        )
+        for i in range(count)
+    ]
+
+
+class TestDatasetHash:
+    def test_matches_one_shot_canonical_hash(self):
+        episodes = _episodes(10)
+        expected = hashlib.sha256(
+            canonical_json([ep.model_dump() for ep in episodes]).encode("utf-8")
+        ).hexdigest()
+        assert CommitmentProtocol.compute_dataset_hash(episodes) == expected
+        assert CommitmentProtocol.compute_dataset_hash(iter(episodes)) == expected
+
+    def test_jsonl_stream_matches_list(self, tmp_path):
+        episodes = _episodes(25)
+        path = tmp_path / "episodes.jsonl"
+        path.write_text(
+            "".join(json.dumps(ep.model_dump(), sort_keys=True) + "\n" for ep in episodes)
+        )
+        assert CommitmentProtocol.compute_dataset_hash(
+            iter_episodes_jsonl(path)
+        ) == CommitmentProtocol.compute_dataset_hash(episodes)
+
+    def test_verify_dataset_hash(self):
+        episodes = _episodes(3)
+        hashes = {"prs": CommitmentProtocol.compute_dataset_hash(episodes)}
+        assert CommitmentProtocol.verify_dataset_hash(hashes, "prs", iter(episodes))
+        assert not CommitmentProtocol.verify_dataset_hash(hashes, "prs", episodes[:2])
+        assert not CommitmentProtocol.verify_dataset_hash(hashes, "missing", episodes)
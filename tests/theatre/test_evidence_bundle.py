@@ -1,12 +1,21 @@
 """Tests for Evidence Bundle Builder — file creation, validation, hash."""
 
+import hashlib
 import json
+import os
 from pathlib import Path
 
 import pytest
 
+from theatre.engine.canonical_json import canonical_json
 from theatre.engine.commitment import CommitmentReceipt
 from theatre.engine.evidence_bundle import EvidenceBundleBuilder
+from theatre.engine.invocation_store import (
+    INDEX_FILENAME,
+    PACK_FILENAME,
+    InvocationIntegrityError,
+    PackedInvocationReader,
+)
 from theatre.engine.models import AuditEvent, BundleManifest
 
 
@@ -139,6 +148,14 @@ class TestBundleHash:
         h2 = builder.compute_bundle_hash()
         assert h1 == h2
 
+    def test_score_statistics_not_hashed(self, builder):
+        builder.write_aggregate_scores({"accuracy": 0.85})
+        h = builder.compute_bundle_hash()
+        builder.write_score_statistics({"sample_size": 3, "composite": {"variance": 0.1}})
+        assert (builder.base_dir / "scores" / "statistics.json").exists()
+        assert "scores/statistics.json" not in builder.compute_file_inventory()
+        assert builder.compute_bundle_hash() == h
+
     def test_hash_on_empty_bundle(self, builder):
         """Empty bundle produces valid hash from empty file inventory."""
         h = builder.compute_bundle_hash()
@@ -177,3 +194,245 @@ class TestMinimumFileValidation:
         missing = builder.validate_minimum_files()
         assert "template.json" in missing
         assert len(missing) > 0
+
+
+def _disk_inventory(base: Path) -> dict[str, str]:
+    """Reference inventory: re-read and hash every file from disk."""
+    return {
+        str(p.relative_to(base)): hashlib.sha256(p.read_bytes()).hexdigest()
+        for p in sorted(base.rglob("*"))
+        if p.is_file() and p.name not in ("manifest.json", "certificate.json")
+    }
+
+
+def _populate(builder: EvidenceBundleBuilder, receipt, n: int = 5) -> None:
+    builder.write_template({"schema_version": "2.0.1"})
+    builder.write_commitment_receipt(receipt)
+    builder.write_ground_truth([{"ep": str(i)} for i in range(n)], "dataset.jsonl")
+    builder.write_invocations(
+        (f"ep{i}", {"episode_id": f"ep{i}"}, {"status": "SUCCESS"}) for i in range(n)
+    )
+    for i in range(n):
+        builder.write_episode_score({"episode_id": f"ep{i}", "score": i / n})
+    builder.append_audit_event(AuditEvent(event_type="replay_completed"))
+    builder.write_aggregate_scores({"accuracy": 0.8})
+    builder.write_rlmf_export([{"ep": "0"}])
+
+
+class TestStreamingWriter:
+    def test_inventory_matches_disk_hashes(self, builder, sample_receipt):
+        _populate(builder, sample_receipt)
+        assert builder.compute_file_inventory() == _disk_inventory(builder.base_dir)
+
+    def test_inventory_matches_with_batched_flush(self, bundle_dir, sample_receipt):
+        with EvidenceBundleBuilder("batched", bundle_dir, flush_every=1000) as builder:
+            _populate(builder, sample_receipt, n=20)
+            inventory = builder.compute_file_inventory()
+        assert inventory == _disk_inventory(builder.base_dir)
+
+    def test_bundle_hash_matches_reference_definition(self, builder, sample_receipt):
+        _populate(builder, sample_receipt)
+        expected = hashlib.sha256(
+            canonical_json(_disk_inventory(builder.base_dir)).encode("utf-8")
+        ).hexdigest()
+        assert builder.compute_bundle_hash() == expected
+
+    def test_batched_records_flushed_on_close(self, bundle_dir):
+        builder = EvidenceBundleBuilder("batched", bundle_dir, flush_every=100)
+        builder.write_episode_score({"episode_id": "ep1"})
+        path = builder.base_dir / "scores" / "per_episode.jsonl"
+        assert path.read_text() == ""
+        builder.close()
+        assert len(path.read_text().splitlines()) == 1
+
+    def test_externally_modified_file_is_rehashed(self, builder, sample_receipt):
+        _populate(builder, sample_receipt)
+        (builder.base_dir / "template.json").write_text('{"tampered": true}')
+        (builder.base_dir / "ground_truth" / "extra.jsonl").write_text("{}\n")
+        assert builder.compute_file_inventory() == _disk_inventory(builder.base_dir)
+
+    def test_same_size_edit_is_rehashed(self, builder, sample_receipt):
+        _populate(builder, sample_receipt)
+        path = builder.base_dir / "template.json"
+        original = path.read_bytes()
+        stat = path.stat()
+        path.write_bytes(original.replace(b"{", b"[", 1))
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert path.stat().st_size == stat.st_size
+        assert builder.compute_file_inventory() == _disk_inventory(builder.base_dir)
+
+    def test_append_to_existing_file_hashes_whole_file(self, bundle_dir):
+        with EvidenceBundleBuilder("resume", bundle_dir) as first:
+            first.write_episode_score({"episode_id": "ep1"})
+        with EvidenceBundleBuilder("resume", bundle_dir, fsync="always") as second:
+            second.write_episode_score({"episode_id": "ep2"})
+            inventory = second.compute_file_inventory()
+        assert inventory == _disk_inventory(second.base_dir)
+        path = second.base_dir / "scores" / "per_episode.jsonl"
+        assert len(path.read_text().splitlines()) == 2
+
+    def test_invalid_flush_every(self, bundle_dir):
+        with pytest.raises(ValueError, match="flush_every"):
+            EvidenceBundleBuilder("bad", bundle_dir, flush_every=0)
+
+
+class TestPackedInvocations:
+    @pytest.fixture
+    def packed(self, bundle_dir):
+        builder = EvidenceBundleBuilder(
+            "packed", bundle_dir, invocation_layout="packed"
+        )
+        yield builder
+        builder.close()
+
+    def test_single_pack_file_and_index(self, packed):
+        packed.write_invocations(
+            (f"ep{i}", {"episode_id": f"ep{i}"}, {"status": "SUCCESS"}) for i in range(3)
+        )
+        packed.write_invocation("ep3", {}, {"status": "ERROR"})
+        packed.flush()
+        inv_dir = packed.base_dir / "invocations"
+        assert sorted(p.name for p in inv_dir.iterdir()) == [INDEX_FILENAME, PACK_FILENAME]
+        assert len((inv_dir / PACK_FILENAME).read_text().splitlines()) == 4
+
+    def test_reader_random_access(self, packed):
+        packed.write_invocations(
+            (f"ep{i}", {"episode_id": f"ep{i}"}, {"n": i}) for i in range(5)
+        )
+        packed.close()
+        reader = PackedInvocationReader(packed.base_dir / "invocations")
+        assert len(reader) == 5
+        assert reader.episode_ids() == [f"ep{i}" for i in range(5)]
+        assert reader.get("ep3") == {"request": {"episode_id": "ep3"}, "response": {"n": 3}}
+        assert [eid for eid, _ in reader.iter_records()] == reader.episode_ids()
+        assert reader.verify() == []
+
+    def test_reader_detects_tampered_record(self, packed):
+        packed.write_invocation("ep1", {}, {"score": 0.5})
+        packed.write_invocation("ep2", {}, {"score": 0.7})
+        packed.close()
+        pack = packed.base_dir / "invocations" / PACK_FILENAME
+        pack.write_bytes(pack.read_bytes().replace(b"0.7", b"0.9"))
+
+        reader = PackedInvocationReader(packed.base_dir / "invocations")
+        assert reader.verify() == ["ep2"]
+        assert reader.get("ep1")["response"] == {"score": 0.5}
+        with pytest.raises(InvocationIntegrityError):
+            reader.get("ep2")
+
+    def test_validate_minimum_files_packed(
+        self, packed, sample_manifest, sample_receipt
+    ):
+        packed.write_manifest(sample_manifest)
+        packed.write_template({"schema_version": "2.0.1"})
+        packed.write_commitment_receipt(sample_receipt)
+        packed.write_ground_truth([{"ep": "1"}], "dataset.jsonl")
+        packed.write_invocation("ep1", {}, {})
+        packed.write_aggregate_scores({"accuracy": 0.8})
+        packed.write_certificate({"cert": "data"})
+        assert packed.validate_minimum_files() == []
+
+        (packed.base_dir / "invocations" / INDEX_FILENAME).unlink()
+        assert packed.validate_minimum_files() == [f"invocations/{INDEX_FILENAME}"]
+
+    def test_validate_reports_corrupt_pack(self, packed):
+        packed.write_invocation("ep1", {}, {"score": 0.5})
+        packed.close()
+        pack = packed.base_dir / "invocations" / PACK_FILENAME
+        pack.write_bytes(pack.read_bytes().replace(b"0.5", b"0.6"))
+        assert any("corrupt records: ep1" in m for m in packed.validate_minimum_files())
+
+    def test_bundle_hash_covers_pack_and_index(self, packed, sample_receipt):
+        _populate(packed, sample_receipt)
+        inventory = packed.compute_file_inventory()
+        assert inventory == _disk_inventory(packed.base_dir)
+        assert f"invocations/{PACK_FILENAME}" in inventory
+        assert f"invocations/{INDEX_FILENAME}" in inventory
+
+        before = packed.compute_bundle_hash()
+        packed.write_invocation("ep_extra", {}, {})
+        assert packed.compute_bundle_hash() != before
+
+    def test_reopen_appends_to_existing_pack(self, bundle_dir):
+        with EvidenceBundleBuilder("resume", bundle_dir, invocation_layout="packed") as b:
+            b.write_invocation("ep1", {}, {"n": 1})
+        with EvidenceBundleBuilder("resume", bundle_dir, invocation_layout="packed") as b:
+            b.write_invocation("ep2", {}, {"n": 2})
+        reader = PackedInvocationReader(b.base_dir / "invocations")
+        assert reader.episode_ids() == ["ep1", "ep2"]
+        assert reader.verify() == []
+
+
+# ── Benchmarks (`bench` fixture in conftest.py) ──────────────────────────
+
+
+_BENCH_INVOCATIONS = 50_000
+
+
+def _bench_episode_results() -> list[tuple[str, dict, dict]]:
+    return [
+        (
+            f"ep_{i:05d}",
+            {"episode_id": f"ep_{i:05d}", "status": "SUCCESS"},
+            {"oracle_output": {"summary": "x" * 200}, "scores": {"precision": 0.5}},
+        )
+        for i in range(_BENCH_INVOCATIONS)
+    ]
+
+
+def _legacy_write_and_hash(base: Path, results) -> str:
+    """Pre-streaming behaviour: reopen per record, re-read every file to hash."""
+    (base / "invocations").mkdir(parents=True)
+    (base / "scores").mkdir()
+    for episode_id, request, response in results:
+        (base / "invocations" / f"{episode_id}.json").write_text(
+            json.dumps({"request": request, "response": response}, indent=2)
+        )
+        with (base / "scores" / "per_episode.jsonl").open("a") as f:
+            f.write(json.dumps(response["scores"], sort_keys=True) + "\n")
+    return hashlib.sha256(canonical_json(_disk_inventory(base)).encode()).hexdigest()
+
+
+def _streaming_write_and_hash(base: Path, results) -> str:
+    with EvidenceBundleBuilder("bench", base, flush_every=256) as builder:
+        builder.write_invocations(results)
+        for _, _, response in results:
+            builder.write_episode_score(response["scores"])
+        return builder.compute_bundle_hash()
+
+
+def test_bench_bundle_legacy_50k(bench, tmp_path_factory):
+    results = _bench_episode_results()
+    bench.pedantic(
+        lambda: _legacy_write_and_hash(tmp_path_factory.mktemp("legacy"), results),
+        rounds=1,
+        iterations=1,
+    )
+
+
+def test_bench_bundle_streaming_50k(bench, tmp_path_factory):
+    results = _bench_episode_results()
+    bench.pedantic(
+        lambda: _streaming_write_and_hash(tmp_path_factory.mktemp("stream"), results),
+        rounds=1,
+        iterations=1,
+    )
+
+
+def _packed_write_and_hash(base: Path, results) -> str:
+    with EvidenceBundleBuilder(
+        "bench", base, flush_every=256, invocation_layout="packed"
+    ) as builder:
+        builder.write_invocations(results)
+        for _, _, response in results:
+            builder.write_episode_score(response["scores"])
+        return builder.compute_bundle_hash()
+
+
+def test_bench_bundle_packed_50k(bench, tmp_path_factory):
+    results = _bench_episode_results()
+    bench.pedantic(
+        lambda: _packed_write_and_hash(tmp_path_factory.mktemp("packed"), results),
+        rounds=1,
+        iterations=1,
+    )
@@ -3,7 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
+import math
+import threading
+import time
 from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -15,6 +22,8 @@ from theatre.integration.github_ingester import (
     _parse_iso_timestamp,
     _truncate_diff,
 )
+from theatre.integration.diff_cache import DiffCache, DiffCacheEntry
+from theatre.integration.ground_truth_store import GroundTruthStore
 from theatre.integration.models import GroundTruthRecord
 
 
@@ -140,10 +149,11 @@ class TestHeaders:
 # ── Ingestion tests ──────────────────────────────────────────────────
 
 
-def _mock_response(json_data=None, text_data=None, status_code=200):
+def _mock_response(json_data=None, text_data=None, status_code=200, headers=None):
     """Build a mock httpx.Response."""
     resp = MagicMock(spec=httpx.Response)
     resp.status_code = status_code
+    resp.headers = httpx.Headers(headers or {})
     resp.json.return_value = json_data or []
     resp.text = text_data or ""
     resp.raise_for_status = MagicMock()
@@ -289,6 +299,325 @@ class TestErrorHandling:
             await ingester.ingest("owner/nonexistent", limit=5)
 
 
+# ── Local stand-in GitHub server ──────────────────────────────────────
+
+
+class _FakeGitHub(ThreadingHTTPServer):
+    """Serves /pulls and per-PR diffs with ETags and a rate-limit budget."""
+
+    daemon_threads = True
+
+    def __init__(self, prs: list[dict], budget: int = 5000, window: int = 3600,
+                 diff_delay: float = 0.0):
+        super().__init__(("127.0.0.1", 0), _FakeGitHubHandler)
+        self.prs = prs
+        self.diffs = {pr["number"]: SAMPLE_DIFF + f"# PR {pr['number']}\n" for pr in prs}
+        self.budget = budget
+        self.window = window
+        self.diff_delay = diff_delay
+        self.remaining = budget
+        self.reset_at = 0
+        self.lock = threading.Lock()
+        self.diff_bodies_sent = 0
+        self.list_pages_sent = 0
+        self.not_modified = 0
+        self.violations = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.throttle_next: int = 0  # Answer this many diff requests with 429
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def charge(self) -> bool:
+        """Spend one request from the budget; False if it is exhausted."""
+        now = time.time()
+        with self.lock:
+            if now >= self.reset_at:
+                self.remaining = self.budget
+                self.reset_at = math.ceil(now + self.window)
+            if self.remaining <= 0:
+                self.violations += 1
+                return False
+            self.remaining -= 1
+            return True
+
+
+class _FakeGitHubHandler(BaseHTTPRequestHandler):
+    server: _FakeGitHub
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        parts = url.path.strip("/").split("/")
+        if parts[-1] == "pulls":
+            query = parse_qs(url.query)
+            page = int(query.get("page", ["1"])[0])
+            per_page = int(query.get("per_page", ["30"])[0])
+            ordered = sorted(
+                self.server.prs, key=lambda pr: pr.get("updated_at", ""), reverse=True
+            )
+            with self.server.lock:
+                self.server.list_pages_sent += 1
+            body = ordered[(page - 1) * per_page:page * per_page]
+            self._charged(200, json.dumps(body).encode())
+            return
+
+        number = int(parts[-1])
+        diff = self.server.diffs[number]
+        etag = '"%s"' % hashlib.sha256(diff.encode()).hexdigest()[:16]
+        with self.server.lock:
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(self.server.max_in_flight, self.server.in_flight)
+            throttled = self.server.throttle_next > 0
+            self.server.throttle_next -= throttled
+        try:
+            time.sleep(self.server.diff_delay)
+            if throttled:
+                self._send(429, b"", {"Retry-After": "0"})
+            elif self.headers.get("If-None-Match") == etag:
+                with self.server.lock:
+                    self.server.not_modified += 1
+                self._send(304, b"", {"ETag": etag})  # Not charged, as on GitHub
+            elif self._charged(200, diff.encode(), {"ETag": etag}):
+                with self.server.lock:
+                    self.server.diff_bodies_sent += 1
+        finally:
+            with self.server.lock:
+                self.server.in_flight -= 1
+
+    def _charged(self, status: int, body: bytes, headers: dict | None = None) -> bool:
+        if not self.server.charge():
+            self._send(403, b'{"message": "API rate limit exceeded"}')
+            return False
+        self._send(status, body, headers)
+        return True
+
+    def _send(self, status: int, body: bytes, headers: dict | None = None) -> None:
+        self.send_response(status)
+        self.send_header("X-RateLimit-Remaining", str(self.server.remaining))
+        self.send_header("X-RateLimit-Reset", str(self.server.reset_at))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def fake_github():
+    servers: list[_FakeGitHub] = []
+
+    def start(n_prs: int = 5, **kwargs) -> _FakeGitHub:
+        server = _FakeGitHub([_make_pr(i) for i in range(1, n_prs + 1)], **kwargs)
+        threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+class TestConcurrentFetch:
+    @pytest.mark.asyncio
+    async def test_diffs_fetched_concurrently_up_to_limit(self, fake_github):
+        server = fake_github(12, diff_delay=0.05)
+        ingester = GitHubIngester(base_url=server.url, max_concurrency=4)
+
+        records = await ingester.ingest("owner/repo", limit=12)
+
+        assert [r.id for r in records] == [f"PR-{i}" for i in range(1, 13)]
+        assert 1 < server.max_in_flight <= 4
+
+    @pytest.mark.asyncio
+    async def test_waits_for_rate_limit_reset(self, fake_github):
+        server = fake_github(6, budget=4, window=1)
+        ingester = GitHubIngester(base_url=server.url, max_concurrency=4)
+
+        records = await ingester.ingest("owner/repo", limit=6)
+
+        assert len(records) == 6
+        assert server.violations == 0
+
+    @pytest.mark.asyncio
+    async def test_throttled_request_retried(self, fake_github):
+        server = fake_github(3)
+        server.throttle_next = 1
+        ingester = GitHubIngester(base_url=server.url, max_concurrency=1)
+
+        records = await ingester.ingest("owner/repo", limit=3)
+        assert len(records) == 3
+
+    def test_invalid_concurrency(self):
+        with pytest.raises(ValueError):
+            GitHubIngester(max_concurrency=0)
+
+
+class TestDiffCache:
+    @pytest.mark.asyncio
+    async def test_reingest_revalidates_instead_of_downloading(self, fake_github, tmp_path):
+        server = fake_github(5)
+        first = GitHubIngester(base_url=server.url, cache_dir=tmp_path)
+        records = await first.ingest("owner/repo", limit=5)
+        assert first.cache_stats.fetched == 5
+        assert first.cache_stats.writes == 5
+
+        second = GitHubIngester(base_url=server.url, cache_dir=tmp_path)
+        again = await second.ingest("owner/repo", limit=5)
+
+        assert [r.model_dump() for r in again] == [r.model_dump() for r in records]
+        assert second.cache_stats.revalidated == 5
+        assert second.cache_stats.fetched == 0
+        assert server.diff_bodies_sent == 5
+        assert server.not_modified == 5
+
+    @pytest.mark.asyncio
+    async def test_changed_pr_refetched(self, fake_github, tmp_path):
+        server = fake_github(3)
+        await GitHubIngester(base_url=server.url, cache_dir=tmp_path).ingest("owner/repo", 3)
+        server.diffs[2] = "diff --git a/new.py b/new.py\n"
+
+        ingester = GitHubIngester(base_url=server.url, cache_dir=tmp_path)
+        records = await ingester.ingest("owner/repo", limit=3)
+
+        assert records[1].files_changed == ["new.py"]
+        assert ingester.cache_stats.fetched == 1
+        assert ingester.cache_stats.revalidated == 2
+
+    def test_round_trip_and_corrupt_entry(self, tmp_path):
+        cache = DiffCache(tmp_path)
+        assert cache.get("owner/repo", 1) is None
+        entry = DiffCacheEntry(diff=SAMPLE_DIFF, etag='"abc"')
+        cache.put("owner/repo", 1, entry)
+        assert cache.get("owner/repo", 1) == entry
+        assert (tmp_path / "owner" / "repo" / "1.json").exists()
+
+        (tmp_path / "owner" / "repo" / "1.json").write_text("{not json")
+        assert cache.get("owner/repo", 1) is None
+
+    def test_repo_slug_cannot_escape_cache_dir(self, tmp_path):
+        cache = DiffCache(tmp_path / "cache")
+        cache.put("../evil", 1, DiffCacheEntry(diff=""))
+        written = list((tmp_path / "cache").rglob("*.json"))
+        assert len(written) == 1
+        assert not (tmp_path / "evil").exists()
+
+    def test_sanitised_slugs_do_not_collide(self, tmp_path):
+        cache = DiffCache(tmp_path)
+        slugs = ["owner/.github", "owner/github", "owner/_github", "own er/x", "own_er/x"]
+        for i, slug in enumerate(slugs):
+            cache.put(slug, 1, DiffCacheEntry(diff=str(i)))
+        assert [cache.get(slug, 1).diff for slug in slugs] == ["0", "1", "2", "3", "4"]
+        assert len(list(tmp_path.rglob("*.json"))) == len(slugs)
+
+
+# ── Incremental sync ─────────────────────────────────────────────────
+
+
+def _timeline_pr(number: int, minute: int, merged: bool = True) -> dict:
+    """A PR last updated *minute* minutes into the day (merged at the same time)."""
+    pr = _make_pr(number, merged=merged)
+    stamp = f"2025-06-15T{minute // 60:02d}:{minute % 60:02d}:00Z"
+    pr["updated_at"] = stamp
+    if merged:
+        pr["merged_at"] = stamp
+    return pr
+
+
+@pytest.fixture
+def timeline_github(fake_github):
+    """Fake server with 300 closed PRs (every 5th unmerged), updated minutes apart."""
+    server = fake_github(0)
+    for n in range(1, 301):
+        server.prs.append(_timeline_pr(n, n, merged=n % 5 != 0))
+        server.diffs[n] = SAMPLE_DIFF + f"# PR {n}\n"
+    return server
+
+
+class TestSync:
+    @pytest.mark.asyncio
+    async def test_first_sync_builds_rolling_window(self, timeline_github, tmp_path):
+        store = GroundTruthStore(tmp_path)
+        ingester = GitHubIngester(base_url=timeline_github.url)
+
+        records = await ingester.sync("owner/repo", store, limit=100)
+
+        assert len(records) == 100
+        assert records[0].id == "PR-299"  # newest merge first
+        assert store.load("owner/repo") == records
+        assert store.watermark("owner/repo") == "2025-06-15T05:00:00Z"
+
+    @pytest.mark.asyncio
+    async def test_incremental_sync_fetches_only_changes(self, timeline_github, tmp_path):
+        store = GroundTruthStore(tmp_path)
+        await GitHubIngester(base_url=timeline_github.url).sync("owner/repo", store, limit=100)
+        pages, diffs = timeline_github.list_pages_sent, timeline_github.diff_bodies_sent
+
+        # Two new merges and an edit to an older PR still inside the window
+        timeline_github.prs.append(_timeline_pr(301, 301))
+        timeline_github.prs.append(_timeline_pr(302, 302))
+        timeline_github.diffs[301] = timeline_github.diffs[302] = SAMPLE_DIFF
+        edited = next(pr for pr in timeline_github.prs if pr["number"] == 251)
+        edited["title"] = "Retitled"
+        edited["updated_at"] = "2025-06-15T05:03:00Z"
+
+        records = await GitHubIngester(base_url=timeline_github.url).sync(
+            "owner/repo", store, limit=100
+        )
+
+        assert timeline_github.list_pages_sent - pages == 1
+        # 301, 302, 251 and 300 (unmerged, equal to the old watermark) are
+        # listed; only the three merged ones need a diff
+        assert timeline_github.diff_bodies_sent - diffs == 3
+        assert [r.id for r in records[:2]] == ["PR-302", "PR-301"]
+        assert len(records) == 100
+        assert next(r for r in records if r.id == "PR-251").title == "Retitled"
+        assert store.watermark("owner/repo") == "2025-06-15T05:03:00Z"
+
+    @pytest.mark.asyncio
+    async def test_no_changes_is_one_request(self, timeline_github, tmp_path):
+        store = GroundTruthStore(tmp_path)
+        first = await GitHubIngester(base_url=timeline_github.url).sync("owner/repo", store, 50)
+        pages, diffs = timeline_github.list_pages_sent, timeline_github.diff_bodies_sent
+
+        again = await GitHubIngester(base_url=timeline_github.url).sync("owner/repo", store, 50)
+
+        assert again == first
+        assert timeline_github.list_pages_sent - pages == 1
+        assert timeline_github.diff_bodies_sent - diffs == 0  # PR 300 is unmerged
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_keeps_watermark(self, timeline_github, tmp_path):
+        store = GroundTruthStore(tmp_path)
+        await GitHubIngester(base_url=timeline_github.url).sync("owner/repo", store, 10)
+        timeline_github.prs.append(_timeline_pr(301, 301))  # No diff on the server → 500
+
+        records = await GitHubIngester(base_url=timeline_github.url).sync("owner/repo", store, 10)
+
+        assert "PR-301" not in {r.id for r in records}
+        assert store.watermark("owner/repo") == "2025-06-15T05:00:00Z"
+
+    def test_store_merge_upserts_and_trims(self, tmp_path):
+        store = GroundTruthStore(tmp_path)
+        old = GitHubIngester._map_to_record(_timeline_pr(1, 1), "", "owner/repo")
+        new = GitHubIngester._map_to_record(_timeline_pr(2, 2), "", "owner/repo")
+        store.merge("owner/repo", [old, new], watermark="w1")
+
+        retitled = old.model_copy(update={"title": "Retitled"})
+        merged = store.merge("owner/repo", [retitled], watermark="w2", limit=1)
+
+        assert merged == [new]
+        assert store.load("owner/repo") == [new]
+        assert store.watermark("owner/repo") == "w2"
+        assert store.load("other/repo") == []
+        assert store.watermark("other/repo") is None
+
+
 # ── Import smoke test ────────────────────────────────────────────────
 
 
@@ -0,0 +1,214 @@
+"""Tests for ground truth sources — JSONL, mmap, async iterator streaming."""
+
+import json
+import tracemalloc
+from typing import Any
+
+import pytest
+
+from theatre.engine.commitment import DatasetHasher
+from theatre.engine.ground_truth import (
+    AsyncIteratorGroundTruthSource,
+    GroundTruthSource,
+    InMemoryGroundTruthSource,
+    JsonlGroundTruthSource,
+    MmapJsonlGroundTruthSource,
+    iter_episodes_jsonl,
+)
+from theatre.engine.models import GroundTruthEpisode, TheatreCriteria
+from theatre.engine.oracle_contract import MockOracleAdapter
+from theatre.engine.replay import DatasetHashMismatchError, ReplayEngine
+from theatre.engine.scoring import TheatreScoringProvider
+
+
+def _episode(i: int, payload_size: int = 0) -> GroundTruthEpisode:
+    return GroundTruthEpisode(
+        episode_id=f"ep_{i:05d}",
+        input_data={"question": f"q{i}", "payload": "x" * payload_size},
+        expected_output={"answer": f"a{i}"},
+    )
+
+
+def _write_jsonl(path, episodes, blank_lines: bool = False) -> None:
+    with path.open("w") as f:
+        for ep in episodes:
+            f.write(json.dumps(ep.model_dump(), sort_keys=True) + "\n")
+            if blank_lines:
+                f.write("\n")
+
+
+def _engine(dataset_hash: str, max_concurrency: int = 1, adapter: Any = None) -> ReplayEngine:
+    criteria = TheatreCriteria(
+        criteria_ids=["accuracy"],
+        criteria_human="Test accuracy",
+        weights={"accuracy": 1.0},
+    )
+    return ReplayEngine(
+        theatre_id="test-theatre",
+        construct_id="observer",
+        construct_version="abc123",
+        criteria=criteria,
+        oracle_adapter=adapter or MockOracleAdapter(),
+        scoring_provider=TheatreScoringProvider(criteria),
+        committed_dataset_hash=dataset_hash,
+        max_concurrency=max_concurrency,
+    )
+
+
+async def _collect(source: GroundTruthSource) -> list[GroundTruthEpisode]:
+    return [ep async for ep in source]
+
+
+class TestSources:
+    @pytest.mark.asyncio
+    async def test_in_memory(self):
+        episodes = [_episode(i) for i in range(3)]
+        source = InMemoryGroundTruthSource(episodes)
+        assert source.total == 3
+        assert source.replayable
+        assert await _collect(source) == episodes
+        assert await _collect(source) == episodes
+
+    @pytest.mark.asyncio
+    async def test_jsonl_round_trip(self, tmp_path):
+        episodes = [_episode(i) for i in range(4)]
+        path = tmp_path / "gt.jsonl"
+        _write_jsonl(path, episodes, blank_lines=True)
+        source = JsonlGroundTruthSource(path)
+        assert source.total is None
+        assert await _collect(source) == episodes
+        assert list(iter_episodes_jsonl(path)) == episodes
+
+    @pytest.mark.asyncio
+    async def test_mmap_index_and_random_access(self, tmp_path):
+        episodes = [_episode(i, payload_size=i * 10) for i in range(6)]
+        path = tmp_path / "gt.jsonl"
+        _write_jsonl(path, episodes, blank_lines=True)
+        source = MmapJsonlGroundTruthSource(path)
+        assert source.total == 6
+        assert await _collect(source) == episodes
+        assert source.episode_at(4) == episodes[4]
+
+    @pytest.mark.asyncio
+    async def test_mmap_file_without_trailing_newline(self, tmp_path):
+        episodes = [_episode(i) for i in range(2)]
+        path = tmp_path / "gt.jsonl"
+        path.write_text("\n".join(
+            json.dumps(ep.model_dump(), sort_keys=True) for ep in episodes
+        ))
+        assert await _collect(MmapJsonlGroundTruthSource(path)) == episodes
+
+    @pytest.mark.asyncio
+    async def test_mmap_empty_file(self, tmp_path):
+        path = tmp_path / "gt.jsonl"
+        path.write_text("")
+        source = MmapJsonlGroundTruthSource(path)
+        assert source.total == 0
+        assert await _collect(source) == []
+        with pytest.raises(IndexError):
+            source.episode_at(0)
+
+    @pytest.mark.asyncio
+    async def test_async_iterator_single_pass(self):
+        async def gen():
+            for i in range(2):
+                yield _episode(i)
+
+        source = AsyncIteratorGroundTruthSource(gen())
+        assert not source.replayable
+        assert len(await _collect(source)) == 2
+        with pytest.raises(RuntimeError, match="once"):
+            await _collect(source)
+
+
+class TestStreamingReplay:
+    @pytest.mark.asyncio
+    async def test_jsonl_source_matches_list_run(self, tmp_path):
+        episodes = [_episode(i) for i in range(10)]
+        path = tmp_path / "gt.jsonl"
+        _write_jsonl(path, episodes)
+        dataset_hash = ReplayEngine._compute_dataset_hash(episodes)
+
+        from_list = await _engine(dataset_hash).run(episodes)
+        from_file = await _engine(dataset_hash, max_concurrency=3).run(
+            JsonlGroundTruthSource(path)
+        )
+        exclude = {"episode_results": {"__all__": {"latency_ms"}}}
+        assert from_file.model_dump(exclude=exclude) == from_list.model_dump(exclude=exclude)
+
+    @pytest.mark.asyncio
+    async def test_replayable_source_verified_before_invocation(self, tmp_path):
+        episodes = [_episode(i) for i in range(3)]
+        path = tmp_path / "gt.jsonl"
+        _write_jsonl(path, episodes)
+        invoked = []
+
+        class _RecordingAdapter:
+            async def invoke(self, input_data: dict[str, Any]) -> dict[str, Any]:
+                invoked.append(input_data["episode_id"])
+                return {}
+
+        engine = _engine("0" * 64, adapter=_RecordingAdapter())
+        with pytest.raises(DatasetHashMismatchError):
+            await engine.run(MmapJsonlGroundTruthSource(path))
+        assert invoked == []
+
+    @pytest.mark.asyncio
+    async def test_async_source_scores_before_fully_parsed(self):
+        episodes = [_episode(i) for i in range(5)]
+        events: list[str] = []
+
+        async def gen():
+            for ep in episodes:
+                events.append(f"yield:{ep.episode_id}")
+                yield ep
+
+        class _RecordingAdapter:
+            async def invoke(self, input_data: dict[str, Any]) -> dict[str, Any]:
+                events.append(f"invoke:{input_data['episode_id']}")
+                return {}
+
+        engine = _engine(
+            ReplayEngine._compute_dataset_hash(episodes), adapter=_RecordingAdapter(),
+        )
+        progress = []
+        result = await engine.run(
+            AsyncIteratorGroundTruthSource(gen()),
+            progress_callback=lambda current, total: progress.append((current, total)),
+        )
+        assert result.replay_count == 5
+        assert events.index("invoke:ep_00000") < events.index("yield:ep_00004")
+        assert progress == [(i, None) for i in range(1, 6)]
+
+    @pytest.mark.asyncio
+    async def test_async_source_hash_mismatch_raised_at_end(self):
+        async def gen():
+            yield _episode(0)
+
+        with pytest.raises(DatasetHashMismatchError, match="mismatch"):
+            await _engine("0" * 64).run(AsyncIteratorGroundTruthSource(gen()))
+
+    @pytest.mark.asyncio
+    async def test_peak_memory_flat_as_dataset_grows(self):
+        payload_size = 20_000
+
+        async def gen(count: int):
+            for i in range(count):
+                yield _episode(i, payload_size=payload_size)
+
+        async def peak_for(count: int) -> int:
+            hasher = DatasetHasher()
+            async for ep in gen(count):
+                hasher.update(ep)
+
+            engine = _engine(hasher.hexdigest(), max_concurrency=4)
+            tracemalloc.start()
+            await engine.run(AsyncIteratorGroundTruthSource(gen(count), total=count))
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            return peak
+
+        small = await peak_for(50)
+        large = await peak_for(500)
+        # Dataset grows by ~9 MB; peak must not grow with the payload volume
+        assert large - small < 450 * payload_size * 0.1
@@ -520,6 +520,103 @@ class TestObserverScoringFunction:
         for v in scores.values():
             assert 0.0 <= v <= 1.0
 
+    @pytest.mark.asyncio
+    async def test_score_many_single_call(self, scorer: ObserverScoringFunction) -> None:
+        """All criteria are judged in one request that carries the diff once."""
+        prompts: list[str] = []
+
+        async def fake_call(prompt):
+            prompts.append(prompt)
+            return (
+                '{"precision": {"claims": [], "precision": 0.8, "total": 2, "supported": 1},'
+                ' "recall": {"changes": [], "recall": 0.6, "total": 5, "surfaced": 3},'
+                ' "reply_accuracy": {"accuracy": 0.9, "reasoning": "ok"}}'
+            )
+
+        scorer._call_anthropic = fake_call
+
+        scores = await scorer.score_many(
+            ["precision", "recall", "reply_accuracy"],
+            self._make_ground_truth(),
+            self._make_oracle_output(),
+        )
+
+        assert len(prompts) == 1
+        assert prompts[0].count("diff content here") == 1
+        assert scores == pytest.approx(
+            {"precision": 0.8, "recall": 0.6, "reply_accuracy": 0.9}
+        )
+
+    @pytest.mark.asyncio
+    async def test_score_many_prompt_built_from_criterion_prompts(
+        self, scorer: ObserverScoringFunction
+    ) -> None:
+        """Each criterion's rubric comes verbatim from its versioned prompt file."""
+        prompts: list[str] = []
+
+        async def fake_call(prompt):
+            prompts.append(prompt)
+            return "{}"
+
+        scorer._call_anthropic = fake_call
+        await scorer.score_many(
+            ["precision", "recall", "reply_accuracy"],
+            self._make_ground_truth(),
+            self._make_oracle_output(),
+        )
+
+        combined = prompts[0]
+        for criteria_id in ("precision", "recall", "reply_accuracy"):
+            template = scorer._prompts[criteria_id]
+            rubric = template[template.index("## Task"):].split("\n", 1)[1]
+            assert rubric.format().strip() in combined
+            assert f"## Criterion: {criteria_id}" in combined
+
+    @pytest.mark.asyncio
+    async def test_score_many_short_circuits_and_falls_back(
+        self, scorer: ObserverScoringFunction
+    ) -> None:
+        """Short-circuit rules match score(); a lone remaining criterion uses score()."""
+        prompts: list[str] = []
+
+        async def fake_call(prompt):
+            prompts.append(prompt)
+            return '{"recall": 0.5, "changes": [], "total": 2, "surfaced": 1}'
+
+        scorer._call_anthropic = fake_call
+        gt = self._make_ground_truth()
+        gt["input_data"]["follow_up_question"] = ""
+
+        scores = await scorer.score_many(
+            ["precision", "recall", "reply_accuracy", "unknown"],
+            gt,
+            self._make_oracle_output(key_claims=[]),
+        )
+
+        assert len(prompts) == 1
+        assert scores == {
+            "precision": 1.0,
+            "recall": pytest.approx(0.5),
+            "reply_accuracy": 0.0,
+            "unknown": 0.0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_score_many_handles_api_failure(
+        self, scorer: ObserverScoringFunction
+    ) -> None:
+        async def fake_call(prompt):
+            raise RuntimeError("API down")
+
+        scorer._call_anthropic = fake_call
+
+        scores = await scorer.score_many(
+            ["precision", "recall", "reply_accuracy"],
+            self._make_ground_truth(),
+            self._make_oracle_output(),
+        )
+        assert scores == {"precision": 0.0, "recall": 0.0, "reply_accuracy": 0.0}
+
 
 # ---------------------------------------------------------------------------
 # T1.4: Observer Template Tests
@@ -0,0 +1,221 @@
+"""Tests for Oracle Response Cache — keys, disk persistence, eviction, replay stats."""
+
+from typing import Any
+
+import pytest
+
+from theatre.engine.models import GroundTruthEpisode, TheatreCriteria
+from theatre.engine.oracle_cache import (
+    CachingOracleAdapter,
+    OracleCacheStats,
+    OracleResponseCache,
+)
+from theatre.engine.oracle_contract import MockOracleAdapter, OracleInvocationMetadata
+from theatre.engine.replay import ReplayEngine
+from theatre.engine.scoring import TheatreScoringProvider
+
+
+class _CountingAdapter:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def invoke(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        self.calls += 1
+        return {"answer": f"a{input_data['question'][1:]}"}
+
+
+def _episodes(count: int) -> list[GroundTruthEpisode]:
+    return [
+        GroundTruthEpisode(
+            episode_id=f"ep_{i:03d}",
+            input_data={"question": f"q{i}"},
+            expected_output={"answer": f"a{i}"},
+        )
+        for i in range(count)
+    ]
+
+
+def _engine(
+    episodes: list[GroundTruthEpisode],
+    adapter: Any,
+    response_cache: OracleResponseCache | None = None,
+    deterministic: bool = True,
+    construct_version: str = "abc123",
+) -> ReplayEngine:
+    criteria = TheatreCriteria(
+        criteria_ids=["accuracy"],
+        criteria_human="Test accuracy",
+        weights={"accuracy": 1.0},
+    )
+    return ReplayEngine(
+        theatre_id="test-theatre",
+        construct_id="observer",
+        construct_version=construct_version,
+        criteria=criteria,
+        oracle_adapter=adapter,
+        scoring_provider=TheatreScoringProvider(criteria),
+        committed_dataset_hash=ReplayEngine._compute_dataset_hash(episodes),
+        invocation_metadata=OracleInvocationMetadata(deterministic=deterministic),
+        response_cache=response_cache,
+    )
+
+
+class TestCacheKey:
+    def test_key_independent_of_dict_order(self):
+        k1 = OracleResponseCache.make_key("c", "v1", {"a": 1, "b": [1.0, 2]})
+        k2 = OracleResponseCache.make_key("c", "v1", {"b": [1, 2], "a": 1})
+        assert k1 == k2
+        assert len(k1) == 64
+
+    def test_key_changes_with_construct_version(self):
+        assert OracleResponseCache.make_key(
+            "c", "v1", {"a": 1}
+        ) != OracleResponseCache.make_key("c", "v2", {"a": 1})
+
+
+class TestOracleResponseCache:
+    def test_round_trip_and_stats(self, tmp_path):
+        cache = OracleResponseCache(tmp_path)
+        key = OracleResponseCache.make_key("c", "v", {"x": 1})
+        assert cache.get(key) is None
+        cache.put(key, {"out": [1, 2]})
+        assert cache.get(key) == {"out": [1, 2]}
+        assert cache.stats == OracleCacheStats(hits=1, misses=1, writes=1)
+
+    def test_persists_across_instances(self, tmp_path):
+        key = OracleResponseCache.make_key("c", "v", {"x": 1})
+        OracleResponseCache(tmp_path).put(key, {"out": "kept"})
+        reopened = OracleResponseCache(tmp_path)
+        assert len(reopened) == 1
+        assert reopened.get(key) == {"out": "kept"}
+
+    def test_hit_returns_fresh_copy(self, tmp_path):
+        cache = OracleResponseCache(tmp_path)
+        cache.put("k" * 64, {"items": [1]})
+        cache.get("k" * 64)["items"].append(2)
+        assert cache.get("k" * 64) == {"items": [1]}
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        cache = OracleResponseCache(tmp_path)
+        key = "ab" + "0" * 62
+        cache.put(key, {"out": 1})
+        (tmp_path / "ab" / f"{key}.json").write_text("{not json")
+        assert cache.get(key) is None
+        assert len(cache) == 0
+
+    def test_size_based_lru_eviction(self, tmp_path):
+        payload = {"blob": "x" * 100}
+        entry_size = len('{"blob":"' + "x" * 100 + '"}')
+        cache = OracleResponseCache(tmp_path, max_bytes=entry_size * 3)
+        keys = [f"{i:02d}" + "0" * 62 for i in range(4)]
+        for key in keys[:3]:
+            cache.put(key, payload)
+        cache.get(keys[0])  # keys[1] is now least recently used
+        cache.put(keys[3], payload)
+
+        assert cache.total_bytes <= entry_size * 3
+        assert cache.stats.evictions >= 1
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) == payload
+        assert cache.get(keys[3]) == payload
+
+    def test_invalid_max_bytes(self, tmp_path):
+        with pytest.raises(ValueError, match="max_bytes"):
+            OracleResponseCache(tmp_path, max_bytes=0)
+
+
+class TestCachingOracleAdapter:
+    @pytest.mark.asyncio
+    async def test_second_call_served_from_cache(self, tmp_path):
+        inner = _CountingAdapter()
+        adapter = CachingOracleAdapter(inner, OracleResponseCache(tmp_path), "c", "v")
+        first = await adapter.invoke({"question": "q1"})
+        second = await adapter.invoke({"question": "q1"})
+        assert first == second
+        assert inner.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_episode_id_not_part_of_key(self, tmp_path):
+        inner = _CountingAdapter()
+        adapter = CachingOracleAdapter(inner, OracleResponseCache(tmp_path), "c", "v")
+        await adapter.invoke({"question": "q1", "episode_id": "ep_a"})
+        await adapter.invoke({"question": "q1", "episode_id": "ep_b"})
+        await adapter.invoke({"question": "q2", "episode_id": "ep_a"})
+        assert inner.calls == 2
+        assert adapter.cache.stats == OracleCacheStats(hits=1, misses=2, writes=2)
+
+    @pytest.mark.asyncio
+    async def test_failures_not_cached(self, tmp_path):
+        cache = OracleResponseCache(tmp_path)
+        adapter = CachingOracleAdapter(
+            MockOracleAdapter(fail_episodes={"ep1"}), cache, "c", "v"
+        )
+        with pytest.raises(RuntimeError):
+            await adapter.invoke({"episode_id": "ep1"})
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_unserialisable_output_returned_but_not_cached(self, tmp_path, caplog):
+        class _SetAdapter:
+            async def invoke(self, input_data: dict[str, Any]) -> dict[str, Any]:
+                return {"tags": {"a", "b"}}
+
+        cache = OracleResponseCache(tmp_path)
+        adapter = CachingOracleAdapter(_SetAdapter(), cache, "c", "v")
+        output = await adapter.invoke({"question": "q1"})
+
+        assert output["tags"] == {"a", "b"}
+        assert len(cache) == 0
+        assert cache.stats.writes == 0
+        assert "Not caching oracle output" in caplog.text
+
+
+class TestReplayCaching:
+    @pytest.mark.asyncio
+    async def test_deterministic_replay_hits_cache_on_rerun(self, tmp_path):
+        episodes = _episodes(5)
+        cache = OracleResponseCache(tmp_path)
+        inner = _CountingAdapter()
+
+        first = await _engine(episodes, inner, response_cache=cache).run(episodes)
+        second = await _engine(episodes, inner, response_cache=cache).run(episodes)
+
+        assert inner.calls == 5
+        assert first.cache_stats == OracleCacheStats(misses=5, writes=5)
+        assert second.cache_stats == OracleCacheStats(hits=5)
+        assert second.aggregate_scores == first.aggregate_scores
+        assert [er.oracle_output for er in second.episode_results] == [
+            er.oracle_output for er in first.episode_results
+        ]
+
+    @pytest.mark.asyncio
+    async def test_new_construct_version_misses(self, tmp_path):
+        episodes = _episodes(3)
+        cache = OracleResponseCache(tmp_path)
+        inner = _CountingAdapter()
+        await _engine(episodes, inner, response_cache=cache).run(episodes)
+        result = await _engine(
+            episodes, inner, response_cache=cache, construct_version="def456",
+        ).run(episodes)
+        assert inner.calls == 6
+        assert result.cache_stats.hits == 0
+
+    @pytest.mark.asyncio
+    async def test_non_deterministic_not_cached_automatically(self, tmp_path):
+        episodes = _episodes(3)
+        cache = OracleResponseCache(tmp_path)
+        result = await _engine(
+            episodes, _CountingAdapter(), response_cache=cache, deterministic=False,
+        ).run(episodes)
+        assert result.cache_stats is None
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_explicit_wrapper_reports_stats(self, tmp_path):
+        episodes = _episodes(2)
+        adapter = CachingOracleAdapter(
+            _CountingAdapter(), OracleResponseCache(tmp_path), "observer", "abc123",
+        )
+        await _engine(episodes, adapter, deterministic=False).run(episodes)
+        result = await _engine(episodes, adapter, deterministic=False).run(episodes)
+        assert result.cache_stats == OracleCacheStats(hits=2)
@@ -5,10 +5,13 @@ import asyncio
 import pytest
 
 from theatre.engine.oracle_contract import (
+    CircuitBreaker,
     MockOracleAdapter,
     OracleInvocationMetadata,
     OracleInvocationRequest,
     OracleInvocationResponse,
+    OracleInvocationStats,
+    compute_backoff,
     invoke_oracle,
 )
 
@@ -55,6 +58,8 @@ class TestOracleInvocationModels:
         assert meta.timeout_seconds == 30
         assert meta.retry_count == 2
         assert meta.retry_backoff_seconds == 5.0
+        assert meta.retry_jitter == 0.0
+        assert compute_backoff(meta, 2) == 20.0  # Deterministic by default
         assert meta.deterministic is False
         assert meta.sanitise_input is True
 
@@ -174,3 +179,146 @@ class TestInvokeOracle:
         assert resp.construct_id == "observer"
         assert resp.construct_version == "abc123"
         assert resp.invocation_id == req.invocation_id
+
+
+class TestBackoffAndCircuitBreaker:
+    def _make_request(self, episode_id="ep1", **metadata) -> OracleInvocationRequest:
+        return OracleInvocationRequest(
+            theatre_id="t1",
+            episode_id=episode_id,
+            construct_id="observer",
+            construct_version="abc123",
+            input_data={},
+            metadata=OracleInvocationMetadata(**metadata),
+        )
+
+    def test_backoff_jitter_bounds(self):
+        meta = OracleInvocationMetadata(retry_backoff_seconds=5.0, retry_jitter=0.25)
+        assert compute_backoff(meta, 1, rng=lambda lo, hi: lo) == pytest.approx(7.5)
+        assert compute_backoff(meta, 1, rng=lambda lo, hi: hi) == pytest.approx(12.5)
+        no_jitter = OracleInvocationMetadata(retry_backoff_seconds=5.0, retry_jitter=0.0)
+        assert compute_backoff(no_jitter, 1) == 10.0
+
+    @pytest.mark.asyncio
+    async def test_backoff_wait_is_injectable_and_counted(self):
+        waits: list[float] = []
+
+        async def record_wait(delay: float) -> None:
+            waits.append(delay)
+
+        stats = OracleInvocationStats()
+        resp = await invoke_oracle(
+            MockOracleAdapter(fail_episodes={"ep1"}),
+            self._make_request(retry_count=2, retry_backoff_seconds=5.0, retry_jitter=0.0),
+            stats=stats,
+            backoff_wait=record_wait,
+        )
+        assert resp.status == "ERROR"
+        assert waits == [5.0, 10.0]
+        assert stats.attempts == 3
+        assert stats.retries == 2
+        assert stats.errors == 3
+        assert stats.backoff_seconds == 15.0
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast_without_invoking(self):
+        calls = 0
+
+        class CountingFailingAdapter:
+            async def invoke(self, input_data):
+                nonlocal calls
+                calls += 1
+                raise RuntimeError("down")
+
+        breaker = CircuitBreaker(failure_threshold=2)
+        stats = OracleInvocationStats()
+        adapter = CountingFailingAdapter()
+        first = await invoke_oracle(
+            adapter, self._make_request("ep1", retry_count=0), circuit_breaker=breaker
+        )
+        second = await invoke_oracle(
+            adapter, self._make_request("ep2", retry_count=0), circuit_breaker=breaker
+        )
+        assert breaker.is_open
+        third = await invoke_oracle(
+            adapter,
+            self._make_request("ep3", retry_count=3),
+            circuit_breaker=breaker,
+            stats=stats,
+        )
+
+        assert [first.status, second.status, third.status] == ["ERROR"] * 3
+        assert calls == 2
+        assert "Circuit open" in third.error_detail
+        assert stats.circuit_rejections == 1
+        assert stats.attempts == 0
+
+    @pytest.mark.asyncio
+    async def test_refusals_do_not_trip_breaker(self):
+        breaker = CircuitBreaker(failure_threshold=1)
+        resp = await invoke_oracle(
+            MockOracleAdapter(refuse_episodes={"ep1"}),
+            self._make_request(),
+            circuit_breaker=breaker,
+        )
+        assert resp.status == "REFUSED"
+        assert not breaker.is_open
+
+    def test_half_open_after_cooldown(self):
+        now = [0.0]
+        breaker = CircuitBreaker(
+            failure_threshold=1, reset_after_seconds=10.0, clock=lambda: now[0]
+        )
+        breaker.record_failure()
+        assert not breaker.allow()
+
+        now[0] = 10.0
+        assert breaker.allow()  # Single trial call
+        assert not breaker.allow()
+        breaker.record_failure()  # Trial failed: re-open
+        assert not breaker.allow()
+
+        now[0] = 20.0
+        assert breaker.allow()
+        breaker.record_success()
+        assert not breaker.is_open
+        assert breaker.allow()
+
+    def _open_breaker(self, now):
+        breaker = CircuitBreaker(
+            failure_threshold=1, reset_after_seconds=10.0, clock=lambda: now[0]
+        )
+        breaker.record_failure()
+        now[0] = 10.0
+        return breaker
+
+    @pytest.mark.asyncio
+    async def test_refused_trial_releases_half_open_slot(self):
+        now = [0.0]
+        breaker = self._open_breaker(now)
+        resp = await invoke_oracle(
+            MockOracleAdapter(refuse_episodes={"ep1"}),
+            self._make_request(),
+            circuit_breaker=breaker,
+        )
+        assert resp.status == "REFUSED"
+        assert breaker.is_open
+        assert breaker.allow()  # A later call gets the trial
+
+    @pytest.mark.asyncio
+    async def test_cancelled_trial_releases_half_open_slot(self):
+        now = [0.0]
+        breaker = self._open_breaker(now)
+        task = asyncio.create_task(invoke_oracle(
+            MockOracleAdapter(timeout_episodes={"ep1"}),
+            self._make_request(),
+            circuit_breaker=breaker,
+        ))
+        await asyncio.sleep(0.01)
+        assert not breaker.allow()  # Trial in flight
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert breaker.is_open
+        assert breaker.allow()
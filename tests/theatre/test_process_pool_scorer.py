@@ -0,0 +1,220 @@
+"""Tests for ProcessPoolScorer — deterministic scoring in worker processes."""
+
+import asyncio
+import concurrent.futures
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from theatre.engine.models import GroundTruthEpisode, TheatreCriteria
+from theatre.engine.replay import ReplayEngine
+from theatre.engine.scoring import BatchScoringFunction, TheatreScoringProvider
+from theatre.scoring import (
+    DeterministicOracleAdapter,
+    EscrowScorer,
+    ProcessPoolScorer,
+    ReconciliationScorer,
+    WaterfallScorer,
+)
+
+DATASETS = Path(__file__).resolve().parents[2] / (
+    "theatre/fixtures/two_rail_theatres_v0_1/datasets"
+)
+
+WATERFALL_CRITERIA = [
+    "waterfall_arithmetic",
+    "noi_pool_conservation",
+    "rounding_policy_compliance",
+    "cap_table_consistency",
+    "ledger_reconciliation",
+]
+ESCROW_CRITERIA = [
+    "required_evidence_present",
+    "signature_policy_satisfied",
+    "validity_window_respected",
+    "release_amount_correct",
+    "idempotency",
+]
+RECONCILIATION_CRITERIA = [
+    "bank_ref_match",
+    "bucket_sum_matches_gross",
+    "bucket_destination_valid",
+    "event_log_complete",
+    "exceptions_correct",
+]
+
+
+def _load_episodes(dataset: str, copies: int = 1) -> list[GroundTruthEpisode]:
+    records = json.loads((DATASETS / dataset).read_text())["records"]
+    return [
+        GroundTruthEpisode(
+            episode_id=f"{record['record_id']}_{copy:06d}",
+            input_data=record["inputs"],
+            expected_output=record.get("expected_outputs", {}),
+        )
+        for copy in range(copies)
+        for record in records
+    ]
+
+
+def _perturb(value):
+    if isinstance(value, dict):
+        return {k: _perturb(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_perturb(v) for v in value]
+    if isinstance(value, bool):
+        return not value
+    if isinstance(value, (int, float)):
+        return value + 7
+    if isinstance(value, str):
+        return value + "_x"
+    return value
+
+
+def _broken(episodes: list[GroundTruthEpisode]) -> list[GroundTruthEpisode]:
+    """Perturb every third episode's inputs so its checks fail."""
+    return [
+        ep.model_copy(update={"input_data": _perturb(ep.input_data)})
+        if i % 3 == 0 else ep
+        for i, ep in enumerate(episodes)
+    ]
+
+
+def _make_engine(episodes, criteria_ids, scorer, max_concurrency=1) -> ReplayEngine:
+    criteria = TheatreCriteria(
+        criteria_ids=criteria_ids,
+        criteria_human="Two-rail checks",
+        weights={cid: 1.0 / len(criteria_ids) for cid in criteria_ids},
+    )
+    return ReplayEngine(
+        theatre_id="test-theatre",
+        construct_id="deterministic",
+        construct_version="v1",
+        criteria=criteria,
+        oracle_adapter=DeterministicOracleAdapter(),
+        scoring_provider=TheatreScoringProvider(criteria, scorer=scorer),
+        committed_dataset_hash=ReplayEngine._compute_dataset_hash(episodes),
+        max_concurrency=max_concurrency,
+    )
+
+
+class _FailingScorer:
+    def score_sync(self, criteria_id, ground_truth, oracle_output) -> float:
+        raise ValueError("bad fixture")
+
+
+class TestProcessPoolScorer:
+    def test_implements_batch_protocol(self):
+        assert isinstance(ProcessPoolScorer(WaterfallScorer()), BatchScoringFunction)
+
+    @pytest.mark.parametrize("scorer_cls,dataset,criteria_ids", [
+        (WaterfallScorer, "waterfall_fixtures_10.json", WATERFALL_CRITERIA),
+        (EscrowScorer, "escrow_fixtures_10.json", ESCROW_CRITERIA),
+        (ReconciliationScorer, "reconciliation_fixtures_10.json", RECONCILIATION_CRITERIA),
+    ])
+    @pytest.mark.asyncio
+    async def test_results_identical_to_inline(self, scorer_cls, dataset, criteria_ids):
+        episodes = _broken(_load_episodes(dataset, copies=5))
+
+        inline = await _make_engine(episodes, criteria_ids, scorer_cls()).run(episodes)
+        with ProcessPoolScorer(scorer_cls(), max_workers=2, batch_size=8) as pooled:
+            offloaded = await _make_engine(
+                episodes, criteria_ids, pooled, max_concurrency=16
+            ).run(episodes)
+
+        exclude = {
+            "episode_results": {"__all__": {"latency_ms"}},
+            "statistics": {"latency_ms"},
+        }
+        assert offloaded.model_dump(exclude=exclude) == inline.model_dump(exclude=exclude)
+        assert 0.0 < inline.composite_score < 1.0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_batched(self):
+        episodes = _load_episodes("waterfall_fixtures_10.json", copies=4)
+        with ProcessPoolScorer(WaterfallScorer(), max_workers=1, batch_size=16) as pooled:
+            results = await asyncio.gather(*(
+                pooled.score_many(
+                    WATERFALL_CRITERIA,
+                    TheatreScoringProvider.ground_truth_inputs(ep),
+                    ep.input_data,
+                )
+                for ep in episodes
+            ))
+            assert pooled.batches_submitted == 3  # 40 episodes in batches of <= 16
+        assert all(scores == dict.fromkeys(WATERFALL_CRITERIA, 1.0) for scores in results)
+
+    @pytest.mark.asyncio
+    async def test_single_criterion_score(self):
+        ep = _load_episodes("waterfall_fixtures_10.json")[0]
+        with ProcessPoolScorer(WaterfallScorer(), max_workers=1) as pooled:
+            gt = TheatreScoringProvider.ground_truth_inputs(ep)
+            assert await pooled.score("waterfall_arithmetic", gt, ep.input_data) == 1.0
+            assert await pooled.score("unknown", gt, ep.input_data) == 0.0
+
+    @pytest.mark.asyncio
+    async def test_worker_errors_propagate(self):
+        with ProcessPoolScorer(_FailingScorer(), max_workers=1) as pooled:
+            with pytest.raises(ValueError, match="bad fixture"):
+                await pooled.score_many(["x"], {}, {})
+
+    @pytest.mark.asyncio
+    async def test_cancelled_batch_cancels_callers(self):
+        loop = asyncio.get_running_loop()
+        waiting = [loop.create_future() for _ in range(3)]
+        batch_future = concurrent.futures.Future()
+        batch_future.cancel()
+
+        ProcessPoolScorer._deliver([(None, f) for f in waiting], batch_future)
+        assert all(f.cancelled() for f in waiting)
+
+    def test_invalid_batch_size(self):
+        with pytest.raises(ValueError):
+            ProcessPoolScorer(WaterfallScorer(), batch_size=0)
+
+
+# ============================================
+# BENCHMARKS (`bench` fixture in conftest.py)
+# ============================================
+
+_BENCH_EPISODES = 100_000
+
+
+@pytest.fixture(scope="module")
+def waterfall_100k():
+    return _load_episodes("waterfall_fixtures_10.json", copies=_BENCH_EPISODES // 10)
+
+
+@pytest.mark.parametrize("workers", [0, 1, 2, 4, 8])
+def test_bench_waterfall_replay_scaling(bench, waterfall_100k, workers):
+    """End-to-end replay of 100k waterfall episodes; 0 workers = inline scoring."""
+    batch_size = 512
+
+    def run() -> float:
+        async def go():
+            pooled = (
+                ProcessPoolScorer(WaterfallScorer(), max_workers=workers, batch_size=batch_size)
+                if workers else None
+            )
+            engine = _make_engine(
+                waterfall_100k,
+                WATERFALL_CRITERIA,
+                pooled or WaterfallScorer(),
+                max_concurrency=max(1, workers) * batch_size,
+            )
+            try:
+                start = time.perf_counter()
+                result = await engine.run(waterfall_100k)
+                elapsed = time.perf_counter() - start
+            finally:
+                if pooled is not None:
+                    pooled.close()
+            assert result.composite_score == 1.0
+            return elapsed
+
+        return asyncio.run(go())
+
+    elapsed = bench.pedantic(run, rounds=1, iterations=1)
+    bench.extra_info["episodes_per_sec"] = round(_BENCH_EPISODES / elapsed)
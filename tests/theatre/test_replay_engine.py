@@ -1,9 +1,19 @@
 """Tests for Replay Engine — full lifecycle, failure cap, hash mismatch."""
 
+import asyncio
+import json
+import time
+from typing import Any
+
 import pytest
 
+from theatre.engine.checkpoint import CheckpointMismatchError, ReplayCheckpoint
 from theatre.engine.models import GroundTruthEpisode, TheatreCriteria
-from theatre.engine.oracle_contract import MockOracleAdapter
+from theatre.engine.oracle_contract import (
+    CircuitBreaker,
+    MockOracleAdapter,
+    OracleInvocationMetadata,
+)
 from theatre.engine.replay import (
     DatasetHashMismatchError,
     ReplayEngine,
@@ -35,10 +45,25 @@ def _compute_dataset_hash(episodes: list[GroundTruthEpisode]) -> str:
     return ReplayEngine._compute_dataset_hash(episodes)
 
 
+class _SlowOracleAdapter:
+    """Adapter with fixed artificial latency and episode-dependent output."""
+
+    def __init__(self, latency_seconds: float):
+        self._latency_seconds = latency_seconds
+
+    async def invoke(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        await asyncio.sleep(self._latency_seconds)
+        # Alternate hits/misses so aggregate scores are order-sensitive
+        index = int(input_data["question"][1:])
+        return {"answer": f"a{index}" if index % 3 else "wrong"}
+
+
 def _make_engine(
     episodes: list[GroundTruthEpisode],
-    adapter: MockOracleAdapter | None = None,
+    adapter: Any = None,
     criteria: TheatreCriteria | None = None,
+    max_concurrency: int = 1,
+    **engine_kwargs: Any,
 ) -> ReplayEngine:
     crit = criteria or _make_criteria()
     scorer = TheatreScoringProvider(crit)
@@ -52,6 +77,8 @@ def _make_engine(
         oracle_adapter=oracle,
         scoring_provider=scorer,
         committed_dataset_hash=dataset_hash,
+        max_concurrency=max_concurrency,
+        **engine_kwargs,
     )
 
 
@@ -93,6 +120,49 @@ class TestReplayEngineLifecycle:
         assert 0.0 <= result.composite_score <= 1.0
         assert "accuracy" in result.aggregate_scores
 
+    @pytest.mark.asyncio
+    async def test_session_matches_run(self):
+        """A caller-driven ReplaySession yields the same result as run()."""
+        episodes = _make_episodes(6)
+        engine = _make_engine(episodes, adapter=_SlowOracleAdapter(0))
+        session = engine.start_session()
+        for episode in episodes:
+            session.record(await session.run_episode(episode))
+        dataset_hash = engine.check_dataset_hash(_compute_dataset_hash(episodes))
+
+        exclude = {
+            "episode_results": {"__all__": {"latency_ms"}},
+            "statistics": {"latency_ms"},
+        }
+        manual = session.finish(dataset_hash).model_dump(exclude=exclude)
+        assert manual == (await engine.run(episodes)).model_dump(exclude=exclude)
+        assert session.metrics(0.0).invocations.attempts == 6
+        with pytest.raises(DatasetHashMismatchError):
+            engine.check_dataset_hash("0" * 64)
+
+    @pytest.mark.asyncio
+    async def test_statistics_reported(self):
+        pytest.importorskip("numpy")
+        episodes = _make_episodes(30)
+        result = await _make_engine(
+            episodes, adapter=_SlowOracleAdapter(0), bootstrap_resamples=200,
+        ).run(episodes)
+
+        stats = result.statistics
+        assert stats.sample_size == result.scored_count == 30
+        accuracy = stats.criteria["accuracy"]
+        assert accuracy.mean == result.aggregate_scores["accuracy"]
+        assert accuracy.variance > 0
+        assert accuracy.ci_low <= accuracy.mean <= accuracy.ci_high
+        assert stats.composite.mean == pytest.approx(result.composite_score)
+        assert stats.latency_ms is not None
+
+        # Seeded from the dataset hash, so a rerun gives identical intervals
+        rerun = await _make_engine(
+            episodes, adapter=_SlowOracleAdapter(0), bootstrap_resamples=200,
+        ).run(episodes)
+        assert rerun.statistics.criteria == stats.criteria
+
 
 class TestReplayEngineFailures:
     @pytest.mark.asyncio
@@ -160,6 +230,289 @@ class TestReplayEngineFailures:
         assert len(timeout_results) == 1
 
 
+class TestReplayEngineConcurrency:
+    def test_invalid_max_concurrency_rejected(self):
+        with pytest.raises(ValueError, match="max_concurrency"):
+            _make_engine(_make_episodes(1), max_concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_results_match_sequential_run(self):
+        episodes = _make_episodes(12)
+        adapter = _SlowOracleAdapter(latency_seconds=0.01)
+        sequential = await _make_engine(episodes, adapter=adapter).run(episodes)
+        concurrent = await _make_engine(
+            episodes, adapter=adapter, max_concurrency=5,
+        ).run(episodes)
+
+        assert [er.episode_id for er in concurrent.episode_results] == [
+            ep.episode_id for ep in episodes
+        ]
+        exclude = {
+            "episode_results": {"__all__": {"latency_ms"}},
+            "statistics": {"latency_ms"},
+        }
+        assert concurrent.model_dump(exclude=exclude) == sequential.model_dump(
+            exclude=exclude
+        )
+
+    @pytest.mark.asyncio
+    async def test_progress_reports_every_completion(self):
+        episodes = _make_episodes(6)
+        engine = _make_engine(
+            episodes, adapter=_SlowOracleAdapter(0.01), max_concurrency=3,
+        )
+        progress_calls = []
+        await engine.run(
+            episodes,
+            progress_callback=lambda current, total: progress_calls.append((current, total)),
+        )
+        assert progress_calls == [(i, 6) for i in range(1, 7)]
+
+    @pytest.mark.asyncio
+    async def test_near_linear_speedup(self):
+        episodes = _make_episodes(20)
+        adapter = _SlowOracleAdapter(latency_seconds=0.05)
+
+        start = time.monotonic()
+        await _make_engine(episodes, adapter=adapter).run(episodes)
+        sequential_elapsed = time.monotonic() - start
+
+        start = time.monotonic()
+        await _make_engine(episodes, adapter=adapter, max_concurrency=10).run(episodes)
+        concurrent_elapsed = time.monotonic() - start
+
+        # 20 episodes x 50 ms: ~1 s sequential vs ~0.1 s with 10 in flight
+        assert sequential_elapsed >= 1.0
+        assert sequential_elapsed / concurrent_elapsed >= 5.0
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_respected(self):
+        in_flight = 0
+        peak = 0
+
+        class _CountingAdapter:
+            async def invoke(self, input_data: dict[str, Any]) -> dict[str, Any]:
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return {}
+
+        episodes = _make_episodes(15)
+        await _make_engine(
+            episodes, adapter=_CountingAdapter(), max_concurrency=4,
+        ).run(episodes)
+        assert peak == 4
+
+    @pytest.mark.asyncio
+    async def test_source_failure_settles_inflight_episodes(self):
+        """Episodes in flight when the source fails are cancelled and awaited."""
+        episodes = _make_episodes(3)
+
+        class _FailingSource:
+            total = None
+            replayable = False
+
+            async def __aiter__(self):
+                for ep in episodes:
+                    yield ep
+                    await asyncio.sleep(0)  # Let the invocation start
+                raise OSError("dataset read failed")
+
+        engine = _make_engine(
+            episodes, adapter=_SlowOracleAdapter(60), max_concurrency=8,
+        )
+        with pytest.raises(OSError, match="dataset read failed"):
+            await engine.run(_FailingSource())
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+class _CountingOracleAdapter(_SlowOracleAdapter):
+    def __init__(self):
+        super().__init__(latency_seconds=0.0)
+        self.calls = 0
+
+    async def invoke(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        self.calls += 1
+        return await super().invoke(input_data)
+
+
+class _Crash(Exception):
+    pass
+
+
+class TestReplayCheckpoint:
+    async def _crash_after(self, episodes, path, n, max_concurrency=1):
+        def crash(completed, total):
+            if completed == n:
+                raise _Crash()
+
+        engine = _make_engine(
+            episodes, adapter=_CountingOracleAdapter(), max_concurrency=max_concurrency,
+        )
+        with pytest.raises(_Crash):
+            await engine.run(
+                episodes, progress_callback=crash, checkpoint=ReplayCheckpoint(path),
+            )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("max_concurrency", [1, 4])
+    async def test_resume_matches_uninterrupted_run(self, tmp_path, max_concurrency):
+        episodes = _make_episodes(12)
+        path = tmp_path / "replay.ckpt.jsonl"
+        await self._crash_after(episodes, path, n=5, max_concurrency=max_concurrency)
+        # In-flight episodes may finish (and be checkpointed) after the crash
+        checkpointed = len(path.read_text().splitlines()) - 1
+        assert 5 <= checkpointed < 12
+
+        adapter = _CountingOracleAdapter()
+        resumed = await _make_engine(
+            episodes, adapter=adapter, max_concurrency=max_concurrency,
+        ).run(episodes, checkpoint=ReplayCheckpoint(path))
+        uninterrupted = await _make_engine(episodes, adapter=_SlowOracleAdapter(0)).run(
+            episodes
+        )
+
+        assert adapter.calls == 12 - checkpointed
+        exclude = {
+            "episode_results": {"__all__": {"latency_ms"}},
+            "statistics": {"latency_ms"},
+        }
+        assert resumed.model_dump(exclude=exclude) == uninterrupted.model_dump(
+            exclude=exclude
+        )
+
+    @pytest.mark.asyncio
+    async def test_completed_checkpoint_skips_all_invocations(self, tmp_path):
+        episodes = _make_episodes(6)
+        path = tmp_path / "replay.ckpt.jsonl"
+        first = await _make_engine(episodes).run(episodes, checkpoint=ReplayCheckpoint(path))
+
+        adapter = _CountingOracleAdapter()
+        progress_calls = []
+        second = await _make_engine(episodes, adapter=adapter).run(
+            episodes,
+            progress_callback=lambda c, t: progress_calls.append(c),
+            checkpoint=ReplayCheckpoint(path),
+        )
+        assert adapter.calls == 0
+        assert progress_calls == list(range(1, 7))
+        assert second == first
+
+    @pytest.mark.asyncio
+    async def test_torn_final_line_is_discarded(self, tmp_path):
+        episodes = _make_episodes(6)
+        path = tmp_path / "replay.ckpt.jsonl"
+        await self._crash_after(episodes, path, n=3)
+        with path.open("ab") as f:
+            f.write(b'{"chain": "abc", "index": 3, "res')
+
+        adapter = _CountingOracleAdapter()
+        result = await _make_engine(episodes, adapter=adapter).run(
+            episodes, checkpoint=ReplayCheckpoint(path),
+        )
+        assert adapter.calls == 3
+        assert result.replay_count == 6
+        assert len(path.read_text().splitlines()) == 1 + 6
+
+    @pytest.mark.asyncio
+    async def test_tampered_record_rejected(self, tmp_path):
+        episodes = _make_episodes(4)
+        path = tmp_path / "replay.ckpt.jsonl"
+        await _make_engine(episodes).run(episodes, checkpoint=ReplayCheckpoint(path))
+        lines = path.read_text().splitlines()
+        record = json.loads(lines[2])
+        record["result"]["composite_score"] = 1.0
+        lines[2] = json.dumps(record, sort_keys=True)
+        path.write_text("\n".join(lines) + "\n")
+
+        with pytest.raises(CheckpointMismatchError, match="verification"):
+            await _make_engine(episodes).run(episodes, checkpoint=ReplayCheckpoint(path))
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("bad_line", ['{"chain": "abc", "ind', '["not", "a record"]'])
+    async def test_corrupt_inner_line_rejected(self, tmp_path, bad_line):
+        """Only the final line may be torn; a bad complete line fails verification."""
+        episodes = _make_episodes(4)
+        path = tmp_path / "replay.ckpt.jsonl"
+        await _make_engine(episodes).run(episodes, checkpoint=ReplayCheckpoint(path))
+        lines = path.read_text().splitlines()
+        lines[2] = bad_line
+        path.write_text("\n".join(lines) + "\n")
+
+        with pytest.raises(CheckpointMismatchError, match="line 3"):
+            await _make_engine(episodes).run(episodes, checkpoint=ReplayCheckpoint(path))
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_for_other_replay_rejected(self, tmp_path):
+        episodes = _make_episodes(4)
+        path = tmp_path / "replay.ckpt.jsonl"
+        await _make_engine(episodes).run(episodes, checkpoint=ReplayCheckpoint(path))
+
+        other = _make_episodes(5)
+        with pytest.raises(CheckpointMismatchError, match="different replay"):
+            await _make_engine(other).run(other, checkpoint=ReplayCheckpoint(path))
+
+
+class TestDeferredRetries:
+    @pytest.mark.asyncio
+    async def test_backoff_does_not_block_other_episodes(self):
+        """A flaky episode backing off frees its slot for the rest of the replay."""
+        episodes = _make_episodes(10)
+        attempts: dict[int, int] = {}
+
+        class _FlakyFirstEpisode(_SlowOracleAdapter):
+            async def invoke(self, input_data):
+                index = int(input_data["question"][1:])
+                attempts[index] = attempts.get(index, 0) + 1
+                if index == 0 and attempts[index] == 1:
+                    raise RuntimeError("transient")
+                return await super().invoke(input_data)
+
+        engine = _make_engine(
+            episodes,
+            adapter=_FlakyFirstEpisode(0.05),
+            invocation_metadata=OracleInvocationMetadata(
+                retry_backoff_seconds=0.3, retry_jitter=0.0,
+            ),
+        )
+        start = time.monotonic()
+        result = await engine.run(episodes)
+        elapsed = time.monotonic() - start
+
+        # Inline backoff would take 0.3 + 10 x 0.05 = 0.8 s
+        assert elapsed < 0.7
+        assert result.failure_count == 0
+        assert [er.episode_id for er in result.episode_results] == [
+            ep.episode_id for ep in episodes
+        ]
+        metrics = engine.last_metrics
+        assert metrics.invocations.retries == 1
+        assert metrics.invocations.attempts == 11
+        assert metrics.wall_time_seconds == pytest.approx(elapsed, abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_circuit_breaker_fails_remaining_episodes_fast(self):
+        episodes = _make_episodes(8)
+        adapter = MockOracleAdapter(fail_episodes={ep.episode_id for ep in episodes})
+        engine = _make_engine(
+            episodes,
+            adapter=adapter,
+            invocation_metadata=OracleInvocationMetadata(retry_count=0),
+            circuit_breaker=CircuitBreaker(failure_threshold=3),
+        )
+
+        result = await engine.run(episodes)
+
+        assert result.failure_count == 8
+        assert all(er.invocation_status == "ERROR" for er in result.episode_results)
+        metrics = engine.last_metrics
+        assert metrics.circuit_open
+        assert metrics.invocations.attempts == 3
+        assert metrics.invocations.circuit_rejections == 5
+
+
 class TestDatasetHash:
     def test_deterministic(self):
         episodes = _make_episodes(5)
@@ -172,3 +525,25 @@ class TestDatasetHash:
         eps1 = _make_episodes(5)
         eps2 = _make_episodes(3)
         assert _compute_dataset_hash(eps1) != _compute_dataset_hash(eps2)
+
+
+class TestStreamedDatasetVerification:
+    def _write_jsonl(self, path, episodes):
+        with path.open("w") as f:
+            for ep in episodes:
+                f.write(json.dumps(ep.model_dump(), sort_keys=True) + "\n")
+
+    def test_verify_dataset_jsonl(self, tmp_path):
+        episodes = _make_episodes(8)
+        path = tmp_path / "gt.jsonl"
+        self._write_jsonl(path, episodes)
+        engine = _make_engine(episodes)
+        assert engine.verify_dataset_jsonl(path) == _compute_dataset_hash(episodes)
+
+    def test_verify_dataset_jsonl_mismatch(self, tmp_path):
+        episodes = _make_episodes(8)
+        path = tmp_path / "gt.jsonl"
+        self._write_jsonl(path, episodes[:-1])
+        engine = _make_engine(episodes)
+        with pytest.raises(DatasetHashMismatchError, match="mismatch"):
+            engine.verify_dataset_jsonl(path)
@@ -1,4 +1,7 @@
-"""Tests for Resolution State Machine — linear execution, escalation, HITL."""
+"""Tests for Resolution State Machine — linear execution, escalation, HITL, DAG."""
+
+import asyncio
+import time
 
 import pytest
 
@@ -217,3 +220,147 @@ class TestAuditTrail:
             e.event_type.startswith("resolution_step_")
             for e in result.audit_events
         )
+
+
+class _SleepyAdapter:
+    """Sleeps per step (by episode_id) and records start/finish order."""
+
+    def __init__(self, delays: dict[str, float], fail: set[str] = frozenset()):
+        self.delays = delays
+        self.fail = fail
+        self.started: list[str] = []
+        self.finished: list[str] = []
+        self.inputs: dict[str, dict] = {}
+
+    async def invoke(self, input_data: dict) -> dict:
+        step_id = input_data["episode_id"]
+        self.started.append(step_id)
+        self.inputs[step_id] = input_data
+        await asyncio.sleep(self.delays.get(step_id, 0.0))
+        if step_id in self.fail:
+            raise PermissionError(f"{step_id} refused")  # Not retried
+        self.finished.append(step_id)
+        return {"from": step_id, "value": len(self.finished)}
+
+
+def _invoke(step_id: str, **kwargs) -> ResolutionStep:
+    return ResolutionStep(
+        step_id=step_id, type="construct_invocation", construct_id="observer", **kwargs
+    )
+
+
+_PINS = {"constructs": {"observer": "abc123"}}
+
+
+class TestDagExecution:
+    @pytest.mark.asyncio
+    async def test_independent_invocations_run_concurrently(self):
+        adapter = _SleepyAdapter({"a": 0.2, "b": 0.2, "c": 0.2})
+        sm = ResolutionStateMachine(
+            [_invoke("a"), _invoke("b"), _invoke("c"),
+             ResolutionStep(step_id="agg", type="aggregation")],
+            _PINS, oracle_adapter=adapter,
+        )
+
+        start = time.perf_counter()
+        result = await sm.execute(_make_context())
+        elapsed = time.perf_counter() - start
+
+        assert result.final_status == "COMPLETED"
+        assert elapsed < 0.4  # Slowest step, not the 0.6s sum
+        assert result.outcomes[-1].output["aggregated_steps"] == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_outcomes_and_audit_in_committed_order(self):
+        # Later steps finish first
+        adapter = _SleepyAdapter({"a": 0.15, "b": 0.1, "c": 0.0})
+        sm = ResolutionStateMachine(
+            [_invoke("a"), ResolutionStep(step_id="review", type="hitl_rubric"),
+             _invoke("b"), _invoke("c")],
+            _PINS, oracle_adapter=adapter,
+        )
+        result = await sm.execute(_make_context())
+
+        assert adapter.finished == ["c", "b", "a"]
+        assert [o.step_id for o in result.outcomes] == ["a", "review", "b", "c"]
+        assert [e.detail["step_id"] for e in result.audit_events] == ["a", "review", "b", "c"]
+        assert result.final_status == "PENDING_HITL"
+
+    @pytest.mark.asyncio
+    async def test_referenced_output_is_dependency_and_resolved(self):
+        adapter = _SleepyAdapter({"a": 0.05})
+        steps = [
+            _invoke("a"),
+            _invoke("b", input_spec={"prior": "step_outputs.a.from", "whole": "step_outputs.a"}),
+        ]
+        sm = ResolutionStateMachine(steps, _PINS, oracle_adapter=adapter)
+        assert sm.dependencies["b"] == {"a"}
+
+        result = await sm.execute(_make_context())
+
+        assert result.final_status == "COMPLETED"
+        assert adapter.started == ["a", "b"]  # b waited for a
+        assert adapter.inputs["b"]["prior"] == "a"
+        assert adapter.inputs["b"]["whole"] == {"from": "a", "value": 1}
+
+    @pytest.mark.asyncio
+    async def test_unresolvable_references_are_left_unchanged(self):
+        adapter = _SleepyAdapter({})
+        spec = {"ghost": "step_outputs.ghost.x", "missing": "step_outputs.a.nope",
+                "deep": "step_outputs.a.from.x"}
+        sm = ResolutionStateMachine(
+            [_invoke("a"), _invoke("b", input_spec=spec)], _PINS, oracle_adapter=adapter,
+        )
+        assert sm.dependencies["b"] == {"a"}  # Unknown ids add no dependency
+
+        result = await sm.execute(_make_context())
+
+        assert result.final_status == "COMPLETED"
+        assert {k: adapter.inputs["b"][k] for k in spec} == spec
+
+    @pytest.mark.asyncio
+    async def test_explicit_dependency_waits(self):
+        adapter = _SleepyAdapter({"a": 0.05})
+        sm = ResolutionStateMachine(
+            [_invoke("a"), _invoke("b", depends_on=["a"]), _invoke("c")],
+            _PINS, oracle_adapter=adapter,
+        )
+        await sm.execute(_make_context())
+        assert adapter.started == ["a", "c", "b"]
+
+    @pytest.mark.asyncio
+    async def test_escalation_discards_speculative_steps(self):
+        adapter = _SleepyAdapter({"primary": 0.05, "skipped": 0.2}, fail={"primary"})
+        sm = ResolutionStateMachine(
+            [_invoke("primary", escalation_path="fallback"), _invoke("skipped"),
+             ResolutionStep(step_id="fallback", type="deterministic_computation")],
+            _PINS, oracle_adapter=adapter,
+        )
+        result = await sm.execute(_make_context())
+
+        assert [(o.step_id, o.status) for o in result.outcomes] == [
+            ("primary", "FAILED"), ("primary", "ESCALATED"), ("fallback", "SUCCESS"),
+        ]
+        assert "skipped" not in adapter.finished  # Cancelled
+        assert result.final_status == "COMPLETED"
+
+    @pytest.mark.asyncio
+    async def test_failure_hides_later_version_pin_error(self):
+        # Sequentially, the unpinned step is never reached
+        adapter = _SleepyAdapter({"a": 0.05}, fail={"a"})
+        sm = ResolutionStateMachine(
+            [_invoke("a"), ResolutionStep(
+                step_id="unpinned", type="construct_invocation", construct_id="ghost"
+            )],
+            _PINS, oracle_adapter=adapter,
+        )
+        result = await sm.execute(_make_context())
+        assert result.final_status == "FAILED"
+
+    def test_dependency_must_precede(self):
+        with pytest.raises(ValueError, match="does not precede"):
+            ResolutionStateMachine(
+                [_invoke("a", depends_on=["b"]), _invoke("b")], _PINS,
+            )
+        with pytest.raises(ValueError, match="unknown step"):
+            ResolutionStateMachine([_invoke("a", depends_on=["ghost"])], _PINS)
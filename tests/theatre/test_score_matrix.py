@@ -0,0 +1,101 @@
+"""Tests for ScoreMatrix columnar aggregation and replay statistics."""
+
+import math
+import random
+import statistics
+
+import pytest
+
+from theatre.engine.score_matrix import ScoreMatrix
+
+
+def _filled(rows: list[dict[str, float]], criteria=("a", "b")) -> ScoreMatrix:
+    matrix = ScoreMatrix(list(criteria))
+    for row in rows:
+        matrix.add_scores(row)
+    return matrix
+
+
+class TestMeans:
+    def test_means_match_python_mean(self):
+        rng = random.Random(7)
+        rows = [{"a": rng.random(), "b": rng.random()} for _ in range(500)]
+        means = _filled(rows).means()
+        assert means["a"] == pytest.approx(statistics.fmean(r["a"] for r in rows))
+        assert means["b"] == pytest.approx(statistics.fmean(r["b"] for r in rows))
+
+    def test_means_match_sequential_sum(self):
+        """Same rounding as sum()/len(), so certificate values do not shift."""
+        rows = [{"a": 0.1, "b": 0.7}] * 10
+        means = _filled(rows).means()
+        assert means["a"] == sum([0.1] * 10) / 10 == 0.09999999999999999
+        assert means["b"] == sum([0.7] * 10) / 10
+
+    def test_missing_criterion_counts_as_zero(self):
+        assert _filled([{"a": 1.0}, {"a": 0.0, "b": 1.0}]).means() == {"a": 0.5, "b": 0.5}
+
+    def test_empty_matrix_means_are_zero(self):
+        matrix = _filled([])
+        assert len(matrix) == 0
+        assert matrix.means() == {"a": 0.0, "b": 0.0}
+
+    def test_columns_keep_insertion_order(self):
+        matrix = _filled([{"a": float(i), "b": 0.0} for i in range(100)])
+        assert len(matrix) == 100
+        assert list(matrix.column("a")) == [float(i) for i in range(100)]
+
+
+class TestStatistics:
+    @pytest.fixture(autouse=True)
+    def _numpy(self):
+        pytest.importorskip("numpy")
+
+    def test_variance_and_composite(self):
+        rows = [{"a": 1.0, "b": 0.0}, {"a": 0.0, "b": 0.0}, {"a": 1.0, "b": 1.0}]
+        stats = _filled(rows).statistics([0.5, 0.5], bootstrap_resamples=0)
+        assert stats.sample_size == 3
+        assert stats.criteria["a"].variance == pytest.approx(
+            statistics.variance([1.0, 0.0, 1.0])
+        )
+        assert stats.composite.mean == pytest.approx(0.5)
+        assert stats.composite.variance == pytest.approx(
+            statistics.variance([0.5, 0.0, 1.0])
+        )
+        assert stats.criteria["a"].ci_low is None
+
+    def test_bootstrap_interval_brackets_mean_and_is_seeded(self):
+        rng = random.Random(3)
+        matrix = _filled([{"a": rng.random(), "b": rng.random()} for _ in range(400)])
+        first = matrix.statistics([0.7, 0.3], bootstrap_resamples=300, seed=11)
+        again = matrix.statistics([0.7, 0.3], bootstrap_resamples=300, seed=11)
+        assert first == again
+        for cid in ("a", "b"):
+            crit = first.criteria[cid]
+            assert crit.ci_low < crit.mean < crit.ci_high
+            # Roughly mean ± 1.96 standard errors
+            half_width = 1.96 * math.sqrt(crit.variance / 400)
+            assert crit.ci_high - crit.ci_low == pytest.approx(2 * half_width, rel=0.25)
+        assert first.composite.ci_low < first.composite.mean < first.composite.ci_high
+
+    def test_constant_scores_have_degenerate_interval(self):
+        matrix = _filled([{"a": 0.8, "b": 0.2}] * 20)
+        stats = matrix.statistics([1.0, 0.0], bootstrap_resamples=50)
+        assert stats.criteria["a"].variance == pytest.approx(0.0)
+        assert stats.criteria["a"].ci_low == pytest.approx(0.8)
+        assert stats.criteria["a"].ci_high == pytest.approx(0.8)
+
+    def test_latency_percentiles(self):
+        matrix = _filled([])
+        for ms in range(1, 101):
+            matrix.add_latency(ms)
+        latency = matrix.statistics([0.5, 0.5]).latency_ms
+        assert latency.p50 == pytest.approx(50.5)
+        assert latency.p99 == pytest.approx(99.01)
+        assert latency.max == 100.0
+
+    def test_no_scored_episodes(self):
+        stats = _filled([]).statistics([0.5, 0.5])
+        assert stats.sample_size == 0
+        assert stats.bootstrap_resamples == 0
+        assert stats.composite.mean == 0.0
+        assert stats.latency_ms is None
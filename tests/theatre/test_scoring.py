@@ -95,6 +95,16 @@ class TestTheatreScoringProvider:
         scorer = TheatreScoringProvider(criteria)
         assert scorer.compute_composite({}) == 0.0
 
+    def test_composite_weights_in_criteria_order(self):
+        scorer = TheatreScoringProvider(
+            _make_criteria(weights={"completeness": 0.3, "accuracy": 0.7})
+        )
+        assert scorer.composite_weights() == [0.7, 0.3]
+
+    def test_composite_weights_equal_fallback(self):
+        scorer = TheatreScoringProvider(_make_criteria(weights={}))
+        assert scorer.composite_weights() == [0.5, 0.5]
+
     @pytest.mark.asyncio
     async def test_scores_clamped_to_01(self):
         """Scores are clamped to [0.0, 1.0] range."""
@@ -111,6 +121,29 @@ class TestTheatreScoringProvider:
         scores = await scorer.score_episode(episode, response)
         assert all(v <= 1.0 for v in scores.values())
 
+    @pytest.mark.asyncio
+    async def test_batch_scorer_used_and_clamped(self):
+        """Scorers with score_many() are called once per episode, still clamped."""
+
+        class BatchScorer:
+            def __init__(self):
+                self.batch_calls = 0
+
+            async def score(self, criteria_id, ground_truth, oracle_output):
+                raise AssertionError("score() should not be called")
+
+            async def score_many(self, criteria_ids, ground_truth, oracle_output):
+                self.batch_calls += 1
+                return {"accuracy": 1.5, "unexpected": 0.3}
+
+        batch_scorer = BatchScorer()
+        criteria = _make_criteria()
+        scorer = TheatreScoringProvider(criteria, scorer=batch_scorer)
+
+        scores = await scorer.score_episode(_make_episode(), _make_response())
+        assert batch_scorer.batch_calls == 1
+        assert scores == {"accuracy": 1.0, "completeness": 0.0}
+
 
 class TestSimpleScoringFunction:
     @pytest.mark.asyncio
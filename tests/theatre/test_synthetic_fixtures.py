@@ -0,0 +1,115 @@
+"""Tests for the synthetic two-rail fixture generator and lifecycle benchmark."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+_ROOT = Path(__file__).resolve().parents[2]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from scripts.bench_theatre_lifecycle import STAGES, run_lifecycle_benchmark
+from theatre.engine.commitment import CommitmentProtocol
+from theatre.engine.ground_truth import iter_episodes_jsonl
+from theatre.engine.scoring import TheatreScoringProvider
+from theatre.fixtures.synthetic import (
+    GENERATORS,
+    generate_records,
+    load_template,
+    record_to_episode,
+    write_dataset_jsonl,
+)
+from theatre.scoring import EscrowScorer, ReconciliationScorer, WaterfallScorer
+
+SCORERS = {
+    "distribution_waterfall_v1": WaterfallScorer,
+    "escrow_milestone_release_v1": EscrowScorer,
+    "ledger_reconciliation_v1": ReconciliationScorer,
+}
+
+
+# ---- Generator ----
+
+
+@pytest.mark.parametrize("theatre_key", sorted(GENERATORS))
+def test_generated_records_pass_every_check(theatre_key):
+    scorer = SCORERS[theatre_key]()
+    criteria_ids = load_template(theatre_key)["criteria"]["criteria_ids"]
+    for record in generate_records(theatre_key, 500, seed=3):
+        episode = record_to_episode(record)
+        gt = TheatreScoringProvider.ground_truth_inputs(episode)
+        for cid in criteria_ids:
+            assert scorer.score_sync(cid, gt, episode.input_data) == 1.0, (
+                f"{record['record_id']} failed {cid}"
+            )
+
+
+@pytest.mark.parametrize("theatre_key", sorted(GENERATORS))
+def test_same_seed_same_dataset_hash(theatre_key, tmp_path):
+    first = write_dataset_jsonl(theatre_key, 200, tmp_path / "a.jsonl", seed=7)
+    second = write_dataset_jsonl(theatre_key, 200, tmp_path / "b.jsonl", seed=7)
+    other = write_dataset_jsonl(theatre_key, 200, tmp_path / "c.jsonl", seed=8)
+    assert first == second
+    assert first != other
+    assert (tmp_path / "a.jsonl").read_bytes() == (tmp_path / "b.jsonl").read_bytes()
+
+
+def test_written_hash_matches_commitment(tmp_path):
+    path = tmp_path / "waterfall.jsonl"
+    dataset_hash = write_dataset_jsonl("distribution_waterfall_v1", 300, path)
+    assert dataset_hash == CommitmentProtocol.compute_dataset_hash(iter_episodes_jsonl(path))
+
+
+def test_records_vary():
+    grosses = {
+        record["inputs"]["payment"]["gross_amount"]
+        for record in generate_records("distribution_waterfall_v1", 100)
+    }
+    assert len(grosses) > 90
+
+
+def test_unknown_theatre():
+    with pytest.raises(ValueError, match="Unknown theatre"):
+        next(generate_records("nope", 1))
+
+
+# ---- Lifecycle harness ----
+
+
+@pytest.mark.parametrize("theatre_key", sorted(GENERATORS))
+@pytest.mark.asyncio
+async def test_lifecycle_benchmark_smoke(theatre_key, tmp_path):
+    report = await run_lifecycle_benchmark(theatre_key, 200, tmp_path, max_concurrency=8)
+
+    assert report.composite_score == pytest.approx(1.0)
+    assert set(report.stages) == set(STAGES)
+    assert report.episodes_per_second > 0
+    assert report.peak_rss_mb > 0
+    assert report.stages["replay"].peak_traced_mb is None
+
+
+@pytest.mark.asyncio
+async def test_lifecycle_benchmark_traces_memory(tmp_path):
+    report = await run_lifecycle_benchmark(
+        "ledger_reconciliation_v1", 50, tmp_path, trace_memory=True
+    )
+    assert all(stage.peak_traced_mb > 0 for stage in report.stages.values())
+
+
+# ---- Benchmarks (`bench` fixture in conftest.py) ----
+
+
+@pytest.mark.parametrize("theatre_key", sorted(GENERATORS))
+def test_bench_lifecycle_10k(bench, theatre_key, tmp_path):
+    def run():
+        return asyncio.run(run_lifecycle_benchmark(theatre_key, 10_000, tmp_path))
+
+    report = bench.pedantic(run, rounds=1, iterations=1)
+    bench.extra_info["episodes_per_second"] = round(report.episodes_per_second)
+    bench.extra_info["peak_rss_mb"] = round(report.peak_rss_mb)
+    for name, stage in report.stages.items():
+        bench.extra_info[f"{name}_seconds"] = round(stage.seconds, 3)
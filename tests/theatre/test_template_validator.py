@@ -218,3 +218,23 @@ class TestRuntimeRule7DatasetHashPresence:
         template["product_theatre_config"]["replay_dataset_id"] = "missing_dataset"
         errors = validator.validate(template, is_certificate_run=False)
         assert any("rule 7" in e for e in errors)
+
+
+class TestRuntimeRule8StepDependencies:
+    def test_dependency_on_earlier_step_valid(self, validator):
+        template = _make_valid_product_template()
+        first = template["resolution_programme"][0]["step_id"]
+        template["resolution_programme"].append(
+            {"step_id": "after", "type": "deterministic_computation", "depends_on": [first]}
+        )
+        errors = validator.validate(template, is_certificate_run=False)
+        assert not any("rule 8" in e for e in errors)
+
+    def test_dependency_on_later_or_unknown_step(self, validator):
+        template = _make_valid_product_template()
+        template["resolution_programme"].insert(
+            0, {"step_id": "before", "type": "deterministic_computation",
+                "depends_on": [template["resolution_programme"][0]["step_id"], "ghost"]},
+        )
+        errors = validator.validate(template, is_certificate_run=False)
+        assert sum("rule 8" in e for e in errors) == 2
@@ -0,0 +1,248 @@
+"""Tests for TournamentRunner — one dataset pass against several constructs."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from theatre.engine.commitment import CommitmentProtocol
+from theatre.engine.ground_truth import GroundTruthSource
+from theatre.engine.models import GroundTruthEpisode, TheatreCriteria
+from theatre.engine.oracle_contract import MockOracleAdapter
+from theatre.engine.replay import DatasetHashMismatchError, ReplayEngine
+from theatre.engine.scoring import TheatreScoringProvider
+from theatre.engine.tournament import TournamentRunner, entrant_key
+
+
+def _make_criteria() -> TheatreCriteria:
+    return TheatreCriteria(
+        criteria_ids=["accuracy"],
+        criteria_human="Test accuracy",
+        weights={"accuracy": 1.0},
+    )
+
+
+def _make_episodes(count: int = 12) -> list[GroundTruthEpisode]:
+    return [
+        GroundTruthEpisode(
+            episode_id=f"ep_{i:03d}",
+            input_data={"question": f"q{i}"},
+            expected_output={"answer": f"a{i}"},
+        )
+        for i in range(count)
+    ]
+
+
+class _AccuracyAdapter:
+    """Answers correctly unless index % modulus == 0."""
+
+    def __init__(self, modulus: int, latency_seconds: float = 0.0):
+        self._modulus = modulus
+        self._latency_seconds = latency_seconds
+        self.calls = 0
+
+    async def invoke(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        self.calls += 1
+        await asyncio.sleep(self._latency_seconds)
+        index = int(input_data["question"][1:])
+        return {"answer": "wrong" if index % self._modulus == 0 else f"a{index}"}
+
+
+def _make_engine(
+    episodes: list[GroundTruthEpisode],
+    adapter: Any,
+    version: str,
+    dataset_hash: str | None = None,
+    criteria: TheatreCriteria | None = None,
+) -> ReplayEngine:
+    crit = criteria or _make_criteria()
+    return ReplayEngine(
+        theatre_id="test-theatre",
+        construct_id="observer",
+        construct_version=version,
+        criteria=crit,
+        oracle_adapter=adapter,
+        scoring_provider=TheatreScoringProvider(crit),
+        committed_dataset_hash=dataset_hash or CommitmentProtocol.compute_dataset_hash(episodes),
+    )
+
+
+class _SinglePassSource:
+    def __init__(self, episodes: list[GroundTruthEpisode]):
+        self._episodes = episodes
+        self.iterations = 0
+
+    @property
+    def total(self) -> int | None:
+        return None
+
+    @property
+    def replayable(self) -> bool:
+        return False
+
+    async def __aiter__(self):
+        self.iterations += 1
+        for ep in self._episodes:
+            yield ep
+
+
+class TestTournament:
+    @pytest.mark.asyncio
+    async def test_results_match_solo_runs(self):
+        episodes = _make_episodes()
+        moduli = {"v1": 2, "v2": 3, "v3": 4}
+
+        solo = {
+            version: await _make_engine(episodes, _AccuracyAdapter(m), version).run(episodes)
+            for version, m in moduli.items()
+        }
+        tournament = await TournamentRunner(
+            [_make_engine(episodes, _AccuracyAdapter(m), v) for v, m in moduli.items()],
+            max_concurrency=4,
+        ).run(episodes)
+
+        exclude = {
+            "episode_results": {"__all__": {"latency_ms"}},
+            "statistics": {"latency_ms"},
+        }
+        for version, result in solo.items():
+            assert tournament.results[entrant_key("observer", version)].model_dump(
+                exclude=exclude
+            ) == result.model_dump(exclude=exclude)
+
+    @pytest.mark.asyncio
+    async def test_leaderboard_ranks_by_composite(self):
+        episodes = _make_episodes()
+        engines = [
+            _make_engine(episodes, _AccuracyAdapter(2), "worst"),
+            _make_engine(episodes, _AccuracyAdapter(6), "best"),
+            _make_engine(episodes, _AccuracyAdapter(3), "middle"),
+        ]
+        result = await TournamentRunner(engines).run(episodes)
+
+        assert [s.construct_version for s in result.leaderboard] == ["best", "middle", "worst"]
+        assert [s.rank for s in result.leaderboard] == [1, 2, 3]
+        scores = [s.composite_score for s in result.leaderboard]
+        assert scores == sorted(scores, reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_tied_entrants_share_rank(self):
+        episodes = _make_episodes()
+        engines = [
+            _make_engine(episodes, _AccuracyAdapter(2), "a"),
+            _make_engine(episodes, _AccuracyAdapter(2), "b"),
+            _make_engine(episodes, _AccuracyAdapter(1), "c"),
+        ]
+        result = await TournamentRunner(engines).run(episodes)
+        assert [(s.construct_version, s.rank) for s in result.leaderboard] == [
+            ("a", 1), ("b", 1), ("c", 3),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_single_pass_source_iterated_once(self):
+        episodes = _make_episodes()
+        adapters = [_AccuracyAdapter(2), _AccuracyAdapter(3)]
+        source = _SinglePassSource(episodes)
+        assert isinstance(source, GroundTruthSource)
+
+        progress: list[tuple[int, int | None]] = []
+        result = await TournamentRunner(
+            [_make_engine(episodes, a, f"v{i}") for i, a in enumerate(adapters)],
+            max_concurrency=3,
+        ).run(source, progress_callback=lambda c, t: progress.append((c, t)))
+
+        assert source.iterations == 1
+        assert all(a.calls == len(episodes) for a in adapters)
+        assert progress[-1] == (len(episodes), None)
+        assert result.dataset_hash == CommitmentProtocol.compute_dataset_hash(episodes)
+
+    @pytest.mark.asyncio
+    async def test_entrants_run_concurrently(self):
+        episodes = _make_episodes(4)
+        engines = [
+            _make_engine(episodes, _AccuracyAdapter(2, latency_seconds=0.05), f"v{i}")
+            for i in range(5)
+        ]
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await TournamentRunner(engines, max_concurrency=20).run(episodes)
+        # 20 invocations of 50ms each; sequentially this would take ~1s
+        assert loop.time() - start < 0.5
+
+    @pytest.mark.asyncio
+    async def test_hash_mismatch_rejected_before_invocation(self):
+        episodes = _make_episodes()
+        adapter = _AccuracyAdapter(2)
+        runner = TournamentRunner(
+            [_make_engine(episodes, adapter, "v1", dataset_hash="0" * 64)]
+        )
+        with pytest.raises(DatasetHashMismatchError):
+            await runner.run(episodes)
+        assert adapter.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_source_failure_settles_inflight_invocations(self):
+        """Invocations in flight when the source fails are cancelled and awaited."""
+        episodes = _make_episodes(2)
+
+        class _FailingSource(_SinglePassSource):
+            async def __aiter__(self):
+                for ep in self._episodes:
+                    yield ep
+                    await asyncio.sleep(0)  # Let the invocation start
+                raise OSError("dataset read failed")
+
+        runner = TournamentRunner([
+            _make_engine(episodes, _AccuracyAdapter(2, latency_seconds=60), f"v{i}")
+            for i in range(2)
+        ], max_concurrency=8)
+        with pytest.raises(OSError, match="dataset read failed"):
+            await runner.run(_FailingSource(episodes))
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    @pytest.mark.asyncio
+    async def test_per_entrant_metrics(self):
+        episodes = _make_episodes(3)
+        runner = TournamentRunner([
+            _make_engine(episodes, MockOracleAdapter(), "v1"),
+            _make_engine(episodes, MockOracleAdapter(refuse_episodes={"ep_001"}), "v2"),
+        ])
+        result = await runner.run(episodes)
+
+        assert result.results[entrant_key("observer", "v2")].refused_count == 1
+        metrics = runner.last_metrics
+        assert metrics[entrant_key("observer", "v1")].invocations.attempts == 3
+        assert metrics[entrant_key("observer", "v2")].invocations.refusals == 1
+
+
+class TestTournamentValidation:
+    def test_requires_engines(self):
+        with pytest.raises(ValueError):
+            TournamentRunner([])
+
+    def test_rejects_duplicate_entrants(self):
+        episodes = _make_episodes()
+        with pytest.raises(ValueError, match="Duplicate"):
+            TournamentRunner([
+                _make_engine(episodes, _AccuracyAdapter(2), "v1"),
+                _make_engine(episodes, _AccuracyAdapter(3), "v1"),
+            ])
+
+    def test_rejects_mismatched_commitment(self):
+        episodes = _make_episodes()
+        with pytest.raises(ValueError, match="does not share"):
+            TournamentRunner([
+                _make_engine(episodes, _AccuracyAdapter(2), "v1"),
+                _make_engine(episodes, _AccuracyAdapter(2), "v2", dataset_hash="f" * 64),
+            ])
+
+    def test_rejects_mismatched_criteria(self):
+        episodes = _make_episodes()
+        other = TheatreCriteria(
+            criteria_ids=["precision"], criteria_human="Other", weights={"precision": 1.0}
+        )
+        with pytest.raises(ValueError, match="does not share"):
+            TournamentRunner([
+                _make_engine(episodes, _AccuracyAdapter(2), "v1"),
+                _make_engine(episodes, _AccuracyAdapter(2), "v2", criteria=other),
+            ])
@@ -7,8 +7,10 @@ Verifies schema validity, score correctness, and deterministic hashing.
 from __future__ import annotations
 
 import json
+import math
 import shutil
 import tempfile
+from datetime import datetime
 from pathlib import Path
 
 import jsonschema
@@ -23,11 +25,15 @@ if str(_ROOT) not in sys.path:
 
 from scripts.run_two_rail_theatres import (
     THEATRES,
+    certificate_to_schema_dict,
     convert_records_to_episodes,
     run_all_theatres,
     run_single_theatre,
 )
 
+from theatre.engine.certificate import TheatreCalibrationCertificate
+from theatre.engine.models import TheatreCriteria
+
 CERT_SCHEMA_PATH = _ROOT / "docs" / "schemas" / "echelon_certificate_schema.json"
 
 
@@ -195,3 +201,50 @@ def test_convert_records_to_episodes():
     assert ep.input_data == {"key": "value"}
     assert ep.expected_output == {"result": True}
     assert ep.metadata["asset_id"] == "asset_x"
+
+
+# ---- Certificate serialisation ----
+
+
+def _certificate(composite_score: float) -> TheatreCalibrationCertificate:
+    now = datetime(2026, 1, 1)
+    cert = TheatreCalibrationCertificate(
+        certificate_id="cert-1",
+        theatre_id="theatre-1",
+        template_id="template-1",
+        construct_id="construct-1",
+        criteria=TheatreCriteria(
+            criteria_ids=["a", "b"],
+            criteria_human="Two criteria",
+            weights={"a": 0.5, "b": 0.5},
+        ),
+        scores={"a": 1.0, "b": 1.0},
+        composite_score=1.0,
+        replay_count=1,
+        evidence_bundle_hash="b" * 64,
+        ground_truth_hash="c" * 64,
+        construct_version="abc1234",
+        scorer_version="deterministic",
+        methodology_version="1.0.0",
+        dataset_hash="d" * 64,
+        verification_tier="UNVERIFIED",
+        commitment_hash="e" * 64,
+        issued_at=now,
+        theatre_committed_at=now,
+        theatre_resolved_at=now,
+        ground_truth_source="FIXTURE",
+        execution_path="replay",
+    )
+    # model_copy skips validation, so any composite reaches the conversion
+    return cert.model_copy(update={"composite_score": composite_score})
+
+
+def test_composite_rounding_overshoot_is_absorbed():
+    data = certificate_to_schema_dict(_certificate(math.nextafter(1.0, 2.0)))
+    assert data["composite_score"] == 1.0
+
+
+@pytest.mark.parametrize("composite_score", [1.001, -0.1])
+def test_out_of_range_composite_raises(composite_score):
+    with pytest.raises(ValueError, match="outside"):
+        certificate_to_schema_dict(_certificate(composite_score))
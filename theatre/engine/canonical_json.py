@@ -1,14 +1,28 @@
 """Canonical JSON utility — RFC 8785 compliant deterministic serialisation.
 
 All commitment hash computations MUST use canonical_json(). Never raw json.dumps().
+
+The encoder is single-pass: values are normalised and written to an output
+buffer in the same traversal, with no intermediate copy of the payload.
 """
 
 from __future__ import annotations
 
 import json
 import math
+from collections.abc import Callable
+from json.encoder import encode_basestring as _encode_str
 from typing import Any
 
+# Whole floats below this magnitude are written as integers
+_MAX_SAFE_WHOLE_FLOAT = 2**53
+
+_LITERALS = {None: "null", True: "true", False: "false"}
+
+_float_repr = float.__repr__
+_int_repr = int.__repr__
+_is_integer = float.is_integer
+
 
 def canonical_json(obj: Any) -> str:
     """Produce RFC 8785-compliant canonical JSON.
@@ -21,42 +35,110 @@ def canonical_json(obj: Any) -> str:
     - Arrays preserve insertion order
     - NaN and Infinity prohibited
     """
-    normalised = _normalise_value(obj)
-    return json.dumps(
-        normalised,
-        sort_keys=True,
-        separators=(",", ":"),
-        ensure_ascii=False,
-        allow_nan=False,
-    )
-
-
-def _normalise_value(v: Any) -> Any:
-    """Recursively normalise values for canonical representation."""
-    if v is None:
-        return None
-    if isinstance(v, bool):
-        # Must check bool before int — bool is a subclass of int in Python
-        return v
-    if isinstance(v, dict):
-        return {k: _normalise_value(val) for k, val in v.items()}
-    if isinstance(v, (list, tuple)):
-        return [_normalise_value(item) for item in v]
-    if isinstance(v, float):
-        return _normalise_float(v)
-    if isinstance(v, int):
-        return v
-    if isinstance(v, str):
-        return v
-    # Fallback: attempt to convert via standard JSON serialisation
-    raise TypeError(f"canonical_json: unsupported type {type(v).__name__}: {v!r}")
-
-
-def _normalise_float(f: float) -> float | int:
-    """Normalise floats: 1.0 → 1, 0.10 → 0.1. Disallow NaN/Inf."""
-    if math.isnan(f) or math.isinf(f):
+    buffer: list[str] = []
+    _encode(obj, buffer.append)
+    return "".join(buffer)
+
+
+def _encode(v: Any, write: Callable[[str], Any]) -> None:
+    """Normalise and write v in a single traversal.
+
+    Exact built-in types take the fast paths; subclasses (OrderedDict,
+    IntEnum, ...) fall through to the isinstance chain at the end.
+    """
+    t = type(v)
+    if t is dict:
+        if not v:
+            write("{}")
+            return
+        sep = "{"
+        for key in sorted(v):
+            item = v[key]
+            ti = type(item)
+            encoded_key = _encode_str(key) if type(key) is str else _encode_key(key)
+            # Scalars are inlined to avoid a recursive call per leaf
+            if ti is str:
+                write(f"{sep}{encoded_key}:{_encode_str(item)}")
+            elif ti is int:
+                write(f"{sep}{encoded_key}:{_int_repr(item)}")
+            elif ti is float:
+                write(f"{sep}{encoded_key}:{_encode_float(item)}")
+            elif ti is bool or item is None:
+                write(f"{sep}{encoded_key}:{_LITERALS[item]}")
+            else:
+                write(f"{sep}{encoded_key}:")
+                _encode(item, write)
+            sep = ","
+        write("}")
+    elif t is list or t is tuple:
+        if not v:
+            write("[]")
+            return
+        # Homogeneous scalar arrays are encoded in one C-level join
+        item_types = set(map(type, v))
+        if len(item_types) == 1:
+            item_type = next(iter(item_types))
+            if item_type is str:
+                write("[" + ",".join(map(_encode_str, v)) + "]")
+                return
+            if item_type is int:
+                write("[" + ",".join(map(_int_repr, v)) + "]")
+                return
+            if item_type is float:
+                if any(map(_is_integer, v)) or not all(map(math.isfinite, v)):
+                    write("[" + ",".join(map(_encode_float, v)) + "]")
+                else:
+                    write("[" + ",".join(map(_float_repr, v)) + "]")
+                return
+        sep = "["
+        for item in v:
+            write(sep)
+            _encode(item, write)
+            sep = ","
+        write("]")
+    elif t is str:
+        write(_encode_str(v))
+    elif t is int:
+        write(_int_repr(v))
+    elif t is float:
+        write(_encode_float(v))
+    elif v is None:
+        write("null")
+    elif v is True:
+        write("true")
+    elif v is False:
+        write("false")
+    elif isinstance(v, dict):
+        _encode(dict(v), write)
+    elif isinstance(v, (list, tuple)):
+        _encode(list(v), write)
+    elif isinstance(v, float):
+        write(_encode_float(float(v)))
+    elif isinstance(v, int):
+        write(_int_repr(v))
+    elif isinstance(v, str):
+        write(_encode_str(v))
+    else:
+        raise TypeError(f"canonical_json: unsupported type {type(v).__name__}: {v!r}")
+
+
+def _encode_float(f: float) -> str:
+    """Encode a float: 1.0 → 1, 0.10 → 0.1. Disallow NaN/Inf."""
+    if _is_integer(f):
+        if -_MAX_SAFE_WHOLE_FLOAT < f < _MAX_SAFE_WHOLE_FLOAT:
+            return _int_repr(int(f))
+    elif f != f or f in (math.inf, -math.inf):
         raise ValueError(f"canonical_json: NaN/Infinity not permitted: {f}")
-    # Convert whole-number floats to int: 1.0 → 1, -3.0 → -3
-    if f == int(f) and abs(f) < 2**53:
-        return int(f)
-    return f
+    return _float_repr(f)
+
+
+def _encode_key(key: Any) -> str:
+    """Encode a dict key, coercing non-string keys the way json.dumps does."""
+    if type(key) is str:
+        return _encode_str(key)
+    if isinstance(key, str):
+        return _encode_str(str(key))
+    if key is None or isinstance(key, (bool, int, float)):
+        return '"' + json.dumps(key, allow_nan=False) + '"'
+    raise TypeError(f"canonical_json: unsupported key type {type(key).__name__}: {key!r}")
+
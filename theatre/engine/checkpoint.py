@@ -0,0 +1,125 @@
+"""Replay Checkpoint — incremental persistence of completed episode results.
+
+A checkpoint is a JSONL file. The first line is a header binding it to one
+replay (theatre, construct version, committed dataset hash, criteria); each
+following line records one completed episode by dataset index. Records are
+hash-chained: every line carries SHA-256(previous chain || canonical JSON of
+the record), so a resumed replay re-verifies every persisted result before
+reusing it. A torn final line from a crash mid-write is discarded.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from theatre.engine.canonical_json import canonical_json
+
+CHECKPOINT_FORMAT = "echelon-replay-checkpoint/1"
+_GENESIS = "0" * 64
+
+
+class CheckpointMismatchError(Exception):
+    """Raised when a checkpoint belongs to a different replay or fails verification."""
+
+
+def _chain(prev: str, index: int, result: dict[str, Any]) -> str:
+    payload = canonical_json({"index": index, "result": result})
+    return hashlib.sha256((prev + payload).encode("utf-8")).hexdigest()
+
+
+class ReplayCheckpoint:
+    """Append-only store of completed episode results for one replay.
+
+    Args:
+        path: Checkpoint file; created on first open if missing.
+        fsync: fsync after every record (durable across power loss, slower).
+
+    Results are stored as plain dicts (EpisodeResult.model_dump()) keyed by
+    dataset index.
+    """
+
+    def __init__(self, path: Path, fsync: bool = False):
+        self._path = Path(path)
+        self._fsync = fsync
+        self._handle: BinaryIO | None = None
+        self._chain = _GENESIS
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def open(self, binding: dict[str, Any]) -> dict[int, dict[str, Any]]:
+        """Load and verify existing records, then open for appending.
+
+        Returns index -> result dict for every verified completed episode.
+
+        Raises:
+            CheckpointMismatchError: If the header binding differs from
+                ``binding``, a complete line is not a valid record, or a
+                record fails its chain hash.
+        """
+        header = {"format": CHECKPOINT_FORMAT, **binding}
+        completed: dict[int, dict[str, Any]] = {}
+        good_bytes = 0
+
+        if self._path.exists():
+            with self._path.open("rb") as f:
+                raw = f.read()
+            lines = raw.split(b"\n")
+            # Anything after the final newline is a torn write
+            for i, line in enumerate(lines[:-1]):
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise CheckpointMismatchError(
+                        f"Checkpoint {self._path} has a corrupt record at line {i + 1}"
+                    ) from e
+                if i == 0:
+                    if record != json.loads(json.dumps(header)):
+                        raise CheckpointMismatchError(
+                            f"Checkpoint {self._path} was written for a different "
+                            f"replay: {record}"
+                        )
+                else:
+                    if not (isinstance(record, dict) and {"index", "result"} <= record.keys()):
+                        raise CheckpointMismatchError(
+                            f"Checkpoint {self._path} has a malformed record at line {i + 1}"
+                        )
+                    expected = _chain(self._chain, record["index"], record["result"])
+                    if record.get("chain") != expected:
+                        raise CheckpointMismatchError(
+                            f"Checkpoint {self._path} failed verification at "
+                            f"record {i} (index {record.get('index')})"
+                        )
+                    self._chain = expected
+                    completed[record["index"]] = record["result"]
+                good_bytes += len(line) + 1
+
+        self._handle = self._path.open("r+b" if self._path.exists() else "wb")
+        self._handle.truncate(good_bytes)
+        self._handle.seek(good_bytes)
+        if good_bytes == 0:
+            self._write_line(header)
+        return completed
+
+    def append(self, index: int, result: dict[str, Any]) -> None:
+        """Persist one completed episode result."""
+        if self._handle is None:
+            raise RuntimeError("Checkpoint is not open")
+        self._chain = _chain(self._chain, index, result)
+        self._write_line({"chain": self._chain, "index": index, "result": result})
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def _write_line(self, record: dict[str, Any]) -> None:
+        self._handle.write((json.dumps(record, sort_keys=True) + "\n").encode("utf-8"))
+        self._handle.flush()
+        if self._fsync:
+            os.fsync(self._handle.fileno())
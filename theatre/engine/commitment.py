@@ -2,16 +2,21 @@
 
 The commitment hash is SHA-256 over canonical JSON of a composite object
 with exactly three keys: dataset_hashes, template, version_pins.
+
+Dataset hashes are SHA-256 over canonical JSON of the episode array, computed
+incrementally so datasets can be verified while streaming.
 """
 
 from __future__ import annotations
 
 import hashlib
+from collections.abc import Iterable
 from datetime import datetime
 
 from pydantic import BaseModel
 
 from theatre.engine.canonical_json import canonical_json
+from theatre.engine.models import GroundTruthEpisode
 
 
 class CommitmentReceipt(BaseModel):
@@ -25,6 +30,34 @@ class CommitmentReceipt(BaseModel):
     dataset_hashes: dict
 
 
+class DatasetHasher:
+    """Incremental dataset hash — feed episodes one at a time.
+
+    hexdigest() equals CommitmentProtocol.compute_dataset_hash() over the same
+    episodes in the same order. Used when a dataset can only be read once.
+    """
+
+    def __init__(self) -> None:
+        self._hasher = hashlib.sha256()
+        self._count = 0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def update(self, episode: GroundTruthEpisode) -> None:
+        prefix = "," if self._count else "["
+        self._hasher.update(
+            (prefix + canonical_json(episode.model_dump())).encode("utf-8")
+        )
+        self._count += 1
+
+    def hexdigest(self) -> str:
+        final = self._hasher.copy()
+        final.update(b"]" if self._count else b"[]")
+        return final.hexdigest()
+
+
 class CommitmentProtocol:
     """Generates and verifies commitment hashes."""
 
@@ -60,6 +93,34 @@ class CommitmentProtocol:
         )
         return recomputed == commitment_hash
 
+    @staticmethod
+    def compute_dataset_hash(episodes: Iterable[GroundTruthEpisode]) -> str:
+        """SHA-256 over canonical JSON of the episode array.
+
+        Episodes are consumed one at a time, so a generator (e.g. a JSONL
+        reader) is hashed without holding the dataset in memory. The digest
+        equals hashing canonical_json([ep.model_dump() for ep in episodes]).
+        """
+        hasher = DatasetHasher()
+        for ep in episodes:
+            hasher.update(ep)
+        return hasher.hexdigest()
+
+    @staticmethod
+    def verify_dataset_hash(
+        dataset_hashes: dict,
+        dataset_id: str,
+        episodes: Iterable[GroundTruthEpisode],
+    ) -> bool:
+        """Recompute a dataset hash and compare with the committed entry.
+
+        Returns False if dataset_id has no committed hash.
+        """
+        committed = dataset_hashes.get(dataset_id)
+        if committed is None:
+            return False
+        return CommitmentProtocol.compute_dataset_hash(episodes) == committed
+
     @staticmethod
     def create_receipt(
         theatre_id: str,
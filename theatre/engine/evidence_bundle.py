@@ -3,22 +3,124 @@
 The evidence bundle contains all artefacts needed to independently reproduce
 and verify a Theatre's certificate: template, commitment, ground truth,
 invocations, scores, and audit trail.
+
+Every file written through the builder is hashed as its bytes are written.
+Append-only files (per-episode scores, audit trail) are streamed through
+handles kept open for the builder's lifetime, so compute_file_inventory()
+only re-reads files that were written or modified outside the builder.
+
+Invocations are stored either as one JSON file per episode ("files", the
+default) or packed into a single JSONL file with an offset index ("packed",
+see theatre.engine.invocation_store).
 """
 
 from __future__ import annotations
 
 import hashlib
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Iterable, Literal
 
 from theatre.engine.canonical_json import canonical_json
 from theatre.engine.commitment import CommitmentReceipt
+from theatre.engine.invocation_store import (
+    INDEX_FILENAME,
+    PACK_FILENAME,
+    PackedIndexEntry,
+    PackedInvocationReader,
+    encode_invocation,
+    index_to_json,
+)
 from theatre.engine.models import AuditEvent, BundleManifest
 
+FsyncPolicy = Literal["never", "close", "always"]
+InvocationLayout = Literal["files", "packed"]
+
+_HASH_CHUNK_BYTES = 1 << 20
+
+# Score error bars come from an optional NumPy bootstrap, so they vary by
+# machine and are kept out of the inventory (and the bundle hash)
+SCORE_STATISTICS_FILE = "scores/statistics.json"
+
+
+def _stamped(path: Path, hexdigest: str) -> tuple[int, int, str]:
+    """(size, mtime_ns, digest) for a file whose digest was taken as it was written."""
+    stat = path.stat()
+    return stat.st_size, stat.st_mtime_ns, hexdigest
+
+
+class _HashingAppendStream:
+    """Open append handle that hashes bytes as they are written.
+
+    Lines are buffered in memory and written in batches of ``flush_every``.
+    If the file already has content, the running hash is seeded from it
+    once so the digest always covers the whole file.
+    """
+
+    def __init__(self, path: Path, flush_every: int, fsync: FsyncPolicy):
+        self._hasher = hashlib.sha256()
+        self._size = 0
+        if path.exists():
+            with path.open("rb") as f:
+                while chunk := f.read(_HASH_CHUNK_BYTES):
+                    self._hasher.update(chunk)
+                    self._size += len(chunk)
+        self._handle: BinaryIO = path.open("ab")
+        self._pending: list[bytes] = []
+        self._flush_every = flush_every
+        self._fsync = fsync
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def write_line(self, line: str) -> None:
+        self.write_bytes((line + "\n").encode("utf-8"))
+
+    def write_bytes(self, data: bytes) -> None:
+        self._hasher.update(data)
+        self._size += len(data)
+        self._pending.append(data)
+        if len(self._pending) >= self._flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending:
+            self._handle.write(b"".join(self._pending))
+            self._pending.clear()
+        self._handle.flush()
+        if self._fsync == "always":
+            os.fsync(self._handle.fileno())
+
+    def hexdigest(self) -> str:
+        return self._hasher.hexdigest()
+
+    def close(self) -> None:
+        self.flush()
+        if self._fsync == "close":
+            os.fsync(self._handle.fileno())
+        self._handle.close()
+
 
 class EvidenceBundleBuilder:
-    """Builds the auditable evidence bundle directory for a Theatre."""
+    """Builds the auditable evidence bundle directory for a Theatre.
+
+    Args:
+        theatre_id: Bundle directory suffix.
+        output_dir: Parent directory for the bundle.
+        flush_every: Append-only records buffered before each write.
+            1 (default) writes every record through immediately.
+        fsync: "never" (default), "close" to fsync append streams when the
+            builder is closed, or "always" to fsync on every flush.
+        max_workers: Thread pool size used by write_invocations().
+        invocation_layout: "files" (default) writes invocations/{episode_id}.json;
+            "packed" appends to invocations/invocations.jsonl and maintains
+            invocations/index.json.
+
+    Use as a context manager, or call close(), to release open handles.
+    """
 
     REQUIRED_FILES = [
         "manifest.json",
@@ -28,92 +130,242 @@ class EvidenceBundleBuilder:
         "certificate.json",
     ]
 
-    def __init__(self, theatre_id: str, output_dir: Path):
+    def __init__(
+        self,
+        theatre_id: str,
+        output_dir: Path,
+        *,
+        flush_every: int = 1,
+        fsync: FsyncPolicy = "never",
+        max_workers: int = 8,
+        invocation_layout: InvocationLayout = "files",
+    ):
+        if flush_every < 1:
+            raise ValueError(f"flush_every must be >= 1, got {flush_every}")
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
         self._theatre_id = theatre_id
         self._base_dir = output_dir / f"evidence_bundle_{theatre_id}"
         self._base_dir.mkdir(parents=True, exist_ok=True)
         (self._base_dir / "ground_truth").mkdir(exist_ok=True)
         (self._base_dir / "invocations").mkdir(exist_ok=True)
         (self._base_dir / "scores").mkdir(exist_ok=True)
+        self._flush_every = flush_every
+        self._fsync = fsync
+        self._max_workers = max_workers
+        # relative path -> (size, mtime_ns, sha256 hex) for whole files written here
+        self._digests: dict[str, tuple[int, int, str]] = {}
+        self._streams: dict[str, _HashingAppendStream] = {}
+        self._invocation_layout = invocation_layout
+        self._pack_index: dict[str, PackedIndexEntry] = {}
+        self._pack_index_dirty = False
+        index_path = self._base_dir / "invocations" / INDEX_FILENAME
+        if invocation_layout == "packed" and index_path.exists():
+            self._pack_index = PackedInvocationReader(index_path.parent).index()
+
+    def __enter__(self) -> EvidenceBundleBuilder:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     @property
     def base_dir(self) -> Path:
         return self._base_dir
 
+    def close(self) -> None:
+        """Flush and close all open append streams. Safe to call twice."""
+        self._write_pack_index()
+        streams, self._streams = self._streams, {}
+        for rel, stream in streams.items():
+            stream.close()
+            self._record_digest(rel, stream.hexdigest())
+
+    def flush(self) -> None:
+        """Write any buffered append-only records (and the pack index) to disk."""
+        for stream in self._streams.values():
+            stream.flush()
+        self._write_pack_index()
+
+    def _record_digest(self, rel: str, hexdigest: str) -> None:
+        """Remember the digest of a file just written, keyed to its size and mtime."""
+        self._digests[rel] = _stamped(self._base_dir / rel, hexdigest)
+
+    def _write_file(self, rel: str, text: str) -> None:
+        """Write a whole file, recording its digest from the written bytes."""
+        data = text.encode("utf-8")
+        (self._base_dir / rel).write_bytes(data)
+        self._record_digest(rel, hashlib.sha256(data).hexdigest())
+
+    def _stream(self, rel: str) -> _HashingAppendStream:
+        stream = self._streams.get(rel)
+        if stream is None:
+            self._digests.pop(rel, None)
+            stream = _HashingAppendStream(
+                self._base_dir / rel, self._flush_every, self._fsync
+            )
+            self._streams[rel] = stream
+        return stream
+
+    def _append_line(self, rel: str, line: str) -> None:
+        self._stream(rel).write_line(line)
+
+    def _append_packed_invocation(
+        self, episode_id: str, request: dict, response: dict
+    ) -> None:
+        data = encode_invocation(episode_id, request, response)
+        stream = self._stream(f"invocations/{PACK_FILENAME}")
+        self._pack_index[episode_id] = PackedIndexEntry(
+            offset=stream.size,
+            length=len(data),
+            sha256=hashlib.sha256(data).hexdigest(),
+        )
+        stream.write_bytes(data)
+        self._pack_index_dirty = True
+
+    def _write_pack_index(self) -> None:
+        if self._pack_index_dirty:
+            self._write_file(
+                f"invocations/{INDEX_FILENAME}", index_to_json(self._pack_index)
+            )
+            self._pack_index_dirty = False
+
     def write_manifest(self, manifest: BundleManifest) -> None:
         """Write the bundle manifest with sorted keys for determinism."""
-        path = self._base_dir / "manifest.json"
         data = json.loads(manifest.model_dump_json())
-        path.write_text(json.dumps(data, sort_keys=True, indent=2))
+        self._write_file("manifest.json", json.dumps(data, sort_keys=True, indent=2))
 
     def write_template(self, template: dict) -> None:
         """Write the committed template."""
-        path = self._base_dir / "template.json"
-        path.write_text(json.dumps(template, indent=2))
+        self._write_file("template.json", json.dumps(template, indent=2))
 
     def write_commitment_receipt(self, receipt: CommitmentReceipt) -> None:
         """Write the commitment receipt."""
-        path = self._base_dir / "commitment_receipt.json"
-        path.write_text(receipt.model_dump_json(indent=2))
+        self._write_file("commitment_receipt.json", receipt.model_dump_json(indent=2))
 
-    def write_ground_truth(self, dataset: list[dict], filename: str) -> None:
+    def write_ground_truth(self, dataset: Iterable[dict], filename: str) -> None:
         """Write ground truth dataset as JSONL."""
-        path = self._base_dir / "ground_truth" / filename
-        with path.open("w") as f:
-            for record in dataset:
-                f.write(json.dumps(record, sort_keys=True) + "\n")
+        self._write_jsonl(f"ground_truth/{filename}", dataset)
 
     def write_invocation(
         self, episode_id: str, request: dict, response: dict
     ) -> None:
         """Write a single episode invocation."""
-        path = self._base_dir / "invocations" / f"{episode_id}.json"
+        if self._invocation_layout == "packed":
+            self._append_packed_invocation(episode_id, request, response)
+            return
         data = {"request": request, "response": response}
-        path.write_text(json.dumps(data, indent=2))
+        self._write_file(f"invocations/{episode_id}.json", json.dumps(data, indent=2))
+
+    def write_invocations(
+        self, invocations: Iterable[tuple[str, dict, dict]]
+    ) -> None:
+        """Write many (episode_id, request, response) invocations in parallel.
+
+        Serialisation stays on the calling thread; file writes and hashing
+        (both release the GIL) are spread over a thread pool. The packed
+        layout appends sequentially instead.
+        """
+        if self._invocation_layout == "packed":
+            for episode_id, request, response in invocations:
+                self._append_packed_invocation(episode_id, request, response)
+            return
+        payloads = [
+            (
+                f"invocations/{episode_id}.json",
+                json.dumps({"request": request, "response": response}, indent=2),
+            )
+            for episode_id, request, response in invocations
+        ]
+        if not payloads:
+            return
+
+        def _write(item: tuple[str, str]) -> tuple[str, tuple[int, int, str]]:
+            rel, text = item
+            data = text.encode("utf-8")
+            path = self._base_dir / rel
+            path.write_bytes(data)
+            return rel, _stamped(path, hashlib.sha256(data).hexdigest())
+
+        workers = min(self._max_workers, len(payloads))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            self._digests.update(pool.map(_write, payloads))
 
     def write_episode_score(self, score: dict) -> None:
         """Append a per-episode score to the JSONL file."""
-        path = self._base_dir / "scores" / "per_episode.jsonl"
-        with path.open("a") as f:
-            f.write(json.dumps(score, sort_keys=True) + "\n")
+        self._append_line("scores/per_episode.jsonl", json.dumps(score, sort_keys=True))
 
     def write_aggregate_scores(self, aggregate: dict) -> None:
         """Write aggregate scores."""
-        path = self._base_dir / "scores" / "aggregate.json"
-        path.write_text(json.dumps(aggregate, indent=2))
+        self._write_file("scores/aggregate.json", json.dumps(aggregate, indent=2))
+
+    def write_score_statistics(self, statistics: dict) -> None:
+        """Write score statistics; not part of the file inventory."""
+        self._write_file(SCORE_STATISTICS_FILE, json.dumps(statistics, indent=2))
 
     def write_certificate(self, certificate_data: dict) -> None:
         """Write the certificate."""
-        path = self._base_dir / "certificate.json"
-        path.write_text(json.dumps(certificate_data, indent=2))
+        self._write_file("certificate.json", json.dumps(certificate_data, indent=2))
 
     def write_rlmf_export(self, records: list[dict]) -> None:
         """Write RLMF export records as JSONL."""
-        path = self._base_dir / "rlmf_export.jsonl"
-        with path.open("w") as f:
+        self._write_jsonl("rlmf_export.jsonl", records)
+
+    def _write_jsonl(self, rel: str, records: Iterable[dict]) -> None:
+        """Write records as sorted-key JSONL, hashing each chunk as it is written."""
+        if rel in self._streams:
+            self._streams.pop(rel).close()
+        hasher = hashlib.sha256()
+        with (self._base_dir / rel).open("wb") as f:
             for record in records:
-                f.write(json.dumps(record, sort_keys=True) + "\n")
+                data = (json.dumps(record, sort_keys=True) + "\n").encode("utf-8")
+                hasher.update(data)
+                f.write(data)
+        self._record_digest(rel, hasher.hexdigest())
 
     def append_audit_event(self, event: AuditEvent) -> None:
         """Append an audit event to the trail."""
-        path = self._base_dir / "audit_trail.jsonl"
-        with path.open("a") as f:
-            f.write(event.model_dump_json() + "\n")
+        self._append_line("audit_trail.jsonl", event.model_dump_json())
 
     def compute_file_inventory(self) -> dict[str, str]:
         """Compute SHA-256 hashes of all files in the bundle.
 
         Returns dict of relative_path → SHA-256 hex, sorted lexicographically
         by key. Excludes manifest.json and certificate.json (they reference
-        the inventory or are written after hash computation).
+        the inventory or are written after hash computation), and the score
+        statistics, which are not reproducible across machines.
+
+        Digests of append streams still open in this builder are used as is.
+        Digests recorded for other files written here are reused only while
+        the file's size and mtime are unchanged; anything else is hashed from
+        disk. In the packed layout the
+        pack and its index are inventoried as ordinary files; the index
+        carries every per-record SHA-256, so the bundle hash covers them.
         """
+        self.flush()
         inventory: dict[str, str] = {}
         for path in sorted(self._base_dir.rglob("*")):
             if path.is_file() and path.name not in ("manifest.json", "certificate.json"):
-                rel = str(path.relative_to(self._base_dir))
-                inventory[rel] = hashlib.sha256(path.read_bytes()).hexdigest()
+                rel = path.relative_to(self._base_dir)
+                if rel.as_posix() == SCORE_STATISTICS_FILE:
+                    continue
+                inventory[str(rel)] = self._file_digest(rel.as_posix(), path)
         return dict(sorted(inventory.items()))
 
+    def _file_digest(self, rel: str, path: Path) -> str:
+        stat = path.stat()
+        stream = self._streams.get(rel)
+        if stream is not None and stream.size == stat.st_size:
+            return stream.hexdigest()
+        recorded = self._digests.get(rel)
+        if recorded is not None and recorded[:2] == (stat.st_size, stat.st_mtime_ns):
+            return recorded[2]
+        hasher = hashlib.sha256()
+        with path.open("rb") as f:
+            while chunk := f.read(_HASH_CHUNK_BYTES):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
     def compute_bundle_hash(self) -> str:
         """Compute deterministic SHA-256 over sorted file inventory.
 
@@ -129,8 +381,10 @@ class EvidenceBundleBuilder:
         Checks for:
         - All REQUIRED_FILES exist
         - At least 1 ground_truth file
-        - At least 1 invocation file
+        - At least 1 invocation file, or for a packed bundle: a readable
+          index, at least 1 record, and every record matching its hash
         """
+        self.flush()
         missing: list[str] = []
 
         for required in self.REQUIRED_FILES:
@@ -142,7 +396,22 @@ class EvidenceBundleBuilder:
             missing.append("ground_truth/ (no files)")
 
         inv_dir = self._base_dir / "invocations"
-        if not any(inv_dir.iterdir()):
+        if (inv_dir / PACK_FILENAME).exists():
+            missing.extend(self._validate_pack(inv_dir))
+        elif not any(inv_dir.iterdir()):
             missing.append("invocations/ (no files)")
 
         return missing
+
+    @staticmethod
+    def _validate_pack(inv_dir: Path) -> list[str]:
+        try:
+            reader = PackedInvocationReader(inv_dir)
+        except (FileNotFoundError, ValueError):
+            return [f"invocations/{INDEX_FILENAME}"]
+        if len(reader) == 0:
+            return [f"invocations/{PACK_FILENAME} (no records)"]
+        bad = reader.verify()
+        if bad:
+            return [f"invocations/{PACK_FILENAME} (corrupt records: {', '.join(bad)})"]
+        return []
@@ -0,0 +1,180 @@
+"""Ground truth dataset I/O — streams GroundTruthEpisodes into a replay.
+
+JSONL files hold one episode per line (the format written by
+EvidenceBundleBuilder.write_ground_truth). Episodes are parsed lazily so
+datasets can be hashed and replayed without loading them fully into memory.
+
+A GroundTruthSource is an async iterable of episodes with an optional known
+total. Replayable sources can be iterated more than once, which lets the
+ReplayEngine verify the dataset hash before any construct is invoked.
+"""
+
+from __future__ import annotations
+
+import mmap
+from array import array
+from collections.abc import AsyncIterable, AsyncIterator, Iterator, Sequence
+from pathlib import Path
+from typing import Protocol, runtime_checkable
+
+from theatre.engine.models import GroundTruthEpisode
+
+
+def iter_episodes_jsonl(path: Path) -> Iterator[GroundTruthEpisode]:
+    """Yield episodes from a JSONL file one line at a time. Blank lines are skipped."""
+    with Path(path).open("r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield GroundTruthEpisode.model_validate_json(line)
+
+
+@runtime_checkable
+class GroundTruthSource(Protocol):
+    """Protocol for streamed ground truth datasets.
+
+    total: episode count if known up front, else None.
+    replayable: True if the source can be iterated more than once.
+    """
+
+    @property
+    def total(self) -> int | None: ...
+
+    @property
+    def replayable(self) -> bool: ...
+
+    def __aiter__(self) -> AsyncIterator[GroundTruthEpisode]: ...
+
+
+class InMemoryGroundTruthSource:
+    """Source over an already-materialised list of episodes."""
+
+    def __init__(self, episodes: Sequence[GroundTruthEpisode]):
+        self._episodes = episodes
+
+    @property
+    def total(self) -> int | None:
+        return len(self._episodes)
+
+    @property
+    def replayable(self) -> bool:
+        return True
+
+    async def __aiter__(self) -> AsyncIterator[GroundTruthEpisode]:
+        for episode in self._episodes:
+            yield episode
+
+
+class JsonlGroundTruthSource:
+    """Source that parses a JSONL file line by line on each iteration.
+
+    The total is unknown unless supplied, since counting would need a full read.
+    """
+
+    def __init__(self, path: Path, total: int | None = None):
+        self._path = Path(path)
+        self._total = total
+
+    @property
+    def total(self) -> int | None:
+        return self._total
+
+    @property
+    def replayable(self) -> bool:
+        return True
+
+    async def __aiter__(self) -> AsyncIterator[GroundTruthEpisode]:
+        for episode in iter_episodes_jsonl(self._path):
+            yield episode
+
+
+class MmapJsonlGroundTruthSource:
+    """Source over a memory-mapped JSONL file with a line-offset index.
+
+    The index (one int64 per episode) is built on first use, giving a known
+    total and random access via episode_at() without holding any record text.
+    """
+
+    def __init__(self, path: Path):
+        self._path = Path(path)
+        self._offsets: array | None = None
+
+    @property
+    def total(self) -> int | None:
+        return len(self._index())
+
+    @property
+    def replayable(self) -> bool:
+        return True
+
+    def episode_at(self, index: int) -> GroundTruthEpisode:
+        """Parse the episode on the index-th non-blank line."""
+        offsets = self._index()
+        start = offsets[index]  # IndexError before mapping, also when empty
+        with self._open() as mm:
+            return self._parse(mm, start)
+
+    async def __aiter__(self) -> AsyncIterator[GroundTruthEpisode]:
+        offsets = self._index()
+        if not offsets:
+            return  # mmap cannot map an empty file
+        with self._open() as mm:
+            for start in offsets:
+                yield self._parse(mm, start)
+
+    def _open(self) -> mmap.mmap:
+        with self._path.open("rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _index(self) -> array:
+        if self._offsets is None:
+            offsets = array("q")
+            if self._path.stat().st_size:
+                with self._open() as mm:
+                    pos, size = 0, len(mm)
+                    while pos < size:
+                        end = mm.find(b"\n", pos)
+                        if end == -1:
+                            end = size
+                        if mm[pos:end].strip():
+                            offsets.append(pos)
+                        pos = end + 1
+            self._offsets = offsets
+        return self._offsets
+
+    @staticmethod
+    def _parse(mm: mmap.mmap, start: int) -> GroundTruthEpisode:
+        end = mm.find(b"\n", start)
+        return GroundTruthEpisode.model_validate_json(
+            mm[start:end if end != -1 else len(mm)]
+        )
+
+
+class AsyncIteratorGroundTruthSource:
+    """Single-pass source wrapping an async iterable (e.g. an async generator).
+
+    Not replayable: the ReplayEngine hashes episodes as they stream past and
+    verifies the commitment once the iterator is exhausted.
+    """
+
+    def __init__(
+        self,
+        episodes: AsyncIterable[GroundTruthEpisode],
+        total: int | None = None,
+    ):
+        self._episodes = episodes
+        self._total = total
+        self._consumed = False
+
+    @property
+    def total(self) -> int | None:
+        return self._total
+
+    @property
+    def replayable(self) -> bool:
+        return False
+
+    def __aiter__(self) -> AsyncIterator[GroundTruthEpisode]:
+        if self._consumed:
+            raise RuntimeError("AsyncIteratorGroundTruthSource can only be iterated once")
+        self._consumed = True
+        return self._episodes.__aiter__()
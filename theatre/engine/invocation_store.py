@@ -0,0 +1,147 @@
+"""Packed Invocation Store — single-file layout for evidence bundle invocations.
+
+Instead of one ``invocations/{episode_id}.json`` per episode, the packed
+layout appends every invocation as one sorted-key JSON line to
+``invocations/invocations.jsonl``. A sidecar ``invocations/index.json`` maps
+episode_id to the record's byte offset, length and SHA-256, which gives
+random access by episode_id and lets a reader verify each record without
+trusting the rest of the file.
+
+Both files are ordinary bundle files, so they appear in the file inventory
+and are covered by the bundle hash; the index in turn commits to every
+record hash.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Iterator
+
+from pydantic import BaseModel
+
+PACK_FILENAME = "invocations.jsonl"
+INDEX_FILENAME = "index.json"
+PACK_FORMAT = "echelon-invocation-pack/1"
+
+
+class InvocationIntegrityError(Exception):
+    """Raised when a packed invocation record does not match its index entry."""
+
+
+class PackedIndexEntry(BaseModel):
+    """Location and hash of one record in the pack file."""
+
+    offset: int
+    length: int
+    sha256: str
+
+
+def encode_invocation(episode_id: str, request: dict, response: dict) -> bytes:
+    """Serialise one invocation as a newline-terminated JSONL record."""
+    record = {"episode_id": episode_id, "request": request, "response": response}
+    return (json.dumps(record, sort_keys=True) + "\n").encode("utf-8")
+
+
+def index_to_json(index: dict[str, PackedIndexEntry]) -> str:
+    """Render the sidecar index with sorted keys for determinism."""
+    data = {
+        "format": PACK_FORMAT,
+        "records": {eid: entry.model_dump() for eid, entry in index.items()},
+    }
+    return json.dumps(data, sort_keys=True, indent=2)
+
+
+class PackedInvocationReader:
+    """Random-access reader over a packed invocations directory.
+
+    Args:
+        invocations_dir: The bundle's ``invocations/`` directory.
+
+    Raises:
+        FileNotFoundError: If the pack or its index is missing.
+        ValueError: If the index declares an unknown format.
+    """
+
+    def __init__(self, invocations_dir: Path):
+        self._pack_path = invocations_dir / PACK_FILENAME
+        index_path = invocations_dir / INDEX_FILENAME
+        if not self._pack_path.exists():
+            raise FileNotFoundError(f"Invocation pack not found: {self._pack_path}")
+        data = json.loads(index_path.read_text())
+        if data.get("format") != PACK_FORMAT:
+            raise ValueError(f"Unsupported invocation pack format: {data.get('format')!r}")
+        self._index = {
+            eid: PackedIndexEntry(**entry) for eid, entry in data["records"].items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, episode_id: object) -> bool:
+        return episode_id in self._index
+
+    def index(self) -> dict[str, PackedIndexEntry]:
+        """Copy of the episode_id -> index entry mapping."""
+        return dict(self._index)
+
+    def episode_ids(self) -> list[str]:
+        """Indexed episode ids in pack order."""
+        return sorted(self._index, key=lambda eid: self._index[eid].offset)
+
+    def get(self, episode_id: str, verify: bool = True) -> dict[str, Any]:
+        """Return {"request", "response"} for an episode.
+
+        Raises:
+            KeyError: If the episode is not in the index.
+            InvocationIntegrityError: If verify is set and the record's
+                bytes do not hash to the indexed SHA-256.
+        """
+        entry = self._index[episode_id]
+        with self._pack_path.open("rb") as f:
+            f.seek(entry.offset)
+            raw = f.read(entry.length)
+        return self._decode(episode_id, entry, raw, verify)
+
+    def iter_records(self, verify: bool = True) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Yield (episode_id, record) in pack order over a single open handle."""
+        with self._pack_path.open("rb") as f:
+            for episode_id in self.episode_ids():
+                entry = self._index[episode_id]
+                f.seek(entry.offset)
+                raw = f.read(entry.length)
+                yield episode_id, self._decode(episode_id, entry, raw, verify)
+
+    def verify(self) -> list[str]:
+        """Return episode ids whose record is missing or fails its hash. Empty = valid."""
+        bad: list[str] = []
+        with self._pack_path.open("rb") as f:
+            for episode_id in self.episode_ids():
+                entry = self._index[episode_id]
+                f.seek(entry.offset)
+                raw = f.read(entry.length)
+                if (
+                    len(raw) != entry.length
+                    or hashlib.sha256(raw).hexdigest() != entry.sha256
+                ):
+                    bad.append(episode_id)
+        return bad
+
+    @staticmethod
+    def _decode(
+        episode_id: str, entry: PackedIndexEntry, raw: bytes, verify: bool
+    ) -> dict[str, Any]:
+        if verify and (
+            len(raw) != entry.length or hashlib.sha256(raw).hexdigest() != entry.sha256
+        ):
+            raise InvocationIntegrityError(
+                f"Packed invocation {episode_id!r} does not match its index entry"
+            )
+        record = json.loads(raw)
+        if record.get("episode_id") != episode_id:
+            raise InvocationIntegrityError(
+                f"Packed record at offset {entry.offset} is for "
+                f"{record.get('episode_id')!r}, expected {episode_id!r}"
+            )
+        return {"request": record["request"], "response": record["response"]}
@@ -0,0 +1,217 @@
+"""Oracle Response Cache — content-addressed memoisation of construct invocations.
+
+Cache keys are SHA-256 over canonical JSON of (construct_id, construct_version,
+input_data), so a response is only reused for the exact same pinned construct
+and the exact same input. Entries live on disk as one JSON file each; the cache
+is bounded by total size and evicts least-recently-used entries.
+
+CachingOracleAdapter does the disk I/O in a worker thread, so cache lookups do
+not block the replay's event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+from theatre.engine.canonical_json import canonical_json
+from theatre.engine.oracle_contract import OracleAdapter
+
+logger = logging.getLogger(__name__)
+
+# Adapter input keys that identify the invocation rather than its content
+_INVOCATION_KEYS = frozenset({"episode_id"})
+
+
+class OracleCacheStats(BaseModel):
+    """Hit/miss counters for an oracle response cache."""
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+
+    def since(self, earlier: "OracleCacheStats") -> "OracleCacheStats":
+        """Counters accumulated after the earlier snapshot."""
+        return OracleCacheStats(
+            hits=self.hits - earlier.hits,
+            misses=self.misses - earlier.misses,
+            writes=self.writes - earlier.writes,
+            evictions=self.evictions - earlier.evictions,
+        )
+
+
+class OracleResponseCache:
+    """Size-bounded on-disk store of oracle outputs keyed by content hash.
+
+    Eviction is LRU by file mtime (refreshed on every hit) and runs down to
+    90% of max_bytes so that a full cache does not evict on every write.
+    get() and put() are thread-safe.
+    """
+
+    _LOW_WATERMARK = 0.9
+
+    def __init__(self, cache_dir: Path, max_bytes: int = 512 * 1024 * 1024):
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be > 0, got {max_bytes}")
+        self._dir = Path(cache_dir)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._stats = OracleCacheStats()
+        # key → (size_bytes, last_used) for every entry on disk
+        self._index: dict[str, tuple[int, float]] = {}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._load_index()
+
+    @property
+    def stats(self) -> OracleCacheStats:
+        with self._lock:
+            return self._stats.model_copy()
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @staticmethod
+    def make_key(
+        construct_id: str,
+        construct_version: str,
+        input_data: dict[str, Any],
+    ) -> str:
+        """SHA-256 over canonical JSON of the construct pin and its input."""
+        payload = {
+            "construct_id": construct_id,
+            "construct_version": construct_version,
+            "input_data": input_data,
+        }
+        return hashlib.sha256(canonical_json(payload).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return a fresh copy of the cached output, or None on miss."""
+        with self._lock:
+            return self._get(key)
+
+    def put(self, key: str, output: dict[str, Any]) -> None:
+        """Store output atomically, then evict if over the size limit.
+
+        An output that cannot be serialised to JSON is logged and not cached.
+        """
+        try:
+            data = json.dumps(output, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        except (TypeError, ValueError) as e:
+            logger.warning("Not caching oracle output for key %s: %s", key, e)
+            return
+        with self._lock:
+            self._put(key, data)
+
+    def _get(self, key: str) -> dict[str, Any] | None:
+        path = self._path(key)
+        if key not in self._index:
+            self._stats.misses += 1
+            return None
+        try:
+            output = json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            # Missing or corrupt entry — drop it and treat as a miss
+            self._forget(key)
+            self._stats.misses += 1
+            return None
+        now = time.time()
+        os.utime(path, (now, now))
+        self._index[key] = (self._index[key][0], now)
+        self._stats.hits += 1
+        return output
+
+    def _put(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        if key in self._index:
+            self._total_bytes -= self._index[key][0]
+        self._index[key] = (len(data), time.time())
+        self._total_bytes += len(data)
+        self._stats.writes += 1
+        if self._total_bytes > self._max_bytes:
+            self._evict()
+
+    def _path(self, key: str) -> Path:
+        return self._dir / key[:2] / f"{key}.json"
+
+    def _load_index(self) -> None:
+        for path in self._dir.glob("*/*.json"):
+            stat = path.stat()
+            self._index[path.stem] = (stat.st_size, stat.st_mtime)
+            self._total_bytes += stat.st_size
+
+    def _forget(self, key: str) -> None:
+        size, _ = self._index.pop(key, (0, 0.0))
+        self._total_bytes -= size
+        self._path(key).unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        target = self._max_bytes * self._LOW_WATERMARK
+        for key, _ in sorted(self._index.items(), key=lambda item: item[1][1]):
+            if self._total_bytes <= target:
+                break
+            self._forget(key)
+            self._stats.evictions += 1
+
+
+class CachingOracleAdapter:
+    """OracleAdapter wrapper that memoises the wrapped adapter's outputs.
+
+    Only successful invocations are stored; exceptions (errors, timeouts,
+    refusals) propagate unchanged so invoke_oracle() status semantics hold.
+    The key covers the adapter input except the episode_id that
+    invoke_oracle() injects, so the same input under another episode id hits.
+    """
+
+    def __init__(
+        self,
+        adapter: OracleAdapter,
+        cache: OracleResponseCache,
+        construct_id: str,
+        construct_version: str,
+    ):
+        self._adapter = adapter
+        self._cache = cache
+        self._construct_id = construct_id
+        self._construct_version = construct_version
+
+    @property
+    def cache(self) -> OracleResponseCache:
+        return self._cache
+
+    async def invoke(self, input_data: dict[str, Any]) -> dict[str, Any]:
+        key = OracleResponseCache.make_key(
+            self._construct_id,
+            self._construct_version,
+            {k: v for k, v in input_data.items() if k not in _INVOCATION_KEYS},
+        )
+        cached = await asyncio.to_thread(self._cache.get, key)
+        if cached is not None:
+            return cached
+        output = await self._adapter.invoke(input_data)
+        await asyncio.to_thread(self._cache.put, key, output)
+        return output
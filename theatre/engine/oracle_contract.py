@@ -2,15 +2,22 @@
 
 Wraps the existing OracleAdapter with Theatre-aware invocation tracking,
 retry logic, timeout handling, and structured status reporting.
+
+Retries back off exponentially, with optional jitter. The wait is delegated to a
+caller-supplied ``backoff_wait`` so a replay can give up its concurrency
+slot while an episode is backing off. An optional CircuitBreaker shared by
+all invocations of one adapter fails the remaining calls fast once the
+adapter has failed repeatedly.
 """
 
 from __future__ import annotations
 
 import asyncio
+import random
 import time
 import uuid
 from datetime import datetime
-from typing import Any, Callable, Literal, Protocol
+from typing import Any, Awaitable, Callable, Literal, Protocol
 
 from pydantic import BaseModel, Field
 
@@ -21,6 +28,7 @@ class OracleInvocationMetadata(BaseModel):
     timeout_seconds: int = 30
     retry_count: int = 2
     retry_backoff_seconds: float = 5.0
+    retry_jitter: float = Field(default=0.0, ge=0.0, le=1.0)  # ± fraction of backoff
     deterministic: bool = False
     sanitise_input: bool = True
 
@@ -50,6 +58,78 @@ class OracleInvocationResponse(BaseModel):
     responded_at: datetime = Field(default_factory=datetime.utcnow)
 
 
+class OracleInvocationStats(BaseModel):
+    """Attempt, retry and failure counters across oracle invocations."""
+
+    attempts: int = 0
+    retries: int = 0
+    timeouts: int = 0
+    errors: int = 0
+    refusals: int = 0
+    circuit_rejections: int = 0
+    backoff_seconds: float = 0.0
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one oracle adapter.
+
+    Opens after ``failure_threshold`` consecutive TIMEOUT/ERROR attempts;
+    while open, invoke_oracle() returns ERROR without calling the adapter.
+    With ``reset_after_seconds`` set, one trial call is let through after
+    the cooldown (half-open): success closes the breaker, failure re-opens
+    it. Without it the breaker stays open for the breaker's lifetime.
+    REFUSED responses do not count either way; a trial that ends without a
+    verdict (refused or cancelled) is released so a later call can retry it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_after_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if failure_threshold < 1:
+            raise ValueError(f"failure_threshold must be >= 1, got {failure_threshold}")
+        self._threshold = failure_threshold
+        self._reset_after = reset_after_seconds
+        self._clock = clock
+        self._consecutive_failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def allow(self) -> bool:
+        """Whether a call may proceed now."""
+        if self._opened_at is None:
+            return True
+        if (
+            self._reset_after is not None
+            and not self._trial_in_flight
+            and self._clock() - self._opened_at >= self._reset_after
+        ):
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self._consecutive_failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self._consecutive_failures += 1
+        if self._opened_at is not None or self._consecutive_failures >= self._threshold:
+            self._opened_at = self._clock()
+        self._trial_in_flight = False
+
+    def release(self) -> None:
+        """End a call that neither succeeded nor failed; frees a half-open trial."""
+        self._trial_in_flight = False
+
+
 class OracleAdapter(Protocol):
     """Protocol for oracle adapters — matches existing echelon-verify contract."""
 
@@ -94,21 +174,52 @@ class MockOracleAdapter:
         return dict(self._default_response)
 
 
+def compute_backoff(
+    metadata: OracleInvocationMetadata,
+    attempt: int,
+    rng: Callable[[float, float], float] = random.uniform,
+) -> float:
+    """Exponential backoff for a retry after ``attempt`` (0-based), with optional jitter."""
+    base = metadata.retry_backoff_seconds * (2 ** attempt)
+    jitter = metadata.retry_jitter
+    return base * rng(1.0 - jitter, 1.0 + jitter) if jitter else base
+
+
 async def invoke_oracle(
     adapter: OracleAdapter,
     request: OracleInvocationRequest,
+    *,
+    circuit_breaker: CircuitBreaker | None = None,
+    stats: OracleInvocationStats | None = None,
+    backoff_wait: Callable[[float], Awaitable[None]] = asyncio.sleep,
 ) -> OracleInvocationResponse:
     """Invoke an oracle adapter with retry and timeout handling.
 
     Wraps the raw adapter call with:
     - Timeout enforcement
-    - Retry with exponential backoff
+    - Retry with exponential backoff and jitter, waited via backoff_wait
+      (a replay passes a wait that frees its concurrency slot meanwhile)
+    - Optional circuit breaker: while open, returns ERROR without invoking
     - Structured status reporting (SUCCESS/TIMEOUT/ERROR/REFUSED)
+    - Optional counters in ``stats``
     """
     last_error: str | None = None
+    start_time = time.monotonic()
 
     for attempt in range(request.metadata.retry_count + 1):
+        if circuit_breaker is not None and not circuit_breaker.allow():
+            if stats is not None:
+                stats.circuit_rejections += 1
+            last_error = (
+                f"Circuit open for {request.construct_id} "
+                f"(attempt {attempt + 1}/{request.metadata.retry_count + 1})"
+                + (f"; last error: {last_error}" if last_error else "")
+            )
+            break
+
         start_time = time.monotonic()
+        if stats is not None:
+            stats.attempts += 1
         try:
             result = await asyncio.wait_for(
                 adapter.invoke({
@@ -117,15 +228,6 @@ async def invoke_oracle(
                 }),
                 timeout=request.metadata.timeout_seconds,
             )
-            elapsed_ms = int((time.monotonic() - start_time) * 1000)
-            return OracleInvocationResponse(
-                invocation_id=request.invocation_id,
-                construct_id=request.construct_id,
-                construct_version=request.construct_version,
-                output_data=result,
-                latency_ms=elapsed_ms,
-                status="SUCCESS",
-            )
 
         except asyncio.TimeoutError:
             elapsed_ms = int((time.monotonic() - start_time) * 1000)
@@ -133,10 +235,14 @@ async def invoke_oracle(
                 f"Timeout after {request.metadata.timeout_seconds}s "
                 f"(attempt {attempt + 1}/{request.metadata.retry_count + 1})"
             )
+            if stats is not None:
+                stats.timeouts += 1
 
         except PermissionError as e:
             # REFUSED — do not retry
             elapsed_ms = int((time.monotonic() - start_time) * 1000)
+            if stats is not None:
+                stats.refusals += 1
             return OracleInvocationResponse(
                 invocation_id=request.invocation_id,
                 construct_id=request.construct_id,
@@ -149,11 +255,37 @@ async def invoke_oracle(
         except Exception as e:
             elapsed_ms = int((time.monotonic() - start_time) * 1000)
             last_error = f"{type(e).__name__}: {e}"
+            if stats is not None:
+                stats.errors += 1
+
+        else:
+            elapsed_ms = int((time.monotonic() - start_time) * 1000)
+            if circuit_breaker is not None:
+                circuit_breaker.record_success()
+            return OracleInvocationResponse(
+                invocation_id=request.invocation_id,
+                construct_id=request.construct_id,
+                construct_version=request.construct_version,
+                output_data=result,
+                latency_ms=elapsed_ms,
+                status="SUCCESS",
+            )
+
+        finally:
+            # Refusals and cancellation give no verdict; never strand a trial
+            if circuit_breaker is not None:
+                circuit_breaker.release()
+
+        if circuit_breaker is not None:
+            circuit_breaker.record_failure()
 
         # Backoff before retry (except on last attempt)
         if attempt < request.metadata.retry_count:
-            backoff = request.metadata.retry_backoff_seconds * (2 ** attempt)
-            await asyncio.sleep(backoff)
+            backoff = compute_backoff(request.metadata, attempt)
+            if stats is not None:
+                stats.retries += 1
+                stats.backoff_seconds += backoff
+            await backoff_wait(backoff)
 
     # All retries exhausted
     elapsed_ms = int((time.monotonic() - start_time) * 1000)
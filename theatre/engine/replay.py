@@ -1,26 +1,55 @@
 """Replay Engine — orchestrates Product Theatre execution.
 
-Processes ground truth episodes sequentially: invoke construct, score, aggregate.
+Processes ground truth episodes: invoke construct, score, aggregate.
+Episodes may run concurrently up to ``max_concurrency``; results are always
+recorded in dataset order so the outcome is identical to a sequential run.
 Tracks failure rates and enforces the >20% cap rule.
+Completed episodes can be checkpointed so an interrupted replay resumes
+without re-invoking the construct for episodes already done.
+Episodes waiting out a retry backoff release their concurrency slot, so a
+flaky episode does not stall the rest of the replay.
 """
 
 from __future__ import annotations
 
-import hashlib
+import asyncio
 import json
-from typing import Any, Callable
+import time
+from collections import deque
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any, Awaitable, Callable
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
-from theatre.engine.canonical_json import canonical_json
 from theatre.engine.certificate import TheatreCalibrationCertificate
+from theatre.engine.checkpoint import CheckpointMismatchError, ReplayCheckpoint
+from theatre.engine.commitment import CommitmentProtocol, DatasetHasher
+from theatre.engine.ground_truth import (
+    GroundTruthSource,
+    InMemoryGroundTruthSource,
+    iter_episodes_jsonl,
+)
 from theatre.engine.models import GroundTruthEpisode, TheatreCriteria
+from theatre.engine.oracle_cache import (
+    CachingOracleAdapter,
+    OracleCacheStats,
+    OracleResponseCache,
+)
 from theatre.engine.oracle_contract import (
+    CircuitBreaker,
     OracleAdapter,
+    OracleInvocationMetadata,
     OracleInvocationRequest,
     OracleInvocationResponse,
+    OracleInvocationStats,
     invoke_oracle,
 )
+from theatre.engine.score_matrix import (
+    DEFAULT_BOOTSTRAP_RESAMPLES,
+    ScoreMatrix,
+    ScoreStatistics,
+)
 from theatre.engine.scoring import TheatreScoringProvider
 
 
@@ -48,6 +77,16 @@ class ReplayResult(BaseModel):
     failure_rate: float
     refused_count: int
     dataset_hash: str
+    cache_stats: OracleCacheStats | None = None  # Set when invocations are cached
+    statistics: ScoreStatistics | None = None  # Error bars; None without NumPy
+
+
+class ReplayMetrics(BaseModel):
+    """Operational metrics for one replay run (not part of the result)."""
+
+    wall_time_seconds: float = 0.0
+    invocations: OracleInvocationStats = Field(default_factory=OracleInvocationStats)
+    circuit_open: bool = False
 
 
 class DatasetHashMismatchError(Exception):
@@ -66,7 +105,14 @@ class ReplayEngine:
         oracle_adapter: OracleAdapter,
         scoring_provider: TheatreScoringProvider,
         committed_dataset_hash: str,
+        max_concurrency: int = 1,
+        invocation_metadata: OracleInvocationMetadata | None = None,
+        response_cache: OracleResponseCache | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        bootstrap_resamples: int = DEFAULT_BOOTSTRAP_RESAMPLES,
     ):
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
         self._theatre_id = theatre_id
         self._construct_id = construct_id
         self._construct_version = construct_version
@@ -74,121 +120,411 @@ class ReplayEngine:
         self._oracle = oracle_adapter
         self._scorer = scoring_provider
         self._committed_dataset_hash = committed_dataset_hash
+        self._max_concurrency = max_concurrency
+        self._invocation_metadata = invocation_metadata or OracleInvocationMetadata()
+        self._circuit_breaker = circuit_breaker
+        self._bootstrap_resamples = bootstrap_resamples
+        self._last_metrics: ReplayMetrics | None = None
+        # Deterministic constructs are memoised automatically when a cache is
+        # supplied; callers may also pass an explicit CachingOracleAdapter.
+        if (
+            response_cache is not None
+            and self._invocation_metadata.deterministic
+            and not isinstance(oracle_adapter, CachingOracleAdapter)
+        ):
+            self._oracle = CachingOracleAdapter(
+                oracle_adapter, response_cache, construct_id, construct_version
+            )
+
+    @property
+    def theatre_id(self) -> str:
+        return self._theatre_id
+
+    @property
+    def committed_dataset_hash(self) -> str:
+        return self._committed_dataset_hash
+
+    @property
+    def criteria(self) -> TheatreCriteria:
+        return self._criteria
+
+    @property
+    def construct_id(self) -> str:
+        return self._construct_id
+
+    @property
+    def construct_version(self) -> str:
+        return self._construct_version
+
+    @property
+    def last_metrics(self) -> ReplayMetrics | None:
+        """Wall time and invocation counters from the most recent run()."""
+        return self._last_metrics
 
     async def run(
         self,
-        ground_truth: list[GroundTruthEpisode],
-        progress_callback: Callable[[int, int], None] | None = None,
+        ground_truth: Sequence[GroundTruthEpisode] | GroundTruthSource,
+        progress_callback: Callable[[int, int | None], None] | None = None,
+        checkpoint: ReplayCheckpoint | None = None,
     ) -> ReplayResult:
         """Execute full replay lifecycle.
 
         1. Verify dataset hash matches commitment
-        2. For each episode: invoke → score → record
+        2. For each episode: invoke → score → record (up to max_concurrency
+           episodes in flight; results kept in dataset order)
         3. Compute failure rate
-        4. Aggregate scores across episodes
+        4. Aggregate scores across episodes, with variance, bootstrap
+           confidence intervals and latency percentiles in ``statistics``
+
+        ground_truth may be a list or a GroundTruthSource. Episodes are pulled
+        from the source only as concurrency slots free up. Replayable sources
+        are first verified in a streaming hash pass, so no construct is invoked
+        on a dataset that does not match its commitment; scoring starts once
+        that pass is done. Single-pass sources are hashed as they stream, so
+        scoring starts before the dataset is fully parsed, and
+        DatasetHashMismatchError is raised once the source is exhausted.
+
+        progress_callback receives (completed, total) as episodes finish;
+        total is None when the source cannot report its size up front.
+
+        With a checkpoint, each completed EpisodeResult is persisted as it
+        finishes. On resume, verified results are reused by dataset index
+        (the episode is still hashed, but the construct is not invoked), so
+        the ReplayResult matches an uninterrupted run; only cache_stats
+        reflects just the invocations made in this run. Raises
+        CheckpointMismatchError if the checkpoint belongs to another replay
+        or its episode_ids do not line up with the dataset.
+
+        Wall time, retries and circuit-breaker rejections for the run are
+        available afterwards from last_metrics, including after a failure.
         """
-        # Step 1: Verify dataset hash
-        actual_hash = self._compute_dataset_hash(ground_truth)
-        if actual_hash != self._committed_dataset_hash:
-            raise DatasetHashMismatchError(
-                f"Dataset hash mismatch: expected {self._committed_dataset_hash}, "
-                f"got {actual_hash}"
-            )
+        started = time.monotonic()
+        session = self.start_session()
+        try:
+            return await self._run(ground_truth, progress_callback, checkpoint, session)
+        finally:
+            self._last_metrics = session.metrics(time.monotonic() - started)
 
-        # Step 2: Process episodes sequentially
-        episode_results: list[EpisodeResult] = []
-        scored_episodes: list[dict[str, float]] = []
-        failure_count = 0
-        refused_count = 0
+    def start_session(self) -> ReplaySession:
+        """Begin accumulating one replay driven by the caller.
 
-        total = len(ground_truth)
-        for i, episode in enumerate(ground_truth):
-            request = OracleInvocationRequest(
-                theatre_id=self._theatre_id,
-                episode_id=episode.episode_id,
-                construct_id=self._construct_id,
-                construct_version=self._construct_version,
-                input_data=episode.input_data,
-            )
+        run() drives a session itself; a caller that fans one dataset out to
+        several engines (see TournamentRunner) drives one session per engine.
+        """
+        return ReplaySession(self)
+
+    async def _run(
+        self,
+        ground_truth: Sequence[GroundTruthEpisode] | GroundTruthSource,
+        progress_callback: Callable[[int, int | None], None] | None,
+        checkpoint: ReplayCheckpoint | None,
+        session: ReplaySession,
+    ) -> ReplayResult:
+        source: GroundTruthSource = (
+            InMemoryGroundTruthSource(ground_truth)
+            if isinstance(ground_truth, Sequence)
+            else ground_truth
+        )
 
-            response = await invoke_oracle(self._oracle, request)
-
-            if response.status == "REFUSED":
-                # Excluded from scoring
-                episode_results.append(EpisodeResult(
-                    episode_id=episode.episode_id,
-                    invocation_status=response.status,
-                    latency_ms=response.latency_ms,
-                    excluded=True,
-                    oracle_output=response.output_data,
-                ))
-                refused_count += 1
-            elif response.status in ("TIMEOUT", "ERROR"):
-                # Scored as missing (0.0 for all criteria)
-                scores = {cid: 0.0 for cid in self._criteria.criteria_ids}
-                composite = self._scorer.compute_composite(scores)
-                episode_results.append(EpisodeResult(
-                    episode_id=episode.episode_id,
-                    invocation_status=response.status,
-                    latency_ms=response.latency_ms,
-                    scores=scores,
-                    composite_score=composite,
-                    oracle_output=response.output_data,
-                ))
-                scored_episodes.append(scores)
-                failure_count += 1
-            else:
-                # SUCCESS — score normally
-                scores = await self._scorer.score_episode(episode, response)
-                composite = self._scorer.compute_composite(scores)
-                episode_results.append(EpisodeResult(
-                    episode_id=episode.episode_id,
-                    invocation_status=response.status,
-                    latency_ms=response.latency_ms,
-                    scores=scores,
-                    composite_score=composite,
-                    oracle_output=response.output_data,
-                ))
-                scored_episodes.append(scores)
+        # Step 1: Verify dataset hash (up front when the source can be re-read)
+        inline_hasher: DatasetHasher | None = None
+        if source.replayable:
+            actual_hash = await self.verify_source(source)
+        else:
+            inline_hasher = DatasetHasher()
 
+        # Step 2: Process episodes under the concurrency limit
+        total = source.total
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        pending: deque[asyncio.Future[EpisodeResult]] = deque()
+        completed = 0
+        resumed: dict[int, dict[str, Any]] = (
+            checkpoint.open(self._checkpoint_binding()) if checkpoint is not None else {}
+        )
+
+        def _report() -> None:
+            nonlocal completed
+            completed += 1
             if progress_callback:
-                progress_callback(i + 1, total)
+                progress_callback(completed, total)
+
+        async def _execute(index: int, episode: GroundTruthEpisode) -> EpisodeResult:
+            holding = True
+
+            async def _backoff_wait(delay: float) -> None:
+                # Free the slot while backing off, then queue for it again
+                nonlocal holding
+                semaphore.release()
+                holding = False
+                await asyncio.sleep(delay)
+                await semaphore.acquire()
+                holding = True
+
+            try:
+                result = await session.run_episode(episode, _backoff_wait)
+            finally:
+                if holding:
+                    semaphore.release()
+            if checkpoint is not None:
+                checkpoint.append(index, result.model_dump())
+            _report()
+            return result
+
+        try:
+            index = 0
+            async for episode in source:
+                if inline_hasher is not None:
+                    inline_hasher.update(episode)
+                if index in resumed:
+                    # Already done: queue a settled future to keep dataset order
+                    restored = asyncio.get_running_loop().create_future()
+                    restored.set_result(
+                        self._restore_result(index, episode, resumed[index])
+                    )
+                    pending.append(restored)
+                    _report()
+                else:
+                    await semaphore.acquire()
+                    pending.append(asyncio.create_task(_execute(index, episode)))
+                index += 1
+                while pending and pending[0].done():
+                    session.record(pending.popleft().result())
+            while pending:
+                session.record(await pending[0])
+                pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            if checkpoint is not None:
+                checkpoint.close()
+
+        if inline_hasher is not None:
+            actual_hash = self.check_dataset_hash(inline_hasher.hexdigest())
+
+        return session.finish(actual_hash)
+
+    def _build_result(
+        self,
+        episode_results: list[EpisodeResult],
+        matrix: ScoreMatrix,
+        actual_hash: str,
+        cache_stats: OracleCacheStats | None,
+    ) -> ReplayResult:
+        """Steps 3-4: failure rate and aggregation over recorded episodes."""
+        replay_count = len(episode_results)
+        failure_count = sum(
+            1 for er in episode_results if er.invocation_status in ("TIMEOUT", "ERROR")
+        )
+        refused_count = sum(1 for er in episode_results if er.excluded)
 
         # Step 3: Compute failure rate (over non-refused episodes)
-        scoreable_count = total - refused_count
+        scoreable_count = replay_count - refused_count
         failure_rate = failure_count / scoreable_count if scoreable_count > 0 else 0.0
 
         # Step 4: Aggregate scores
-        aggregate_scores = self._aggregate_scores(scored_episodes)
+        aggregate_scores = matrix.means()
         composite_score = self._scorer.compute_composite(aggregate_scores)
+        statistics = matrix.statistics(
+            self._scorer.composite_weights(),
+            bootstrap_resamples=self._bootstrap_resamples,
+            seed=int(actual_hash[:16], 16),
+        )
 
         return ReplayResult(
             episode_results=episode_results,
             aggregate_scores=aggregate_scores,
             composite_score=composite_score,
-            replay_count=total,
-            scored_count=len(scored_episodes),
+            replay_count=replay_count,
+            scored_count=len(matrix),
             failure_count=failure_count,
             failure_rate=failure_rate,
             refused_count=refused_count,
             dataset_hash=actual_hash,
+            cache_stats=cache_stats,
+            statistics=statistics,
+        )
+
+    def verify_dataset(self, ground_truth: Iterable[GroundTruthEpisode]) -> str:
+        """Check a dataset against the committed hash, returning the hash.
+
+        Accepts any iterable, so a streamed dataset is verified without
+        materialising it. Raises DatasetHashMismatchError on mismatch.
+        """
+        return self.check_dataset_hash(self._compute_dataset_hash(ground_truth))
+
+    def verify_dataset_jsonl(self, path: Path) -> str:
+        """Stream a JSONL dataset from disk and verify it against the commitment."""
+        return self.verify_dataset(iter_episodes_jsonl(path))
+
+    async def verify_source(self, source: GroundTruthSource) -> str:
+        """Stream a GroundTruthSource through the dataset hash and verify it.
+
+        Consumes one full iteration, so only use with replayable sources.
+        """
+        hasher = DatasetHasher()
+        async for episode in source:
+            hasher.update(episode)
+        return self.check_dataset_hash(hasher.hexdigest())
+
+    def _response_cache(self) -> OracleResponseCache | None:
+        return self._oracle.cache if isinstance(self._oracle, CachingOracleAdapter) else None
+
+    def _metrics(
+        self, wall_time_seconds: float, stats: OracleInvocationStats
+    ) -> ReplayMetrics:
+        return ReplayMetrics(
+            wall_time_seconds=wall_time_seconds,
+            invocations=stats,
+            circuit_open=(
+                self._circuit_breaker is not None and self._circuit_breaker.is_open
+            ),
         )
 
-    def _aggregate_scores(
-        self, scored_episodes: list[dict[str, float]]
-    ) -> dict[str, float]:
-        """Compute mean scores across all scored episodes."""
-        if not scored_episodes:
-            return {cid: 0.0 for cid in self._criteria.criteria_ids}
+    def _checkpoint_binding(self) -> dict[str, Any]:
+        """Identity a checkpoint must match to be reused by this engine."""
+        return {
+            "theatre_id": self._theatre_id,
+            "construct_id": self._construct_id,
+            "construct_version": self._construct_version,
+            "dataset_hash": self._committed_dataset_hash,
+            "criteria_ids": list(self._criteria.criteria_ids),
+        }
+
+    @staticmethod
+    def _restore_result(
+        index: int, episode: GroundTruthEpisode, data: dict[str, Any]
+    ) -> EpisodeResult:
+        result = EpisodeResult.model_validate(data)
+        if result.episode_id != episode.episode_id:
+            raise CheckpointMismatchError(
+                f"Checkpoint index {index} is episode {result.episode_id!r}, "
+                f"dataset has {episode.episode_id!r}"
+            )
+        return result
 
-        aggregated: dict[str, float] = {}
-        for cid in self._criteria.criteria_ids:
-            values = [ep.get(cid, 0.0) for ep in scored_episodes]
-            aggregated[cid] = sum(values) / len(values)
-        return aggregated
+    def check_dataset_hash(self, actual_hash: str) -> str:
+        """Compare an already computed dataset hash with the commitment.
+
+        Returns the hash; raises DatasetHashMismatchError on mismatch.
+        """
+        if actual_hash != self._committed_dataset_hash:
+            raise DatasetHashMismatchError(
+                f"Dataset hash mismatch: expected {self._committed_dataset_hash}, "
+                f"got {actual_hash}"
+            )
+        return actual_hash
+
+    async def _run_episode(
+        self,
+        episode: GroundTruthEpisode,
+        stats: OracleInvocationStats | None = None,
+        backoff_wait: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        ground_truth_inputs: dict[str, Any] | None = None,
+    ) -> EpisodeResult:
+        """Invoke the construct for one episode and score the response.
+
+        ground_truth_inputs may carry the episode's prebuilt scoring inputs
+        (TheatreScoringProvider.ground_truth_inputs) when shared across runs.
+        """
+        request = OracleInvocationRequest(
+            theatre_id=self._theatre_id,
+            episode_id=episode.episode_id,
+            construct_id=self._construct_id,
+            construct_version=self._construct_version,
+            input_data=episode.input_data,
+            metadata=self._invocation_metadata,
+        )
+
+        response = await invoke_oracle(
+            self._oracle,
+            request,
+            circuit_breaker=self._circuit_breaker,
+            stats=stats,
+            backoff_wait=backoff_wait,
+        )
+
+        if response.status == "REFUSED":
+            # Excluded from scoring
+            return EpisodeResult(
+                episode_id=episode.episode_id,
+                invocation_status=response.status,
+                latency_ms=response.latency_ms,
+                excluded=True,
+                oracle_output=response.output_data,
+            )
+
+        if response.status in ("TIMEOUT", "ERROR"):
+            # Scored as missing (0.0 for all criteria)
+            scores = {cid: 0.0 for cid in self._criteria.criteria_ids}
+        else:
+            # SUCCESS — score normally
+            scores = await self._scorer.score_episode(
+                episode, response, ground_truth_inputs=ground_truth_inputs
+            )
+
+        return EpisodeResult(
+            episode_id=episode.episode_id,
+            invocation_status=response.status,
+            latency_ms=response.latency_ms,
+            scores=scores,
+            composite_score=self._scorer.compute_composite(scores),
+            oracle_output=response.output_data,
+        )
 
     @staticmethod
-    def _compute_dataset_hash(episodes: list[GroundTruthEpisode]) -> str:
+    def _compute_dataset_hash(episodes: Iterable[GroundTruthEpisode]) -> str:
         """Compute SHA-256 hash of the dataset for commitment verification."""
-        serialised = canonical_json([ep.model_dump() for ep in episodes])
-        return hashlib.sha256(serialised.encode("utf-8")).hexdigest()
+        return CommitmentProtocol.compute_dataset_hash(episodes)
+
+
+class ReplaySession:
+    """One in-progress replay for a ReplayEngine: invokes and accumulates.
+
+    Episodes are run with run_episode() and handed back, in dataset order,
+    to record(); finish() then builds the ReplayResult. Invocation counters
+    and oracle cache activity are tracked from the session's start.
+    """
+
+    def __init__(self, engine: ReplayEngine):
+        self._engine = engine
+        self._stats = OracleInvocationStats()
+        self._cache = engine._response_cache()
+        self._cache_before = self._cache.stats if self._cache is not None else None
+        self._episode_results: list[EpisodeResult] = []
+        self._matrix = ScoreMatrix(engine.criteria.criteria_ids)
+
+    async def run_episode(
+        self,
+        episode: GroundTruthEpisode,
+        backoff_wait: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        ground_truth_inputs: dict[str, Any] | None = None,
+    ) -> EpisodeResult:
+        """Invoke the construct for one episode and score the response.
+
+        ground_truth_inputs may carry the episode's prebuilt scoring inputs
+        (TheatreScoringProvider.ground_truth_inputs) when shared across engines.
+        """
+        return await self._engine._run_episode(
+            episode, self._stats, backoff_wait, ground_truth_inputs=ground_truth_inputs
+        )
+
+    def record(self, result: EpisodeResult) -> None:
+        """Add the next episode's result; call in dataset order."""
+        self._episode_results.append(result)
+        self._matrix.add_latency(result.latency_ms)
+        if not result.excluded and result.scores is not None:
+            self._matrix.add_scores(result.scores)
+
+    def finish(self, dataset_hash: str) -> ReplayResult:
+        """Aggregate the recorded episodes of a dataset verified as ``dataset_hash``."""
+        cache_stats = (
+            self._cache.stats.since(self._cache_before) if self._cache is not None else None
+        )
+        return self._engine._build_result(
+            self._episode_results, self._matrix, dataset_hash, cache_stats
+        )
+
+    def metrics(self, wall_time_seconds: float) -> ReplayMetrics:
+        """Operational metrics for the session so far."""
+        return self._engine._metrics(wall_time_seconds, self._stats)
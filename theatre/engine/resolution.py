@@ -6,11 +6,22 @@ Processes resolution steps in committed order with support for:
 - hitl_rubric: produce PENDING_HITL status
 - aggregation: combine previous step outputs
 - Escalation paths on step failure
+
+Steps form a DAG. A step depends on the steps in its ``depends_on`` list,
+on every step its input_spec references as ``"step_outputs.<step_id>[.<key>...]"``
+(references are replaced with that output before invocation; strings naming
+an unknown step or a missing key are passed through unchanged), and, for
+aggregation, on every earlier step. Dependencies must come earlier in the
+committed order. A step starts as soon as its dependencies have been
+resolved, so independent construct invocations run concurrently, but
+outcomes are resolved strictly in committed order: outcomes, audit events,
+escalation and PENDING_HITL are exactly what sequential execution produces.
+Work started ahead of a failure or escalation is cancelled and discarded.
 """
 
 from __future__ import annotations
 
-from datetime import datetime
+import asyncio
 from typing import Any, Literal
 
 from pydantic import BaseModel, Field
@@ -39,6 +50,7 @@ class ResolutionStep(BaseModel):
     output_spec: dict[str, Any] = {}
     escalation_path: str | None = None  # step_id to jump to on failure
     timeout_seconds: int = 30
+    depends_on: list[str] = []  # step_ids that must resolve before this step starts
 
 
 class StepOutcome(BaseModel):
@@ -71,6 +83,46 @@ class VersionPinError(Exception):
     """Raised when a construct lacks a version pin."""
 
 
+_STEP_OUTPUTS_PREFIX = "step_outputs."
+
+
+def _output_references(value: Any) -> set[str]:
+    """Every ``step_outputs.<step_id>...`` string in an input_spec, as step ids."""
+    if isinstance(value, str):
+        if value.startswith(_STEP_OUTPUTS_PREFIX):
+            return {value[len(_STEP_OUTPUTS_PREFIX):].split(".", 1)[0]}
+        return set()
+    if isinstance(value, dict):
+        return set().union(*(_output_references(v) for v in value.values()))
+    if isinstance(value, list):
+        return set().union(*(_output_references(v) for v in value))
+    return set()
+
+
+_UNRESOLVED = object()
+
+
+def _resolve_references(value: Any, step_outputs: dict[str, dict[str, Any]]) -> Any:
+    """Replace step_outputs references with the referenced output.
+
+    A string naming a step without an output, or a key that output lacks,
+    is left unchanged.
+    """
+    if isinstance(value, str) and value.startswith(_STEP_OUTPUTS_PREFIX):
+        step_id, *path = value[len(_STEP_OUTPUTS_PREFIX):].split(".")
+        resolved: Any = step_outputs.get(step_id, _UNRESOLVED)
+        for key in path:
+            if not isinstance(resolved, dict):
+                return value
+            resolved = resolved.get(key, _UNRESOLVED)
+        return value if resolved is _UNRESOLVED else resolved
+    if isinstance(value, dict):
+        return {k: _resolve_references(v, step_outputs) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_resolve_references(v, step_outputs) for v in value]
+    return value
+
+
 class ResolutionStateMachine:
     """Executes pre-committed oracle programme sequence."""
 
@@ -84,77 +136,119 @@ class ResolutionStateMachine:
         self._execution_order = [s.step_id for s in steps]
         self._version_pins = version_pins
         self._oracle = oracle_adapter
+        self._dependencies = self._build_dependencies(steps)
+
+    @property
+    def dependencies(self) -> dict[str, frozenset[str]]:
+        """step_id → step_ids it waits for (explicit, referenced and implicit)."""
+        return dict(self._dependencies)
+
+    @staticmethod
+    def _build_dependencies(steps: list[ResolutionStep]) -> dict[str, frozenset[str]]:
+        """Collect each step's dependencies; they must all precede it."""
+        dependencies: dict[str, frozenset[str]] = {}
+        seen: list[str] = []
+        known = {s.step_id for s in steps}
+        for step in steps:
+            deps = set(step.depends_on) | (_output_references(step.input_spec) & known)
+            if step.type == "aggregation":
+                deps.update(seen)  # Aggregates everything resolved before it
+            for dep in sorted(deps):
+                if dep not in known:
+                    raise ValueError(
+                        f"Resolution step '{step.step_id}' depends on unknown step '{dep}'"
+                    )
+                if dep not in seen:
+                    raise ValueError(
+                        f"Resolution step '{step.step_id}' depends on '{dep}', "
+                        f"which does not precede it in the committed order"
+                    )
+            dependencies[step.step_id] = frozenset(deps)
+            seen.append(step.step_id)
+        return dependencies
 
     async def execute(self, context: ResolutionContext) -> ResolutionResult:
-        """Run each step in committed order. On failure, follow escalation_path if defined."""
+        """Run the programme, resolving steps in committed order.
+
+        Steps start as soon as their dependencies are resolved. On failure,
+        follow escalation_path if defined.
+        """
         outcomes: list[StepOutcome] = []
         audit_events: list[AuditEvent] = []
         pending_hitl = False
 
         current_order = list(self._execution_order)
+        # position in current_order → step started ahead of resolution
+        started: dict[int, asyncio.Task[StepOutcome]] = {}
         i = 0
 
-        while i < len(current_order):
-            step_id = current_order[i]
-            step = self._steps[step_id]
-
-            # Execute step
-            outcome = await self._execute_step(step, context)
-            outcomes.append(outcome)
-
-            audit_events.append(AuditEvent(
-                event_type=f"resolution_step_{outcome.status.lower()}",
-                detail={
-                    "step_id": step_id,
-                    "step_type": step.type,
-                    "status": outcome.status,
-                },
-            ))
-
-            if outcome.status == "PENDING_HITL":
-                pending_hitl = True
+        try:
+            while i < len(current_order):
+                self._start_ready_steps(current_order, i, started, context)
+                step_id = current_order[i]
+                step = self._steps[step_id]
+
+                # Resolve the step (re-raises VersionPinError at its position)
+                outcome = await started.pop(i)
+                outcomes.append(outcome)
+
+                audit_events.append(AuditEvent(
+                    event_type=f"resolution_step_{outcome.status.lower()}",
+                    detail={
+                        "step_id": step_id,
+                        "step_type": step.type,
+                        "status": outcome.status,
+                    },
+                ))
+
+                if outcome.status == "PENDING_HITL":
+                    pending_hitl = True
+                    i += 1
+                    continue
+
+                if outcome.status == "FAILED" and step.escalation_path:
+                    # Follow escalation path
+                    if step.escalation_path in self._steps:
+                        outcomes.append(StepOutcome(
+                            step_id=step_id,
+                            status="ESCALATED",
+                            error=f"Escalating to {step.escalation_path}",
+                        ))
+                        audit_events.append(AuditEvent(
+                            event_type="resolution_escalation",
+                            detail={
+                                "from_step": step_id,
+                                "to_step": step.escalation_path,
+                            },
+                        ))
+                        # Work started past this step assumed it would succeed
+                        await self._discard(started)
+                        # Jump to escalation step
+                        try:
+                            esc_idx = current_order.index(step.escalation_path)
+                            i = esc_idx
+                            continue
+                        except ValueError:
+                            # Escalation step not in remaining order — append it
+                            current_order.append(step.escalation_path)
+                            i = len(current_order) - 1
+                            continue
+
+                if outcome.status == "FAILED":
+                    # No escalation path — resolution fails
+                    return ResolutionResult(
+                        outcomes=outcomes,
+                        audit_events=audit_events,
+                        final_status="FAILED",
+                    )
+
+                # Store output for downstream steps
+                if outcome.output:
+                    context.step_outputs[step_id] = outcome.output
+
                 i += 1
-                continue
-
-            if outcome.status == "FAILED" and step.escalation_path:
-                # Follow escalation path
-                if step.escalation_path in self._steps:
-                    outcomes.append(StepOutcome(
-                        step_id=step_id,
-                        status="ESCALATED",
-                        error=f"Escalating to {step.escalation_path}",
-                    ))
-                    audit_events.append(AuditEvent(
-                        event_type="resolution_escalation",
-                        detail={
-                            "from_step": step_id,
-                            "to_step": step.escalation_path,
-                        },
-                    ))
-                    # Jump to escalation step
-                    try:
-                        esc_idx = current_order.index(step.escalation_path)
-                        i = esc_idx
-                        continue
-                    except ValueError:
-                        # Escalation step not in remaining order — append it
-                        current_order.append(step.escalation_path)
-                        i = len(current_order) - 1
-                        continue
-
-            if outcome.status == "FAILED":
-                # No escalation path — resolution fails
-                return ResolutionResult(
-                    outcomes=outcomes,
-                    audit_events=audit_events,
-                    final_status="FAILED",
-                )
-
-            # Store output for downstream steps
-            if outcome.output:
-                context.step_outputs[step_id] = outcome.output
-
-            i += 1
+        finally:
+            await self._discard(started)
 
         final_status: Literal["COMPLETED", "FAILED", "PENDING_HITL"] = (
             "PENDING_HITL" if pending_hitl else "COMPLETED"
@@ -166,6 +260,37 @@ class ResolutionStateMachine:
             final_status=final_status,
         )
 
+    def _start_ready_steps(
+        self,
+        order: list[str],
+        position: int,
+        started: dict[int, asyncio.Task[StepOutcome]],
+        context: ResolutionContext,
+    ) -> None:
+        """Start every step from *position* on whose dependencies are resolved.
+
+        A dependency is resolved once the resolution position has passed its
+        last occurrence before the dependent step. The step at *position*
+        itself is always ready.
+        """
+        last_seen: dict[str, int] = {}
+        for k, step_id in enumerate(order):
+            if k >= position and k not in started:
+                if all(last_seen.get(dep, -1) < position for dep in self._dependencies[step_id]):
+                    started[k] = asyncio.create_task(
+                        self._execute_step(self._steps[step_id], context)
+                    )
+            last_seen[step_id] = k
+
+    @staticmethod
+    async def _discard(started: dict[int, asyncio.Task[StepOutcome]]) -> None:
+        """Cancel and drop steps started ahead of resolution."""
+        tasks = list(started.values())
+        started.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
     async def _execute_step(
         self, step: ResolutionStep, context: ResolutionContext
     ) -> StepOutcome:
@@ -219,7 +344,7 @@ class ResolutionStateMachine:
             episode_id=step.step_id,
             construct_id=step.construct_id,
             construct_version=constructs[step.construct_id],
-            input_data=step.input_spec,
+            input_data=_resolve_references(step.input_spec, context.step_outputs),
         )
         request.metadata.timeout_seconds = step.timeout_seconds
 
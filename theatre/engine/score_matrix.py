@@ -0,0 +1,192 @@
+"""Score Matrix — columnar storage and statistics for replay episode scores.
+
+Episode scores are appended as a replay records them into one contiguous
+float64 column per criterion (plus a latency column covering every
+episode). NumPy reads those buffers directly to build an (episodes x
+criteria) matrix in one copy. Aggregation runs column-wise instead of
+rebuilding a Python list per criterion.
+
+Means sum each column left to right exactly as the previous per-criterion
+lists did, so aggregate scores (and the certificates built from them) are
+unchanged and do not depend on NumPy. With NumPy available, the matrix
+additionally yields per-criterion variance, bootstrap confidence
+intervals for each criterion mean and for the weighted composite, and
+latency percentiles. Without NumPy those statistics are omitted (None).
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+
+from pydantic import BaseModel
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+DEFAULT_BOOTSTRAP_RESAMPLES = 1000
+DEFAULT_CONFIDENCE_LEVEL = 0.95
+LATENCY_PERCENTILES = (50, 90, 99)
+
+# Upper bound on resample-count cells materialised per bootstrap chunk; each
+# cell costs 16 bytes (draws + counts), so a chunk stays around 256 KB
+_BOOTSTRAP_CHUNK_CELLS = 16_384
+
+
+class CriterionStatistics(BaseModel):
+    """Spread of one criterion (or the composite) across scored episodes."""
+
+    mean: float
+    variance: float  # Sample variance (ddof=1); 0.0 below two episodes
+    ci_low: float | None = None  # Bootstrap percentile interval for the mean
+    ci_high: float | None = None
+
+
+class LatencyStatistics(BaseModel):
+    """Latency percentiles in milliseconds over all replayed episodes."""
+
+    p50: float
+    p90: float
+    p99: float
+    max: float
+
+
+class ScoreStatistics(BaseModel):
+    """Error bars for a replay's aggregate and composite scores."""
+
+    sample_size: int
+    confidence_level: float
+    bootstrap_resamples: int
+    criteria: dict[str, CriterionStatistics]
+    composite: CriterionStatistics
+    latency_ms: LatencyStatistics | None = None
+
+
+class ScoreMatrix:
+    """Append-only (episodes x criteria) score matrix plus a latency column.
+
+    Args:
+        criteria_ids: Column order; scores missing a criterion count as 0.0.
+    """
+
+    def __init__(self, criteria_ids: Sequence[str]):
+        self._criteria_ids = list(criteria_ids)
+        self._columns = [array("d") for _ in self._criteria_ids]
+        self._latencies = array("d")
+        self._rows = 0
+
+    @property
+    def criteria_ids(self) -> list[str]:
+        return list(self._criteria_ids)
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def add_scores(self, scores: dict[str, float]) -> None:
+        """Append one scored episode."""
+        for column, cid in zip(self._columns, self._criteria_ids):
+            column.append(scores.get(cid, 0.0))
+        self._rows += 1
+
+    def add_latency(self, latency_ms: float) -> None:
+        """Record the latency of any replayed episode, scored or not."""
+        self._latencies.append(latency_ms)
+
+    def column(self, criteria_id: str) -> Sequence[float]:
+        return self._columns[self._criteria_ids.index(criteria_id)]
+
+    def means(self) -> dict[str, float]:
+        """Per-criterion mean; 0.0 for every criterion when nothing was scored."""
+        if self._rows == 0:
+            return {cid: 0.0 for cid in self._criteria_ids}
+        return {cid: sum(self.column(cid)) / self._rows for cid in self._criteria_ids}
+
+    def statistics(
+        self,
+        weights: Sequence[float],
+        bootstrap_resamples: int = DEFAULT_BOOTSTRAP_RESAMPLES,
+        confidence_level: float = DEFAULT_CONFIDENCE_LEVEL,
+        seed: int = 0,
+    ) -> ScoreStatistics | None:
+        """Variance, bootstrap CIs and latency percentiles; None without NumPy.
+
+        ``weights`` gives the composite weight of each criterion in column
+        order. The bootstrap is seeded so identical inputs give identical
+        intervals; pass 0 resamples to skip it.
+        """
+        if np is None:
+            return None
+
+        n = self._rows
+        scores = np.empty((n, len(self._columns)), dtype=np.float64)
+        for i, column in enumerate(self._columns):
+            scores[:, i] = np.frombuffer(column, dtype=np.float64)
+        w = np.asarray(weights, dtype=np.float64)
+        composites = scores @ w
+        ddof_ok = n > 1
+
+        variances = scores.var(axis=0, ddof=1) if ddof_ok else np.zeros(len(w))
+        composite_variance = float(composites.var(ddof=1)) if ddof_ok else 0.0
+
+        ci_low = ci_high = comp_low = comp_high = None
+        if bootstrap_resamples > 0 and n > 0:
+            boot = self._bootstrap_means(scores, bootstrap_resamples, seed)
+            alpha = (1.0 - confidence_level) / 2
+            ci_low, ci_high = np.quantile(boot, [alpha, 1.0 - alpha], axis=0)
+            comp_low, comp_high = np.quantile(boot @ w, [alpha, 1.0 - alpha])
+
+        means = self.means()
+        criteria = {
+            cid: CriterionStatistics(
+                mean=means[cid],
+                variance=float(variances[i]),
+                ci_low=None if ci_low is None else float(ci_low[i]),
+                ci_high=None if ci_high is None else float(ci_high[i]),
+            )
+            for i, cid in enumerate(self._criteria_ids)
+        }
+        composite = CriterionStatistics(
+            mean=sum(composites.tolist()) / n if n else 0.0,
+            variance=composite_variance,
+            ci_low=None if comp_low is None else float(comp_low),
+            ci_high=None if comp_high is None else float(comp_high),
+        )
+
+        latency = None
+        if len(self._latencies):
+            lat = np.frombuffer(self._latencies, dtype=np.float64)
+            p50, p90, p99 = np.percentile(lat, LATENCY_PERCENTILES)
+            latency = LatencyStatistics(
+                p50=float(p50), p90=float(p90), p99=float(p99), max=float(lat.max())
+            )
+
+        return ScoreStatistics(
+            sample_size=n,
+            confidence_level=confidence_level,
+            bootstrap_resamples=bootstrap_resamples if n else 0,
+            criteria=criteria,
+            composite=composite,
+            latency_ms=latency,
+        )
+
+    @staticmethod
+    def _bootstrap_means(scores, resamples: int, seed: int):
+        """(resamples x criteria) column means of rows resampled with replacement.
+
+        Each resample is expressed as per-row draw counts, so the means come
+        from one matrix product per chunk rather than materialising the
+        resampled rows.
+        """
+        n = scores.shape[0]
+        rng = np.random.default_rng(seed)
+        chunk = max(1, _BOOTSTRAP_CHUNK_CELLS // n)
+        out = np.empty((resamples, scores.shape[1]), dtype=np.float64)
+        for start in range(0, resamples, chunk):
+            size = min(chunk, resamples - start)
+            draws = rng.integers(0, n, size=(size, n))
+            draws += np.arange(size)[:, None] * n
+            counts = np.bincount(draws.ravel(), minlength=size * n).reshape(size, n)
+            out[start:start + size] = (counts @ scores) / n
+        return out
@@ -6,7 +6,7 @@ using the TheatreCriteria structure from the committed template.
 
 from __future__ import annotations
 
-from typing import Any, Callable, Protocol
+from typing import Any, Callable, Protocol, runtime_checkable
 
 from theatre.engine.models import GroundTruthEpisode, TheatreCriteria
 from theatre.engine.oracle_contract import OracleInvocationResponse
@@ -23,6 +23,23 @@ class ScoringFunction(Protocol):
     ) -> float: ...
 
 
+@runtime_checkable
+class BatchScoringFunction(Protocol):
+    """Optional extension: score several criteria for one episode in one call.
+
+    Scorers backed by a remote judge implement this so the episode context is
+    sent once rather than once per criterion. Criteria missing from the
+    returned dict score 0.0.
+    """
+
+    async def score_many(
+        self,
+        criteria_ids: list[str],
+        ground_truth: dict[str, Any],
+        oracle_output: dict[str, Any],
+    ) -> dict[str, float]: ...
+
+
 class SimpleScoringFunction:
     """Default scoring function for testing — exact match on expected_output keys."""
 
@@ -56,21 +73,36 @@ class TheatreScoringProvider:
         self,
         ground_truth: GroundTruthEpisode,
         oracle_response: OracleInvocationResponse,
+        ground_truth_inputs: dict[str, Any] | None = None,
     ) -> dict[str, float]:
         """Score a single episode against all criteria_ids.
 
         Returns dict of criteria_id -> score (0.0-1.0).
         If oracle response has no output_data (TIMEOUT/ERROR), returns 0.0 for all criteria.
+        Uses the scorer's score_many() when it implements BatchScoringFunction.
+        ground_truth_inputs, if given, is the prebuilt ground_truth_inputs()
+        dict for this episode (shared read-only when several constructs are
+        scored against the same episode).
         """
         if oracle_response.output_data is None:
             return {cid: 0.0 for cid in self._criteria.criteria_ids}
 
-        gt_dict = {
-            "input_data": ground_truth.input_data,
-            "expected_output": ground_truth.expected_output or {},
-            "labels": ground_truth.labels or {},
-            "metadata": ground_truth.metadata,
-        }
+        gt_dict = (
+            ground_truth_inputs
+            if ground_truth_inputs is not None
+            else self.ground_truth_inputs(ground_truth)
+        )
+
+        if isinstance(self._scorer, BatchScoringFunction):
+            batch = await self._scorer.score_many(
+                criteria_ids=list(self._criteria.criteria_ids),
+                ground_truth=gt_dict,
+                oracle_output=oracle_response.output_data,
+            )
+            return {
+                cid: max(0.0, min(1.0, batch.get(cid, 0.0)))  # Clamp to [0, 1]
+                for cid in self._criteria.criteria_ids
+            }
 
         scores: dict[str, float] = {}
         for criteria_id in self._criteria.criteria_ids:
@@ -83,6 +115,16 @@ class TheatreScoringProvider:
 
         return scores
 
+    @staticmethod
+    def ground_truth_inputs(ground_truth: GroundTruthEpisode) -> dict[str, Any]:
+        """The ground truth dict passed to scoring functions for an episode."""
+        return {
+            "input_data": ground_truth.input_data,
+            "expected_output": ground_truth.expected_output or {},
+            "labels": ground_truth.labels or {},
+            "metadata": ground_truth.metadata,
+        }
+
     def compute_composite(self, scores: dict[str, float]) -> float:
         """Weighted aggregate: sum(weight_i * score_i).
 
@@ -99,3 +141,14 @@ class TheatreScoringProvider:
             self._criteria.weights.get(cid, 0.0) * scores.get(cid, 0.0)
             for cid in self._criteria.criteria_ids
         )
+
+    def composite_weights(self) -> list[float]:
+        """Weight per criteria_id, in order, as used by compute_composite().
+
+        Equal weights when the weights dict is empty, so a score matrix with
+        one column per criteria_id yields composites via a dot product.
+        """
+        ids = self._criteria.criteria_ids
+        if not self._criteria.weights:
+            return [1.0 / len(ids)] * len(ids) if ids else []
+        return [self._criteria.weights.get(cid, 0.0) for cid in ids]
@@ -129,6 +129,17 @@ class TemplateValidator:
                     f"not found in dataset_hashes"
                 )
 
+        # Rule 8: resolution step dependencies name earlier steps (so the programme is a DAG)
+        preceding: set[str] = set()
+        for step in resolution_programme:
+            for dep in step.get("depends_on", []):
+                if dep not in preceding:
+                    errors.append(
+                        f"Runtime rule 8: resolution step '{step.get('step_id')}' "
+                        f"depends on '{dep}', which is not an earlier step"
+                    )
+            preceding.add(step.get("step_id"))
+
         return errors
 
     def _validate_certificate_rules(self, template: dict) -> list[str]:
@@ -0,0 +1,239 @@
+"""Tournament Runner — replays one dataset against several constructs in one pass.
+
+Each entrant is a ReplayEngine bound to the same theatre, criteria and
+committed dataset hash. The dataset is verified once and iterated once;
+every episode is fanned out to all entrants concurrently (one ReplaySession
+per entrant), with its scoring inputs built once and shared. Each entrant gets the ReplayResult a solo
+run would have produced, and a leaderboard ranks them by composite score.
+
+Invocations from all entrants share one ``max_concurrency`` budget. As in a
+solo replay, an invocation backing off between retries frees its slot.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Sequence
+from typing import Callable
+
+from pydantic import BaseModel
+
+from theatre.engine.commitment import DatasetHasher
+from theatre.engine.ground_truth import GroundTruthSource, InMemoryGroundTruthSource
+from theatre.engine.models import GroundTruthEpisode
+from theatre.engine.replay import (
+    EpisodeResult,
+    ReplayEngine,
+    ReplayMetrics,
+    ReplayResult,
+    ReplaySession,
+)
+from theatre.engine.scoring import TheatreScoringProvider
+
+
+class TournamentStanding(BaseModel):
+    """One entrant's place on the tournament leaderboard."""
+
+    rank: int  # 1 = best; entrants tied on composite and failure rate share a rank
+    construct_id: str
+    construct_version: str
+    composite_score: float
+    composite_ci_low: float | None = None
+    composite_ci_high: float | None = None
+    failure_rate: float
+    scored_count: int
+
+
+class TournamentResult(BaseModel):
+    """Per-entrant replay results plus the comparative leaderboard."""
+
+    dataset_hash: str
+    results: dict[str, ReplayResult]  # Keyed by entrant_key()
+    leaderboard: list[TournamentStanding]
+
+
+def entrant_key(construct_id: str, construct_version: str) -> str:
+    return f"{construct_id}@{construct_version}"
+
+
+class TournamentRunner:
+    """Runs several ReplayEngines over a single pass of one dataset."""
+
+    def __init__(self, engines: Sequence[ReplayEngine], max_concurrency: int = 1):
+        if not engines:
+            raise ValueError("A tournament needs at least one engine")
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+
+        first = engines[0]
+        keys: list[str] = []
+        for engine in engines:
+            if (
+                engine.theatre_id != first.theatre_id
+                or engine.committed_dataset_hash != first.committed_dataset_hash
+                or engine.criteria.criteria_ids != first.criteria.criteria_ids
+            ):
+                raise ValueError(
+                    f"Engine {entrant_key(engine.construct_id, engine.construct_version)} "
+                    "does not share the tournament's theatre, dataset commitment "
+                    "and criteria"
+                )
+            keys.append(entrant_key(engine.construct_id, engine.construct_version))
+        if len(set(keys)) != len(keys):
+            raise ValueError(f"Duplicate tournament entrants: {keys}")
+
+        self._engines = list(engines)
+        self._keys = keys
+        self._max_concurrency = max_concurrency
+        self._last_metrics: dict[str, ReplayMetrics] = {}
+
+    @property
+    def last_metrics(self) -> dict[str, ReplayMetrics]:
+        """Per-entrant invocation counters from the most recent run()."""
+        return dict(self._last_metrics)
+
+    async def run(
+        self,
+        ground_truth: Sequence[GroundTruthEpisode] | GroundTruthSource,
+        progress_callback: Callable[[int, int | None], None] | None = None,
+    ) -> TournamentResult:
+        """Replay every episode against every entrant.
+
+        Dataset verification follows ReplayEngine.run(): replayable sources
+        are verified up front, single-pass sources are hashed as they stream.
+        progress_callback receives (completed, total) once all entrants have
+        finished an episode.
+        """
+        started = time.monotonic()
+        sessions = [engine.start_session() for engine in self._engines]
+        try:
+            return await self._run(ground_truth, progress_callback, sessions)
+        finally:
+            wall_time = time.monotonic() - started
+            self._last_metrics = {
+                key: session.metrics(wall_time)
+                for key, session in zip(self._keys, sessions)
+            }
+
+    async def _run(
+        self,
+        ground_truth: Sequence[GroundTruthEpisode] | GroundTruthSource,
+        progress_callback: Callable[[int, int | None], None] | None,
+        sessions: list[ReplaySession],
+    ) -> TournamentResult:
+        source: GroundTruthSource = (
+            InMemoryGroundTruthSource(ground_truth)
+            if isinstance(ground_truth, Sequence)
+            else ground_truth
+        )
+        verifier = self._engines[0]
+
+        inline_hasher: DatasetHasher | None = None
+        if source.replayable:
+            actual_hash = await verifier.verify_source(source)
+        else:
+            inline_hasher = DatasetHasher()
+
+        total = source.total
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        pending: deque[list[asyncio.Task[EpisodeResult]]] = deque()
+        completed = 0
+
+        def _record(tasks: list[asyncio.Task[EpisodeResult]]) -> None:
+            nonlocal completed
+            for session, task in zip(sessions, tasks):
+                session.record(task.result())
+            completed += 1
+            if progress_callback:
+                progress_callback(completed, total)
+
+        async def _execute(
+            session: ReplaySession,
+            episode: GroundTruthEpisode,
+            inputs: dict,
+        ) -> EpisodeResult:
+            holding = True
+
+            async def _backoff_wait(delay: float) -> None:
+                nonlocal holding
+                semaphore.release()
+                holding = False
+                await asyncio.sleep(delay)
+                await semaphore.acquire()
+                holding = True
+
+            try:
+                return await session.run_episode(
+                    episode, _backoff_wait, ground_truth_inputs=inputs
+                )
+            finally:
+                if holding:
+                    semaphore.release()
+
+        try:
+            async for episode in source:
+                if inline_hasher is not None:
+                    inline_hasher.update(episode)
+                inputs = TheatreScoringProvider.ground_truth_inputs(episode)
+                tasks: list[asyncio.Task[EpisodeResult]] = []
+                pending.append(tasks)
+                for session in sessions:
+                    await semaphore.acquire()
+                    tasks.append(asyncio.create_task(_execute(session, episode, inputs)))
+                while pending and all(t.done() for t in pending[0]):
+                    _record(pending.popleft())
+            while pending:
+                await asyncio.gather(*pending[0])
+                _record(pending.popleft())
+        finally:
+            cancelled = [task for tasks in pending for task in tasks]
+            for task in cancelled:
+                task.cancel()
+            await asyncio.gather(*cancelled, return_exceptions=True)
+
+        if inline_hasher is not None:
+            actual_hash = verifier.check_dataset_hash(inline_hasher.hexdigest())
+
+        results = {
+            key: session.finish(actual_hash) for key, session in zip(self._keys, sessions)
+        }
+        return TournamentResult(
+            dataset_hash=actual_hash,
+            results=results,
+            leaderboard=self._leaderboard(results),
+        )
+
+    def _leaderboard(self, results: dict[str, ReplayResult]) -> list[TournamentStanding]:
+        """Rank by composite score (desc), then failure rate (asc), then entrant key."""
+        ordered = sorted(
+            zip(self._keys, self._engines),
+            key=lambda item: (
+                -results[item[0]].composite_score,
+                results[item[0]].failure_rate,
+                item[0],
+            ),
+        )
+        standings: list[TournamentStanding] = []
+        for position, (key, engine) in enumerate(ordered, start=1):
+            result = results[key]
+            rank = position
+            if standings:
+                prev = standings[-1]
+                if (prev.composite_score, prev.failure_rate) == (
+                    result.composite_score, result.failure_rate
+                ):
+                    rank = prev.rank
+            composite_stats = result.statistics.composite if result.statistics else None
+            standings.append(TournamentStanding(
+                rank=rank,
+                construct_id=engine.construct_id,
+                construct_version=engine.construct_version,
+                composite_score=result.composite_score,
+                composite_ci_low=composite_stats.ci_low if composite_stats else None,
+                composite_ci_high=composite_stats.ci_high if composite_stats else None,
+                failure_rate=result.failure_rate,
+                scored_count=result.scored_count,
+            ))
+        return standings
@@ -0,0 +1,277 @@
+"""Synthetic two-rail fixtures — seeded generators for large replay datasets.
+
+Produces waterfall, escrow and reconciliation records in the same format as
+the 10-record files under two_rail_theatres_v0_1, at any size. Amounts,
+splits and supplies vary per record, but every record is internally
+consistent, so each deterministic scorer check passes. The same seed always
+yields the same records and therefore the same dataset hash.
+
+Datasets are written straight to JSONL (one GroundTruthEpisode per line)
+and hashed as they are written, so 1M-episode fixtures never have to be
+held in memory. Pair them with the v0.1 templates in TEMPLATE_FILES.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+from collections.abc import Callable, Iterator
+from decimal import ROUND_HALF_UP, Decimal
+from pathlib import Path
+from typing import Any
+
+from theatre.engine.commitment import DatasetHasher
+from theatre.engine.models import GroundTruthEpisode
+
+TWO_RAIL_DIR = Path(__file__).parent / "two_rail_theatres_v0_1"
+
+TEMPLATE_FILES = {
+    "distribution_waterfall_v1": "DISTRIBUTION_WATERFALL_V1.template.json",
+    "escrow_milestone_release_v1": "ESCROW_MILESTONE_RELEASE_V1.template.json",
+    "ledger_reconciliation_v1": "LEDGER_RECONCILIATION_V1.template.json",
+}
+
+_CENT = Decimal("0.01")
+_ROUNDING_POLICY = {"mode": "half_up", "precision": 2, "currency": "GBP"}
+
+
+def _money(value: Decimal) -> float:
+    return float(value.quantize(_CENT, rounding=ROUND_HALF_UP))
+
+
+def _pence(rng: random.Random, low: int, high: int) -> Decimal:
+    """Random amount between low and high pounds, in whole pence."""
+    return Decimal(rng.randint(low * 100, high * 100)) / 100
+
+
+def _period_end(i: int) -> str:
+    return f"{2026 + (i // 12) % 10}-{i % 12 + 1:02d}-28"
+
+
+def _hex(rng: random.Random) -> str:
+    return "%064x" % rng.getrandbits(256)
+
+
+def waterfall_record(i: int, rng: random.Random) -> dict[str, Any]:
+    gross = _pence(rng, 500, 50_000)
+    operating = (gross * Decimal(rng.randint(20, 60)) / 100).quantize(_CENT)
+    noi = gross - operating
+    supply = rng.choice([10_000, 50_000, 100_000, 250_000, 1_000_000])
+    per_token = (noi * Decimal("0.8") / supply).quantize(
+        Decimal("0.00000001"), rounding=ROUND_HALF_UP
+    )
+    distributions = (per_token * supply).quantize(_CENT, rounding=ROUND_HALF_UP)
+    platform_fee = (noi * Decimal(rng.randint(1, 5)) / 100).quantize(_CENT)
+    ladder_credit = noi - distributions - platform_fee
+    ref = f"pay_{i:07d}"
+    return {
+        "record_id": f"waterfall_{i:07d}",
+        "asset_id": f"asset_{i % 1000:03d}",
+        "period_end": _period_end(i),
+        "inputs": {
+            "payment": {
+                "payment_id": ref,
+                "gross_amount": _money(gross),
+                "currency": "GBP",
+                "settlement_reference": f"BANKREF-{ref}",
+                "splits": [
+                    {"bucket": "operating_costs", "amount": _money(operating)},
+                    {"bucket": "noi_pool", "amount": _money(noi)},
+                ],
+            },
+            "noi_report": {
+                "period_end": _period_end(i),
+                "noi_pool": _money(noi),
+                "allocations": [
+                    {"bucket": "distributions", "amount": _money(distributions)},
+                    {"bucket": "platform_fee", "amount": _money(platform_fee)},
+                    {"bucket": "ladder_credit", "amount": _money(ladder_credit)},
+                ],
+            },
+            "cap_table_snapshot": {
+                "token_class": "rail1_income_units",
+                "token_supply": supply,
+                "distribution_per_token": float(per_token),
+            },
+            "rounding_policy": dict(_ROUNDING_POLICY),
+        },
+        "expected_outputs": {
+            "distribution_statement": {
+                "gross_amount": _money(gross),
+                "splits_sum": _money(gross),
+                "operating_costs": _money(operating),
+                "noi_pool": _money(noi),
+                "noi_allocations_sum": _money(noi),
+                "distributions": _money(distributions),
+                "platform_fee": _money(platform_fee),
+                "ladder_credit": _money(ladder_credit),
+                "distribution_per_token": float(per_token),
+            },
+        },
+    }
+
+
+def escrow_record(i: int, rng: random.Random) -> dict[str, Any]:
+    balance = _pence(rng, 10_000, 2_000_000)
+    release_pct = Decimal(rng.randint(5, 40)) / 100
+    release_amount = (release_pct * balance).quantize(_CENT, rounding=ROUND_HALF_UP)
+    milestone_id = f"ms_{i:07d}_{rng.choice(['foundation', 'frame', 'roof', 'fitout'])}_complete"
+    roles = [("quantity_surveyor", "qs"), ("engineer", "eng"), ("administrator", "admin")]
+    return {
+        "record_id": f"escrow_{i:07d}",
+        "asset_id": f"asset_{i % 1000:03d}",
+        "inputs": {
+            "escrow_state": {
+                "escrow_id": f"escrow_{i:07d}",
+                "balance": _money(balance),
+                "currency": "GBP",
+                "funding_reference": f"BANKREF-pay_{i:07d}",
+            },
+            "milestone_schedule": {
+                "milestones": [{
+                    "milestone_id": milestone_id,
+                    "release_pct": float(release_pct),
+                    "evidence_required": ["qs_report", "engineer_signoff"],
+                    "required_signer_roles": [role for role, _ in roles],
+                }],
+                "rounding_policy": dict(_ROUNDING_POLICY),
+            },
+            "evidence_bundle": {
+                "documents": [
+                    {"doc_type": "qs_report", "doc_hash": _hex(rng)},
+                    {"doc_type": "engineer_signoff", "doc_hash": _hex(rng)},
+                ],
+                "attestations": [
+                    {
+                        "role": role,
+                        "signer_id": f"{prefix}_{rng.randint(1, 999):03d}",
+                        "signature": _hex(rng),
+                    }
+                    for role, prefix in roles
+                ],
+                "evidence_timestamp": f"{_period_end(i)}T12:00:00Z",
+            },
+        },
+        "expected_outputs": {
+            "release_instruction": {
+                "release_allowed": True,
+                "release_amount": _money(release_amount),
+                "currency": "GBP",
+                "milestone_id": milestone_id,
+            },
+        },
+    }
+
+
+def reconciliation_record(i: int, rng: random.Random) -> dict[str, Any]:
+    gross = _pence(rng, 500, 50_000)
+    operating = (gross * Decimal(rng.randint(20, 60)) / 100).quantize(_CENT)
+    splits = [
+        {"bucket": "operating_costs", "amount": _money(operating), "destination_ref": "ops_wallet"},
+        {"bucket": "noi_pool", "amount": _money(gross - operating), "destination_ref": "noi_wallet"},
+    ]
+    ref = f"BANKREF-pay_{i:07d}"
+    return {
+        "record_id": f"recon_{i:07d}",
+        "asset_id": f"asset_{i % 1000:03d}",
+        "inputs": {
+            "bank_statement_slice": {
+                "transactions": [{
+                    "bank_txn_id": f"txn_{i:07d}",
+                    "reference": ref,
+                    "amount": _money(gross),
+                    "currency": "GBP",
+                    "posted_at": f"{_period_end(i)}T09:30:00Z",
+                }],
+            },
+            "payment": {
+                "payment_id": f"pay_{i:07d}",
+                "gross_amount": _money(gross),
+                "currency": "GBP",
+                "settlement_reference": ref,
+                "splits": splits,
+            },
+            "event_log": [
+                {
+                    "event_id": f"evt_{i:07d}_{n}",
+                    "type": "payment_split_posted",
+                    "bucket": split["bucket"],
+                    "amount": split["amount"],
+                    "ref": ref,
+                }
+                for n, split in enumerate(splits, start=1)
+            ],
+            "reconciliation_rules": {
+                "match_on": ["settlement_reference", "amount", "currency"],
+                "bucket_rules": {
+                    "operating_costs": {"allowed_destinations": ["ops_wallet"]},
+                    "noi_pool": {"allowed_destinations": ["noi_wallet"]},
+                },
+                "rounding_policy": dict(_ROUNDING_POLICY),
+            },
+        },
+        "expected_outputs": {
+            "reconciliation_result": {
+                "matched": True,
+                "match_reason": "reference_and_amount_match",
+                "exceptions": [],
+                "ledger_events_expected": len(splits),
+                "ledger_events_observed": len(splits),
+            },
+        },
+    }
+
+
+GENERATORS: dict[str, Callable[[int, random.Random], dict[str, Any]]] = {
+    "distribution_waterfall_v1": waterfall_record,
+    "escrow_milestone_release_v1": escrow_record,
+    "ledger_reconciliation_v1": reconciliation_record,
+}
+
+
+def generate_records(theatre_key: str, count: int, seed: int = 0) -> Iterator[dict[str, Any]]:
+    """Yield ``count`` fixture-format records for a two-rail theatre."""
+    try:
+        make = GENERATORS[theatre_key]
+    except KeyError:
+        raise ValueError(
+            f"Unknown theatre {theatre_key!r}; expected one of {sorted(GENERATORS)}"
+        ) from None
+    # Per-theatre stream so each theatre's dataset depends only on the seed
+    rng = random.Random(
+        int(hashlib.sha256(f"{theatre_key}:{seed}".encode()).hexdigest()[:16], 16)
+    )
+    for i in range(1, count + 1):
+        yield make(i, rng)
+
+
+def record_to_episode(record: dict[str, Any]) -> GroundTruthEpisode:
+    """Convert a fixture record to a GroundTruthEpisode (as the theatre scripts do)."""
+    return GroundTruthEpisode(
+        episode_id=record["record_id"],
+        input_data=record["inputs"],
+        expected_output=record.get("expected_outputs", {}),
+        metadata={
+            "asset_id": record.get("asset_id", ""),
+            "period_end": record.get("period_end", ""),
+        },
+    )
+
+
+def write_dataset_jsonl(theatre_key: str, count: int, path: Path, seed: int = 0) -> str:
+    """Write a synthetic episode JSONL dataset and return its dataset hash."""
+    hasher = DatasetHasher()
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as f:
+        for record in generate_records(theatre_key, count, seed):
+            episode = record_to_episode(record)
+            hasher.update(episode)
+            f.write(json.dumps(episode.model_dump(), sort_keys=True) + "\n")
+    return hasher.hexdigest()
+
+
+def load_template(theatre_key: str) -> dict[str, Any]:
+    """Load the v0.1 template matching a synthetic theatre."""
+    return json.loads((TWO_RAIL_DIR / "templates" / TEMPLATE_FILES[theatre_key]).read_text())
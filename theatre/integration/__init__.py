@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Any
 
 from theatre.integration.github_ingester import GitHubIngester
+from theatre.integration.ground_truth_store import GroundTruthStore
 from theatre.integration.ground_truth_adapter import (
     GroundTruthAdapter,
     convert_record_to_episode,
@@ -26,6 +27,7 @@ __all__ = [
     "GitHubIngester",
     "GroundTruthAdapter",
     "GroundTruthRecord",
+    "GroundTruthStore",
     "OracleOutput",
     "ObserverOracleAdapter",
     "ObserverScoringFunction",
@@ -0,0 +1,85 @@
+"""PR Diff Cache — on-disk store of GitHub diffs with their validators.
+
+Each entry holds the (truncated) diff for one pull request together with the
+ETag and Last-Modified headers GitHub returned for it. The ingester sends
+those back as If-None-Match / If-Modified-Since, so an unchanged PR costs a
+304 with no body — which GitHub does not count against the rate limit for
+authenticated requests. Entries live at ``<cache_dir>/<owner>/<repo>/<pr>.json``;
+an owner or repo name that is not already a safe directory name (leading
+dot, unusual characters) is sanitised and suffixed with a short hash of the
+original, so distinct slugs never share a directory.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+from pathlib import Path
+
+from pydantic import BaseModel
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9._-]")
+
+
+def _dir_name(part: str) -> str:
+    safe = _UNSAFE_CHARS.sub("_", part).lstrip(".")
+    if safe and safe == part:
+        return part
+    digest = hashlib.sha256(part.encode("utf-8")).hexdigest()[:8]
+    return f"{safe or '_'}-{digest}"
+
+
+def repo_dir(root: Path, repo: str) -> Path:
+    """``<root>/<owner>/<repo>`` for an ``owner/repo`` slug, kept inside root."""
+    owner, _, name = repo.partition("/")
+    return Path(root) / _dir_name(owner) / _dir_name(name)
+
+
+class DiffCacheEntry(BaseModel):
+    """A cached diff plus the HTTP validators needed to revalidate it."""
+
+    diff: str
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+class DiffCacheStats(BaseModel):
+    """Counters for one ingester's use of the diff cache."""
+
+    revalidated: int = 0  # 304 Not Modified — cached diff reused
+    fetched: int = 0  # 200 — diff downloaded (new or changed)
+    writes: int = 0
+
+
+class DiffCache:
+    """Directory of cached PR diffs keyed by repo slug and PR number."""
+
+    def __init__(self, cache_dir: Path):
+        self._dir = Path(cache_dir)
+        self._dir.mkdir(parents=True, exist_ok=True)
+
+    def get(self, repo: str, pr_number: int) -> DiffCacheEntry | None:
+        """Return the cached entry, or None if absent or unreadable."""
+        try:
+            return DiffCacheEntry.model_validate_json(self._path(repo, pr_number).read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def put(self, repo: str, pr_number: int, entry: DiffCacheEntry) -> None:
+        """Store an entry atomically (write to a temp file, then rename)."""
+        path = self._path(repo, pr_number)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry.model_dump(), f)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def _path(self, repo: str, pr_number: int) -> Path:
+        return repo_dir(self._dir, repo) / f"{int(pr_number)}.json"
@@ -1,13 +1,31 @@
-"""GitHub PR ingester — fetches merged PRs and maps them to GroundTruthRecords."""
+"""GitHub PR ingester — fetches merged PRs and maps them to GroundTruthRecords.
+
+Diffs are fetched concurrently (bounded by ``max_concurrency``) once the PR
+list has been paginated. Every response's ``X-RateLimit-Remaining`` and
+``X-RateLimit-Reset`` headers are tracked: once the budget is spent, new
+requests wait for the reset instead of failing, and 403/429 rate-limit
+responses are retried after ``Retry-After`` or the reset. With a
+``cache_dir`` the diffs are kept on disk with their ETag/Last-Modified and
+revalidated with conditional requests, so re-ingesting a repo only
+downloads PRs that changed. sync() goes further for rolling datasets: with
+a GroundTruthStore it only lists and fetches PRs updated since the last run.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
+import time
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 from datetime import datetime, timezone
+from pathlib import Path
 
 import httpx
 
+from theatre.integration.diff_cache import DiffCache, DiffCacheEntry, DiffCacheStats
+from theatre.integration.ground_truth_store import GroundTruthStore
 from theatre.integration.models import GroundTruthRecord
 
 logger = logging.getLogger(__name__)
@@ -15,6 +33,11 @@ logger = logging.getLogger(__name__)
 # Cycle-027 convention: truncate diffs larger than 100 KB.
 _MAX_DIFF_BYTES = 100 * 1024
 
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Rate-limited (403/429) responses are retried at most this many times
+_MAX_RATE_LIMIT_RETRIES = 3
+
 
 def _truncate_diff(diff: str, max_bytes: int = _MAX_DIFF_BYTES) -> str:
     """Truncate a diff to at most *max_bytes* UTF-8 bytes without splitting a character."""
@@ -40,20 +63,59 @@ def _parse_iso_timestamp(value: str | None) -> datetime:
         return datetime.now(timezone.utc)
 
 
+def _header_int(headers: httpx.Headers, name: str) -> int | None:
+    """Parse an integer response header, or None if absent or malformed."""
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
 class GitHubIngester:
-    """Fetch merged PRs from the GitHub REST API and return GroundTruthRecords."""
+    """Fetch merged PRs from the GitHub REST API and return GroundTruthRecords.
+
+    Args:
+        token: GitHub token; unauthenticated requests get 60/hour.
+        timeout: Per-request timeout in seconds.
+        cache_dir: If set, cache diffs here and revalidate them with
+            conditional requests on later runs.
+        max_concurrency: Maximum diff requests in flight at once.
+        base_url: API root (overridable for GitHub Enterprise or tests).
+    """
 
     _BASE = "https://api.github.com"
 
-    def __init__(self, token: str | None = None, timeout: float = 30.0) -> None:
+    def __init__(
+        self,
+        token: str | None = None,
+        timeout: float = 30.0,
+        cache_dir: Path | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        base_url: str = _BASE,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
         headers: dict[str, str] = {"Accept": "application/vnd.github+json"}
         if token:
             headers["Authorization"] = f"Bearer {token}"
         self._client = httpx.AsyncClient(
-            base_url=self._BASE,
+            base_url=base_url,
             headers=headers,
             timeout=timeout,
         )
+        self._cache = DiffCache(cache_dir) if cache_dir is not None else None
+        self._cache_stats = DiffCacheStats()
+        self._max_concurrency = max_concurrency
+        # Rate-limit budget as last reported by GitHub, less requests sent since
+        self._remaining: int | None = None
+        self._reset_at = 0.0
+
+    @property
+    def cache_stats(self) -> DiffCacheStats:
+        return self._cache_stats.model_copy()
 
     # ------------------------------------------------------------------
     # Public API
@@ -71,28 +133,82 @@ class GitHubIngester:
         """
         merged_prs = await self._fetch_merged_prs(repo, limit)
         logger.info("Fetched %d merged PRs from %s", len(merged_prs), repo)
+        records = await self._fetch_records(repo, merged_prs)
+        return [record for record in records if record is not None]
+
+    async def sync(
+        self,
+        repo: str,
+        store: GroundTruthStore,
+        limit: int = 1000,
+    ) -> list[GroundTruthRecord]:
+        """Bring *store*'s rolling window of *limit* merged PRs up to date.
+
+        The first sync for a repo behaves like ingest(). Later syncs list
+        closed PRs newest-updated first and stop at the stored watermark,
+        so only PRs created or edited since the last run are fetched and
+        upserted. If any diff fetch fails the watermark is left where it
+        was, so those PRs are retried next time.
+
+        Returns the store's records for *repo*, newest merge first.
+        """
+        watermark = store.watermark(repo)
+        changed: list[dict] = []
+        newest: str | None = None
+        async with aclosing(self._iter_closed_prs(repo, min(max(limit, 1), 100))) as prs:
+            async for pr in prs:
+                updated_at = pr.get("updated_at") or ""
+                if newest is None:
+                    newest = updated_at
+                # Equal timestamps are re-fetched: a PR edited in the same
+                # second as the last sync must not be missed
+                if watermark is not None and updated_at < watermark:
+                    break
+                if pr.get("merged_at"):
+                    changed.append(pr)
+                    if len(changed) >= limit:
+                        break
 
-        records: list[GroundTruthRecord] = []
-        for pr in merged_prs:
-            try:
-                diff = await self._fetch_diff(repo, pr["number"])
-                records.append(self._map_to_record(pr, diff, repo))
-            except Exception:
-                logger.exception("Skipping PR #%s — failed to fetch diff", pr.get("number"))
-        return records
+        records = await self._fetch_records(repo, changed)
+        fetched = [record for record in records if record is not None]
+        complete = len(fetched) == len(changed)
+        logger.info(
+            "Synced %s: %d changed merged PRs since %s (%d failed)",
+            repo, len(changed), watermark or "start", len(changed) - len(fetched),
+        )
+        return store.merge(
+            repo,
+            fetched,
+            watermark=(newest or watermark) if complete else watermark,
+            limit=limit,
+        )
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
-    async def _fetch_merged_prs(self, repo: str, limit: int) -> list[dict]:
-        """Paginate ``/repos/{repo}/pulls`` until *limit* merged PRs collected."""
-        merged: list[dict] = []
-        page = 1
-        per_page = min(limit, 100)
+    async def _fetch_records(
+        self, repo: str, prs: list[dict]
+    ) -> list[GroundTruthRecord | None]:
+        """Fetch diffs concurrently; None marks a PR whose fetch failed."""
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def fetch(pr: dict) -> GroundTruthRecord | None:
+            async with semaphore:
+                try:
+                    diff = await self._fetch_diff(repo, pr["number"])
+                    return self._map_to_record(pr, diff, repo)
+                except Exception:
+                    logger.exception("Skipping PR #%s — failed to fetch diff", pr.get("number"))
+                    return None
+
+        return await asyncio.gather(*(fetch(pr) for pr in prs))
 
-        while len(merged) < limit:
-            resp = await self._client.get(
+    async def _iter_closed_prs(self, repo: str, per_page: int) -> AsyncIterator[dict]:
+        """Yield closed PRs, most recently updated first, one page at a time."""
+        page = 1
+        while True:
+            resp = await self._get(
                 f"/repos/{repo}/pulls",
                 params={
                     "state": "closed",
@@ -106,26 +222,106 @@ class GitHubIngester:
             items = resp.json()
 
             if not items:
-                break  # No more pages
-
+                return  # No more pages
             for pr in items:
+                yield pr
+            page += 1
+
+    async def _fetch_merged_prs(self, repo: str, limit: int) -> list[dict]:
+        """Paginate ``/repos/{repo}/pulls`` until *limit* merged PRs collected."""
+        merged: list[dict] = []
+        if limit < 1:
+            return merged
+
+        async with aclosing(self._iter_closed_prs(repo, min(limit, 100))) as prs:
+            async for pr in prs:
                 if pr.get("merged_at"):
                     merged.append(pr)
                     if len(merged) >= limit:
                         break
 
-            page += 1
-
         return merged
 
     async def _fetch_diff(self, repo: str, pr_number: int) -> str:
-        """Fetch the unified diff for a single PR."""
-        resp = await self._client.get(
-            f"/repos/{repo}/pulls/{pr_number}",
-            headers={"Accept": "application/vnd.github.v3.diff"},
-        )
+        """Fetch the unified diff for a single PR, revalidating any cached copy."""
+        headers = {"Accept": "application/vnd.github.v3.diff"}
+        cached = self._cache.get(repo, pr_number) if self._cache is not None else None
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        resp = await self._get(f"/repos/{repo}/pulls/{pr_number}", headers=headers)
+        if resp.status_code == 304 and cached is not None:
+            self._cache_stats.revalidated += 1
+            return cached.diff
         resp.raise_for_status()
-        return _truncate_diff(resp.text)
+        diff = _truncate_diff(resp.text)
+        self._cache_stats.fetched += 1
+
+        if self._cache is not None:
+            entry = DiffCacheEntry(
+                diff=diff,
+                etag=resp.headers.get("etag"),
+                last_modified=resp.headers.get("last-modified"),
+            )
+            if entry.etag or entry.last_modified:
+                self._cache.put(repo, pr_number, entry)
+                self._cache_stats.writes += 1
+        return diff
+
+    async def _get(self, url: str, **kwargs) -> httpx.Response:
+        """GET within the rate-limit budget, retrying rate-limited responses."""
+        for attempt in range(_MAX_RATE_LIMIT_RETRIES + 1):
+            await self._wait_for_rate_limit()
+            resp = await self._client.get(url, **kwargs)
+            self._update_rate_limit(resp.headers)
+            delay = self._rate_limited_delay(resp)
+            if delay is None or attempt == _MAX_RATE_LIMIT_RETRIES:
+                return resp
+            logger.warning("GitHub rate limited %s; retrying in %.1fs", url, delay)
+            await asyncio.sleep(delay)
+        return resp
+
+    async def _wait_for_rate_limit(self) -> None:
+        """Block until the budget allows another request, then reserve it."""
+        while self._remaining is not None and self._remaining <= 0:
+            delay = self._reset_at - time.time()
+            if delay <= 0:
+                # New window; the next response reports the fresh budget
+                self._remaining = None
+                break
+            logger.warning("GitHub rate limit exhausted; waiting %.1fs for reset", delay)
+            await asyncio.sleep(delay)
+        if self._remaining is not None:
+            self._remaining -= 1
+
+    def _update_rate_limit(self, headers: httpx.Headers) -> None:
+        remaining = _header_int(headers, "x-ratelimit-remaining")
+        reset_at = _header_int(headers, "x-ratelimit-reset")
+        if remaining is None or reset_at is None:
+            return
+        if reset_at > self._reset_at:
+            self._reset_at = reset_at
+            self._remaining = remaining
+        elif reset_at == self._reset_at:
+            # Responses can arrive out of order; keep the lowest figure
+            self._remaining = (
+                remaining if self._remaining is None else min(self._remaining, remaining)
+            )
+
+    @staticmethod
+    def _rate_limited_delay(resp: httpx.Response) -> float | None:
+        """Seconds to wait before retrying, or None if not rate limited."""
+        if resp.status_code not in (403, 429):
+            return None
+        retry_after = _header_int(resp.headers, "retry-after")
+        if retry_after is not None:
+            return float(retry_after)
+        if _header_int(resp.headers, "x-ratelimit-remaining") == 0:
+            return 0.0  # _wait_for_rate_limit sleeps until the reset
+        return None
 
     @staticmethod
     def _map_to_record(pr: dict, diff: str, repo: str) -> GroundTruthRecord:
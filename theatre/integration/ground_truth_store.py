@@ -0,0 +1,93 @@
+"""Ground Truth Store — per-repo rolling set of ingested PR records.
+
+Holds the GroundTruthRecords built by GitHubIngester.sync() together with a
+watermark: the newest ``updated_at`` seen on the repo's closed-PR listing.
+The next sync lists PRs newest-updated first and stops as soon as it passes
+the watermark, so only PRs that changed since the last run are fetched.
+
+Layout per repo under ``<store_dir>/<owner>/<repo>/``:
+``records.jsonl`` (one record per line, newest merge first) and
+``state.json`` (the watermark). Both are replaced atomically.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from collections.abc import Iterable
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from theatre.integration.diff_cache import repo_dir
+from theatre.integration.models import GroundTruthRecord
+
+
+class SyncState(BaseModel):
+    """Persisted sync position for one repo."""
+
+    watermark: str | None = None  # Newest PR updated_at seen (ISO-8601)
+
+
+class GroundTruthStore:
+    """Directory of synced ground-truth records, one subdirectory per repo."""
+
+    def __init__(self, store_dir: Path):
+        self._dir = Path(store_dir)
+        self._dir.mkdir(parents=True, exist_ok=True)
+
+    def watermark(self, repo: str) -> str | None:
+        """The watermark of the last completed sync, or None if never synced."""
+        try:
+            return SyncState.model_validate_json(
+                (repo_dir(self._dir, repo) / "state.json").read_bytes()
+            ).watermark
+        except (OSError, ValueError):
+            return None
+
+    def load(self, repo: str) -> list[GroundTruthRecord]:
+        """All stored records for *repo*, newest merge first."""
+        path = repo_dir(self._dir, repo) / "records.jsonl"
+        try:
+            with path.open(encoding="utf-8") as f:
+                return [GroundTruthRecord.model_validate_json(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
+
+    def merge(
+        self,
+        repo: str,
+        records: Iterable[GroundTruthRecord],
+        watermark: str | None,
+        limit: int | None = None,
+    ) -> list[GroundTruthRecord]:
+        """Upsert *records* by id, keep the newest *limit*, and save.
+
+        The records are written before the watermark, so an interrupted
+        merge at worst re-fetches the same PRs on the next sync.
+        """
+        by_id = {record.id: record for record in self.load(repo)}
+        by_id.update((record.id, record) for record in records)
+        merged = sorted(by_id.values(), key=lambda r: (r.timestamp, r.id), reverse=True)
+        if limit is not None:
+            merged = merged[:limit]
+
+        directory = repo_dir(self._dir, repo)
+        directory.mkdir(parents=True, exist_ok=True)
+        _write_atomic(
+            directory / "records.jsonl",
+            "".join(record.model_dump_json() + "\n" for record in merged),
+        )
+        _write_atomic(directory / "state.json", SyncState(watermark=watermark).model_dump_json())
+        return merged
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
@@ -3,6 +3,9 @@
 Uses Anthropic to evaluate oracle outputs against ground truth PRs.
 Supports three criteria: precision, recall, reply_accuracy.
 Uses the scoring prompts from echelon_verify/scoring/prompts/v1/.
+
+score_many() judges all requested criteria in a single request so the PR
+diff is sent once per episode instead of once per criterion.
 """
 
 from __future__ import annotations
@@ -21,6 +24,12 @@ _PROMPT_DIR = Path(__file__).resolve().parents[2] / (
 
 _VALID_CRITERIA = frozenset({"precision", "recall", "reply_accuracy"})
 
+# Key holding each criterion's score inside its object in a combined response
+_SCORE_KEYS = {"precision": "precision", "recall": "recall", "reply_accuracy": "accuracy"}
+
+# Criterion prompts share the PR preamble; their own text starts after the diff
+_DIFF_BLOCK_END = "{diff_content}\n```\n"
+
 
 class ObserverScoringFunction:
     """ScoringFunction implementation for Observer verification.
@@ -32,6 +41,9 @@ class ObserverScoringFunction:
         async def score(
             self, criteria_id: str, ground_truth: dict, oracle_output: dict
         ) -> float
+
+    and to BatchScoringFunction via score_many(), which TheatreScoringProvider
+    prefers when available.
     """
 
     def __init__(
@@ -48,7 +60,9 @@ class ObserverScoringFunction:
 
     def _load_prompts(self) -> None:
         """Load scoring prompt templates from disk."""
-        for name in ("precision", "recall", "reply_accuracy", "follow_up_question"):
+        for name in (
+            "precision", "recall", "reply_accuracy", "follow_up_question", "combined",
+        ):
             path = _PROMPT_DIR / f"{name}.txt"
             if path.exists():
                 self._prompts[name] = path.read_text()
@@ -112,6 +126,96 @@ class ObserverScoringFunction:
 
         return 0.0  # unreachable but satisfies type checker
 
+    async def score_many(
+        self,
+        criteria_ids: list[str],
+        ground_truth: dict[str, Any],
+        oracle_output: dict[str, Any],
+    ) -> dict[str, float]:
+        """Score several criteria for one episode with a single Anthropic call.
+
+        Short-circuit rules match score(): unknown criteria score 0.0, no
+        claims is vacuous precision 1.0, no summary is recall 0.0, and a
+        missing follow-up question or response is reply_accuracy 0.0. Any
+        criterion absent from the combined response is re-scored with score().
+
+        Returns:
+            Dict of criteria_id -> float score (unclamped, as with score()).
+        """
+        input_data = ground_truth.get("input_data", {})
+        fields = {
+            "claims_json": json.dumps(oracle_output.get("key_claims", []), indent=2),
+            "summary": oracle_output.get("summary", ""),
+            "follow_up_question": input_data.get("follow_up_question", ""),
+            "follow_up_response": oracle_output.get("follow_up_response", ""),
+        }
+
+        scores: dict[str, float] = {}
+        to_judge: list[str] = []
+        for criteria_id in criteria_ids:
+            if criteria_id not in _VALID_CRITERIA:
+                logger.warning("Unknown criteria_id: %s, returning 0.0", criteria_id)
+                scores[criteria_id] = 0.0
+            elif criteria_id == "precision" and not oracle_output.get("key_claims"):
+                scores[criteria_id] = 1.0  # No claims = vacuous precision
+            elif criteria_id == "recall" and not fields["summary"]:
+                scores[criteria_id] = 0.0
+            elif criteria_id == "reply_accuracy" and not (
+                fields["follow_up_question"] and fields["follow_up_response"]
+            ):
+                scores[criteria_id] = 0.0  # Cannot score without both Q and A
+            elif criteria_id not in to_judge:
+                to_judge.append(criteria_id)
+
+        prompt_template = self._prompts.get("combined", "")
+        sections = [self._batch_section(cid, fields) for cid in to_judge]
+        if len(to_judge) < 2 or not prompt_template or None in sections:
+            # Nothing to batch — fall back to one call per criterion
+            for criteria_id in to_judge:
+                scores[criteria_id] = await self.score(
+                    criteria_id, ground_truth, oracle_output
+                )
+            return scores
+
+        prompt = prompt_template.format(
+            title=input_data.get("title", ""),
+            description=input_data.get("description", ""),
+            diff_content=_truncate(input_data.get("diff_content", ""), 60_000),
+            criteria=", ".join(f'"{cid}"' for cid in to_judge),
+            sections="\n\n".join(sections),
+        )
+
+        try:
+            result = _parse_json_response(await self._call_anthropic(prompt))
+        except Exception:
+            logger.exception(
+                "Batch scoring failed for criteria_ids=%s, returning 0.0", to_judge
+            )
+            return {**scores, **{cid: 0.0 for cid in to_judge}}
+
+        for criteria_id in to_judge:
+            score = _extract_batch_score(result, criteria_id)
+            if score is None:
+                score = await self.score(criteria_id, ground_truth, oracle_output)
+            scores[criteria_id] = score
+        return scores
+
+    def _batch_section(self, criteria_id: str, fields: dict[str, str]) -> str | None:
+        """One criterion's part of the combined prompt, taken from its own prompt.
+
+        That is everything after the shared PR preamble and diff, with headings
+        nested under a per-criterion heading. None if the prompt is missing or
+        no longer has the expected layout.
+        """
+        template = self._prompts.get(criteria_id, "")
+        _, found, body = template.partition(_DIFF_BLOCK_END)
+        if not found:
+            return None
+        body = body.strip().replace("\n## ", "\n### ")
+        if body.startswith("## "):
+            body = "#" + body
+        return f"## Criterion: {criteria_id}\n" + body.format(**fields)
+
     async def _score_precision(
         self,
         title: str,
@@ -245,6 +349,16 @@ def _truncate(text: str, max_chars: int) -> str:
     return text[:max_chars] + "\n\n[... truncated ...]"
 
 
+def _extract_batch_score(result: dict[str, Any], criteria_id: str) -> float | None:
+    """Read one criterion's score from a combined response, or None if absent."""
+    section = result.get(criteria_id)
+    if isinstance(section, dict):
+        section = section.get(_SCORE_KEYS[criteria_id])
+    if isinstance(section, (int, float)) and not isinstance(section, bool):
+        return float(section)
+    return None
+
+
 def _parse_json_response(raw: str) -> dict[str, Any]:
     """Parse JSON from LLM response."""
     try:
@@ -2,12 +2,14 @@
 
 from theatre.scoring.deterministic_oracle import DeterministicOracleAdapter
 from theatre.scoring.escrow_scorer import EscrowScorer
+from theatre.scoring.process_pool import ProcessPoolScorer
 from theatre.scoring.reconciliation_scorer import ReconciliationScorer
 from theatre.scoring.waterfall_scorer import WaterfallScorer
 
 __all__ = [
     "DeterministicOracleAdapter",
     "EscrowScorer",
+    "ProcessPoolScorer",
     "ReconciliationScorer",
     "WaterfallScorer",
 ]
@@ -22,6 +22,15 @@ class EscrowScorer:
         ground_truth: dict[str, Any],
         oracle_output: dict[str, Any],
     ) -> float:
+        return self.score_sync(criteria_id, ground_truth, oracle_output)
+
+    def score_sync(
+        self,
+        criteria_id: str,
+        ground_truth: dict[str, Any],
+        oracle_output: dict[str, Any],
+    ) -> float:
+        """Blocking form of score(), for use off the event loop."""
         inputs = ground_truth.get("input_data", {})
         expected = ground_truth.get("expected_output", {})
 
@@ -0,0 +1,155 @@
+"""Process Pool Scorer — runs deterministic scoring in worker processes.
+
+The two-rail scorers are pure-CPU Decimal arithmetic, so scoring them on the
+event loop uses a single core. ProcessPoolScorer wraps any scorer exposing a
+blocking ``score_sync`` and implements BatchScoringFunction: episodes that
+request scoring while the loop is busy are collected into one batch and
+scored in a worker process, and each caller receives its own episode's
+scores. The wrapped scorer is shipped to each worker once, at start-up.
+
+Batches are sized by how many episodes are in flight, so a replay should
+run with max_concurrency of roughly ``max_workers * batch_size`` to keep
+every worker busy. Scores are computed by the same score_sync code as the
+inline path, so results are identical.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Protocol
+
+DEFAULT_BATCH_SIZE = 256
+
+_BatchItem = tuple[list[str], dict[str, Any], dict[str, Any]]
+
+# Set in each worker by _init_worker
+_worker_scorer: SyncScoringFunction | None = None
+
+
+class SyncScoringFunction(Protocol):
+    """A scorer whose checks can run without an event loop."""
+
+    def score_sync(
+        self,
+        criteria_id: str,
+        ground_truth: dict[str, Any],
+        oracle_output: dict[str, Any],
+    ) -> float: ...
+
+
+def _init_worker(scorer: SyncScoringFunction) -> None:
+    global _worker_scorer
+    _worker_scorer = scorer
+
+
+def _score_batch(items: list[_BatchItem]) -> list[dict[str, float]]:
+    scorer = _worker_scorer
+    return [
+        {cid: scorer.score_sync(cid, ground_truth, oracle_output) for cid in criteria_ids}
+        for criteria_ids, ground_truth, oracle_output in items
+    ]
+
+
+class ProcessPoolScorer:
+    """Scores episodes in batches on a ProcessPoolExecutor.
+
+    Args:
+        scorer: Picklable scorer with score_sync (e.g. WaterfallScorer).
+        max_workers: Worker processes; defaults to the CPU count.
+        batch_size: Maximum episodes per batch sent to a worker.
+
+    Close with close() (or use as a context manager) to stop the workers.
+    """
+
+    def __init__(
+        self,
+        scorer: SyncScoringFunction,
+        max_workers: int | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        self._scorer = scorer
+        self._max_workers = max_workers
+        self._batch_size = batch_size
+        self._executor: ProcessPoolExecutor | None = None
+        self._pending: list[tuple[_BatchItem, asyncio.Future[dict[str, float]]]] = []
+        self._flush_handle: asyncio.Handle | None = None
+        self.batches_submitted = 0
+
+    async def score(
+        self,
+        criteria_id: str,
+        ground_truth: dict[str, Any],
+        oracle_output: dict[str, Any],
+    ) -> float:
+        scores = await self.score_many([criteria_id], ground_truth, oracle_output)
+        return scores.get(criteria_id, 0.0)
+
+    async def score_many(
+        self,
+        criteria_ids: list[str],
+        ground_truth: dict[str, Any],
+        oracle_output: dict[str, Any],
+    ) -> dict[str, float]:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[dict[str, float]] = loop.create_future()
+        self._pending.append(((list(criteria_ids), ground_truth, oracle_output), future))
+        if len(self._pending) >= self._batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            # Let the other episodes that are ready this tick join the batch
+            self._flush_handle = loop.call_soon(self._flush)
+        return await future
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> ProcessPoolScorer:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                initializer=_init_worker,
+                initargs=(self._scorer,),
+            )
+        loop = asyncio.get_running_loop()
+        done = self._executor.submit(_score_batch, [item for item, _ in batch])
+        self.batches_submitted += 1
+        done.add_done_callback(
+            lambda f: loop.call_soon_threadsafe(self._deliver, batch, f)
+        )
+
+    @staticmethod
+    def _deliver(
+        batch: list[tuple[_BatchItem, asyncio.Future[dict[str, float]]]],
+        done: Future[list[dict[str, float]]],
+    ) -> None:
+        # A batch cancelled before it ran (pool shutdown) has no exception()
+        cancelled = done.cancelled()
+        error = None if cancelled else done.exception()
+        failed = cancelled or error is not None
+        results = [None] * len(batch) if failed else done.result()
+        for (_, future), scores in zip(batch, results):
+            if future.done():
+                continue  # Caller was cancelled
+            if cancelled:
+                future.cancel()
+            elif error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(scores)